@@ -0,0 +1,169 @@
+"""
+Startup benchmark
+
+Measures time from interpreter start to the first rendered main menu
+frame, and how long each module takes to import on the way there.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 15] [--window]
+
+Each run is a fresh interpreter (started with -X importtime), so module
+caches don't carry over between runs. By default the display is SDL's
+dummy driver, so the benchmark works without a window.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Packages that belong to the game (everything else is a dependency)
+GAME_PACKAGES = ("main", "core", "states", "systems", "ui", "entities", "utils")
+
+
+class ImportRecorder:
+    """Meta path hook that notes which thread first imported each game module (finds nothing itself)"""
+
+    def __init__(self):
+        self.threads = {}
+
+    def find_spec(self, name, path=None, target=None):
+        if is_game_module(name):
+            self.threads.setdefault(name, threading.current_thread().name)
+        return None
+
+
+def run_startup():
+    """Child process: start the game up to its first frame and report timings as JSON"""
+    start = time.perf_counter()
+    recorder = ImportRecorder()
+    sys.meta_path.insert(0, recorder)
+    sys.path.insert(0, str(SRC_DIR))
+    import pygame
+    import main
+    from core.state_manager import StateManager
+    imported = time.perf_counter()
+
+    pygame.init()
+    screen = pygame.display.set_mode((main.SCREEN_WIDTH, main.SCREEN_HEIGHT))
+    state_manager = StateManager()
+    for name, factory in main.STATE_FACTORIES.items():
+        state_manager.register_factory(name, factory)
+    state_manager.change_state("main_menu")
+    entered = time.perf_counter()
+
+    state = state_manager.get_current_state()
+    state.update(1.0 / main.FPS)
+    screen.fill(main.BLACK)
+    state.render(screen)
+    pygame.display.flip()
+    first_frame = time.perf_counter()
+    # Warm-up threads keep importing in the background; only the main thread delays the first frame
+    main_thread = threading.main_thread().name
+    blocking = sorted(name for name, thread in list(recorder.threads.items()) if thread == main_thread)
+
+    state_manager.shutdown()
+    pygame.quit()
+    print(json.dumps({
+        "import_ms": (imported - start) * 1000.0,
+        "enter_ms": (entered - imported) * 1000.0,
+        "first_frame_ms": (first_frame - start) * 1000.0,
+        "states_built": sorted(state_manager.states),
+        "main_thread_modules": blocking
+    }))
+
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output.
+
+    Returns:
+        dict: module -> (self microseconds, cumulative microseconds)
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(runs, window):
+    """
+    Run the startup several times in fresh interpreters.
+
+    Returns:
+        tuple: (list of per-run timing dicts, import times from the first run)
+    """
+    env = dict(os.environ)
+    if not window:
+        env.setdefault("SDL_VIDEODRIVER", "dummy")
+        env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+    results = []
+    import_times = None
+    for _ in range(runs):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", __file__, "--child"],
+            capture_output=True, text=True, env=env, check=True)
+        results.append(json.loads(process.stdout.strip().splitlines()[-1]))
+        if import_times is None:
+            import_times = parse_importtime(process.stderr)
+    return results, import_times
+
+
+def is_game_module(name):
+    """Whether a module is part of the game rather than a dependency"""
+    return name.split(".")[0] in GAME_PACKAGES
+
+
+def report(results, import_times, top):
+    """Print the timing summary and the slowest imports"""
+    print(f"Startup over {len(results)} runs (median, min):")
+    for key, label in (("import_ms", "Imports"), ("enter_ms", "Enter main menu"),
+                       ("first_frame_ms", "Time to first frame")):
+        values = [result[key] for result in results]
+        print(f"  {label:<20} {statistics.median(values):8.1f} ms {min(values):8.1f} ms")
+    print(f"  States built: {', '.join(results[0]['states_built'])}")
+
+    by_cumulative = sorted(import_times.items(), key=lambda item: item[1][1], reverse=True)
+    print(f"\nSlowest imports (first run, top {top}):")
+    print(f"  {'module':<45} {'self ms':>8} {'total ms':>9}")
+    for name, (self_us, cumulative_us) in by_cumulative[:top]:
+        print(f"  {name:<45} {self_us / 1000:8.1f} {cumulative_us / 1000:9.1f}")
+
+    blocking = set(results[0]["main_thread_modules"])
+    game_modules = [item for item in by_cumulative if is_game_module(item[0])]
+    print(f"\nGame modules imported at startup ({len(game_modules)}, "
+          f"{len(blocking)} on the main thread before the first frame; * = background warm-up):")
+    for name, (self_us, cumulative_us) in game_modules:
+        marker = " " if name in blocking else "*"
+        print(f" {marker}{name:<45} {self_us / 1000:8.1f} {cumulative_us / 1000:9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time to first frame and per-module import time")
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreter runs (default 5)")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list (default 15)")
+    parser.add_argument("--window", action="store_true", help="open a real window instead of the dummy driver")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_startup()
+        return
+
+    results, import_times = measure(args.runs, args.window)
+    report(results, import_times, args.top)
+
+
+if __name__ == "__main__":
+    main()
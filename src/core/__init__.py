@@ -1,8 +1,22 @@
 # Core game systems and managers
-from .game_state import GameState
-from .state_manager import StateManager
-from .game_session import GameSession
-from .context_manager import ContextManager, NavigationContext
-from .data_loader import DataLoader
-from .input_manager import InputManager
-from .collision_manager import CollisionManager
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __all__ = lazy_exports(globals(), {
+    "GameState": ".game_state",
+    "StateManager": ".state_manager",
+    "GameSession": ".game_session",
+    "ContextManager": ".context_manager",
+    "NavigationContext": ".context_manager",
+    "EventScheduler": ".event_scheduler",
+    "DataLoader": ".data_loader",
+    "get_data_loader": ".data_loader",
+    "SystemLoader": ".system_loader",
+    "get_system_loader": ".system_loader",
+    "InputManager": ".input_manager",
+    "CollisionManager": ".collision_manager",
+    "Trigger": ".trigger_index",
+    "TriggerIndex": ".trigger_index",
+    "MessageLog": ".message_log",
+    "GameData": ".game_data",
+    "get_game_data": ".game_data"
+})
@@ -1,7 +1,7 @@
 from utils.collision import point_in_circle
 from core.constants import (
     CONTEXT_GRID_SIZE, 
-    RENDER_SCALE
+    SHIP_RADIUS
 )
 
 class CollisionManager:
@@ -22,15 +22,13 @@ class CollisionManager:
         Args:
             ship_x, ship_y: Ship's current position (in game units)
             interactables: List of Interactable objects
-            ship_radius: Radius of the ship in game units (defaults to 22px / RENDER_SCALE)
+            ship_radius: Radius of the ship in game units (defaults to SHIP_RADIUS)
 
         Returns:
             Interactable object if collision detected, None otherwise
         """
         if ship_radius is None:
-            # Ship sprite is 22 pixels, so radius is 11 pixels
-            # Convert to game units
-            ship_radius = 11 / RENDER_SCALE
+            ship_radius = SHIP_RADIUS
 
         collision = None
         for interactable in interactables:
@@ -53,10 +53,24 @@ INNER_ZONE_MULTIPLIER = 0.1 # Inner system zone is 1/3 the size of the star
 # Movement and spacing
 BOUNDARY_INSET = 1.0  # Distance from boundary to prevent immediate re-trigger
 BOUNDARY_CLEARANCE = 0.11  # Distance to place ship outside boundary on exit
-MOVEMENT_SPEED = 0.08  # Units per keypress (~8 presses to cross 1 unit)
+MOVEMENT_SPEED = 4.8  # Units per second while a movement key is held (0.08 per 60 Hz step)
+
+# Fixed-step simulation
+SIMULATION_STEP = 1.0 / 60.0  # Seconds of game time per simulation step
+MAX_SIMULATION_CATCHUP = 0.25  # Most time simulated in one frame (after a stall)
 
 # Rendering scale (separates game logic from visual presentation)
 RENDER_SCALE = 100.0  # How many pixels per game unit (1 unit = 8 pixels)
+SHIP_RADIUS = 11 / RENDER_SCALE  # Ship sprite is 22 pixels across; collisions and triggers pad shapes by this
+
+# =============================================================================
+# Planetary Surface Constants
+# Based on game_constants.json planetary_grid
+# =============================================================================
+PLANETARY_GRID_SIZE = 500  # Surface heightmap is 500 x 500 cells
+PLANETARY_TILE_SIZE = 8  # Units per surface cell
+SURFACE_CHUNK_SIZE = 16  # Cells per side of a streamed terrain chunk
+SURFACE_RENDER_SCALE = 2.0  # Pixels per surface unit (1 cell = 16 pixels)
 # =============================================================================
 
 # Local Space Regions (Kept for repurposing reason)
@@ -5,6 +5,7 @@ Manages pushing/popping navigation contexts and calculating
 ship/player position during transitions between contexts
 """
 
+import copy
 import math
 import utils.position_calculator as pos_calc
 
@@ -34,6 +35,15 @@ class NavigationContext:
         self.type = context_type
         self.data = kwargs
 
+    def to_dict(self):
+        """Serialize this context (a deep copy, safe to hand to another thread)"""
+        return {"type": self.type, "data": copy.deepcopy(self.data)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a context from to_dict() output"""
+        return cls(data["type"], **data["data"])
+
 class ContextManager:
     """
     Manages navigation context transitions and calculations
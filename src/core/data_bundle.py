@@ -0,0 +1,310 @@
+"""
+Compiled static data bundle
+
+Packs every JSON file under data/static into one versioned binary file,
+so startup reads a single memory-mapped file instead of parsing dozens of
+small JSON files. DataLoader builds it on first use when it's missing or
+any source file has changed (see ensure_bundle); to build it by hand, or
+to check the data without starting the game, run:
+
+    python src/core/data_bundle.py
+
+Layout:
+    magic (4 bytes) | header length (uint32, little-endian) | header JSON | sections
+
+The header records the format version, the Python version (sections are
+marshal-encoded), a SHA-256 content hash of all sources, and for each
+source file its mtime/size at build time plus the offset, length and
+CRC32 of its section. Sections are checked against their CRC when loaded,
+so a truncated or corrupted bundle is never trusted.
+"""
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+
+BUNDLE_MAGIC = b"SFDB"
+# Bump when the layout or section encoding changes
+BUNDLE_FORMAT_VERSION = 2
+BUNDLE_FILENAME = "static_data.sfdb"
+
+_HEADER_PREFIX = struct.Struct("<4sI")
+
+
+class BundleError(Exception):
+    """Raised when static data fails validation or a bundle can't be read"""
+
+
+def _reject_duplicate_keys(pairs):
+    """object_pairs_hook that refuses duplicate keys (json silently keeps the last)"""
+    result = {}
+    for key, value in pairs:
+        if key in result:
+            raise ValueError(f"duplicate key '{key}'")
+        result[key] = value
+    return result
+
+
+def _reject_constant(name):
+    """parse_constant hook that refuses NaN/Infinity (not valid JSON)"""
+    raise ValueError(f"invalid number '{name}'")
+
+
+def validate_json(path, raw):
+    """
+    Strictly parse one static data file.
+
+    Args:
+        path: Path of the file (for error messages)
+        raw: File contents as bytes
+
+    Returns:
+        dict: Parsed data
+
+    Raises:
+        BundleError: If the file isn't valid JSON, has duplicate keys,
+            or its top level isn't an object
+    """
+    try:
+        data = json.loads(raw.decode("utf-8"),
+                          object_pairs_hook=_reject_duplicate_keys,
+                          parse_constant=_reject_constant)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise BundleError(f"Invalid static data in {path}: {e}")
+
+    if not isinstance(data, dict):
+        raise BundleError(f"Invalid static data in {path}: top level must be an object")
+    return data
+
+
+def build_bundle(static_root, bundle_path):
+    """
+    Validate every JSON file under static_root and compile them into a bundle.
+
+    Every file is checked before anything is written, and the bundle is
+    written to a temp file and renamed into place, so a failed build never
+    leaves a broken bundle behind.
+
+    Args:
+        static_root: Directory containing the static JSON files
+        bundle_path: Output file path
+
+    Returns:
+        str: Content hash of the bundled data
+
+    Raises:
+        BundleError: If any file fails validation (all errors are reported)
+    """
+    static_root = Path(static_root)
+    bundle_path = Path(bundle_path)
+
+    sections = []
+    errors = []
+    content_hash = hashlib.sha256()
+    for path in sorted(static_root.rglob("*.json")):
+        key = path.relative_to(static_root).as_posix()
+        raw = path.read_bytes()
+        try:
+            data = validate_json(path, raw)
+        except BundleError as e:
+            errors.append(str(e))
+            continue
+
+        stat = path.stat()
+        content_hash.update(key.encode("utf-8") + b"\0" + raw + b"\0")
+        sections.append((key, stat, marshal.dumps(data)))
+
+    if errors:
+        raise BundleError("\n".join(errors))
+
+    offset = 0
+    entries = {}
+    for key, stat, blob in sections:
+        entries[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "offset": offset,
+            "length": len(blob),
+            "crc32": zlib.crc32(blob)
+        }
+        offset += len(blob)
+
+    header = json.dumps({
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "python": list(sys.version_info[:2]),
+        "content_hash": content_hash.hexdigest(),
+        "sections": entries
+    }, sort_keys=True).encode("utf-8")
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = bundle_path.with_name(bundle_path.name + f".{os.getpid()}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER_PREFIX.pack(BUNDLE_MAGIC, len(header)))
+        f.write(header)
+        for _, _, blob in sections:
+            f.write(blob)
+    os.replace(temp_path, bundle_path)
+
+    return content_hash.hexdigest()
+
+
+class DataBundle:
+    """
+    Read-only view of a compiled bundle.
+
+    The file is memory-mapped once; a section is only decoded when it's
+    first requested. Sections whose source file has changed since the
+    build (different mtime or size) are reported as stale so the caller
+    can fall back to the JSON file.
+    """
+
+    def __init__(self, bundle_path):
+        """
+        Open and memory-map a bundle.
+
+        Args:
+            bundle_path: Path to the bundle file
+
+        Raises:
+            BundleError: If the file is missing, malformed, or was built by
+                an incompatible format or Python version
+        """
+        self.path = Path(bundle_path)
+        try:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise BundleError(f"Could not open data bundle {self.path}: {e}")
+
+        try:
+            magic, header_length = _HEADER_PREFIX.unpack_from(self._map, 0)
+            if magic != BUNDLE_MAGIC:
+                raise BundleError(f"{self.path} is not a data bundle")
+            header_start = _HEADER_PREFIX.size
+            header = json.loads(bytes(self._map[header_start:header_start + header_length]))
+        except (struct.error, ValueError) as e:
+            self.close()
+            raise BundleError(f"Corrupt data bundle {self.path}: {e}")
+        except BundleError:
+            self.close()
+            raise
+
+        if header.get("format_version") != BUNDLE_FORMAT_VERSION:
+            self.close()
+            raise BundleError(f"Data bundle {self.path} has an old format version")
+        if tuple(header.get("python", ())) != tuple(sys.version_info[:2]):
+            # marshal output is only guaranteed readable by the same Python version
+            self.close()
+            raise BundleError(f"Data bundle {self.path} was built by a different Python version")
+
+        self.content_hash = header["content_hash"]
+        self.sections = header["sections"]
+        self._data_start = header_start + header_length
+
+        data_length = sum(entry["length"] for entry in self.sections.values())
+        if len(self._map) != self._data_start + data_length:
+            self.close()
+            raise BundleError(f"Data bundle {self.path} is truncated or has trailing data")
+
+    def __contains__(self, key):
+        return key in self.sections
+
+    def is_current(self, key, mtime_ns, size):
+        """Whether a section still matches its source file's mtime and size"""
+        entry = self.sections.get(key)
+        return entry is not None and entry["mtime_ns"] == mtime_ns and entry["size"] == size
+
+    def matches_sources(self, static_root):
+        """Whether the bundle holds exactly the JSON files under static_root, all unchanged"""
+        static_root = Path(static_root)
+        paths = list(static_root.rglob("*.json"))
+        if len(paths) != len(self.sections):
+            return False
+        for path in paths:
+            stat = path.stat()
+            if not self.is_current(path.relative_to(static_root).as_posix(), stat.st_mtime_ns, stat.st_size):
+                return False
+        return True
+
+    def load(self, key):
+        """
+        Decode one section.
+
+        Args:
+            key: Source path relative to the static root, with forward slashes
+                (e.g. "ship_equipment/weapons.json")
+
+        Returns:
+            dict: The file's parsed data
+
+        Raises:
+            KeyError: If the file isn't in the bundle
+            BundleError: If the section doesn't match its CRC
+        """
+        entry = self.sections[key]
+        start = self._data_start + entry["offset"]
+        blob = self._map[start:start + entry["length"]]
+        if zlib.crc32(blob) != entry["crc32"]:
+            raise BundleError(f"Data bundle {self.path} is corrupt (section {key})")
+        return marshal.loads(blob)
+
+    def close(self):
+        """Release the memory map"""
+        self._map.close()
+
+
+def open_bundle(bundle_path):
+    """
+    Open a bundle if there is a usable one.
+
+    Returns:
+        DataBundle or None: None if the bundle is missing or can't be used
+    """
+    if not Path(bundle_path).exists():
+        return None
+    try:
+        return DataBundle(bundle_path)
+    except BundleError as e:
+        print(f"WARNING: Ignoring data bundle, loading JSON instead: {e}")
+        return None
+
+
+def ensure_bundle(static_root, bundle_path):
+    """
+    Open the bundle, building it first if it's missing or out of date.
+
+    A bundle is out of date when a JSON file under static_root was added,
+    removed or changed since it was built, or when it can't be used at all
+    (old format, other Python version, corrupt). A build that fails (invalid
+    data, read-only directory) is reported and the JSON files are used.
+
+    Returns:
+        DataBundle or None: None if there's no usable bundle
+    """
+    bundle = open_bundle(bundle_path)
+    if bundle is not None and bundle.matches_sources(static_root):
+        return bundle
+    if bundle is not None:
+        bundle.close()
+
+    try:
+        build_bundle(static_root, bundle_path)
+    except (BundleError, OSError) as e:
+        print(f"WARNING: Could not build data bundle, loading JSON instead: {e}")
+        return None
+    return open_bundle(bundle_path)
+
+
+if __name__ == "__main__":
+    data_root = Path(__file__).parent.parent.parent / "data"
+    try:
+        digest = build_bundle(data_root / "static", data_root / "cache" / BUNDLE_FILENAME)
+    except BundleError as e:
+        print(f"Static data validation failed:\n{e}")
+        sys.exit(1)
+    print(f"Built {data_root / 'cache' / BUNDLE_FILENAME} (content hash {digest[:16]})")
@@ -2,7 +2,70 @@
 Centralized data loading utility for Starflight
 """
 import json
+import os
+import threading
 from pathlib import Path
+from types import MappingProxyType
+from core.data_bundle import BUNDLE_FILENAME, BundleError, ensure_bundle
+
+# Process-wide loader returned by get_data_loader()
+_shared_loader = None
+_shared_loader_lock = threading.Lock()
+
+
+def get_data_loader():
+    """
+    Get the process-wide DataLoader.
+
+    Every state and system should use this instead of creating its own
+    DataLoader, so each static file is parsed once per process.
+
+    Returns:
+        DataLoader: The shared loader
+    """
+    global _shared_loader
+    if _shared_loader is None:
+        with _shared_loader_lock:
+            if _shared_loader is None:
+                _shared_loader = DataLoader()
+    return _shared_loader
+
+
+def freeze(data):
+    """
+    Convert parsed JSON into a read-only view (dicts -> MappingProxyType, lists -> tuples)
+
+    Args:
+        data: Parsed JSON value
+
+    Returns:
+        Read-only equivalent of data
+    """
+    # Exact type checks: this runs over every node of every file, and parsed
+    # JSON only ever contains plain dicts and lists (tuples from the bundle)
+    data_type = type(data)
+    if data_type is dict:
+        return MappingProxyType({key: freeze(value) for key, value in data.items()})
+    if data_type is list or data_type is tuple:
+        return tuple([freeze(value) for value in data])
+    return data
+
+
+def thaw(data):
+    """
+    Make a mutable deep copy of frozen data (the inverse of freeze())
+
+    Args:
+        data: Value returned by load_static()
+
+    Returns:
+        Plain dicts/lists that are safe to modify
+    """
+    if isinstance(data, (dict, MappingProxyType)):
+        return {key: thaw(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [thaw(value) for value in data]
+    return data
 
 
 class DataLoader:
@@ -12,6 +75,14 @@ class DataLoader:
     Provides consistent path resolution and error handling for:
     - Static game data (species, ships, planets, etc.)
     - Runtime data (save files, generated systems)
+
+    Static data comes from the compiled bundle (see core/data_bundle.py,
+    built on first use if it's missing or stale) when the file hasn't
+    changed since the build and its section passes its CRC check, otherwise
+    from the JSON file itself. Either way it is decoded once and memoized by path. Since the same objects
+    are handed to every caller, they are returned as read-only views; use
+    thaw() for a private mutable copy. Cached files are only re-checked
+    against their mtime and size when a caller asks (revalidate=True).
     """
 
     def __init__(self):
@@ -21,7 +92,17 @@ class DataLoader:
         self.data_root = Path(__file__).parent.parent.parent / "data"
         self.static_root = self.data_root / "static"
 
-    def load_static(self, *path_parts):
+        # Compiled bundle of data/static, opened on first use
+        self.bundle_path = self.data_root / "cache" / BUNDLE_FILENAME
+        self._bundle = None
+        self._bundle_opened = False
+
+        # Parsed static data: path -> (mtime_ns, size, frozen data)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "reloads": 0, "from_bundle": 0}
+
+    def load_static(self, *path_parts, revalidate=False):
         """
         Load static game data from the static directory
 
@@ -31,21 +112,149 @@ class DataLoader:
                         - load_static("species.json")
                         - load_static("menu", "main_menu.json")
                         - load_static("planetary_info", "planet_types.json")
+            revalidate: Re-parse if the file's mtime or size changed since it was cached
 
         Returns:
-            dict: Parsed JSON data
+            MappingProxyType: Parsed JSON data as a read-only view (lists become tuples)
 
         Raises:
             FileNotFoundError: If the file doesn't exist
             json.JSONDecodeError: If the file isn't valid JSON
         """
         file_path = self.static_root / Path(*path_parts)
-        return self._load_json(file_path)
+        return self._load_cached(file_path, revalidate, bundle_key="/".join(path_parts))
+
+    def load_cached(self, *path_parts, revalidate=False):
+        """
+        Load read-only data from anywhere under the data directory, memoized like load_static()
+
+        For files the game reads but doesn't write, such as star system
+        definitions in data/systems/. Use load_runtime() for files that
+        change while the game runs.
+
+        Args:
+            *path_parts: Path components relative to src/data/
+                        Example: load_cached("systems", "home_system.json")
+            revalidate: Re-parse if the file's mtime or size changed since it was cached
+
+        Returns:
+            MappingProxyType: Parsed JSON data as a read-only view
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            json.JSONDecodeError: If the file isn't valid JSON
+        """
+        return self._load_cached(self.data_root / Path(*path_parts), revalidate)
+
+    def _load_cached(self, file_path, revalidate, bundle_key=None):
+        """
+        Return memoized, frozen data for a file, parsing it on first use
+
+        Args:
+            file_path: Absolute path to the JSON file
+            revalidate: Compare mtime/size against the cached entry first
+            bundle_key: Section name in the static data bundle, if it could be bundled
+
+        Returns:
+            Frozen parsed data
+        """
+        key = str(file_path)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and not revalidate:
+                self.stats["hits"] += 1
+                return entry[2]
+
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {file_path}")
+
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                self.stats["hits"] += 1
+                return entry[2]
+
+        data = None
+        if bundle_key is not None:
+            data = self._load_from_bundle(bundle_key, stat)
+        if data is None:
+            data = self._load_json(file_path)
+        data = freeze(data)
+        with self._cache_lock:
+            self.stats["reloads" if key in self._cache else "misses"] += 1
+            self._cache[key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    @property
+    def bundle(self):
+        """The compiled static data bundle (built if missing or stale), or None if there isn't a usable one"""
+        if not self._bundle_opened:
+            with self._cache_lock:
+                if not self._bundle_opened:
+                    self._bundle = ensure_bundle(self.static_root, self.bundle_path)
+                    self._bundle_opened = True
+        return self._bundle
+
+    def _load_from_bundle(self, key, stat):
+        """
+        Decode a static file's section from the bundle if it's current
+
+        Args:
+            key: Section name (path relative to the static root, "/"-separated)
+            stat: os.stat() result for the JSON file
+
+        Returns:
+            dict or None: Parsed data, or None if the file must be read as JSON
+        """
+        bundle = self.bundle
+        if bundle is None:
+            return None
+
+        # A file edited since the bundle was built is stale; use the JSON
+        if not bundle.is_current(key, stat.st_mtime_ns, stat.st_size):
+            return None
+        try:
+            data = bundle.load(key)
+        except BundleError as e:
+            print(f"WARNING: {e}; loading JSON instead")
+            return None
+        with self._cache_lock:
+            self.stats["from_bundle"] += 1
+        return data
+
+    def invalidate(self, *path_parts):
+        """
+        Drop cached static data (one file, or everything if no path is given)
+
+        Args:
+            *path_parts: Path components relative to src/data/static/
+        """
+        with self._cache_lock:
+            if path_parts:
+                self._cache.pop(str(self.static_root / Path(*path_parts)), None)
+            else:
+                self._cache.clear()
+
+    def cache_info(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: hits, misses, reloads, sections decoded from the bundle
+                  and the number of cached files
+        """
+        with self._cache_lock:
+            return {**self.stats, "cached_files": len(self._cache)}
 
     def load_runtime(self, *path_parts):
         """
         Load runtime game data (save files, procedurally generated data)
 
+        Runtime data is written by the game itself, so it isn't cached and
+        comes back as ordinary mutable dicts.
+
         Args:
             *path_parts: Path components relative to src/data/
                         Examples:
@@ -0,0 +1,282 @@
+"""
+Game-time event scheduler
+Runs delayed and recurring game events (distress calls, patrol arrivals,
+story triggers) when simulation time reaches them, so systems don't have
+to poll every frame for things that happen rarely
+"""
+
+import copy
+import heapq
+
+
+class ScheduledEvent:
+    """
+    One scheduled event; also the handle used to cancel it.
+
+    Events carry a type name and a JSON-compatible payload rather than a
+    callback, so they can be saved and run again after loading.
+    """
+
+    __slots__ = ("event_id", "event_type", "time", "payload", "interval", "cancelled")
+
+    def __init__(self, event_id, event_type, time, payload=None, interval=None):
+        """
+        Args:
+            event_id: Id unique within the scheduler
+            event_type: Name of the handler that runs the event
+            time: Game time (seconds) the event is due
+            payload: JSON-compatible data for the handler
+            interval: Seconds between repeats (None for a one-off event)
+        """
+        self.event_id = event_id
+        self.event_type = event_type
+        self.time = time
+        self.payload = payload if payload is not None else {}
+        self.interval = interval
+        self.cancelled = False
+
+    def to_dict(self):
+        """Serialize the event (the payload is copied)"""
+        return {
+            "id": self.event_id,
+            "type": self.event_type,
+            "time": self.time,
+            "payload": copy.deepcopy(self.payload),
+            "interval": self.interval
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an event from to_dict() output"""
+        return cls(data["id"], data["type"], data["time"], data["payload"], data["interval"])
+
+
+class EventScheduler:
+    """
+    Priority queue of game events keyed on simulation time.
+
+    Events sit in a heap ordered by (time, id), so advance() only looks at
+    events that are actually due; a frame with nothing due costs one
+    comparison. Cancelled events are skipped when they reach the top of
+    the heap, and the heap is rebuilt without them once they make up half
+    of it.
+
+    Handlers are registered per event type and called once per advance()
+    with every event of that type that came due (in due order), so a
+    system with hundreds of events handles them in one batch. Event types
+    are dispatched in the order their first event came due. Events a
+    handler schedules run on a later advance(), never the same one.
+
+    Due events with no handler registered yet wait in pending and are
+    delivered on the first advance() after their handler registers.
+
+    Example:
+        scheduler.register_handler("distress_call", on_distress_calls)
+        handle = scheduler.schedule("distress_call", 90.0, {"system": "systems/home_system.json"})
+        scheduler.schedule("fuel_tick", 1.0, interval=1.0)
+        scheduler.cancel(handle)
+        scheduler.advance(dt)
+    """
+
+    # Rebuild the heap once cancelled entries make up this share of it
+    COMPACT_RATIO = 0.5
+
+    def __init__(self, time=0.0):
+        """
+        Initialize an empty scheduler
+
+        Args:
+            time: Current game time in seconds
+        """
+        self.time = time
+        self.handlers = {}   # event type -> handler(list of ScheduledEvent)
+        self.events = {}     # event id -> live ScheduledEvent
+        self.pending = []    # Due events whose type had no handler
+        self.next_id = 1
+        self._heap = []      # (time, event id, event)
+        self._cancelled = 0  # Cancelled entries still in the heap
+
+    def __len__(self):
+        """Number of events waiting to run (scheduled and pending)"""
+        return len(self.events)
+
+    def register_handler(self, event_type, handler):
+        """
+        Set the function that runs events of a type
+
+        Args:
+            event_type: Event type name
+            handler: Called with a list of due ScheduledEvents of that type
+        """
+        self.handlers[event_type] = handler
+
+    def unregister_handler(self, event_type):
+        """Stop handling an event type (its due events wait in pending)"""
+        self.handlers.pop(event_type, None)
+
+    def schedule(self, event_type, delay, payload=None, interval=None):
+        """
+        Schedule an event some time from now
+
+        Args:
+            event_type: Name of the handler that runs it
+            delay: Seconds of game time until it's due
+            payload: JSON-compatible data passed to the handler
+            interval: If given, repeat every interval seconds after that
+
+        Returns:
+            ScheduledEvent: Handle for cancel()
+
+        Raises:
+            ValueError: If interval isn't positive
+        """
+        return self.schedule_at(event_type, self.time + delay, payload, interval)
+
+    def schedule_at(self, event_type, time, payload=None, interval=None):
+        """
+        Schedule an event at an absolute game time (see schedule())
+
+        Returns:
+            ScheduledEvent: Handle for cancel()
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError(f"Recurring event interval must be positive, got {interval}")
+        event = ScheduledEvent(self.next_id, event_type, time, payload, interval)
+        self.next_id += 1
+        self._push(event)
+        return event
+
+    def cancel(self, event):
+        """
+        Cancel a scheduled event (and its repeats)
+
+        Args:
+            event: ScheduledEvent handle or its event id
+
+        Returns:
+            bool: True if the event was waiting to run
+        """
+        event_id = event if isinstance(event, int) else event.event_id
+        event = self.events.pop(event_id, None)
+        if event is None:
+            return False
+        event.cancelled = True
+        if event in self.pending:
+            self.pending.remove(event)
+        else:
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) * self.COMPACT_RATIO:
+                self._compact()
+        return True
+
+    def next_event_time(self):
+        """Game time of the next scheduled event (None if there isn't one)"""
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+        return self._heap[0][0] if self._heap else None
+
+    def advance(self, dt):
+        """
+        Move game time forward and run every event that came due
+
+        Recurring events run once for each time they came due, so a long
+        step doesn't drop repeats.
+
+        Args:
+            dt: Seconds of game time to advance
+
+        Returns:
+            int: Number of events run
+        """
+        self.time += dt
+        due = self._pop_due()
+        if self.pending:
+            waiting, self.pending = self.pending, []
+            due = waiting + due
+
+        # Batch by type, in the order each type first came due
+        batches = {}
+        for event in due:
+            batches.setdefault(event.event_type, []).append(event)
+
+        dispatched = 0
+        for event_type, batch in batches.items():
+            handler = self.handlers.get(event_type)
+            if handler is None:
+                self.pending.extend(batch)
+                continue
+            # Skip events cancelled since they came due (by an earlier handler,
+            # or while pending)
+            batch = [event for event in batch if event.event_id in self.events]
+            for event in batch:
+                if event.interval is None:
+                    self.events.pop(event.event_id, None)
+            if batch:
+                handler(batch)
+                dispatched += len(batch)
+        return dispatched
+
+    def _pop_due(self):
+        """Take every event due by now off the heap, rescheduling repeats"""
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= self.time:
+            _, _, event = heapq.heappop(heap)
+            if event.cancelled:
+                self._cancelled -= 1
+                continue
+            if event.interval is None:
+                due.append(event)
+                continue
+            # Hand the handler a copy fixed at this occurrence's time; the
+            # live event moves on to its next occurrence
+            occurrence = ScheduledEvent(event.event_id, event.event_type, event.time, event.payload, event.interval)
+            due.append(occurrence)
+            event.time += event.interval
+            heapq.heappush(heap, (event.time, event.event_id, event))
+        return due
+
+    def _push(self, event):
+        """Add a live event to the heap"""
+        self.events[event.event_id] = event
+        heapq.heappush(self._heap, (event.time, event.event_id, event))
+
+    def _compact(self):
+        """Rebuild the heap without cancelled entries"""
+        self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+
+    def to_dict(self):
+        """
+        Serialize the scheduler for a save (handlers aren't saved)
+
+        Returns:
+            dict: Game time, next id, and every waiting event
+        """
+        scheduled = sorted(
+            (entry for entry in self._heap if not entry[2].cancelled), key=lambda entry: entry[:2])
+        return {
+            "time": self.time,
+            "next_id": self.next_id,
+            "events": [event.to_dict() for _, _, event in scheduled],
+            "pending": [event.to_dict() for event in self.pending]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a scheduler from to_dict() output
+
+        Handlers must be registered again before the events come due.
+        """
+        scheduler = cls(data["time"])
+        scheduler.next_id = data["next_id"]
+        for event_data in data["events"]:
+            scheduler._push(ScheduledEvent.from_dict(event_data))
+        scheduler.pending = [ScheduledEvent.from_dict(event_data) for event_data in data["pending"]]
+        for event in scheduler.pending:
+            # One-off events are live only here; repeats are already live in the heap
+            scheduler.events.setdefault(event.event_id, event)
+        return scheduler
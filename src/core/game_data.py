@@ -0,0 +1,441 @@
+"""
+Typed game data records
+Validates static data files against declared schemas and builds frozen,
+integer-indexed records plus lookup tables for hot game logic
+"""
+import re
+import threading
+from dataclasses import dataclass
+from typing import Tuple
+import numpy as np
+from core.data_loader import get_data_loader
+
+# Equipment categories, in id order
+EQUIPMENT_WEAPON = "weapon"
+EQUIPMENT_ENGINE = "engine"
+EQUIPMENT_SHIELD = "shield"
+EQUIPMENT_ARMOR = "armor"
+EQUIPMENT_SPECIAL = "special"
+
+# (category, file, top-level key, grouped): grouped files nest items one
+# level deeper by type (e.g. weapons -> laser -> class_1)
+EQUIPMENT_FILES = (
+    (EQUIPMENT_WEAPON, "weapons.json", "weapons", True),
+    (EQUIPMENT_ENGINE, "engines.json", "engine", False),
+    (EQUIPMENT_SHIELD, "shields.json", "shield", False),
+    (EQUIPMENT_ARMOR, "armor.json", "armor", False),
+    (EQUIPMENT_SPECIAL, "special.json", "special", True),
+)
+
+# Rarity tiers, most common first
+RARITIES = ("common", "uncommon", "rare")
+
+# Schemas: field -> (type, required). float fields also accept ints.
+EQUIPMENT_SCHEMA = {
+    "name": (str, True),
+    "description": (str, True),
+    "class": (int, False),
+    "cost": (int, True),
+    "power_consumption_rate": (float, False),
+}
+EQUIPMENT_STAT_SCHEMAS = {
+    EQUIPMENT_WEAPON: {"damage": (float, True)},
+    EQUIPMENT_ENGINE: {},
+    EQUIPMENT_SHIELD: {"protection_value": (float, True)},
+    EQUIPMENT_ARMOR: {"durability": (float, True)},
+    EQUIPMENT_SPECIAL: {},
+}
+SKILL_SCHEMA = {
+    "description": (str, True),
+    "associated_role": (str, True),
+}
+SPECIES_SCHEMA = {
+    "name": (str, True),
+    "description": (str, True),
+    "portrait": (str, True),
+    "communication_style": (str, True),
+    "starting_skill_value": (dict, True),
+    "maximum_skill_value": (dict, True),
+    "species_affinities": (dict, True),
+}
+MINERAL_SCHEMA = {
+    "name": (str, True),
+    "nickname": (str, False),
+    "value": (int, True),
+    "rarity": (str, True),
+    "is_fuel": (bool, False),
+    "is_repair_material": (bool, False),
+}
+SHIP_CLASS_SCHEMA = {
+    "name": (str, True),
+    "designer_species": (str, True),
+    "size_class": (str, True),
+    "sprite": (str, True),
+    "base_hull": (int, True),
+    "available_cargo_bays": (int, True),
+    "max_equipment_class": (dict, True),
+}
+
+_CLASS_KEY = re.compile(r"^class_(\d+)$")
+
+
+class SchemaError(ValueError):
+    """Raised when a static data file doesn't match its schema"""
+
+
+def validate_fields(where, raw, schema):
+    """
+    Check one raw record against a schema.
+
+    Args:
+        where: Description of the record for error messages (e.g. "minerals.json: iron")
+        raw: The record's dict
+        schema: Field -> (type, required)
+
+    Raises:
+        SchemaError: On a missing required field, an unknown field, or a wrong type
+    """
+    unknown = set(raw) - set(schema)
+    if unknown:
+        raise SchemaError(f"{where}: unknown field(s) {', '.join(sorted(unknown))}")
+
+    for field, (field_type, required) in schema.items():
+        if field not in raw:
+            if required:
+                raise SchemaError(f"{where}: missing required field '{field}'")
+            continue
+
+        value = raw[field]
+        if field_type is float:
+            valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+        elif field_type is int:
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        elif field_type is dict:
+            valid = hasattr(value, "items")
+        else:
+            valid = isinstance(value, field_type)
+        if not valid:
+            raise SchemaError(f"{where}: field '{field}' should be {field_type.__name__}, "
+                              f"got {type(value).__name__}")
+
+
+@dataclass(frozen=True, slots=True)
+class EquipmentRecord:
+    """One piece of ship equipment (weapon, engine, shield, armor or special)"""
+    id: int
+    key: str                 # e.g. "laser.class_2"
+    category: str            # EQUIPMENT_* constant
+    group: str               # e.g. "laser", "missile_launcher", "scanners"; the category if ungrouped
+    name: str
+    description: str
+    equipment_class: int     # 1-5, or 0 for unclassed gear (mining laser, scanners)
+    cost: int
+    power_consumption_rate: float = 0.0
+    damage: float = 0.0
+    protection_value: float = 0.0
+    durability: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SkillRecord:
+    """A crew skill"""
+    id: int
+    key: str
+    description: str
+    associated_role: str
+
+
+@dataclass(frozen=True, slots=True)
+class SpeciesRecord:
+    """A crew species; skill tuples are indexed by skill id, affinities by species id"""
+    id: int
+    key: str
+    name: str
+    description: str
+    portrait: str
+    communication_style: str
+    starting_skills: Tuple[int, ...]
+    maximum_skills: Tuple[int, ...]
+    affinities: Tuple[int, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class MineralRecord:
+    """A tradeable mineral; id matches its position in minerals.json"""
+    id: int
+    key: str
+    name: str
+    value: int
+    rarity: str
+    rarity_rank: int         # Index into RARITIES (0 = common)
+    nickname: str = ""
+    is_fuel: bool = False
+    is_repair_material: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class ShipClassRecord:
+    """A ship hull design"""
+    id: int
+    key: str
+    name: str
+    designer_species_id: int
+    size_class: str
+    sprite: str
+    base_hull: int
+    cargo_bays: int
+    max_engine_class: int
+    max_shield_class: int
+    max_armor_class: int
+    max_weapon_class: int
+
+
+class GameData:
+    """
+    Validated, typed view of the static game data.
+
+    Records are frozen and slotted, and each kind is numbered from 0 in
+    file order, so an id indexes straight into its tuple (game_data.minerals[3])
+    and into the NumPy column arrays (game_data.mineral_value[3]).
+
+    Every file is checked against its schema when GameData is built, so
+    hot code can trust the records instead of re-checking dict keys.
+
+    Example:
+        laser = game_data.equipment_by_key["laser.class_2"]
+        laser.damage  # 20.0
+        game_data.equipment_by_class[("shield", 3)]  # Class 3 shield's id
+    """
+
+    def __init__(self, data_loader=None):
+        """
+        Load and validate all record data
+
+        Args:
+            data_loader: Optional DataLoader (the shared loader if None)
+
+        Raises:
+            SchemaError: If any file doesn't match its schema or a reference
+                (skill, species) doesn't resolve
+        """
+        self.data_loader = data_loader or get_data_loader()
+
+        self.skills = self._load_skills()
+        self.skill_ids = {skill.key: skill.id for skill in self.skills}
+
+        self.species = self._load_species()
+        self.species_ids = {species.key: species.id for species in self.species}
+
+        self.equipment = self._load_equipment()
+        self.equipment_by_key = {item.key: item for item in self.equipment}
+
+        self.minerals = self._load_minerals()
+        self.mineral_ids = {mineral.key: mineral.id for mineral in self.minerals}
+
+        self.ship_classes = self._load_ship_classes()
+        self.ship_class_ids = {ship.key: ship.id for ship in self.ship_classes}
+
+        self._build_indexes()
+
+    def _load_skills(self):
+        """Build skill records from skills.json"""
+        raw = self.data_loader.load_static("skills.json")["skills"]
+        records = []
+        for skill_id, (key, entry) in enumerate(raw.items()):
+            validate_fields(f"skills.json: {key}", entry, SKILL_SCHEMA)
+            records.append(SkillRecord(skill_id, key, entry["description"], entry["associated_role"]))
+        return tuple(records)
+
+    def _load_species(self):
+        """Build species records from species.json (skills must be loaded first)"""
+        raw = self.data_loader.load_static("species.json")["species"]
+        species_keys = list(raw.keys())
+        records = []
+        for species_id, (key, entry) in enumerate(raw.items()):
+            where = f"species.json: {key}"
+            validate_fields(where, entry, SPECIES_SCHEMA)
+            records.append(SpeciesRecord(
+                id=species_id,
+                key=key,
+                name=entry["name"],
+                description=entry["description"],
+                portrait=entry["portrait"],
+                communication_style=entry["communication_style"],
+                starting_skills=self._skill_vector(where, entry["starting_skill_value"]),
+                maximum_skills=self._skill_vector(where, entry["maximum_skill_value"]),
+                affinities=self._affinity_vector(where, entry["species_affinities"], species_keys)
+            ))
+        return tuple(records)
+
+    def _skill_vector(self, where, values):
+        """Turn a {skill: value} dict into a tuple indexed by skill id"""
+        unknown = set(values) - set(self.skill_ids)
+        if unknown:
+            raise SchemaError(f"{where}: unknown skill(s) {', '.join(sorted(unknown))}")
+        missing = set(self.skill_ids) - set(values)
+        if missing:
+            raise SchemaError(f"{where}: missing skill(s) {', '.join(sorted(missing))}")
+        return tuple(int(values[skill.key]) for skill in self.skills)
+
+    def _affinity_vector(self, where, values, species_keys):
+        """Turn a {species: affinity} dict into a tuple indexed by species id (0 if unlisted)"""
+        unknown = set(values) - set(species_keys)
+        if unknown:
+            raise SchemaError(f"{where}: affinity for unknown species {', '.join(sorted(unknown))}")
+        return tuple(int(values.get(key, 0)) for key in species_keys)
+
+    def _load_equipment(self):
+        """Build equipment records from every ship_equipment file"""
+        records = []
+        for category, filename, top_key, grouped in EQUIPMENT_FILES:
+            raw = self.data_loader.load_static("ship_equipment", filename)[top_key]
+            groups = raw.items() if grouped else [(category, raw)]
+            schema = {**EQUIPMENT_SCHEMA, **EQUIPMENT_STAT_SCHEMAS[category]}
+
+            for group, items in groups:
+                for item_key, entry in items.items():
+                    key = f"{group}.{item_key}"
+                    where = f"{filename}: {key}"
+                    validate_fields(where, entry, schema)
+                    records.append(EquipmentRecord(
+                        id=len(records),
+                        key=key,
+                        category=category,
+                        group=group,
+                        name=entry["name"],
+                        description=entry["description"],
+                        equipment_class=self._equipment_class(where, item_key, entry),
+                        cost=entry["cost"],
+                        power_consumption_rate=float(entry.get("power_consumption_rate", 0.0)),
+                        damage=float(entry.get("damage", 0.0)),
+                        protection_value=float(entry.get("protection_value", 0.0)),
+                        durability=float(entry.get("durability", 0.0))
+                    ))
+        return tuple(records)
+
+    def _equipment_class(self, where, item_key, entry):
+        """Equipment class from the "class" field, else from a "class_N" key, else 0"""
+        match = _CLASS_KEY.match(item_key)
+        key_class = int(match.group(1)) if match else None
+        if "class" in entry:
+            if key_class is not None and key_class != entry["class"]:
+                raise SchemaError(f"{where}: class {entry['class']} doesn't match key '{item_key}'")
+            return entry["class"]
+        return key_class or 0
+
+    def _load_minerals(self):
+        """Build mineral records from minerals.json"""
+        raw = self.data_loader.load_static("minerals.json")["minerals"]
+        records = []
+        for mineral_id, (key, entry) in enumerate(raw.items()):
+            where = f"minerals.json: {key}"
+            validate_fields(where, entry, MINERAL_SCHEMA)
+            if entry["rarity"] not in RARITIES:
+                raise SchemaError(f"{where}: unknown rarity '{entry['rarity']}'")
+            records.append(MineralRecord(
+                id=mineral_id,
+                key=key,
+                name=entry["name"],
+                value=entry["value"],
+                rarity=entry["rarity"],
+                rarity_rank=RARITIES.index(entry["rarity"]),
+                nickname=entry.get("nickname", ""),
+                is_fuel=entry.get("is_fuel", False),
+                is_repair_material=entry.get("is_repair_material", False)
+            ))
+        return tuple(records)
+
+    def _load_ship_classes(self):
+        """Build ship class records from ships.json (species must be loaded first)"""
+        raw = self.data_loader.load_static("ships.json")["ship_classes"]
+        records = []
+        for ship_id, (key, entry) in enumerate(raw.items()):
+            where = f"ships.json: {key}"
+            validate_fields(where, entry, SHIP_CLASS_SCHEMA)
+
+            designer = entry["designer_species"]
+            if designer not in self.species_ids:
+                raise SchemaError(f"{where}: unknown designer species '{designer}'")
+            max_class = entry["max_equipment_class"]
+            slots = (EQUIPMENT_ENGINE, EQUIPMENT_SHIELD, EQUIPMENT_ARMOR, EQUIPMENT_WEAPON)
+            missing = [slot for slot in slots if slot not in max_class]
+            if missing:
+                raise SchemaError(f"{where}: max_equipment_class missing {', '.join(missing)}")
+
+            records.append(ShipClassRecord(
+                id=ship_id,
+                key=key,
+                name=entry["name"],
+                designer_species_id=self.species_ids[designer],
+                size_class=entry["size_class"],
+                sprite=entry["sprite"],
+                base_hull=entry["base_hull"],
+                cargo_bays=entry["available_cargo_bays"],
+                max_engine_class=max_class[EQUIPMENT_ENGINE],
+                max_shield_class=max_class[EQUIPMENT_SHIELD],
+                max_armor_class=max_class[EQUIPMENT_ARMOR],
+                max_weapon_class=max_class[EQUIPMENT_WEAPON]
+            ))
+        return tuple(records)
+
+    def _build_indexes(self):
+        """Build lookup tables and NumPy columns over the records"""
+        # Equipment: ids per category/group, id per (group, class), columns by id
+        self.equipment_by_category = {}
+        self.equipment_by_group = {}
+        self.equipment_by_class = {}
+        for item in self.equipment:
+            self.equipment_by_category.setdefault(item.category, []).append(item.id)
+            self.equipment_by_group.setdefault(item.group, []).append(item.id)
+            if item.equipment_class:
+                self.equipment_by_class[(item.group, item.equipment_class)] = item.id
+        self.equipment_by_category = {k: tuple(v) for k, v in self.equipment_by_category.items()}
+        self.equipment_by_group = {k: tuple(v) for k, v in self.equipment_by_group.items()}
+
+        self.equipment_cost = np.array([e.cost for e in self.equipment], dtype=np.int64)
+        self.equipment_class = np.array([e.equipment_class for e in self.equipment], dtype=np.int8)
+        self.equipment_power = np.array([e.power_consumption_rate for e in self.equipment], dtype=np.float32)
+        self.equipment_damage = np.array([e.damage for e in self.equipment], dtype=np.float32)
+        self.equipment_protection = np.array([e.protection_value for e in self.equipment], dtype=np.float32)
+        self.equipment_durability = np.array([e.durability for e in self.equipment], dtype=np.float32)
+        # Ids from cheapest to most expensive
+        self.equipment_by_cost = tuple(np.argsort(self.equipment_cost, kind="stable").tolist())
+
+        # Minerals: ids per rarity, columns by id, ids sorted by value
+        self.minerals_by_rarity = {
+            rarity: tuple(m.id for m in self.minerals if m.rarity == rarity) for rarity in RARITIES
+        }
+        self.mineral_value = np.array([m.value for m in self.minerals], dtype=np.int64)
+        self.mineral_rarity = np.array([m.rarity_rank for m in self.minerals], dtype=np.int8)
+        self.minerals_by_value = tuple(np.argsort(self.mineral_value, kind="stable").tolist())
+
+        # Species: skill tables indexed [species_id, skill_id], affinity [species, species]
+        self.species_starting_skills = np.array([s.starting_skills for s in self.species], dtype=np.int16)
+        self.species_maximum_skills = np.array([s.maximum_skills for s in self.species], dtype=np.int16)
+        self.species_affinity = np.array([s.affinities for s in self.species], dtype=np.int16)
+
+        for table in (self.equipment_cost, self.equipment_class, self.equipment_power,
+                      self.equipment_damage, self.equipment_protection, self.equipment_durability,
+                      self.mineral_value, self.mineral_rarity, self.species_starting_skills,
+                      self.species_maximum_skills, self.species_affinity):
+            table.flags.writeable = False  # Shared tables, like the records themselves
+
+
+# Process-wide instance returned by get_game_data()
+_shared_game_data = None
+_shared_game_data_lock = threading.Lock()
+
+
+def get_game_data():
+    """
+    Get the process-wide GameData, validating and building it on first use.
+
+    Returns:
+        GameData: The shared records
+    """
+    global _shared_game_data
+    if _shared_game_data is None:
+        with _shared_game_data_lock:
+            if _shared_game_data is None:
+                _shared_game_data = GameData()
+    return _shared_game_data
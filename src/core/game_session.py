@@ -1,10 +1,15 @@
 """
 Base class for game session
 """
+import copy
 from operator import index
 from entities.ship import Ship
 from entities.celestial_objects.star_system import StarSystem
 from core.context_manager import ContextManager, NavigationContext
+from core.event_scheduler import EventScheduler
+from core.message_log import CHANNEL_SYSTEM, MessageLog
+from core.trigger_index import TriggerIndex, context_key
+from core.system_loader import HOME_SYSTEM_ID, get_system_loader
 
 from .constants import (
     CONTEXT_HYPERSPACE,
@@ -21,7 +26,9 @@ class GameSession:
         """
         Build the context chain from top to bottom
         """
-        self.home_system = StarSystem("data/systems/home_system.json")
+        # Star systems by system id, loaded on first access (see from_save_data)
+        self._systems = {}
+        self.home_system = StarSystem(HOME_SYSTEM_ID)
         self.current_system = self.home_system
 
         # Find the planet with Starport (should be Homeworld)
@@ -61,30 +68,195 @@ class GameSession:
         # Give the player a new ship
         self.player_ship = Ship(ship_id=0)
 
-        # Message log for player feedback
-        self.messages = [] # list of message strings
-        self.max_messages = 20 # Keep the last 20 messages
+        # Message log for player feedback (older messages page out to a journal file)
+        self.messages = MessageLog()
+
+        # Delayed and recurring game events, on the game-time clock
+        self.events = EventScheduler()
+
+        # Story and encounter trigger regions. Only progress is saved (retired
+        # one-shot triggers and the visit in progress); the regions come from
+        # data, and nothing adds any yet
+        self.triggers = TriggerIndex()
+
+        # Background planet generation, started on first use
+        self._planet_pregen = None
+
+        # Mineral market, opened on first use (see market)
+        self._market = None
+        self._saved_market = None
+
+    @classmethod
+    def from_save_data(cls, data):
+        """
+        Restore a session from saved data (already migrated to SAVE_VERSION).
+
+        Only what the first frame needs is rebuilt up front: the navigation
+        stack and the player's ship. Star systems are loaded through the
+        SystemLoader the first time they're accessed, and the message log is
+        rebuilt on first read, so loading stays fast as saves grow.
+
+        Args:
+            data: The "data" part of SaveManager.load_save_data()
+
+        Returns:
+            GameSession: The restored session
+        """
+        session = cls.__new__(cls)
+        session._systems = {}
+        session._home_system_id = data["home_system"]["id"]
+        session._current_system_id = data["current_system"]["id"]
+
+        session.context_manager = ContextManager(navigation_stack=[
+            NavigationContext.from_dict(context) for context in data["navigation_stack"]
+        ])
+        session.interaction_target = data["interaction_target"]
+        session.player_ship = Ship.from_dict(data["ship"])
+
+        session._messages = None
+        session._saved_messages = data["messages"]
+
+        session.events = EventScheduler.from_dict(data["events"])
+        session.triggers = TriggerIndex.from_dict(data["triggers"])
+
+        session._planet_pregen = None
+        session._market = None
+        session._saved_market = data["market"]
+        return session
+
+    @property
+    def home_system(self):
+        """The player's home star system"""
+        return self._get_system(self._home_system_id)
+
+    @home_system.setter
+    def home_system(self, system):
+        self._systems[system.system_id] = system
+        self._home_system_id = system.system_id
+
+    @property
+    def current_system(self):
+        """The star system the player is in"""
+        return self._get_system(self._current_system_id)
+
+    @current_system.setter
+    def current_system(self, system):
+        self._systems[system.system_id] = system
+        self._current_system_id = system.system_id
+
+    def _get_system(self, system_id):
+        """Get a star system by id, loading it on first access"""
+        system = self._systems.get(system_id)
+        if system is None:
+            system = StarSystem(system_id)
+            self._systems[system_id] = system
+        return system
+
+    @property
+    def messages(self):
+        """Message log (rebuilt from saved data on first read after loading)"""
+        if self._messages is None:
+            self._messages = MessageLog.from_dict(self._saved_messages)
+            self._saved_messages = None
+        return self._messages
+
+    @messages.setter
+    def messages(self, value):
+        self._messages = value
+        self._saved_messages = None
+
+    @property
+    def planet_pregen(self):
+        """Builds planet surfaces in the background before the player lands"""
+        if self._planet_pregen is None:
+            # Imported here: systems modules import core, so a module-level import would be circular
+            from systems.planet_pregen import PlanetPregenService
+            self._planet_pregen = PlanetPregenService()
+        return self._planet_pregen
+
+    @property
+    def market(self):
+        """
+        Mineral prices at every station, ticking on the event scheduler.
+
+        Every system SystemLoader can list has ports, including systems
+        added since a save was made.
+
+        Opened on first use: until a trade moves them, prices sit at each
+        port's equilibrium, so there's nothing to simulate before then.
+        After a load, economy ticks that came due while it was closed wait
+        in the scheduler and run when it reopens.
+        """
+        if self._market is None:
+            # Imported here: systems modules import core, so a module-level import would be circular
+            from systems.mineral_market import MineralMarket
+            system_ids = sorted({self._home_system_id, *get_system_loader().system_ids()})
+            if self._saved_market is None:
+                self._market = MineralMarket.for_systems(system_ids)
+            else:
+                # Systems added since the save open their ports now
+                self._market = MineralMarket.from_dict(self._saved_market)
+                self._market.add_systems(system_ids)
+                self._saved_market = None
+            self._market.attach(self.events)
+        return self._market
+
+    def shutdown(self):
+        """Stop background work owned by the session"""
+        if self._planet_pregen is not None:
+            self._planet_pregen.shutdown()
+        if self._messages is not None:
+            self._messages.close()
 
     def get_current_context(self):
         """Return the current context"""
         return self.current_context
 
+    def get_context_key(self):
+        """Key of the current navigation context in the trigger index"""
+        return context_key(self._current_system_id, self.current_context)
+
     def get_hyperspace_coordinates(self):
         """Return the hyperspace coordinates from the current context"""
         return self.context_manager.navigation_stack[0].data.get("ship_coords")
     
-    def add_message(self, message):
+    def add_message(self, message, channel=CHANNEL_SYSTEM):
         """
-        Add a message to the message log.
+        Add a message to the message log, stamped with the game time.
 
         Args:
             message (str): The message to add to the log.
+            channel (str): Message channel (see core.message_log.CHANNELS)
+
+        Returns:
+            Message: The logged message
         """
-        self.messages.append(message)
+        return self.messages.add(message, channel, self.events.time)
 
-        # Keep only the most recent messages
-        if len(self.messages) > self.max_messages:
-            self.messages.pop(0) # Remove oldest message
+    def to_save_data(self):
+        """
+        Capture the session as plain, JSON-compatible data for the SaveManager.
+
+        Everything is copied, so the result can be written on another thread
+        while the game keeps running.
+
+        Returns:
+            dict: Navigation stack, ship, messages, scheduled events, trigger progress, market and system state
+        """
+        # Ids are used directly so saving never forces a lazy system load
+        messages = copy.deepcopy(self._saved_messages) if self._messages is None else self._messages.to_dict()
+        market = copy.deepcopy(self._saved_market) if self._market is None else self._market.to_dict()
+        return {
+            "home_system": {"id": self._home_system_id},
+            "current_system": {"id": self._current_system_id},
+            "navigation_stack": [context.to_dict() for context in self.context_manager.navigation_stack],
+            "interaction_target": copy.deepcopy(self.interaction_target),
+            "ship": self.player_ship.to_dict(),
+            "messages": messages,
+            "events": self.events.to_dict(),
+            "triggers": self.triggers.to_dict(),
+            "market": market
+        }
 
     def set_interaction(self, target_type, **kwargs):
         """
@@ -49,3 +49,7 @@ class GameState:
     def on_exit(self):
         """Called when leaving this state"""
         pass
+
+    def shutdown(self):
+        """Stop background work owned by this state (called once, at quit)"""
+        pass
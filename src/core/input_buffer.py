@@ -0,0 +1,129 @@
+"""
+Timestamped key buffer
+Records when keys go down and up so held time can be measured exactly,
+independent of the frame rate
+"""
+import time
+
+# A press and release seen in the same frame still counts as held this long,
+# so quick taps aren't lost between frames
+MIN_TAP_SECONDS = 1.0 / 60.0
+
+# How long released intervals are kept before trim() drops them
+DEFAULT_HISTORY_SECONDS = 1.0
+
+
+class InputBuffer:
+    """
+    Key-down intervals on a perf_counter() timeline.
+
+    Every press becomes an interval [down, up) (open while the key is
+    held). held_time() measures how much of a time window a set of keys
+    covered, merging overlaps, so a fixed-step simulation can move by
+    exactly the time each key was held during each step, whatever the
+    frame rate. Key repeat KEYDOWNs for a key that is already down are
+    ignored.
+
+    Example:
+        buffer.key_down(pygame.K_w, t0)
+        buffer.key_up(pygame.K_w, t1)
+        buffer.held_time({pygame.K_w}, step_start, step_end)
+    """
+
+    def __init__(self, min_tap=MIN_TAP_SECONDS, history=DEFAULT_HISTORY_SECONDS):
+        """
+        Initialize an empty buffer
+
+        Args:
+            min_tap: Shortest duration a completed press counts for
+            history: Seconds of released intervals kept by trim()
+        """
+        self.min_tap = min_tap
+        self.history = history
+        self.down_since = {}  # key -> press timestamp, for keys held now
+        self.released = []    # (key, down, up) for completed presses
+
+    def key_down(self, key, timestamp=None):
+        """Record a key press (repeats while held are ignored)"""
+        if key not in self.down_since:
+            self.down_since[key] = time.perf_counter() if timestamp is None else timestamp
+
+    def key_up(self, key, timestamp=None):
+        """Record a key release"""
+        down = self.down_since.pop(key, None)
+        if down is None:
+            return
+        up = time.perf_counter() if timestamp is None else timestamp
+        self.released.append((key, down, max(up, down + self.min_tap)))
+
+    def sync(self, pressed, keys, timestamp=None):
+        """
+        Reconcile with a key-state snapshot
+
+        Closes presses whose key-up was never delivered (e.g. focus was lost)
+        and opens presses for keys that were already down when the buffer
+        started watching them.
+
+        Args:
+            pressed: Key state indexable by key code (pygame.key.get_pressed())
+            keys: Key codes to check (the bound keys)
+            timestamp: Snapshot time (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        for key in list(self.down_since):
+            if not pressed[key]:
+                self.key_up(key, timestamp)
+        for key in keys:
+            if pressed[key] and key not in self.down_since:
+                self.down_since[key] = timestamp
+
+    def held_time(self, keys, start, end):
+        """
+        Seconds within [start, end) that at least one of the keys was down
+
+        Args:
+            keys: Set of key codes
+            start, end: Window on the perf_counter() timeline
+
+        Returns:
+            float: Held time, between 0 and end - start
+        """
+        spans = [
+            (max(down, start), min(up, end))
+            for key, down, up in self.released
+            if key in keys and down < end and up > start
+        ]
+        for key, down in self.down_since.items():
+            if key in keys and down < end:
+                spans.append((max(down, start), end))
+        if not spans:
+            return 0.0
+
+        # Merge overlapping spans so two keys for one action don't count twice
+        spans.sort()
+        total = 0.0
+        span_start, span_end = spans[0]
+        for next_start, next_end in spans[1:]:
+            if next_start > span_end:
+                total += span_end - span_start
+                span_start, span_end = next_start, next_end
+            else:
+                span_end = max(span_end, next_end)
+        return total + (span_end - span_start)
+
+    def trim(self, before=None):
+        """
+        Drop released presses that ended before a time
+
+        Args:
+            before: Cutoff timestamp (defaults to history seconds ago)
+        """
+        if before is None:
+            before = time.perf_counter() - self.history
+        self.released = [interval for interval in self.released if interval[2] > before]
+
+    def clear(self):
+        """Forget every press, including keys held now"""
+        self.down_since.clear()
+        self.released.clear()
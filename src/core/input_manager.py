@@ -1,7 +1,47 @@
 """
 Input management and key binding system
 """
+import json
+import threading
+import time
+from collections import deque
 import pygame
+from core.data_loader import get_data_loader
+from core.input_buffer import InputBuffer
+
+# Player rebindings, relative to the data directory
+BINDINGS_CONFIG_PATH = ("config", "key_bindings.json")
+
+# Actions that move toward each side (keypad diagonals count for two sides)
+MOVEMENT_DIRECTIONS = {
+    "left": ("left", "up_left", "down_left"),
+    "right": ("right", "up_right", "down_right"),
+    "up": ("up", "up_left", "up_right"),
+    "down": ("down", "down_left", "down_right")
+}
+
+# Process-wide input manager returned by get_input_manager()
+_shared_input_manager = None
+_shared_input_manager_lock = threading.Lock()
+
+
+def get_input_manager():
+    """
+    Get the process-wide InputManager.
+
+    The main loop takes one key snapshot per frame on this instance, and
+    every state reads from it, so bindings and held keys are shared.
+
+    Returns:
+        InputManager: The shared input manager
+    """
+    global _shared_input_manager
+    if _shared_input_manager is None:
+        with _shared_input_manager_lock:
+            if _shared_input_manager is None:
+                _shared_input_manager = InputManager()
+                _shared_input_manager.load_bindings()
+    return _shared_input_manager
 
 
 class InputManager:
@@ -10,6 +50,17 @@ class InputManager:
 
     Provides abstraction layer between pygame events and game logic,
     making it easier to rebind keys or add controller support later.
+
+    Bindings are compiled into a key -> actions table, so resolving an
+    event is one dict lookup. Held keys come from one snapshot per frame
+    (begin_frame()) instead of a fresh pygame.key.get_pressed() per check.
+    Each frame also collects the actions triggered by KEYDOWN events, both
+    as a set and as an ordered queue.
+
+    Key presses and releases are also recorded in an InputBuffer, so
+    fixed-step simulations can ask exactly how long movement keys were held
+    during each step (get_movement_durations) instead of sampling once per
+    frame.
     """
 
     def __init__(self):
@@ -32,12 +83,112 @@ class InputManager:
             "return": [pygame.K_RETURN, pygame.K_SPACE, pygame.K_KP_ENTER],
             "cancel": [pygame.K_ESCAPE, pygame.K_BACKSPACE],
 
+            # Message log scrollback
+            "log_older": [pygame.K_PAGEUP],
+            "log_newer": [pygame.K_PAGEDOWN],
+
             # TODO: Add more action mappings as needed
             # "fire_weapon": [pygame.K_SPACE],
             # "raise_shields": [pygame.K_r],
             # "scan": [pygame.K_e],
         }
 
+        # key -> tuple of actions, in binding order (rebuilt when bindings change)
+        self.key_actions = {}
+        self._rebuild_key_actions()
+
+        # Per-frame state (see begin_frame)
+        self.held_actions = frozenset()  # Actions with a key down at the snapshot
+        self.triggered_actions = set()   # Actions whose key went down this frame
+        self.action_queue = deque()      # (action, event) in the order they arrived
+        self.frame_time = time.perf_counter()  # Snapshot time, on the input buffer's timeline
+        self._snapshot_taken = False
+
+        # Key-down intervals for exact held durations
+        self.input_buffer = InputBuffer()
+
+    def _rebuild_key_actions(self):
+        """Compile key_bindings into the key -> actions lookup table"""
+        key_actions = {}
+        for action, keys in self.key_bindings.items():
+            for key in keys:
+                key_actions.setdefault(key, []).append(action)
+        self.key_actions = {key: tuple(actions) for key, actions in key_actions.items()}
+
+        # Keys that move toward each side, for get_movement_durations()
+        self.movement_keys = {
+            direction: frozenset(key for action in actions for key in self.key_bindings.get(action, ()))
+            for direction, actions in MOVEMENT_DIRECTIONS.items()
+        }
+
+    def begin_frame(self, pressed=None, timestamp=None):
+        """
+        Start a new frame: take the key snapshot and clear last frame's actions
+
+        Call once per frame, after fetching events and before dispatching them.
+
+        Args:
+            pressed: Optional key state (anything indexable by key code);
+                     defaults to pygame.key.get_pressed()
+            timestamp: Optional snapshot time; defaults to time.perf_counter()
+        """
+        if pressed is None:
+            pressed = pygame.key.get_pressed()
+        self.frame_time = time.perf_counter() if timestamp is None else timestamp
+        self.held_actions = frozenset(
+            action
+            for key, actions in self.key_actions.items() if pressed[key]
+            for action in actions
+        )
+        self.triggered_actions.clear()
+        self.action_queue.clear()
+        self._snapshot_taken = True
+
+        self.input_buffer.sync(pressed, self.key_actions, self.frame_time)
+        self.input_buffer.trim(self.frame_time - self.input_buffer.history)
+
+    def process_event(self, event):
+        """
+        Record a key event: buffer its timing, and queue the actions a KEYDOWN triggers
+
+        pygame events carry no timestamps and arrive once per frame, so
+        they're stamped with the frame's snapshot time. A press and release
+        within one frame therefore still counts as a short tap.
+
+        Args:
+            event: pygame.Event to process
+
+        Returns:
+            tuple: Actions bound to the pressed key (empty if none)
+        """
+        if event.type == pygame.KEYUP:
+            self.input_buffer.key_up(event.key, self.frame_time)
+            return ()
+        if event.type != pygame.KEYDOWN:
+            return ()
+        if event.key in self.key_actions:
+            self.input_buffer.key_down(event.key, self.frame_time)
+        actions = self.key_actions.get(event.key, ())
+        for action in actions:
+            self.triggered_actions.add(action)
+            self.action_queue.append((action, event))
+        return actions
+
+    def poll_actions(self):
+        """
+        Take every action queued since the last poll, oldest first
+
+        Returns:
+            list: (action, event) tuples
+        """
+        actions = list(self.action_queue)
+        self.action_queue.clear()
+        return actions
+
+    def was_triggered(self, action):
+        """Whether a key for an action went down this frame"""
+        return action in self.triggered_actions
+
     def get_action(self, event):
         """
         Convert a pygame event to a game action
@@ -57,16 +208,13 @@ class InputManager:
         if event.type != pygame.KEYDOWN:
             return None
 
-        # Check each action mapping
-        for action, keys in self.key_bindings.items():
-            if event.key in keys:
-                return action
-
-        return None
+        # A key bound to several actions resolves to the first one bound
+        actions = self.key_actions.get(event.key)
+        return actions[0] if actions else None
 
     def is_key_pressed(self, action):
         """
-        Check if a key for the given action is currently pressed
+        Check if a key for the given action was down at this frame's snapshot
 
         Useful for continuous input (like ship movement)
 
@@ -80,15 +228,10 @@ class InputManager:
             if input_manager.is_key_pressed("nav_up"):
                 move_ship_forward()
         """
-        if action not in self.key_bindings:
-            return False
-
-        pressed_keys = pygame.key.get_pressed()
-        for key in self.key_bindings[action]:
-            if pressed_keys[key]:
-                return True
-
-        return False
+        # Outside the main loop (no begin_frame yet), snapshot on demand
+        if not self._snapshot_taken:
+            self.begin_frame()
+        return action in self.held_actions
 
     def add_binding(self, action, key):
         """
@@ -107,6 +250,7 @@ class InputManager:
 
         if key not in self.key_bindings[action]:
             self.key_bindings[action].append(key)
+            self._rebuild_key_actions()
 
     def remove_binding(self, action, key):
         """
@@ -122,6 +266,7 @@ class InputManager:
         """
         if action in self.key_bindings and key in self.key_bindings[action]:
             self.key_bindings[action].remove(key)
+            self._rebuild_key_actions()
 
     def get_bindings_for_action(self, action):
         """
@@ -211,3 +356,76 @@ class InputManager:
             dx = 1
 
         return (dx, dy)
+
+    def get_movement_durations(self, start, end):
+        """
+        Get how long each movement direction was held during a time window
+
+        The fixed-step counterpart to get_movement_vector(): multiply by a
+        per-second speed to move exactly as far as the keys were held,
+        whatever the frame rate. Opposite directions cancel, and keypad
+        diagonals count toward both of their directions.
+
+        Args:
+            start, end: Window on the frame_time timeline (one simulation step)
+
+        Returns:
+            tuple: (x, y) held seconds, using the same signs as
+                   get_movement_vector() (x < 0 is left, y < 0 is up)
+
+        Example:
+            x_seconds, y_seconds = input_manager.get_movement_durations(t, t + step)
+            ship_x += x_seconds * speed_per_second
+        """
+        held = self.input_buffer.held_time
+        keys = self.movement_keys
+        x = held(keys["right"], start, end) - held(keys["left"], start, end)
+        y = held(keys["down"], start, end) - held(keys["up"], start, end)
+        return (x, y)
+
+    def load_bindings(self, path=BINDINGS_CONFIG_PATH):
+        """
+        Apply saved rebindings over the defaults
+
+        The file maps action names to lists of pygame key names, e.g.
+        {"bindings": {"up": ["w", "up", "[8]"]}}. Actions it doesn't list
+        keep their default keys. A missing file is not an error.
+
+        Args:
+            path: Path parts relative to the data directory
+
+        Returns:
+            bool: True if a config file was applied
+        """
+        try:
+            config = get_data_loader().load_runtime(*path)
+        except FileNotFoundError:
+            return False
+        except json.JSONDecodeError as e:
+            print(f"WARNING: Ignoring key bindings config: {e}")
+            return False
+
+        for action, key_names in config.get("bindings", {}).items():
+            keys = []
+            for name in key_names:
+                try:
+                    keys.append(pygame.key.key_code(name))
+                except ValueError:
+                    print(f"WARNING: Unknown key '{name}' bound to '{action}'")
+            self.key_bindings[action] = keys
+        self._rebuild_key_actions()
+        return True
+
+    def save_bindings(self, path=BINDINGS_CONFIG_PATH):
+        """
+        Save the current bindings so load_bindings() restores them
+
+        Args:
+            path: Path parts relative to the data directory
+        """
+        get_data_loader().save_runtime({
+            "bindings": {
+                action: [pygame.key.name(key) for key in keys]
+                for action, keys in self.key_bindings.items()
+            }
+        }, *path)
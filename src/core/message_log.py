@@ -0,0 +1,300 @@
+"""
+Message log
+Player-facing messages in a fixed-size ring buffer; older history is paged
+out to an append-only journal file, so a whole session can be scrolled and
+searched without the log growing in memory
+"""
+
+import bisect
+import itertools
+import json
+import tempfile
+
+# Channels a message can be posted on
+CHANNEL_SYSTEM = "system"
+CHANNEL_NAVIGATION = "navigation"
+CHANNEL_COMMS = "comms"
+CHANNEL_SCIENCE = "science"
+CHANNELS = (CHANNEL_SYSTEM, CHANNEL_NAVIGATION, CHANNEL_COMMS, CHANNEL_SCIENCE)
+
+DEFAULT_CAPACITY = 256   # Messages kept in memory
+JOURNAL_BLOCK = 128      # Journal messages per index entry (one file offset each)
+
+
+class Message:
+    """One log entry; seq numbers every message in a session, from 1"""
+
+    __slots__ = ("seq", "time", "channel", "text")
+
+    def __init__(self, seq, time, channel, text):
+        """
+        Args:
+            seq: Position in the session's log
+            time: Game time (seconds) it was posted
+            channel: One of CHANNELS
+            text: Message text
+        """
+        self.seq = seq
+        self.time = time
+        self.channel = channel
+        self.text = text
+
+    def __repr__(self):
+        """String representation for debugging"""
+        return f"Message(seq={self.seq}, time={self.time}, channel={self.channel}, text={self.text!r})"
+
+    def to_dict(self):
+        """Serialize the message"""
+        return {"seq": self.seq, "time": self.time, "channel": self.channel, "text": self.text}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a message from to_dict() output"""
+        return cls(data["seq"], data["time"], data["channel"], data["text"])
+
+
+class MessageJournal:
+    """
+    Append-only file of messages that have left the ring buffer, one JSON
+    line each.
+
+    Every JOURNAL_BLOCK messages, the seq and file offset of the block's
+    first message are recorded, so paging back reads only the blocks it
+    needs. The file is an anonymous temporary file unless a path is given,
+    and isn't created until the first message arrives.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: File to write (truncated on open), or None for a temporary file
+        """
+        self.path = path
+        self.count = 0
+        self.block_seqs = []      # First seq of each block
+        self.block_offsets = []   # File offset of each block
+        self._file = None
+
+    def __len__(self):
+        return self.count
+
+    def append(self, message):
+        """Write a message at the end of the journal"""
+        if self._file is None:
+            self._file = open(self.path, "w+b") if self.path else tempfile.TemporaryFile("w+b")
+        self._file.seek(0, 2)
+        if self.count % JOURNAL_BLOCK == 0:
+            self.block_seqs.append(message.seq)
+            self.block_offsets.append(self._file.tell())
+        self._file.write(json.dumps(message.to_dict()).encode("utf-8") + b"\n")
+        self.count += 1
+
+    def iter_backward(self, before):
+        """
+        Journal messages with seq below before, newest first
+
+        Args:
+            before: Exclusive upper bound on seq
+        """
+        block = bisect.bisect_left(self.block_seqs, before) - 1
+        for index in range(block, -1, -1):
+            for message in reversed(self._read_block(index)):
+                if message.seq < before:
+                    yield message
+
+    def close(self):
+        """Close the file (a temporary journal is deleted)"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_block(self, index):
+        """Messages in one block, oldest first"""
+        self._file.flush()
+        start = self.block_offsets[index]
+        end = self.block_offsets[index + 1] if index + 1 < len(self.block_offsets) else None
+        self._file.seek(start)
+        raw = self._file.read() if end is None else self._file.read(end - start)
+        return [Message.from_dict(json.loads(line)) for line in raw.splitlines()]
+
+
+class MessageLog:
+    """
+    The session's message log.
+
+    The newest capacity messages live in a ring buffer, so adding one is
+    O(1) and memory stays fixed however long the session runs. Messages
+    pushed out of the ring are appended to a MessageJournal on disk, and
+    history() and search() read back through both, so the player can still
+    page through everything posted this session.
+
+    version goes up with every change, so renderers can redraw only when
+    it moves.
+
+    Example:
+        log.add("Entering inner system", CHANNEL_NAVIGATION, time=events.time)
+        log.recent(8)                          # Newest 8, oldest first
+        log.history(8, before=first_shown)     # The page before that
+        log.search("ruins", channel=CHANNEL_SCIENCE)
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, journal=None):
+        """
+        Initialize an empty log
+
+        Args:
+            capacity: Messages kept in memory
+            journal: MessageJournal for older messages (a temporary one if
+                     None); False to drop them instead
+        """
+        if capacity < 1:
+            raise ValueError(f"Message log capacity must be positive, got {capacity}")
+        if journal is None:
+            journal = MessageJournal()
+        self.capacity = capacity
+        self.journal = journal if journal is not False else None
+        self.next_seq = 1
+        self.version = 0
+        self._buffer = [None] * capacity
+        self._start = 0   # Index of the oldest message
+        self._count = 0
+
+    def __len__(self):
+        """Number of messages in memory"""
+        return self._count
+
+    def __iter__(self):
+        """Messages in memory, oldest first"""
+        for offset in range(self._count):
+            yield self._buffer[(self._start + offset) % self.capacity]
+
+    @property
+    def first_seq(self):
+        """Seq of the oldest message history() can still return"""
+        if self.journal is not None and self.journal.count:
+            return self.journal.block_seqs[0]
+        return self._buffer[self._start].seq if self._count else self.next_seq
+
+    def add(self, text, channel=CHANNEL_SYSTEM, time=0.0):
+        """
+        Post a message
+
+        Args:
+            text: Message text
+            channel: One of CHANNELS
+            time: Game time it was posted
+
+        Returns:
+            Message: The new message
+
+        Raises:
+            ValueError: If the channel isn't one of CHANNELS
+        """
+        if channel not in CHANNELS:
+            raise ValueError(f"Unknown message channel '{channel}'")
+        message = Message(self.next_seq, time, channel, text)
+        self.next_seq += 1
+
+        if self._count < self.capacity:
+            self._buffer[(self._start + self._count) % self.capacity] = message
+            self._count += 1
+        else:
+            # Full: the oldest message moves to the journal and its slot is reused
+            if self.journal is not None:
+                self.journal.append(self._buffer[self._start])
+            self._buffer[self._start] = message
+            self._start = (self._start + 1) % self.capacity
+        self.version += 1
+        return message
+
+    def recent(self, count, channel=None):
+        """
+        The newest messages in memory
+
+        Args:
+            count: Most messages to return
+            channel: Only messages on this channel (None for all)
+
+        Returns:
+            list: Messages, oldest first
+        """
+        return self.history(count, channel=channel, journal=False)
+
+    def history(self, count, before=None, channel=None, journal=True):
+        """
+        A page of messages, reading into the journal if needed
+
+        Args:
+            count: Most messages to return
+            before: Only messages with seq below this (None for the newest)
+            channel: Only messages on this channel (None for all)
+            journal: Whether to read past memory into the journal
+
+        Returns:
+            list: Messages, oldest first
+        """
+        page = list(itertools.islice(self._iter_backward(before, channel, journal), count))
+        page.reverse()
+        return page
+
+    def search(self, text, channel=None, limit=None):
+        """
+        Messages containing some text (case-insensitive), through the whole session
+
+        Args:
+            text: Text to look for
+            channel: Only messages on this channel (None for all)
+            limit: Most matches to return (None for all)
+
+        Returns:
+            list: Matching messages, newest first
+        """
+        needle = text.lower()
+        matches = (message for message in self._iter_backward(None, channel, True)
+                   if needle in message.text.lower())
+        return list(itertools.islice(matches, limit))
+
+    def clear(self):
+        """Forget the messages in memory (the journal keeps what it has)"""
+        self._buffer = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.version += 1
+
+    def close(self):
+        """Close the journal"""
+        if self.journal is not None:
+            self.journal.close()
+
+    def _iter_backward(self, before, channel, journal):
+        """Messages with seq below before, newest first, from memory then the journal"""
+        if before is None:
+            before = self.next_seq
+        for offset in range(self._count - 1, -1, -1):
+            message = self._buffer[(self._start + offset) % self.capacity]
+            if message.seq < before and (channel is None or message.channel == channel):
+                yield message
+        if journal and self.journal is not None and self.journal.count:
+            oldest = self._buffer[self._start].seq if self._count else self.next_seq
+            for message in self.journal.iter_backward(min(before, oldest)):
+                if channel is None or message.channel == channel:
+                    yield message
+
+    def to_dict(self):
+        """
+        Serialize the messages in memory for a save (the journal isn't saved)
+
+        Returns:
+            dict: Next seq and the in-memory messages, oldest first
+        """
+        return {"next_seq": self.next_seq, "messages": [message.to_dict() for message in self]}
+
+    @classmethod
+    def from_dict(cls, data, capacity=DEFAULT_CAPACITY, journal=None):
+        """Rebuild a log from to_dict() output (see __init__ for the other arguments)"""
+        log = cls(capacity, journal)
+        for message_data in data["messages"][-capacity:]:
+            log._buffer[log._count] = Message.from_dict(message_data)
+            log._count += 1
+        log.next_seq = data["next_seq"]
+        return log
@@ -0,0 +1,381 @@
+"""
+Save manager for writing game sessions to disk
+
+Serializes a GameSession on the main thread (a cheap copy of plain data),
+then diffs, compresses and writes it on a background worker. Every file is
+written to a temp file, flushed to disk and renamed into place, so a crash
+mid-write leaves the previous save intact.
+
+Each save slot is a directory holding:
+    snapshot.sav  - full game state
+    delta.sav     - optional autosave: changes since snapshot.sav
+
+File layout:
+    magic (4 bytes) | format (uint16) | kind (uint8) | reserved (uint8) |
+    CRC32 of payload (uint32) | payload length (uint32) | zlib-compressed JSON
+"""
+import json
+import os
+import struct
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from core.data_loader import get_data_loader
+
+SAVE_MAGIC = b"SFSV"
+# Bump when the file layout changes (the JSON inside has its own save_version)
+SAVE_FILE_FORMAT = 1
+# Bump when the shape of the saved game data changes
+SAVE_VERSION = 6
+
+KIND_SNAPSHOT = 0
+KIND_DELTA = 1
+
+SNAPSHOT_FILENAME = "snapshot.sav"
+DELTA_FILENAME = "delta.sav"
+
+AUTOSAVE_SLOT = "autosave"
+# Write a fresh snapshot after this many deltas, or when the delta gets this
+# large relative to the snapshot (deltas are cumulative, so they only grow)
+FULL_SNAPSHOT_EVERY = 10
+MAX_DELTA_RATIO = 0.5
+
+_FILE_HEADER = struct.Struct("<4sHBBII")
+
+
+class SaveError(Exception):
+    """Raised when a save can't be read (missing, corrupt or unsupported)"""
+
+
+def diff_state(base, new):
+    """
+    Compute the changes that turn base into new.
+
+    Dicts are compared key by key (recursively); any other value that
+    differs is replaced whole.
+
+    Args:
+        base, new: JSON-compatible dicts
+
+    Returns:
+        dict or None: {"set": {...}, "del": [...], "sub": {...}}, or None if equal
+    """
+    changes = {}
+    set_values = {}
+    sub = {}
+    for key, value in new.items():
+        if key not in base:
+            set_values[key] = value
+        elif isinstance(value, dict) and isinstance(base[key], dict):
+            nested = diff_state(base[key], value)
+            if nested is not None:
+                sub[key] = nested
+        elif value != base[key]:
+            set_values[key] = value
+    deleted = [key for key in base if key not in new]
+
+    if set_values:
+        changes["set"] = set_values
+    if deleted:
+        changes["del"] = deleted
+    if sub:
+        changes["sub"] = sub
+    return changes or None
+
+
+def apply_diff(base, changes):
+    """
+    Apply changes from diff_state() without modifying base.
+
+    Args:
+        base: JSON-compatible dict
+        changes: Result of diff_state(), or None
+
+    Returns:
+        dict: The updated state (unchanged parts are shared with base)
+    """
+    if not changes:
+        return base
+    result = dict(base)
+    for key in changes.get("del", ()):
+        result.pop(key, None)
+    result.update(changes.get("set", {}))
+    for key, nested in changes.get("sub", {}).items():
+        result[key] = apply_diff(result.get(key, {}), nested)
+    return result
+
+
+def encode_save_file(kind, payload):
+    """Pack a payload dict into save file bytes"""
+    body = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6)
+    header = _FILE_HEADER.pack(SAVE_MAGIC, SAVE_FILE_FORMAT, kind, 0,
+                               zlib.crc32(body) & 0xFFFFFFFF, len(body))
+    return header + body
+
+
+def decode_save_file(raw, path):
+    """
+    Unpack save file bytes, verifying the header and checksum.
+
+    Args:
+        raw: File contents
+        path: File path (for error messages)
+
+    Returns:
+        tuple: (kind, payload dict)
+
+    Raises:
+        SaveError: If the file is truncated, corrupt or an unknown format
+    """
+    try:
+        magic, file_format, kind, _, checksum, length = _FILE_HEADER.unpack_from(raw, 0)
+    except struct.error:
+        raise SaveError(f"Save file {path} is truncated")
+    if magic != SAVE_MAGIC:
+        raise SaveError(f"{path} is not a save file")
+    if file_format != SAVE_FILE_FORMAT:
+        raise SaveError(f"Save file {path} has unsupported format {file_format}")
+
+    body = raw[_FILE_HEADER.size:_FILE_HEADER.size + length]
+    if len(body) != length or zlib.crc32(body) & 0xFFFFFFFF != checksum:
+        raise SaveError(f"Save file {path} is corrupt (checksum mismatch)")
+    return kind, json.loads(zlib.decompress(body))
+
+
+def write_atomic(path, data):
+    """
+    Write bytes to a file so readers only ever see the old or the new contents.
+
+    Args:
+        path: Destination Path
+        data: Bytes to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+class SaveManager:
+    """
+    Writes game saves on a background worker.
+
+    save() writes a full snapshot; autosave() writes only what changed
+    since the slot's last snapshot (a cumulative delta), falling back to
+    a full snapshot every FULL_SNAPSHOT_EVERY autosaves or when the delta
+    grows too large. The caller only pays for GameSession.to_save_data();
+    diffing, JSON encoding, compression and disk I/O all happen on the
+    worker. Requests for a slot that is still waiting to be written are
+    merged, so rapid autosaves never pile up.
+    """
+
+    def __init__(self, save_dir=None, full_snapshot_every=FULL_SNAPSHOT_EVERY):
+        """
+        Initialize the save manager
+
+        Args:
+            save_dir: Directory holding save slots (defaults to data/saves)
+            full_snapshot_every: Autosaves between full snapshots
+        """
+        self.save_dir = Path(save_dir or get_data_loader().get_data_path("saves"))
+        self.full_snapshot_every = full_snapshot_every
+
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+        self.lock = threading.Lock()
+        self.pending = {}     # slot -> (full, save data) waiting for the worker
+        self.snapshots = {}   # slot -> (snapshot_id, save data, encoded size) last written
+        self.deltas_written = {}  # slot -> autosaves since the last snapshot
+        self.queued_at = {}   # slot -> time of its latest request (it may not be on disk yet)
+        self.last_error = None
+
+    def slot_dir(self, slot):
+        """Directory for a save slot"""
+        return self.save_dir / slot
+
+    def save(self, game_session, slot):
+        """
+        Queue a full snapshot of a game session.
+
+        Args:
+            game_session: GameSession to save
+            slot: Save slot name
+        """
+        self._queue(slot, game_session.to_save_data(), full=True)
+
+    def autosave(self, game_session, slot=AUTOSAVE_SLOT):
+        """
+        Queue an incremental autosave of a game session.
+
+        Args:
+            game_session: GameSession to save
+            slot: Save slot name
+        """
+        self._queue(slot, game_session.to_save_data(), full=False)
+
+    def flush(self, timeout=None):
+        """
+        Wait until every queued save has been written.
+
+        Args:
+            timeout: Seconds to wait, or None to wait until done
+        """
+        self.executor.submit(lambda: None).result(timeout)
+
+    def shutdown(self):
+        """Finish queued writes and stop the worker"""
+        self.executor.shutdown(wait=True)
+
+    def list_slots(self):
+        """
+        List slots that hold a save, most recently written first.
+
+        Only file timestamps are read, so this is cheap enough for menus.
+        Slots queued this session count even if the worker hasn't written
+        them yet (call flush() before reading one).
+
+        Returns:
+            list: Slot names
+        """
+        with self.lock:
+            modified = dict(self.queued_at)
+        if self.save_dir.is_dir():
+            for slot_dir in self.save_dir.iterdir():
+                if not (slot_dir / SNAPSHOT_FILENAME).is_file():
+                    continue  # A delta alone can't be loaded
+                for filename in (SNAPSHOT_FILENAME, DELTA_FILENAME):
+                    path = slot_dir / filename
+                    if path.is_file():
+                        modified[slot_dir.name] = max(modified.get(slot_dir.name, 0), path.stat().st_mtime)
+        return sorted(modified, key=modified.get, reverse=True)
+
+    def load_save_data(self, slot):
+        """
+        Read a slot's snapshot and apply its delta, if the delta is valid.
+
+        A delta that is corrupt or was written against an older snapshot is
+        ignored, so the worst case after a crash is losing the last autosave.
+
+        Args:
+            slot: Save slot name
+
+        Returns:
+            dict: {"save_version", "snapshot_id", "saved_at", "data"}
+
+        Raises:
+            SaveError: If the slot has no readable snapshot
+        """
+        snapshot_path = self.slot_dir(slot) / SNAPSHOT_FILENAME
+        try:
+            raw = snapshot_path.read_bytes()
+        except FileNotFoundError:
+            raise SaveError(f"No save in slot '{slot}'")
+        kind, save = decode_save_file(raw, snapshot_path)
+        if kind != KIND_SNAPSHOT:
+            raise SaveError(f"{snapshot_path} is not a snapshot")
+
+        delta_path = self.slot_dir(slot) / DELTA_FILENAME
+        try:
+            kind, delta = decode_save_file(delta_path.read_bytes(), delta_path)
+        except FileNotFoundError:
+            return save
+        except SaveError as e:
+            print(f"WARNING: Ignoring autosave delta: {e}")
+            return save
+
+        if kind != KIND_DELTA or delta.get("snapshot_id") != save["snapshot_id"]:
+            return save
+        return {
+            "save_version": delta["save_version"],
+            "snapshot_id": save["snapshot_id"],
+            "saved_at": delta["saved_at"],
+            "data": apply_diff(save["data"], delta["changes"])
+        }
+
+    def _queue(self, slot, data, full):
+        """Hand save data to the worker, merging with a request still waiting for the slot"""
+        with self.lock:
+            self.queued_at[slot] = time.time()
+            waiting = self.pending.get(slot)
+            if waiting is not None:
+                # Not picked up yet: keep the newest data, and a full save stays full
+                self.pending[slot] = (full or waiting[0], data)
+                return
+            self.pending[slot] = (full, data)
+        self.executor.submit(self._write_slot, slot)
+
+    def _write_slot(self, slot):
+        """Worker: write the newest queued data for a slot"""
+        with self.lock:
+            full, data = self.pending.pop(slot)
+
+        try:
+            snapshot = self.snapshots.get(slot)
+            if full or snapshot is None or self.deltas_written.get(slot, 0) >= self.full_snapshot_every:
+                self._write_snapshot(slot, data)
+                return
+
+            snapshot_id, base, snapshot_size = snapshot
+            delta = encode_save_file(KIND_DELTA, {
+                "save_version": SAVE_VERSION,
+                "snapshot_id": snapshot_id,
+                "saved_at": time.time(),
+                "changes": diff_state(base, data)
+            })
+            if len(delta) > snapshot_size * MAX_DELTA_RATIO:
+                self._write_snapshot(slot, data)
+                return
+
+            write_atomic(self.slot_dir(slot) / DELTA_FILENAME, delta)
+            self.deltas_written[slot] = self.deltas_written.get(slot, 0) + 1
+        except Exception as e:
+            # Nobody waits on the worker's future, so every failure (disk
+            # errors, or data that won't encode) has to be recorded here
+            self.last_error = e
+            print(f"WARNING: Could not write save '{slot}': {e}")
+
+    def _write_snapshot(self, slot, data):
+        """Worker: write a full snapshot and retire the slot's delta"""
+        snapshot_id = uuid.uuid4().hex
+        encoded = encode_save_file(KIND_SNAPSHOT, {
+            "save_version": SAVE_VERSION,
+            "snapshot_id": snapshot_id,
+            "saved_at": time.time(),
+            "data": data
+        })
+        slot_dir = self.slot_dir(slot)
+        write_atomic(slot_dir / SNAPSHOT_FILENAME, encoded)
+        # If this is interrupted, the old delta no longer matches the new
+        # snapshot's id and is ignored on load
+        try:
+            (slot_dir / DELTA_FILENAME).unlink()
+        except FileNotFoundError:
+            pass
+
+        self.snapshots[slot] = (snapshot_id, data, len(encoded))
+        self.deltas_written[slot] = 0
+
+
+# Process-wide instance returned by get_save_manager()
+_shared_save_manager = None
+_shared_save_manager_lock = threading.Lock()
+
+
+def get_save_manager():
+    """
+    Get the process-wide SaveManager.
+
+    Returns:
+        SaveManager: The shared save manager
+    """
+    global _shared_save_manager
+    if _shared_save_manager is None:
+        with _shared_save_manager_lock:
+            if _shared_save_manager is None:
+                _shared_save_manager = SaveManager()
+    return _shared_save_manager
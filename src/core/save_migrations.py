@@ -0,0 +1,119 @@
+"""
+Save game migrations
+Upgrades saved game data from older save versions, one version at a time
+"""
+from core.event_scheduler import EventScheduler
+from core.message_log import CHANNEL_SYSTEM
+from core.save_manager import SAVE_VERSION, SaveError
+from core.trigger_index import TriggerIndex
+
+
+class MigrationRegistry:
+    """
+    Upgrade functions keyed by the save version they upgrade from.
+
+    Each function takes the "data" dict of a save at version N and returns
+    it in the version N + 1 shape. Loading chains them until the save
+    reaches SAVE_VERSION, so old saves never need to be loaded by old code.
+
+    Example:
+        @SAVE_MIGRATIONS.register(2)
+        def add_cargo_hold(data):
+            data["ship"].setdefault("cargo", [])
+            return data
+    """
+
+    def __init__(self):
+        """Initialize an empty registry"""
+        self.migrations = {}
+
+    def register(self, from_version):
+        """
+        Decorator registering an upgrade from from_version to from_version + 1
+
+        Args:
+            from_version: Save version the function upgrades from
+
+        Raises:
+            ValueError: If that version already has a migration
+        """
+        def decorator(migration):
+            if from_version in self.migrations:
+                raise ValueError(f"Save version {from_version} already has a migration")
+            self.migrations[from_version] = migration
+            return migration
+        return decorator
+
+    def migrate(self, save, target_version=SAVE_VERSION):
+        """
+        Bring a loaded save up to the target version.
+
+        Args:
+            save: Result of SaveManager.load_save_data()
+            target_version: Version to upgrade to
+
+        Returns:
+            dict: The save with upgraded "data" and "save_version"
+
+        Raises:
+            SaveError: If the save is newer than this build, or a step is missing
+        """
+        version = save["save_version"]
+        if version > target_version:
+            raise SaveError(f"Save version {version} is newer than this game supports ({target_version})")
+
+        data = save["data"]
+        while version < target_version:
+            migration = self.migrations.get(version)
+            if migration is None:
+                raise SaveError(f"No migration from save version {version}")
+            data = migration(data)
+            version += 1
+
+        return {**save, "save_version": version, "data": data}
+
+
+# Registry used when loading games; register upgrades here as SAVE_VERSION grows
+SAVE_MIGRATIONS = MigrationRegistry()
+
+
+@SAVE_MIGRATIONS.register(1)
+def system_paths_to_ids(data):
+    """Version 2 stores SystemLoader ids instead of CWD-relative file paths"""
+    data = dict(data)
+    for key in ("home_system", "current_system"):
+        path = data[key]["path"]
+        data[key] = {"id": path[len("data/"):] if path.startswith("data/") else path}
+    return data
+
+
+@SAVE_MIGRATIONS.register(2)
+def add_event_scheduler(data):
+    """Version 3 saves the game-time event scheduler"""
+    return {**data, "events": EventScheduler().to_dict()}
+
+
+@SAVE_MIGRATIONS.register(3)
+def messages_to_log(data):
+    """Version 4 saves the message log with seq numbers, times and channels"""
+    messages = [{"seq": seq, "time": 0.0, "channel": CHANNEL_SYSTEM, "text": text}
+                for seq, text in enumerate(data.get("messages", []), start=1)]
+    return {**data, "messages": {"next_seq": len(messages) + 1, "messages": messages}}
+
+
+@SAVE_MIGRATIONS.register(4)
+def add_mineral_market(data):
+    """Version 5 saves the mineral market; older saves open a fresh one on first use"""
+    return {**data, "market": None}
+
+
+@SAVE_MIGRATIONS.register(5)
+def add_trigger_progress(data):
+    """Version 6 saves retired one-shot triggers and the trigger visit in progress"""
+    return {**data, "triggers": TriggerIndex().to_dict()}
+
+
+def migrate_save(save):
+    """Upgrade a loaded save to the current SAVE_VERSION"""
+    return SAVE_MIGRATIONS.migrate(save)
+
@@ -1,6 +1,50 @@
 """
 State manager for handling game state transitions
 """
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LazyState:
+    """
+    State factory that imports its module on first use.
+
+    Registering one of these instead of a GameState instance keeps a
+    state's module (and everything it imports) off the startup path until
+    the state is first entered or warmed up.
+
+    Example:
+        state_manager.register_factory(
+            "space_navigation",
+            LazyState("states.space_navigation_state", "SpaceNavigationState"))
+    """
+
+    def __init__(self, module_name, class_name):
+        """
+        Args:
+            module_name: Module defining the state (e.g. "states.starport_menu_state")
+            class_name: GameState subclass in that module
+        """
+        self.module_name = module_name
+        self.class_name = class_name
+        self.state_class = None
+        self.lock = threading.Lock()
+
+    def load_class(self):
+        """Import the module (once) and return the state class"""
+        with self.lock:
+            if self.state_class is None:
+                module = importlib.import_module(self.module_name)
+                self.state_class = getattr(module, self.class_name)
+            return self.state_class
+
+    def __call__(self, state_manager):
+        """Construct the state"""
+        return self.load_class()(state_manager)
+
+    def __repr__(self):
+        return f"LazyState({self.module_name}.{self.class_name})"
 
 
 class StateManager:
@@ -9,10 +53,15 @@ class StateManager:
     def __init__(self):
         """Initialize the state manager"""
         self.states = {}
+        self.factories = {}  # name -> callable(state_manager) for states not built yet
         self.current_state = None
         self.game_state = None  # Runtime game state (ship, crew, location, etc.)
         self.game_session = None # Initialized during New Game/Load Game main menu actions
 
+        # Background imports for warm_up(), started on first use
+        self._warmup_executor = None
+        self._warmups = {}  # name -> Future
+
     def register_state(self, name, state):
         """
         Register a state with the manager
@@ -22,6 +71,67 @@ class StateManager:
             state: GameState instance
         """
         self.states[name] = state
+        self.factories.pop(name, None)
+
+    def register_factory(self, name, factory):
+        """
+        Register a state that is built the first time it's needed
+
+        Args:
+            name: String identifier for the state
+            factory: Callable taking this StateManager and returning a
+                     GameState (e.g. a LazyState or the state class itself)
+        """
+        self.factories[name] = factory
+        self.states.pop(name, None)
+
+    def is_registered(self, name):
+        """Whether a state (built or not) is registered under name"""
+        return name in self.states or name in self.factories
+
+    def get_state(self, name):
+        """
+        Get a state, constructing it from its factory on first use
+
+        Args:
+            name: String identifier of the state
+
+        Returns:
+            GameState: The state instance
+
+        Raises:
+            ValueError: If no state or factory is registered under name
+        """
+        state = self.states.get(name)
+        if state is None:
+            factory = self.factories.get(name)
+            if factory is None:
+                raise ValueError(f"State '{name}' not registered")
+            state = factory(self)
+            self.states[name] = state
+            del self.factories[name]
+        return state
+
+    def warm_up(self, name):
+        """
+        Import a lazy state's module on a background thread.
+
+        Call this for the state the player is likely to enter next, so its
+        import cost is paid while the current state is running. Only the
+        import happens in the background: the state itself is still
+        constructed on the main thread (states create fonts and surfaces,
+        which pygame expects from the main thread), which is cheap once its
+        module is loaded. Does nothing for built or unknown states.
+
+        Args:
+            name: String identifier of the state
+        """
+        factory = self.factories.get(name)
+        if not isinstance(factory, LazyState) or name in self._warmups:
+            return
+        if self._warmup_executor is None:
+            self._warmup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-warmup")
+        self._warmups[name] = self._warmup_executor.submit(factory.load_class)
 
     def change_state(self, name):
         """
@@ -30,17 +140,27 @@ class StateManager:
         Args:
             name: String identifier of the state to transition to
         """
-        if name not in self.states:
+        if not self.is_registered(name):
             raise ValueError(f"State '{name}' not registered")
 
+        # Build before exiting, so a failed import leaves the current state running
+        state = self.get_state(name)
+
         # Exit current state
         if self.current_state:
             self.current_state.on_exit()
 
         # Enter new state
-        self.current_state = self.states[name]
+        self.current_state = state
         self.current_state.on_enter()
 
     def get_current_state(self):
         """Get the current active state"""
         return self.current_state
+
+    def shutdown(self):
+        """Stop the warm-up thread (pending warm-ups are dropped) and shut down every built state"""
+        if self._warmup_executor is not None:
+            self._warmup_executor.shutdown(wait=False, cancel_futures=True)
+        for state in self.states.values():
+            state.shutdown()
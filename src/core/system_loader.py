@@ -0,0 +1,200 @@
+"""
+Star system definition loading
+One cached entry point for star system data, whatever it comes from
+"""
+import threading
+import time
+from core.data_loader import freeze, get_data_loader
+
+# Source used for ids without a "source:" prefix
+DEFAULT_SOURCE = "data"
+
+# The player's starting system
+HOME_SYSTEM_ID = "systems/home_system.json"
+
+# Folder under data/ listed by the data source (see SystemLoader.system_ids)
+SYSTEMS_DIR = "systems"
+
+
+def split_system_id(system_id):
+    """
+    Split a system id into its source and name.
+
+    Args:
+        system_id: "source:name", or a bare name for the default source
+                   (e.g. "systems/home_system.json", "procedural:4211")
+
+    Returns:
+        tuple: (source, name)
+    """
+    source, separator, name = system_id.partition(":")
+    if not separator:
+        return DEFAULT_SOURCE, system_id
+    return source, name
+
+
+class SystemLoader:
+    """
+    Loads star system definitions through named sources and caches them.
+
+    A system id is "source:name". Built-in sources:
+        data    - JSON file relative to data/ (the default: "systems/home_system.json")
+        static  - file under data/static/, read from the compiled bundle when current
+
+    Other providers (a procedural generator, systems stored in a save)
+    plug in with register_source(). Sources that can list their systems
+    (the data source lists data/systems/) make up system_ids(), the
+    systems that exist whether or not they've been loaded. Every definition is decoded once and
+    shared as a read-only view, the same way DataLoader.load_static()
+    hands out static data.
+
+    Example:
+        loader.register_source("procedural", generator.generate_system)
+        data = loader.load("procedural:4211")
+    """
+
+    def __init__(self, data_loader=None):
+        """
+        Initialize the system loader with the built-in sources
+
+        Args:
+            data_loader: Optional DataLoader (uses the shared one if None)
+        """
+        self.data_loader = data_loader or get_data_loader()
+        self.sources = {
+            "data": lambda name: self.data_loader.load_cached(*name.split("/")),
+            "static": lambda name: self.data_loader.load_static(*name.split("/"))
+        }
+        self.listers = {
+            DEFAULT_SOURCE: lambda: [f"{SYSTEMS_DIR}/{path.name}"
+                                     for path in (self.data_loader.data_root / SYSTEMS_DIR).glob("*.json")]
+        }
+
+        self._cache = {}  # system id -> frozen definition
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "load_time_ms": 0.0}
+        self.source_stats = {}  # source -> {"loads", "load_time_ms"}
+
+    def register_source(self, source, load, list_names=None):
+        """
+        Add (or replace) a source of system definitions.
+
+        Args:
+            source: Prefix used in system ids
+            load: Callable taking the name after the prefix and returning
+                  the system definition dict
+            list_names: Optional callable returning the names of every
+                        system the source has, for system_ids()
+
+        Raises:
+            ValueError: If the source name contains ":"
+        """
+        if ":" in source:
+            raise ValueError(f"Invalid system source name '{source}'")
+        with self._lock:
+            self.sources[source] = load
+            if list_names is None:
+                self.listers.pop(source, None)
+            else:
+                self.listers[source] = list_names
+
+    def system_ids(self):
+        """
+        Ids of every system a listing source has, loaded or not
+
+        Returns:
+            list: Sorted system ids (bare for the data source)
+        """
+        with self._lock:
+            listers = dict(self.listers)
+        ids = []
+        for source, list_names in listers.items():
+            prefix = "" if source == DEFAULT_SOURCE else f"{source}:"
+            ids.extend(f"{prefix}{name}" for name in list_names())
+        return sorted(ids)
+
+    def load(self, system_id):
+        """
+        Get a system definition, loading it on first use.
+
+        Args:
+            system_id: "source:name" or a bare path relative to data/
+
+        Returns:
+            MappingProxyType: The definition as a read-only view
+
+        Raises:
+            KeyError: If the id names an unknown source
+            FileNotFoundError: If a file-backed source has no such file
+        """
+        with self._lock:
+            data = self._cache.get(system_id)
+            if data is not None:
+                self.stats["hits"] += 1
+                return data
+
+        source, name = split_system_id(system_id)
+        load = self.sources.get(source)
+        if load is None:
+            raise KeyError(f"Unknown star system source '{source}' in '{system_id}'")
+
+        start = time.perf_counter()
+        data = freeze(load(name))
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        with self._lock:
+            self.stats["misses"] += 1
+            self.stats["load_time_ms"] += elapsed_ms
+            per_source = self.source_stats.setdefault(source, {"loads": 0, "load_time_ms": 0.0})
+            per_source["loads"] += 1
+            per_source["load_time_ms"] += elapsed_ms
+            self._cache[system_id] = data
+        return data
+
+    def invalidate(self, system_id=None):
+        """
+        Drop cached definitions (one system, or everything if no id is given)
+
+        Args:
+            system_id: System to drop
+        """
+        with self._lock:
+            if system_id is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(system_id, None)
+
+    def cache_info(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: hits, misses, total load time, cached system count and
+                  per-source load counts and times
+        """
+        with self._lock:
+            return {
+                **self.stats,
+                "cached_systems": len(self._cache),
+                "sources": {source: dict(stats) for source, stats in self.source_stats.items()}
+            }
+
+
+# Process-wide loader returned by get_system_loader()
+_shared_system_loader = None
+_shared_system_loader_lock = threading.Lock()
+
+
+def get_system_loader():
+    """
+    Get the process-wide SystemLoader.
+
+    Returns:
+        SystemLoader: The shared system loader
+    """
+    global _shared_system_loader
+    if _shared_system_loader is None:
+        with _shared_system_loader_lock:
+            if _shared_system_loader is None:
+                _shared_system_loader = SystemLoader()
+    return _shared_system_loader
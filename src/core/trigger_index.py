@@ -0,0 +1,369 @@
+"""
+Spatial trigger index
+Coordinate-based story and encounter triggers (clue sites, ruins, encounter
+zones), bucketed per navigation context so each tick only tests the few
+triggers near the ship
+"""
+
+import math
+from core.constants import SHIP_RADIUS
+
+# Callback kinds
+TRIGGER_ENTER = "enter"
+TRIGGER_EXIT = "exit"
+TRIGGER_DWELL = "dwell"
+
+# Grid cell size in game units (a context is CONTEXT_GRID_SIZE across)
+DEFAULT_TRIGGER_CELL = 10.0
+
+# Triggers covering more cells than this are kept in a short per-context
+# list checked every tick instead of being copied into every cell
+MAX_TRIGGER_CELLS = 64
+
+
+def context_key(system_id, context):
+    """
+    Key naming a navigation context for the trigger index
+
+    Hyperspace is shared, so its key is just the context type; contexts
+    inside a star system include the system id and any planet index.
+
+    Args:
+        system_id: SystemLoader id of the current star system
+        context: NavigationContext
+
+    Returns:
+        str: e.g. "hyperspace" or "systems/home_system.json#planetary_system:4"
+    """
+    if context.type == "hyperspace":
+        return context.type
+    key = f"{system_id}#{context.type}"
+    planet_index = context.data.get("planet_index")
+    return key if planet_index is None else f"{key}:{planet_index}"
+
+
+class Trigger:
+    """
+    A region in one navigation context that fires callbacks as the ship
+    moves through it.
+
+    Shapes match Interactable: a circle or an axis-aligned rectangle
+    centered on (x, y).
+    """
+
+    def __init__(self, trigger_id, context, x, y, shape_type, shape_data, trigger_type,
+                 dwell=None, once=False, data=None):
+        """
+        Args:
+            trigger_id: Unique id (authored triggers use stable ids from their data)
+            context: context_key() of the context it lives in
+            x, y: Center in game units
+            shape_type: "circle" or "rectangle"
+            shape_data: {"radius": r} or {"width": w, "height": h}
+            trigger_type: Name of the handler that runs its callbacks
+            dwell: Seconds inside before the dwell callback fires (None for no dwell)
+            once: Retire the trigger after the first visit ends
+            data: Anything the handler needs (message text, encounter id, ...)
+        """
+        self.trigger_id = trigger_id
+        self.context = context
+        self.x = x
+        self.y = y
+        self.shape_type = shape_type
+        self.shape_data = shape_data
+        self.type = trigger_type
+        self.dwell = dwell
+        self.once = once
+        self.data = data
+
+    def __repr__(self):
+        """String representation for debugging"""
+        return f"Trigger(id={self.trigger_id}, type={self.type}, context={self.context}, x={self.x}, y={self.y})"
+
+    @classmethod
+    def circle(cls, trigger_id, context, x, y, radius, trigger_type, **kwargs):
+        """Create a circular trigger"""
+        return cls(trigger_id, context, x, y, "circle", {"radius": radius}, trigger_type, **kwargs)
+
+    @classmethod
+    def rectangle(cls, trigger_id, context, x, y, width, height, trigger_type, **kwargs):
+        """Create a rectangular trigger"""
+        return cls(trigger_id, context, x, y, "rectangle", {"width": width, "height": height},
+                   trigger_type, **kwargs)
+
+    def half_extents(self):
+        """Half width and half height of the bounding box"""
+        if self.shape_type == "circle":
+            radius = self.shape_data["radius"]
+            return radius, radius
+        return self.shape_data["width"] / 2, self.shape_data["height"] / 2
+
+    def contains(self, x, y, padding=0.0):
+        """
+        Whether a point is inside the trigger
+
+        Args:
+            x, y: Position in game units
+            padding: Distance to grow the shape by (the ship's radius, so a
+                trigger agrees with CollisionManager on when the ship touches it)
+        """
+        dx = x - self.x
+        dy = y - self.y
+        if self.shape_type == "circle":
+            radius = self.shape_data["radius"] + padding
+            return dx * dx + dy * dy <= radius * radius
+        half_width, half_height = self.half_extents()
+        return abs(dx) <= half_width + padding and abs(dy) <= half_height + padding
+
+
+class TriggerIndex:
+    """
+    Triggers for every navigation context, looked up by ship position.
+
+    Each context has its own hash grid: a trigger is listed in every cell
+    its bounding box touches, so update() only tests the triggers in the
+    ship's cell. Tens of thousands of triggers cost the same per tick as
+    a handful, as long as few of them overlap the ship's cell. Like
+    CollisionManager, the ship counts as inside once its radius touches
+    a trigger.
+
+    Callbacks follow CollisionManager's suppression: enter fires once when
+    the ship moves into a trigger and not again until it has left; exit
+    fires when it leaves; dwell fires once per visit after the ship has
+    stayed dwell seconds. Changing context exits everything the ship was
+    inside.
+
+    Progress is saved with to_dict(): the once-only triggers already
+    retired (add() skips them, so systems can add all their triggers again
+    after a load) and the visit in progress.
+
+    Example:
+        index.register_handler("ruins", on_enter=show_ruins_hint)
+        index.add(Trigger.circle("ruins_1", key, 40.0, 62.0, 3.0, "ruins", dwell=2.0))
+        index.update(context_key(system_id, context), ship_x, ship_y, dt)
+    """
+
+    def __init__(self, cell_size=DEFAULT_TRIGGER_CELL, ship_radius=SHIP_RADIUS):
+        """
+        Initialize an empty index
+
+        Args:
+            cell_size: Grid cell size in game units
+            ship_radius: Ship radius in game units, added to every trigger's shape
+        """
+        self.cell_size = cell_size
+        self.ship_radius = ship_radius
+        self.triggers = {}   # trigger id -> Trigger
+        self.cells = {}      # context -> {(cell_x, cell_y): [Trigger, ...]}
+        self.large = {}      # context -> [Trigger, ...] too big to grid
+        self.handlers = {}   # trigger type -> {kind: callback(trigger)}
+        self.retired = set() # ids of once-only triggers whose visit has ended
+
+        # The current visit: which context, and how long the ship has been
+        # inside each trigger (None once its dwell has fired)
+        self.context = None
+        self.inside = {}
+
+    def __len__(self):
+        return len(self.triggers)
+
+    def register_handler(self, trigger_type, on_enter=None, on_exit=None, on_dwell=None):
+        """
+        Set the callbacks for a trigger type (each takes the Trigger)
+
+        Args:
+            trigger_type: Trigger type name
+            on_enter, on_exit, on_dwell: Optional callbacks
+        """
+        self.handlers[trigger_type] = {
+            TRIGGER_ENTER: on_enter,
+            TRIGGER_EXIT: on_exit,
+            TRIGGER_DWELL: on_dwell
+        }
+
+    def add(self, trigger):
+        """
+        Add a trigger, unless it's a once-only trigger that has already retired
+
+        Returns:
+            bool: True if it was added
+
+        Raises:
+            ValueError: If the trigger id is already used
+        """
+        if trigger.trigger_id in self.triggers:
+            raise ValueError(f"Trigger '{trigger.trigger_id}' already exists")
+        if trigger.trigger_id in self.retired:
+            return False
+        self.triggers[trigger.trigger_id] = trigger
+
+        if self._is_large(trigger):
+            self.large.setdefault(trigger.context, []).append(trigger)
+            return True
+        grid = self.cells.setdefault(trigger.context, {})
+        for cell in self._cells_covering(trigger):
+            grid.setdefault(cell, []).append(trigger)
+        return True
+
+    def remove(self, trigger_id):
+        """
+        Remove a trigger (no exit callback fires)
+
+        Returns:
+            bool: True if it was in the index
+        """
+        trigger = self.triggers.pop(trigger_id, None)
+        if trigger is None:
+            return False
+        self.inside.pop(trigger_id, None)
+
+        if self._is_large(trigger):
+            self.large[trigger.context].remove(trigger)
+            return True
+        grid = self.cells[trigger.context]
+        for cell in self._cells_covering(trigger):
+            bucket = grid[cell]
+            bucket.remove(trigger)
+            if not bucket:
+                del grid[cell]
+        return True
+
+    def query(self, context, x, y):
+        """
+        Triggers the ship touches at a position
+
+        Args:
+            context: context_key() of the context
+            x, y: Ship position in game units
+
+        Returns:
+            list: Triggers within ship_radius of the position
+        """
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        candidates = self.cells.get(context, {}).get(cell, [])
+        hits = [trigger for trigger in candidates if trigger.contains(x, y, self.ship_radius)]
+        hits.extend(trigger for trigger in self.large.get(context, ())
+                    if trigger.contains(x, y, self.ship_radius))
+        return hits
+
+    def update(self, context, x, y, dt):
+        """
+        Fire enter, exit and dwell callbacks for the ship's new position
+
+        Args:
+            context: context_key() of the ship's context
+            x, y: Ship position in game units
+            dt: Seconds since the last update (for dwell timers)
+
+        Returns:
+            list: (kind, Trigger) for every callback fired, in order
+        """
+        fired = []
+        if context != self.context:
+            self._exit_all(fired)
+            self.context = context
+
+        current = {trigger.trigger_id: trigger for trigger in self.query(context, x, y)}
+
+        # Leaving
+        for trigger_id in [trigger_id for trigger_id in self.inside if trigger_id not in current]:
+            self._exit(trigger_id, fired)
+
+        # Entering, then dwelling
+        for trigger_id, trigger in current.items():
+            if trigger_id not in self.inside:
+                self.inside[trigger_id] = 0.0
+                self._fire(TRIGGER_ENTER, trigger, fired)
+                continue
+            dwelled = self.inside[trigger_id]
+            if dwelled is None or trigger.dwell is None:
+                continue
+            dwelled += dt
+            if dwelled >= trigger.dwell:
+                self.inside[trigger_id] = None  # Fired for this visit
+                self._fire(TRIGGER_DWELL, trigger, fired)
+            else:
+                self.inside[trigger_id] = dwelled
+        return fired
+
+    def reset(self):
+        """Forget the current visit without firing exits (like CollisionManager.reset)"""
+        self.context = None
+        self.inside = {}
+
+    def to_dict(self):
+        """
+        Capture trigger progress for saving (the triggers themselves come from data)
+
+        Returns:
+            dict: Retired trigger ids and the visit in progress
+        """
+        return {
+            "retired": sorted(self.retired),
+            "context": self.context,
+            "inside": dict(self.inside)
+        }
+
+    @classmethod
+    def from_dict(cls, data, cell_size=DEFAULT_TRIGGER_CELL):
+        """
+        Restore trigger progress saved by to_dict()
+
+        Add the triggers before the next update(), so a visit in progress
+        carries on instead of ending.
+
+        Args:
+            data: Result of to_dict()
+            cell_size: Grid cell size in game units
+
+        Returns:
+            TriggerIndex: An index with no triggers yet
+        """
+        index = cls(cell_size=cell_size)
+        index.retired = set(data["retired"])
+        index.context = data["context"]
+        index.inside = dict(data["inside"])
+        return index
+
+    def _exit_all(self, fired):
+        """Exit every trigger the ship is inside"""
+        for trigger_id in list(self.inside):
+            self._exit(trigger_id, fired)
+
+    def _exit(self, trigger_id, fired):
+        """End a visit: fire exit, and retire once-only triggers"""
+        del self.inside[trigger_id]
+        trigger = self.triggers.get(trigger_id)
+        if trigger is None:
+            return
+        self._fire(TRIGGER_EXIT, trigger, fired)
+        if trigger.once:
+            self.remove(trigger_id)
+            self.retired.add(trigger_id)
+
+    def _fire(self, kind, trigger, fired):
+        """Run a trigger type's callback for one kind of event"""
+        fired.append((kind, trigger))
+        callback = self.handlers.get(trigger.type, {}).get(kind)
+        if callback is not None:
+            callback(trigger)
+
+    def _cell_bounds(self, trigger):
+        """First and last grid cell (x, then y) of a trigger's bounding box, grown by ship_radius"""
+        half_width, half_height = trigger.half_extents()
+        half_width += self.ship_radius
+        half_height += self.ship_radius
+        return (math.floor((trigger.x - half_width) / self.cell_size),
+                math.floor((trigger.x + half_width) / self.cell_size),
+                math.floor((trigger.y - half_height) / self.cell_size),
+                math.floor((trigger.y + half_height) / self.cell_size))
+
+    def _is_large(self, trigger):
+        """Whether a trigger covers too many cells to grid"""
+        min_x, max_x, min_y, max_y = self._cell_bounds(trigger)
+        return (max_x - min_x + 1) * (max_y - min_y + 1) > MAX_TRIGGER_CELLS
+
+    def _cells_covering(self, trigger):
+        """Grid cells a trigger's bounding box touches"""
+        min_x, max_x, min_y, max_y = self._cell_bounds(trigger)
+        return [(cell_x, cell_y) for cell_x in range(min_x, max_x + 1) for cell_y in range(min_y, max_y + 1)]
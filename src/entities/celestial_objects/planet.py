@@ -5,7 +5,8 @@ Represents celestial bodies (planets and moons) in star systems
 
 import math
 import utils.position_calculator as pos_calc
-from core.constants import SYSTEM_ORBITS, CONTEXT_CENTER
+from core.constants import SYSTEM_ORBITS, CONTEXT_CENTER, BODY_TYPE_PLANET
+from utils.noise import derive_seed
 
 
 class Planet:
@@ -18,7 +19,8 @@ class Planet:
     """
     
     def __init__(self, name, planet_type, orbit_angle, size, landable=True,
-                 orbital_index=None, moons=None, stations=None):
+                 orbital_index=None, moons=None, stations=None, seed=None,
+                 body_type=BODY_TYPE_PLANET):
         """
         Initialize a planet.
 
@@ -31,6 +33,8 @@ class Planet:
             orbital_index (int): Which orbital slot (0-3), set by parent system
             moons (list): List of Planet objects representing moons
             stations (list): List of station dicts (name, type) orbiting this planet
+            seed (int): Procedural generation seed (derived from the name if None)
+            body_type (str): BODY_TYPE_PLANET, BODY_TYPE_MOON, etc.
         """
         self.name = name # Useful, but not strictly necessary
         self.type = planet_type
@@ -40,6 +44,8 @@ class Planet:
         self.orbital_index = orbital_index
         self.moons = moons or []
         self.stations = stations or []
+        self.seed = seed if seed is not None else derive_seed(name)
+        self.body_type = body_type
     
     def has_starport(self):
         """
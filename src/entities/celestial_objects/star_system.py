@@ -3,7 +3,6 @@ StarSystem entity class
 Loads and manages star system data including planets and moons
 """
 
-import json
 from entities.celestial_objects.planet import Planet
 from entities.celestial_objects.star import Star
 from core.constants import (
@@ -11,29 +10,36 @@ from core.constants import (
     CONTEXT_INNER_SYSTEM,
     CONTEXT_PLANETARY_SYSTEM,
     CENTRAL_OBJECT_SIZE,
-    INNER_ZONE_MULTIPLIER
+    INNER_ZONE_MULTIPLIER,
+    BODY_TYPE_MOON
 )
+from core.system_loader import get_system_loader
+from utils.noise import derive_seed
 
 class StarSystem:
     """
     Represents a complete star system with inner planets, outer planets, and a central star.
     
-    Loads system data from JSON and creates Planet objects with proper orbital indices.
+    Builds Star and Planet objects (with orbital indices) from a system definition.
     """
     
-    def __init__(self, system_data_path):
+    def __init__(self, system_id, data=None):
         """
-        Load a star system from a JSON file.
+        Build a star system from its definition.
         
         Args:
-            system_data_path (str): Path to the system JSON file
+            system_id (str): SystemLoader id (e.g. "systems/home_system.json")
+            data: Optional system definition (loaded through the shared
+                  SystemLoader if None)
         """
-        # Load JSON data
-        with open(system_data_path, 'r') as f:
-            data = json.load(f)
+        self.system_id = system_id
+
+        if data is None:
+            data = get_system_loader().load(system_id)
         
         # Create Star Object
         star_data = data["star"]
+        self.name = data.get("name", star_data["name"])
         self.star = Star(
             name = star_data["name"],
             spectral_class=star_data["spectral_class"],
@@ -68,7 +74,8 @@ class StarSystem:
                     size=planet_data["size"],
                     landable=planet_data.get("landable", True),
                     orbital_index=index,
-                    stations=planet_data.get("stations", [])
+                    stations=planet_data.get("stations", []),
+                    seed=planet_data.get("seed", derive_seed(self.name, planet_data["name"]))
                 )
 
                 # Load moons if present
@@ -98,7 +105,9 @@ class StarSystem:
                 orbit_angle=moon_data["orbit_angle"],
                 size=moon_data["size"],
                 landable=moon_data.get("landable", True),
-                orbital_index=index
+                orbital_index=index,
+                seed=moon_data.get("seed", derive_seed(self.name, moon_data["name"])),
+                body_type=BODY_TYPE_MOON
             )
             moons.append(moon)
         
@@ -44,4 +44,24 @@ class Ship:
         self.armor_class: int = 1 # 1 to 5
 
         # Crew
-        self.crew_roster: List[str] = []
\ No newline at end of file
+        self.crew_roster: List[str] = []
+
+    def to_dict(self) -> dict:
+        """Serialize the ship's fields for saving"""
+        data = dict(vars(self))
+        data["crew_roster"] = list(self.crew_roster)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Ship":
+        """
+        Rebuild a ship from to_dict() output
+
+        Fields missing from the data keep their defaults, and unknown
+        fields are ignored, so older saves still load.
+        """
+        ship = cls(ship_id=data.get("ship_id", 0))
+        for field, value in data.items():
+            if hasattr(ship, field):
+                setattr(ship, field, value)
+        return ship
\ No newline at end of file
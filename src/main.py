@@ -3,11 +3,10 @@ Starflight Remake - Main Entry Point
 """
 import pygame
 import sys
-from core.state_manager import StateManager
+from core.state_manager import LazyState, StateManager
 from core.colors import BLACK
-from states.main_menu_state import MainMenuState
-from states.starport_menu_state import StarportMenuState
-from states.space_navigation_state import SpaceNavigationState
+from core.save_manager import get_save_manager
+from core.input_manager import get_input_manager
 
 
 # Display constants
@@ -15,6 +14,13 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Game states, imported and constructed the first time each is entered
+STATE_FACTORIES = {
+    "main_menu": LazyState("states.main_menu_state", "MainMenuState"),
+    "starport": LazyState("states.starport_menu_state", "StarportMenuState"),
+    "space_navigation": LazyState("states.space_navigation_state", "SpaceNavigationState")
+}
+
 
 def main():
     """Main game loop"""
@@ -33,21 +39,26 @@ def main():
     state_manager = StateManager()
 
     # Register game states
-    state_manager.register_state("main_menu", MainMenuState(state_manager))
-    state_manager.register_state("starport", StarportMenuState(state_manager))
-    state_manager.register_state("space_navigation", SpaceNavigationState(state_manager))
+    for name, factory in STATE_FACTORIES.items():
+        state_manager.register_factory(name, factory)
 
     # Start with main menu
     state_manager.change_state("main_menu")
 
+    # One key snapshot per frame, shared by every state
+    input_manager = get_input_manager()
+
     # Main game loop
     running = True
     while running:
         # Calculate delta time
         dt = clock.tick(FPS) / 1000.0  # Convert to seconds
 
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (fetching them updates the key state the snapshot reads)
+        events = pygame.event.get()
+        input_manager.begin_frame()
+        for event in events:
+            input_manager.process_event(event)
             if event.type == pygame.QUIT:
                 running = False                
             elif event.type == pygame.VIDEORESIZE:
@@ -75,6 +86,11 @@ def main():
         pygame.display.flip()
 
     # Cleanup
+    if state_manager.game_session:
+        state_manager.game_session.shutdown()
+    state_manager.shutdown()
+    # Let queued saves finish writing before exiting
+    get_save_manager().shutdown()
     pygame.quit()
     sys.exit()
 
@@ -1,4 +1,8 @@
 # Game state implementations
-from .main_menu_state import MainMenuState
-from .space_navigation_state import SpaceNavigationState
-from .starport_menu_state import StarportMenuState
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __all__ = lazy_exports(globals(), {
+    "MainMenuState": ".main_menu_state",
+    "SpaceNavigationState": ".space_navigation_state",
+    "StarportMenuState": ".starport_menu_state"
+})
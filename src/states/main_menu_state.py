@@ -3,9 +3,10 @@ Main menu state
 """
 import pygame
 from core.game_state import GameState
-from core.game_session import GameSession
-from core.data_loader import DataLoader
-from core.input_manager import InputManager
+from core.data_loader import get_data_loader
+from core.input_manager import get_input_manager
+from core.save_manager import SaveError, get_save_manager
+from core.constants import INTERACTION_STATION
 from ui.menu_renderer import MenuRenderer
 
 
@@ -17,8 +18,8 @@ class MainMenuState(GameState):
         super().__init__(state_manager)
 
         # Initialize managers and renderers
-        self.data_loader = DataLoader()
-        self.input_manager = InputManager()
+        self.data_loader = get_data_loader()
+        self.input_manager = get_input_manager()
         self.menu_renderer = MenuRenderer()
 
         # Menu data (will be loaded in on_enter)
@@ -39,9 +40,16 @@ class MainMenuState(GameState):
         self.disabled_menu_items = {i for i, opt in enumerate(self.menu_options) if not opt["enabled"]}
         self.selected_menu_index = 0
 
+        # Nothing to load until there's a save on disk
+        if not get_save_manager().list_slots():
+            self.disabled_menu_items |= {i for i, opt in enumerate(self.menu_options) if opt["id"] == "load_game"}
+
     def on_enter(self):
         """Called when entering the main menu state"""
         self._load_menu_data()
+        # New Game and Load Game lead to the starport or space
+        self.state_manager.warm_up("starport")
+        self.state_manager.warm_up("space_navigation")
 
     def handle_event(self, event):
         """Handle menu input events"""
@@ -66,8 +74,7 @@ class MainMenuState(GameState):
             # Transition to starport
             self.state_manager.change_state("starport")
         elif selected_option_id == "load_game":
-            # TODO: Load game
-            print("Load Game selected - TODO: implement")
+            self._load_game()
         elif selected_option_id == "exit_game":
             # Signal to quit the game
             pygame.event.post(pygame.event.Event(pygame.QUIT))
@@ -76,7 +83,43 @@ class MainMenuState(GameState):
         """Create a new game state with default values"""
         # Create minimal game state for now
         # Values are placeholders - will be replaced with actual defaults later
-        self.state_manager.game_session = GameSession()
+        from core.game_session import GameSession  # Only needed once a game starts (keeps it off startup)
+        self._replace_session(GameSession())
+
+    def _load_game(self):
+        """Load the most recent save and resume where it was made"""
+        # Only needed once a game starts (keeps them off startup)
+        from core.game_session import GameSession
+        from core.save_migrations import migrate_save
+
+        save_manager = get_save_manager()
+        save_manager.flush()  # Make sure queued saves are on disk first
+
+        slots = save_manager.list_slots()
+        if not slots:
+            return
+        try:
+            save = migrate_save(save_manager.load_save_data(slots[0]))
+        except SaveError as e:
+            print(f"ERROR: Could not load save '{slots[0]}': {e}")
+            return
+
+        self._replace_session(GameSession.from_save_data(save["data"]))
+
+        # Resume docked or in space, whichever the save was made in
+        interaction = self.state_manager.game_session.interaction_target
+        if interaction and interaction.get("type") == INTERACTION_STATION:
+            self.state_manager.change_state("starport")
+        else:
+            self.state_manager.change_state("space_navigation")
+
+    def _replace_session(self, session):
+        """Make session the current game, shutting down the one it replaces"""
+        previous = self.state_manager.game_session
+        if previous is not None:
+            # Stops its pre-generation workers and closes its message journal
+            previous.shutdown()
+        self.state_manager.game_session = session
 
     def update(self, dt):
         """Update menu state (nothing to update for static menu)"""
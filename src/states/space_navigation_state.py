@@ -6,15 +6,21 @@ from core import interactable
 from ui.hud_renderer import HudRenderer
 from core.game_state import GameState
 from core.colors import SPACE_BLACK, TEXT_NORMAL
-from core.input_manager import InputManager
+from core.input_manager import get_input_manager
 from core.collision_manager import CollisionManager
 from core.interactable import Interactable
+from core.save_manager import get_save_manager
+from core.message_log import CHANNEL_NAVIGATION
+from ui.message_log_renderer import SCROLL_LINES
+from systems.planet_pregen import PRIORITY_APPROACH, PRIORITY_PREFETCH
 from core.constants import (
     CONTEXT_CENTER,
     CONTEXT_OUTER_SYSTEM,
     CONTEXT_INNER_SYSTEM,
     CONTEXT_PLANETARY_SYSTEM,
     MOVEMENT_SPEED,
+    SIMULATION_STEP,
+    MAX_SIMULATION_CATCHUP,
     CONTEXT_GRID_SIZE,
     INTERACTION_PLANET
 )
@@ -27,13 +33,20 @@ class SpaceNavigationState(GameState):
         super().__init__(state_manager)
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
-        self.input_manager = InputManager()
+        self.input_manager = get_input_manager()
         self.hud_renderer = HudRenderer()
         self.collision_manager = CollisionManager()
+        self.simulated_until = None  # Input timeline time simulated up to
 
     def on_enter(self):
         """Called when entering space navigation state"""
         print("Entering space navigation state")
+        # Start simulating from the next frame; time before entering isn't replayed
+        self.simulated_until = None
+
+    def shutdown(self):
+        """Stop the HUD's background rendering work"""
+        self.hud_renderer.shutdown()
 
     def handle_event(self, event):
         """Handle input events"""
@@ -41,17 +54,49 @@ class SpaceNavigationState(GameState):
         
         if action == "cancel":
             self.state_manager.change_state("starport")
+        elif action == "log_older":
+            self.hud_renderer.scroll_message_log(self.game_session, SCROLL_LINES)
+        elif action == "log_newer":
+            self.hud_renderer.scroll_message_log(self.game_session, -SCROLL_LINES)
 
     def update(self, dt):
-        """Update space navigation state"""
-        # Check for movement input every frame
-        dx, dy = self.input_manager.get_movement_vector()
-
-        if dx != 0 or dy != 0:
-            self._move_ship(dx, -dy)
-            # Check for collisions after movement
-            self._check_collisions()
-        
+        """
+        Update space navigation state in fixed simulation steps
+
+        Each step moves the ship by exactly how long the movement keys were
+        held during that step, so distance doesn't depend on the frame rate.
+        Game time (and the session's scheduled events) advances with the
+        steps, so it only passes while flying; trigger regions are checked
+        at the end of each step.
+        """
+        now = self.input_manager.frame_time
+        if self.simulated_until is None:
+            self.simulated_until = now
+        # After a stall, drop the backlog rather than simulating it all at once
+        self.simulated_until = max(self.simulated_until, now - MAX_SIMULATION_CATCHUP)
+
+        context = self.game_session.current_context
+        while self.simulated_until + SIMULATION_STEP <= now:
+            step_start = self.simulated_until
+            self.simulated_until += SIMULATION_STEP
+            self.game_session.events.advance(SIMULATION_STEP)
+
+            x_seconds, y_seconds = self.input_manager.get_movement_durations(step_start, self.simulated_until)
+            if x_seconds or y_seconds:
+                self._move_ship(x_seconds * MOVEMENT_SPEED, -y_seconds * MOVEMENT_SPEED)
+                # Check for collisions after movement
+                self._check_collisions()
+            if self.game_session.current_context is context:
+                x, y = self.game_session.ship_position
+                self.game_session.triggers.update(self.game_session.get_context_key(), x, y, SIMULATION_STEP)
+
+            # An event, collision or trigger can change context or state;
+            # don't carry this frame's remaining steps into it
+            if (self.state_manager.get_current_state() is not self
+                    or self.game_session.current_context is not context):
+                self.simulated_until = now
+                break
+
     def render(self, surface):
         """Render space navigation view with the HUD """
         # Fill background
@@ -61,13 +106,12 @@ class SpaceNavigationState(GameState):
         self.hud_renderer.render(surface, self.game_session)    
         
     def _move_ship(self, dx, dy):
-        """Move the ship by (dx, dy) in current context"""
+        """Move the ship by (dx, dy) units in current context"""
         # get current position
         x, y = self.game_session.ship_position
 
-        # Update position with scaled movement speed
-        new_x = x + (dx * MOVEMENT_SPEED)
-        new_y = y + (dy * MOVEMENT_SPEED)
+        new_x = x + dx
+        new_y = y + dy
 
         # Clamp to context grid boundaries
         new_x = max(0, min(CONTEXT_GRID_SIZE, new_x))
@@ -151,11 +195,18 @@ class SpaceNavigationState(GameState):
                 parent_region=current_context.type,
                 planet_index=planet.orbital_index
             ):
-                self.game_session.add_message(f"Entering {planet.name} moon system")
+                self.game_session.add_message(f"Entering {planet.name} moon system", CHANNEL_NAVIGATION)
                 self.collision_manager.reset()
+                # Context changes are autosave points (written in the background)
+                get_save_manager().autosave(self.game_session)
+                # Start on the moons in case the player lands on one
+                for moon in planet.moons:
+                    self.game_session.planet_pregen.request(moon, PRIORITY_PREFETCH)
         else:
             # Regular planet - show orbit message
-            self.game_session.add_message(f"Approaching {planet.name}. Press Space to orbit.")
+            self.game_session.add_message(f"Approaching {planet.name}. Press Space to orbit.", CHANNEL_NAVIGATION)
+            # Build the surface in the background so landing doesn't have to wait
+            self.game_session.planet_pregen.request(planet, PRIORITY_APPROACH)
 
     def _check_boundary_collisions(self):
         """Check for boundary collisions and handle context transitions"""
@@ -179,9 +230,12 @@ class SpaceNavigationState(GameState):
             parent_object_coords=parent_coords,
             parent_object_radius=parent_radius
         ):
-            self.game_session.add_message(f"Entering outer system from {boundary}")
+            self.game_session.add_message(f"Entering outer system from {boundary}", CHANNEL_NAVIGATION)
+            # Left the planets behind; drop queued surface work for them
+            self.game_session.planet_pregen.cancel_pending()
             # Reset collision manager to prevent immediate re-trigger
             self.collision_manager.reset()
+            get_save_manager().autosave(self.game_session)
         else:
             # Handle other types of boundary exits later
             self.game_session.add_message(f"Boundary collision at {boundary} (not implemented yet)")
@@ -194,9 +248,10 @@ class SpaceNavigationState(GameState):
             target_coords=[CONTEXT_CENTER, CONTEXT_CENTER],
             target_radius=self.game_session.current_system.star.size
         ):
-            self.game_session.add_message("Entering inner system")
+            self.game_session.add_message("Entering inner system", CHANNEL_NAVIGATION)
             # Reset collision manager to prevent immediate re-trigger
             self.collision_manager.reset()
+            get_save_manager().autosave(self.game_session)
         else:
             # Handle other types of central zone collisions later
             self.game_session.add_message("Central zone collision (not implemented yet)")
@@ -2,8 +2,9 @@
 Starport menu state
 """
 from core.game_state import GameState
-from core.data_loader import DataLoader
-from core.input_manager import InputManager
+from core.data_loader import get_data_loader
+from core.input_manager import get_input_manager
+from core.save_manager import get_save_manager
 from ui.menu_renderer import MenuRenderer
 
 
@@ -15,8 +16,8 @@ class StarportMenuState(GameState):
         super().__init__(state_manager)
 
         # Initialize managers and renderers
-        self.data_loader = DataLoader()
-        self.input_manager = InputManager()
+        self.data_loader = get_data_loader()
+        self.input_manager = get_input_manager()
         self.menu_renderer = MenuRenderer()
 
         # Menu data (will be loaded in on_enter)
@@ -40,6 +41,9 @@ class StarportMenuState(GameState):
     def on_enter(self):
         """Called when entering the main menu state"""
         self._load_menu_data()
+        # Docking is an autosave point
+        if self.game_session:
+            get_save_manager().autosave(self.game_session)
 
     def handle_event(self, event):
         """Handle menu input events"""
@@ -1 +1,20 @@
 # Game systems (future ECS implementation)
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __all__ = lazy_exports(globals(), {
+    "TerrainGenerator": ".terrain_generator",
+    "TerrainMap": ".terrain_generator",
+    "CraterOverlay": ".crater_overlay",
+    "GasGiantGenerator": ".gas_giant_generator",
+    "ResourceScatter": ".resource_scatter",
+    "SurfaceMap": ".surface_map",
+    "PlanetPregenService": ".planet_pregen",
+    "ShipStore": ".ship_store",
+    "NpcTraffic": ".npc_traffic",
+    "LodScheduler": ".lod_scheduler",
+    "CombatEngine": ".combat_engine",
+    "CombatEstimator": ".combat_estimator",
+    "Loadout": ".combat_estimator",
+    "PlanetScanner": ".planet_scanner",
+    "MineralMarket": ".mineral_market"
+})
@@ -0,0 +1,441 @@
+"""
+Combat engine
+Fleet battles over a ShipStore: projectiles live in a preallocated array
+pool, and firing, flight, hit-testing and damage are vectorized passes over
+every ship and shot at once
+"""
+
+import numpy as np
+from core.game_data import EQUIPMENT_ARMOR, EQUIPMENT_SHIELD, get_game_data
+from systems.ship_store import integrate_motion
+from utils.spatial_grid import SpatialGrid
+
+COMBAT_STEP = 1.0 / 60.0     # Fixed simulation step (seconds)
+MAX_COMBAT_CATCHUP = 0.25    # Longest backlog update() simulates after a stall
+MAX_TURN_SECONDS = 5.0       # Longest a turn-resolved volley is followed
+
+HIT_RADIUS = 1.0             # A projectile this close to a hostile ship hits it
+SHIELD_RECHARGE = 0.05       # Share of full shields restored per second
+
+# Retargeting: ships without a live target pick one every step; every
+# ship also reconsiders now and then (a round-robin slice per step),
+# choosing the nearest of a few random hostile candidates and its current target
+RETARGET_PER_STEP = 256
+TARGET_CANDIDATES = 8
+
+# Flight and rate of fire per weapon group (weapons.json gives damage):
+# (speed in units/second, lifetime in seconds, seconds between shots,
+# aiming spread in radians, homing turn rate per second or 0)
+WEAPON_BALLISTICS = {
+    "laser": (40.0, 0.6, 0.5, 0.02, 0.0),
+    "missile_launcher": (15.0, 3.0, 2.0, 0.15, 4.0),
+}
+
+DEFAULT_PROJECTILE_CAPACITY = 1024
+
+
+class ProjectilePool:
+    """
+    Every projectile in flight, as parallel NumPy arrays.
+
+    Slots are handed out from a free stack (itself an array), so firing a
+    volley and retiring hits are single vectorized operations and no
+    per-shot objects are created. A full pool doubles in size.
+    """
+
+    def __init__(self, capacity=DEFAULT_PROJECTILE_CAPACITY):
+        """
+        Initialize an empty pool
+
+        Args:
+            capacity: Projectiles to allocate room for up front
+        """
+        self.capacity = 0
+        self.free = np.zeros(0, dtype=np.int64)   # Free slots; the last free_count are available
+        self.free_count = 0
+        self.alive = np.zeros(0, dtype=bool)
+        self.x = np.zeros(0, dtype=np.float32)
+        self.y = np.zeros(0, dtype=np.float32)
+        self.vx = np.zeros(0, dtype=np.float32)
+        self.vy = np.zeros(0, dtype=np.float32)
+        self.ttl = np.zeros(0, dtype=np.float32)       # Seconds left before it fizzles
+        self.damage = np.zeros(0, dtype=np.float32)
+        self.homing = np.zeros(0, dtype=np.float32)    # Turn rate (0 = flies straight)
+        self.owner = np.zeros(0, dtype=np.int64)       # Ship that fired it
+        self.faction = np.zeros(0, dtype=np.int16)
+        self.target = np.zeros(0, dtype=np.int64)      # Ship it homes on
+        self._grow(max(1, capacity))
+
+    def __len__(self):
+        """Number of projectiles in flight"""
+        return self.capacity - self.free_count
+
+    def _grow(self, capacity):
+        """Reallocate every array to hold capacity projectiles"""
+        for name in ("alive", "x", "y", "vx", "vy", "ttl", "damage", "homing", "owner", "faction", "target"):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self.capacity] = array
+            setattr(self, name, grown)
+        # New slots go under the existing free ones, lowest slot on top
+        new_slots = np.arange(capacity - 1, self.capacity - 1, -1)
+        free = np.zeros(capacity, dtype=np.int64)
+        free[:len(new_slots)] = new_slots
+        free[len(new_slots):len(new_slots) + self.free_count] = self.free[:self.free_count]
+        self.free = free
+        self.free_count += len(new_slots)
+        self.capacity = capacity
+
+    def spawn(self, count):
+        """
+        Take count free slots (growing if needed) and mark them alive
+
+        Returns:
+            np.ndarray: The slots, for the caller to fill in
+        """
+        if count > self.free_count:
+            capacity = self.capacity
+            while capacity - len(self) < count:
+                capacity *= 2
+            self._grow(capacity)
+        self.free_count -= count
+        slots = self.free[self.free_count:self.free_count + count][::-1].copy()
+        self.alive[slots] = True
+        return slots
+
+    def release(self, slots):
+        """Return slots to the pool"""
+        slots = slots[self.alive[slots]]
+        self.alive[slots] = False
+        self.free[self.free_count:self.free_count + len(slots)] = slots[::-1]
+        self.free_count += len(slots)
+
+    def active(self):
+        """Slots of every projectile in flight, in ascending order"""
+        return np.flatnonzero(self.alive)
+
+
+class CombatEngine:
+    """
+    Deterministic fleet combat between ships in a ShipStore.
+
+    Ships join with enlist(), which fits them from their equipment classes:
+    a weapon from weapons.json (damage), shields from shields.json
+    (protection_value becomes shield points) and armor from armor.json
+    (durability is the share of hull damage it stops). A hit drains
+    shields first; armor then reduces what gets through to the hull.
+    Ships with no hull left are destroyed and drop out.
+
+    Two ways to run it:
+    - Real time: update(dt) runs fixed COMBAT_STEP steps. Ships move,
+      fire whenever their weapon is ready and their target is in range,
+      and shields recharge.
+    - Turn-resolved: resolve_turn() fires one volley from every ready ship
+      and follows it until every shot has hit or fizzled. Ships hold still.
+
+    The same seed and the same calls give the same battle: all randomness
+    (aim spread, target picks) comes from the engine's own generator and
+    every pass is in a fixed order.
+
+    Example:
+        engine = CombatEngine(store, seed=7)
+        engine.enlist(fleet_a)
+        engine.enlist(fleet_b, weapon_group="missile_launcher")
+        destroyed = engine.update(dt)
+    """
+
+    def __init__(self, store, seed=None, hostile=None, game_data=None,
+                 projectile_capacity=DEFAULT_PROJECTILE_CAPACITY):
+        """
+        Initialize the engine
+
+        Args:
+            store: ShipStore holding the combatants
+            seed: Seed for the engine's random generator
+            hostile: Optional (factions x factions) bool array of who fights
+                     whom; by default every other faction is hostile
+            game_data: Optional GameData (uses the shared one if None)
+            projectile_capacity: Initial projectile pool size
+        """
+        self.store = store
+        self.game_data = game_data or get_game_data()
+        self.rng = np.random.default_rng(seed)
+        self.hostile = None if hostile is None else np.asarray(hostile, dtype=bool)
+        self.projectiles = ProjectilePool(projectile_capacity)
+        self.grid = SpatialGrid(HIT_RADIUS)
+
+        self.ids = np.zeros(0, dtype=np.int64)   # Enlisted ships still fighting
+        self.time = 0.0
+        self.simulated = 0.0                     # Real-time clock, in whole steps
+        self._retarget_cursor = 0
+        self.stats = {"shots": 0, "hits": 0, "damage": 0.0, "destroyed": 0}
+
+        for name, dtype, default in (("weapon_id", np.int16, -1), ("shield_points", np.float32, 0.0),
+                                     ("max_shield_points", np.float32, 0.0), ("armor_durability", np.float32, 0.0),
+                                     ("cooldown", np.float32, 0.0), ("target", np.int64, -1)):
+            if name not in store.columns:
+                store.add_component(name, dtype, default)
+
+        # Weapon tables indexed by equipment id
+        data = self.game_data
+        count = len(data.equipment)
+        self.weapon_speed = np.zeros(count, dtype=np.float32)
+        self.weapon_ttl = np.zeros(count, dtype=np.float32)
+        self.weapon_cooldown = np.zeros(count, dtype=np.float32)
+        self.weapon_spread = np.zeros(count, dtype=np.float32)
+        self.weapon_homing = np.zeros(count, dtype=np.float32)
+        for item in data.equipment:
+            if item.group in WEAPON_BALLISTICS:
+                (self.weapon_speed[item.id], self.weapon_ttl[item.id], self.weapon_cooldown[item.id],
+                 self.weapon_spread[item.id], self.weapon_homing[item.id]) = WEAPON_BALLISTICS[item.group]
+        self.weapon_range = self.weapon_speed * self.weapon_ttl
+
+    def enlist(self, ids, weapon_group="laser"):
+        """
+        Add ships to the battle, fitted from their equipment classes
+
+        Args:
+            ids: Entity ids
+            weapon_group: Weapon group for their weapon_class ("laser" or
+                          "missile_launcher"); class 0 means unarmed
+        """
+        store = self.store
+        ids = np.asarray(ids, dtype=np.int64)
+        data = self.game_data
+
+        def fitted(group, classes):
+            lookup = np.full(6, -1, dtype=np.int16)
+            for equipment_class in range(1, 6):
+                lookup[equipment_class] = data.equipment_by_class.get((group, equipment_class), -1)
+            return lookup[np.clip(classes, 0, 5)]
+
+        store.weapon_id[ids] = fitted(weapon_group, store.weapon_class[ids])
+        shields = fitted(EQUIPMENT_SHIELD, store.shield_class[ids])
+        armor = fitted(EQUIPMENT_ARMOR, store.armor_class[ids])
+        store.max_shield_points[ids] = np.where(shields >= 0, data.equipment_protection[shields], 0.0)
+        store.shield_points[ids] = store.max_shield_points[ids]
+        store.armor_durability[ids] = np.where(armor >= 0, data.equipment_durability[armor], 0.0)
+        store.cooldown[ids] = 0.0
+        store.target[ids] = -1
+        self.ids = np.union1d(self.ids, ids)
+
+    def update(self, dt):
+        """
+        Real-time mode: simulate the fixed steps that fit in dt
+
+        Returns:
+            np.ndarray: Ships destroyed during this update
+        """
+        self.time += dt
+        self.simulated = max(self.simulated, self.time - MAX_COMBAT_CATCHUP)
+        destroyed = []
+        while self.simulated + COMBAT_STEP <= self.time:
+            self.simulated += COMBAT_STEP
+            destroyed.append(self.step(COMBAT_STEP))
+        return np.concatenate(destroyed) if destroyed else np.zeros(0, dtype=np.int64)
+
+    def resolve_turn(self, max_seconds=MAX_TURN_SECONDS):
+        """
+        Turn-resolved mode: every armed ship with a target fires once, then
+        the shots are followed until they all land or fizzle
+
+        Args:
+            max_seconds: Longest the volley is followed
+
+        Returns:
+            dict: shots, hits, damage and the destroyed ship ids for the turn
+        """
+        before = dict(self.stats)
+        self.store.cooldown[self.ids] = 0.0
+        destroyed = [self.step(COMBAT_STEP, move_ships=False, recharge=False)]
+        elapsed = COMBAT_STEP
+        while len(self.projectiles) and elapsed < max_seconds:
+            destroyed.append(self.step(COMBAT_STEP, move_ships=False, fire=False, recharge=False))
+            elapsed += COMBAT_STEP
+        report = {key: self.stats[key] - before[key] for key in ("shots", "hits", "damage")}
+        report["destroyed"] = np.concatenate(destroyed)
+        return report
+
+    def step(self, dt, move_ships=True, fire=True, recharge=True):
+        """
+        One combat step: target, fire, fly, hit
+
+        Args:
+            dt: Seconds to simulate
+            move_ships: Move ships by their velocity
+            fire: Let ready weapons fire
+            recharge: Recharge shields
+
+        Returns:
+            np.ndarray: Ships destroyed this step
+        """
+        store = self.store
+        ids = self.ids
+        if recharge:
+            store.shield_points[ids] = np.minimum(
+                store.shield_points[ids] + store.max_shield_points[ids] * SHIELD_RECHARGE * dt,
+                store.max_shield_points[ids])
+        store.cooldown[ids] = np.maximum(store.cooldown[ids] - dt, 0.0)
+
+        if fire:
+            self._retarget()
+            self._fire()
+        self._fly(dt)
+        if move_ships:
+            integrate_motion(store, dt, fuel_per_unit=0.0, ids=ids)
+        return self._hit()
+
+    def _hostile_to(self, faction, factions):
+        """Which of factions are hostile to faction"""
+        if self.hostile is None:
+            return factions != faction
+        return self.hostile[faction, factions]
+
+    def _retarget(self):
+        """Pick targets for ships without one, plus a round-robin slice of the rest"""
+        store = self.store
+        ids = self.ids
+        if len(ids) < 2:
+            return
+        target = store.target[ids]
+        lost = (target < 0) | ~store.alive[target] | (store.hull[target] <= 0)
+        store.target[ids[lost]] = -1
+
+        count = min(RETARGET_PER_STEP, len(ids))
+        start = self._retarget_cursor % len(ids)
+        rotation = np.zeros(len(ids), dtype=bool)
+        rotation[np.arange(start, start + count) % len(ids)] = True
+        self._retarget_cursor = start + count
+        choosing = ids[(lost | rotation) & (store.weapon_id[ids] >= 0)]
+        if len(choosing) == 0:
+            return
+
+        factions = store.faction[ids]
+        for faction in np.unique(store.faction[choosing]):
+            enemies = ids[self._hostile_to(faction, factions)]
+            if len(enemies) == 0:
+                continue
+            shooters = choosing[store.faction[choosing] == faction]
+            candidates = enemies[self.rng.integers(0, len(enemies), (len(shooters), TARGET_CANDIDATES))]
+            current = store.target[shooters]
+            candidates = np.column_stack([np.where(current >= 0, current, candidates[:, 0]), candidates])
+
+            dx = store.x[candidates] - store.x[shooters, None]
+            dy = store.y[candidates] - store.y[shooters, None]
+            nearest = np.argmin(dx * dx + dy * dy, axis=1)
+            store.target[shooters] = candidates[np.arange(len(shooters)), nearest]
+
+    def _fire(self):
+        """Launch a shot from every ship whose weapon is ready and whose target is in range"""
+        store = self.store
+        ids = self.ids
+        weapon = store.weapon_id[ids]
+        target = store.target[ids]
+        ready = (weapon >= 0) & (target >= 0) & (store.cooldown[ids] <= 0.0)
+        shooters, weapon, target = ids[ready], weapon[ready], target[ready]
+
+        dx = store.x[target] - store.x[shooters]
+        dy = store.y[target] - store.y[shooters]
+        in_range = dx * dx + dy * dy <= self.weapon_range[weapon] ** 2
+        shooters, weapon, target = shooters[in_range], weapon[in_range], target[in_range]
+        if len(shooters) == 0:
+            return
+
+        angle = (np.arctan2(dy[in_range], dx[in_range])
+                 + self.rng.normal(0.0, 1.0, len(shooters)) * self.weapon_spread[weapon])
+        speed = self.weapon_speed[weapon]
+        slots = self.projectiles.spawn(len(shooters))
+        pool = self.projectiles
+        pool.x[slots] = store.x[shooters]
+        pool.y[slots] = store.y[shooters]
+        pool.vx[slots] = np.cos(angle) * speed
+        pool.vy[slots] = np.sin(angle) * speed
+        pool.ttl[slots] = self.weapon_ttl[weapon]
+        pool.damage[slots] = self.game_data.equipment_damage[weapon]
+        pool.homing[slots] = self.weapon_homing[weapon]
+        pool.owner[slots] = shooters
+        pool.faction[slots] = store.faction[shooters]
+        pool.target[slots] = target
+
+        store.cooldown[shooters] = self.weapon_cooldown[weapon]
+        self.stats["shots"] += len(shooters)
+
+    def _fly(self, dt):
+        """Steer homing shots, move every shot, and retire the ones that fizzled"""
+        pool = self.projectiles
+        slots = pool.active()
+        if len(slots) == 0:
+            return
+
+        homing = slots[pool.homing[slots] > 0]
+        if len(homing):
+            store = self.store
+            target = pool.target[homing]
+            live = store.alive[target] & (store.hull[target] > 0)
+            homing, target = homing[live], target[live]
+            vx, vy = pool.vx[homing], pool.vy[homing]
+            speed = np.hypot(vx, vy)
+            to_x = store.x[target] - pool.x[homing]
+            to_y = store.y[target] - pool.y[homing]
+            distance = np.maximum(np.hypot(to_x, to_y), 1e-6)
+            turn = np.minimum(pool.homing[homing] * dt, 1.0)
+            vx = vx + (to_x / distance * speed - vx) * turn
+            vy = vy + (to_y / distance * speed - vy) * turn
+            scale = speed / np.maximum(np.hypot(vx, vy), 1e-6)
+            pool.vx[homing] = vx * scale
+            pool.vy[homing] = vy * scale
+
+        pool.x[slots] += pool.vx[slots] * dt
+        pool.y[slots] += pool.vy[slots] * dt
+        pool.ttl[slots] -= dt
+        pool.release(slots[pool.ttl[slots] <= 0.0])
+
+    def _hit(self):
+        """Apply hits from shots near hostile ships; returns ships destroyed"""
+        pool = self.projectiles
+        store = self.store
+        ids = self.ids
+        slots = pool.active()
+        if len(slots) == 0 or len(ids) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        self.grid.build(store.x[ids], store.y[ids])
+        shot, ship = self.grid.query_points(pool.x[slots], pool.y[slots], HIT_RADIUS)
+        hostile = self._hostile_pairs(pool.faction[slots[shot]], store.faction[ids[ship]])
+        shot, ship = shot[hostile], ship[hostile]
+        if len(shot) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Each shot hits one ship: the nearest (lowest index on ties)
+        dx = pool.x[slots[shot]] - store.x[ids[ship]]
+        dy = pool.y[slots[shot]] - store.y[ids[ship]]
+        order = np.lexsort((ship, dx * dx + dy * dy, shot))
+        shot, ship = shot[order], ship[order]
+        first = np.ones(len(shot), dtype=bool)
+        first[1:] = shot[1:] != shot[:-1]
+        shot, ship = shot[first], ship[first]
+
+        # Shields soak damage first; armor stops a share of the rest
+        incoming = np.bincount(ship, pool.damage[slots[shot]], len(ids)).astype(np.float32)
+        struck = np.flatnonzero(incoming)
+        victims = ids[struck]
+        incoming = incoming[struck]
+        absorbed = np.minimum(store.shield_points[victims], incoming)
+        store.shield_points[victims] -= absorbed
+        hull_damage = (incoming - absorbed) * (1.0 - store.armor_durability[victims])
+        store.hull[victims] = np.maximum(store.hull[victims] - hull_damage, 0.0)
+        pool.release(slots[shot])
+
+        destroyed = victims[store.hull[victims] <= 0.0]
+        if len(destroyed):
+            self.ids = np.setdiff1d(self.ids, destroyed, assume_unique=True)
+        self.stats["hits"] += len(shot)
+        self.stats["damage"] += float(incoming.sum())
+        self.stats["destroyed"] += len(destroyed)
+        return destroyed
+
+    def _hostile_pairs(self, shot_factions, ship_factions):
+        """Whether each shot's faction is hostile to each ship's"""
+        if self.hostile is None:
+            return shot_factions != ship_factions
+        return self.hostile[shot_factions, ship_factions]
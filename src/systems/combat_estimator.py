@@ -0,0 +1,364 @@
+"""
+Combat outcome estimator
+Monte Carlo odds for a duel between two ship loadouts: thousands of seeded
+engagements run on a process pool, and results are cached per loadout pair
+"""
+
+import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import astuple, dataclass
+import numpy as np
+from core.game_data import get_game_data
+from systems.combat_engine import SHIELD_RECHARGE, WEAPON_BALLISTICS
+
+DEFAULT_RUNS = 4000          # Engagements per estimate
+CHUNK_RUNS = 1000            # Engagements per worker job (fixed, so results don't depend on the pool size)
+DEFAULT_MAX_CACHED = 256     # Loadout pairs kept before the oldest is dropped
+
+DUEL_STEP = 0.25             # Seconds per simulated step (divides every weapon's cooldown)
+MAX_DUEL_SECONDS = 180.0     # Engagements still undecided by then are draws
+DAMAGE_SPREAD = 0.2          # Hits do between 80% and 120% of the weapon's damage
+
+# Chance a shot hits: the weapon group's base chance, plus the shooter's
+# navigation (accuracy), minus the target's engine class and navigation (evasion)
+BASE_HIT_CHANCE = {"laser": 0.8, "missile_launcher": 0.9}
+ACCURACY_PER_SKILL = 0.001
+EVASION_PER_ENGINE_CLASS = 0.04
+EVASION_PER_SKILL = 0.0005
+MIN_HIT_CHANCE = 0.05
+MAX_HIT_CHANCE = 0.98
+
+# Engineering speeds up shield recharge (200 points doubles it)
+RECHARGE_PER_SKILL = 0.005
+
+# Win probability an AI wants before it starts a fight
+ENGAGE_THRESHOLD = 0.6
+
+
+@dataclass(frozen=True)
+class Loadout:
+    """
+    Everything about a ship that decides a duel, resolved to numbers.
+
+    Build one with from_equipment(); two loadouts with the same numbers
+    share cache entries no matter which ship or crew they came from.
+    """
+    hull: float
+    weapon_group: str          # Key of WEAPON_BALLISTICS, or "" if unarmed
+    weapon_damage: float
+    shield_points: float
+    armor_durability: float    # Share of hull damage the armor stops
+    engine_class: int
+    navigation: int            # Crew skill levels
+    engineering: int
+
+    @classmethod
+    def from_equipment(cls, ship_class, weapon=None, shield=None, armor=None, engine=None,
+                       skills=None, game_data=None):
+        """
+        Build a loadout from ship_equipment keys and crew skills
+
+        Args:
+            ship_class: ships.json key (gives the hull)
+            weapon, shield, armor, engine: Equipment keys (e.g. "laser.class_2"), or None for none fitted
+            skills: {skill key: level}; skills not given use the designer species' starting levels
+            game_data: Optional GameData (uses the shared one if None)
+
+        Returns:
+            Loadout
+
+        Raises:
+            KeyError: If a ship class, equipment or skill key doesn't exist
+            ValueError: If the weapon isn't one combat knows how to fire
+        """
+        data = game_data or get_game_data()
+        ship = data.ship_classes[data.ship_class_ids[ship_class]]
+        levels = dict(zip((skill.key for skill in data.skills),
+                          data.species_starting_skills[ship.designer_species_id].tolist()))
+        for key, level in (skills or {}).items():
+            data.skill_ids[key]  # Unknown skills are a mistake, not something to ignore
+            levels[key] = level
+
+        def fitted(key):
+            return data.equipment_by_key[key] if key is not None else None
+
+        weapon_record = fitted(weapon)
+        if weapon_record is not None and weapon_record.group not in WEAPON_BALLISTICS:
+            raise ValueError(f"'{weapon}' isn't a combat weapon")
+        shield_record, armor_record, engine_record = fitted(shield), fitted(armor), fitted(engine)
+        return cls(
+            hull=float(ship.base_hull),
+            weapon_group=weapon_record.group if weapon_record else "",
+            weapon_damage=weapon_record.damage if weapon_record else 0.0,
+            shield_points=shield_record.protection_value if shield_record else 0.0,
+            armor_durability=armor_record.durability if armor_record else 0.0,
+            engine_class=engine_record.equipment_class if engine_record else 0,
+            navigation=int(levels["navigation"]),
+            engineering=int(levels["engineering"])
+        )
+
+    def key(self):
+        """Stable hash of the loadout (the same in every process and session)"""
+        return hashlib.sha1(repr(astuple(self)).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CombatEstimate:
+    """Outcome odds for loadout a fighting loadout b"""
+    runs: int
+    win_a: float               # Share of engagements a won
+    win_b: float
+    draw: float                # Neither destroyed in MAX_DUEL_SECONDS, or both in the same step
+    hull_loss_a: float         # Mean hull points a lost (over every engagement)
+    hull_loss_b: float
+    time_to_kill_a: float      # Mean seconds a took to destroy b, over a's wins (None if it never did)
+    time_to_kill_b: float
+
+    def swapped(self):
+        """The same estimate from b's point of view"""
+        return CombatEstimate(self.runs, self.win_b, self.win_a, self.draw, self.hull_loss_b,
+                              self.hull_loss_a, self.time_to_kill_b, self.time_to_kill_a)
+
+
+def hit_chance(shooter, target):
+    """Chance each of shooter's shots hits target"""
+    chance = (BASE_HIT_CHANCE[shooter.weapon_group] + shooter.navigation * ACCURACY_PER_SKILL
+              - target.engine_class * EVASION_PER_ENGINE_CLASS - target.navigation * EVASION_PER_SKILL)
+    return min(max(chance, MIN_HIT_CHANCE), MAX_HIT_CHANCE)
+
+
+def simulate_duels(a, b, runs, seed):
+    """
+    Fight runs seeded engagements between a and b, all at once as arrays
+
+    Module-level so worker processes can run it.
+
+    Args:
+        a, b: Loadouts
+        runs: Number of engagements
+        seed: Seed (int or np.random.SeedSequence)
+
+    Returns:
+        np.ndarray: Totals [wins a, wins b, draws, hull lost a, hull lost b,
+                    kill time a, kill time b] (kill times summed over wins)
+    """
+    rng = np.random.default_rng(seed)
+    sides = (a, b)
+    hull = np.array([[side.hull] * runs for side in sides], dtype=np.float64)
+    shields = np.array([[side.shield_points] * runs for side in sides], dtype=np.float64)
+    recharge = [side.shield_points * SHIELD_RECHARGE * (1.0 + side.engineering * RECHARGE_PER_SKILL) * DUEL_STEP
+                for side in sides]
+    # Steps between shots; both sides open fire at a random point in their first cycle
+    period = [round(WEAPON_BALLISTICS[side.weapon_group][2] / DUEL_STEP) if side.weapon_group else 0
+              for side in sides]
+    cooldown = np.array([rng.integers(0, max(steps, 1), runs) for steps in period])
+    chance = [hit_chance(side, other) if side.weapon_group else 0.0 for side, other in zip(sides, sides[::-1])]
+
+    fighting = np.ones(runs, dtype=bool)
+    ended = np.full(runs, MAX_DUEL_SECONDS)
+    for step in range(int(MAX_DUEL_SECONDS / DUEL_STEP)):
+        live = np.flatnonzero(fighting)
+        if len(live) == 0:
+            break
+        for shooter in (0, 1):
+            if not period[shooter]:
+                continue
+            target = 1 - shooter
+            ready = live[cooldown[shooter, live] == 0]
+            cooldown[shooter, live] -= 1
+            cooldown[shooter, ready] = period[shooter] - 1
+            hits = ready[rng.random(len(ready)) < chance[shooter]]
+            damage = sides[shooter].weapon_damage * rng.uniform(1.0 - DAMAGE_SPREAD, 1.0 + DAMAGE_SPREAD, len(hits))
+            absorbed = np.minimum(shields[target, hits], damage)
+            shields[target, hits] -= absorbed
+            hull[target, hits] -= (damage - absorbed) * (1.0 - sides[target].armor_durability)
+        for side in (0, 1):
+            shields[side, live] = np.minimum(shields[side, live] + recharge[side], sides[side].shield_points)
+
+        # Both sides fire in the same step, so mutual kills are possible
+        done = live[(hull[0, live] <= 0.0) | (hull[1, live] <= 0.0)]
+        fighting[done] = False
+        ended[done] = (step + 1) * DUEL_STEP
+
+    destroyed = hull <= 0.0
+    won_a = destroyed[1] & ~destroyed[0]
+    won_b = destroyed[0] & ~destroyed[1]
+    lost = np.array([side.hull for side in sides])[:, None] - np.maximum(hull, 0.0)
+    return np.array([won_a.sum(), won_b.sum(), runs - won_a.sum() - won_b.sum(),
+                     lost[0].sum(), lost[1].sum(), ended[won_a].sum(), ended[won_b].sum()])
+
+
+def summarize(totals, runs):
+    """Turn summed simulate_duels() totals into a CombatEstimate"""
+    wins_a, wins_b, draws, lost_a, lost_b, kill_time_a, kill_time_b = totals.tolist()
+    return CombatEstimate(
+        runs=runs,
+        win_a=wins_a / runs,
+        win_b=wins_b / runs,
+        draw=draws / runs,
+        hull_loss_a=lost_a / runs,
+        hull_loss_b=lost_b / runs,
+        time_to_kill_a=kill_time_a / wins_a if wins_a else None,
+        time_to_kill_b=kill_time_b / wins_b if wins_b else None
+    )
+
+
+class CombatEstimator:
+    """
+    Estimates who wins a duel between two loadouts by simulating thousands
+    of engagements.
+
+    The engagements are split into CHUNK_RUNS-sized jobs, each with its
+    own child of the estimator's seed, and spread over a process pool (the
+    simulation is pure NumPy on small arrays, so separate processes are
+    what actually run it in parallel). The same seed gives the same odds
+    however many workers there are, and every pair of loadouts is fought
+    with the same random numbers, so comparing two loadouts against an
+    enemy isn't blurred by noise.
+
+    Results are cached by the loadouts' hashes; asking for b against a
+    after a against b is a cache hit. The UI polls: request() starts the
+    work and get() returns None until it's done. AI factions call
+    estimate() or should_engage(), which block.
+
+    Example:
+        estimator = CombatEstimator()
+        player = Loadout.from_equipment("human_survey_vessel", "laser.class_2", "shield.class_1")
+        enemy = Loadout.from_equipment("oval_survey_vessel", "missile_launcher.class_1")
+        estimator.request(player, enemy)
+        ...
+        odds = estimator.get(player, enemy)  # None until ready
+    """
+
+    def __init__(self, runs=DEFAULT_RUNS, seed=0, max_workers=None, max_cached=DEFAULT_MAX_CACHED):
+        """
+        Initialize the estimator
+
+        Args:
+            runs: Engagements per estimate
+            seed: Seed every estimate is drawn from
+            max_workers: Worker processes (None for one per CPU, 0 to run
+                         on the calling thread)
+            max_cached: Loadout pairs kept before the oldest is dropped
+        """
+        self.runs = runs
+        self.seed = seed
+        self.max_cached = max_cached
+        # Workers are spawned, not forked: forking copies a multi-threaded
+        # process (SaveManager, planet pre-generation and bake workers) and
+        # can deadlock on a lock another thread held. Spawn works on every
+        # platform, unlike forkserver.
+        self.executor = (ProcessPoolExecutor(max_workers=max_workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+                         if max_workers != 0 else None)
+        self.lock = threading.Lock()
+        self.jobs = {}               # key -> list of chunk futures
+        self.cache = OrderedDict()   # key -> CombatEstimate, least recently used first
+
+    def key(self, a, b):
+        """Cache key for a fighting b"""
+        return (a.key(), b.key(), self.runs, self.seed)
+
+    def request(self, a, b):
+        """
+        Start estimating a against b, without blocking
+
+        Returns:
+            bool: False if the estimate is already cached
+        """
+        with self.lock:
+            if self._cached(a, b) is not None:
+                return False
+            self._start(a, b)
+            return True
+
+    def get(self, a, b):
+        """
+        Get the estimate for a against b if it's ready, without blocking
+
+        Returns:
+            CombatEstimate or None
+        """
+        with self.lock:
+            estimate = self._cached(a, b)
+            if estimate is not None:
+                return estimate
+            key = self.key(a, b)
+            job = self.jobs.get(key)
+            if job is None or not all(chunk.done() for chunk in job):
+                return None
+            try:
+                return self._finish(key, job)
+            except Exception as e:
+                print(f"WARNING: Combat estimate failed: {e}")
+                return None
+
+    def estimate(self, a, b):
+        """
+        Get the estimate for a against b, simulating it now if needed
+
+        Returns:
+            CombatEstimate
+        """
+        with self.lock:
+            estimate = self._cached(a, b)
+            if estimate is not None:
+                return estimate
+            key = self.key(a, b)
+            job = self._start(a, b)
+        wait(job)
+        with self.lock:
+            estimate = self._cached(a, b)
+            return estimate if estimate is not None else self._finish(key, job)
+
+    def should_engage(self, own, enemy, threshold=ENGAGE_THRESHOLD):
+        """Whether own wins against enemy at least threshold of the time"""
+        return self.estimate(own, enemy).win_a >= threshold
+
+    def shutdown(self):
+        """Drop unfinished work and stop the worker processes"""
+        with self.lock:
+            self.jobs.clear()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _cached(self, a, b):
+        """Cached estimate for a against b, from either side (lock held)"""
+        for key, flip in ((self.key(a, b), False), (self.key(b, a), True)):
+            estimate = self.cache.get(key)
+            if estimate is not None:
+                self.cache.move_to_end(key)
+                return estimate.swapped() if flip else estimate
+        return None
+
+    def _start(self, a, b):
+        """Submit the chunks for a against b unless they're running (lock held)"""
+        key = self.key(a, b)
+        job = self.jobs.get(key)
+        if job is not None:
+            return job
+        seeds = np.random.SeedSequence(self.seed).spawn(-(-self.runs // CHUNK_RUNS))
+        sizes = [min(CHUNK_RUNS, self.runs - index * CHUNK_RUNS) for index in range(len(seeds))]
+        if self.executor is None:
+            job = []
+            for size, seed in zip(sizes, seeds):
+                chunk = Future()
+                chunk.set_result(simulate_duels(a, b, size, seed))
+                job.append(chunk)
+        else:
+            job = [self.executor.submit(simulate_duels, a, b, size, seed) for size, seed in zip(sizes, seeds)]
+        self.jobs[key] = job
+        return job
+
+    def _finish(self, key, job):
+        """Combine a finished job's chunks and cache the estimate (lock held)"""
+        self.jobs.pop(key, None)  # shutdown() may have cleared it while estimate() waited
+        totals = sum(chunk.result() for chunk in job)
+        estimate = summarize(totals, self.runs)
+        self.cache[key] = estimate
+        while len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+        return estimate
@@ -0,0 +1,125 @@
+"""
+Crater overlay for airless bodies
+Scatters seeded impact craters and stamps them onto a heightmap
+"""
+
+import numpy as np
+from utils.noise import derive_seed
+
+# Rim uplift extends this many crater radii from the center
+RIM_EXTENT = 1.5
+# Width of the rim's gaussian falloff, in crater radii
+RIM_WIDTH = 0.2
+
+
+class CraterOverlay:
+    """
+    A seeded set of impact craters that can be rasterized onto any window
+    of a heightmap.
+
+    Crater radii follow a truncated power law (many small, few large).
+    Each crater only touches the cells inside its own bounding box, so cost
+    scales with total crater area rather than cells x craters. Craters are
+    applied in generation order, and each impact partially erases the relief
+    beneath its bowl, so later impacts overwrite earlier ones.
+    """
+
+    def __init__(self, seed, grid_width, grid_height, settings):
+        """
+        Generate the crater population for a surface
+
+        Args:
+            seed: Planet seed
+            grid_width, grid_height: Surface size in cells
+            settings: Crater settings dict with keys:
+                density: Craters per 100x100 cells
+                min_radius, max_radius: Radius range in cells
+                size_exponent: Power-law exponent (higher = more small craters)
+                depth: Bowl depth of a max_radius crater (height units)
+                rim_height: Rim uplift as a fraction of bowl depth
+                erase: How much older relief a bowl flattens (0-1)
+                floor_level: Height that flattened relief settles toward
+        """
+        self.settings = settings
+        rng = np.random.default_rng(derive_seed(seed, "craters"))
+
+        count = int(settings["density"] * grid_width * grid_height / 10000)
+        self.x = rng.uniform(0, grid_width, count).astype(np.float32)
+        self.y = rng.uniform(0, grid_height, count).astype(np.float32)
+        self.radius = self._sample_radii(rng, count).astype(np.float32)
+
+        # Bigger craters are deeper, sub-linearly
+        scale = np.sqrt(self.radius / settings["max_radius"])
+        self.depth = (settings["depth"] * scale).astype(np.float32)
+
+        # Cell-space bounding boxes (inclusive-exclusive)
+        extent = self.radius * RIM_EXTENT
+        self.x_min = np.floor(self.x - extent).astype(np.int32)
+        self.x_max = np.ceil(self.x + extent).astype(np.int32) + 1
+        self.y_min = np.floor(self.y - extent).astype(np.int32)
+        self.y_max = np.ceil(self.y + extent).astype(np.int32) + 1
+
+    def _sample_radii(self, rng, count):
+        """
+        Sample radii from a power law truncated to [min_radius, max_radius]
+
+        Uses the inverse CDF of p(r) ~ r^-(a+1).
+        """
+        r_min = self.settings["min_radius"]
+        r_max = self.settings["max_radius"]
+        a = self.settings["size_exponent"]
+        u = rng.random(count)
+        low = r_min ** -a
+        high = r_max ** -a
+        return (low + u * (high - low)) ** (-1.0 / a)
+
+    def __len__(self):
+        return len(self.radius)
+
+    def apply(self, heights, x0=0, y0=0):
+        """
+        Stamp every crater overlapping a window onto its heights, in place.
+
+        Args:
+            heights: float32 array of shape (rows, cols), indexed [y, x]
+            x0, y0: Grid coordinates of the window's lower-left cell
+
+        Returns:
+            np.ndarray: The same heights array (clipped to [0, 1])
+        """
+        rows, cols = heights.shape
+        overlapping = np.nonzero(
+            (self.x_max > x0) & (self.x_min < x0 + cols) &
+            (self.y_max > y0) & (self.y_min < y0 + rows)
+        )[0]
+
+        rim_height = self.settings.get("rim_height", 0.3)
+        erase = self.settings.get("erase", 0.6)
+        # Bowls flatten toward a fixed level rather than a local average, so a
+        # crater split across two windows comes out identical in both
+        floor_level = self.settings.get("floor_level", 0.5)
+
+        for i in overlapping:
+            # Clip the crater's box to the window (window-local indices)
+            c0 = max(self.x_min[i] - x0, 0)
+            c1 = min(self.x_max[i] - x0, cols)
+            r0 = max(self.y_min[i] - y0, 0)
+            r1 = min(self.y_max[i] - y0, rows)
+
+            # Distance from the crater center in crater radii (cell centers at +0.5)
+            dx = (np.arange(c0, c1, dtype=np.float32) + (x0 + 0.5) - self.x[i]) / self.radius[i]
+            dy = (np.arange(r0, r1, dtype=np.float32) + (y0 + 0.5) - self.y[i]) / self.radius[i]
+            d2 = dx[np.newaxis, :] ** 2 + dy[:, np.newaxis] ** 2
+
+            depth = self.depth[i]
+            inside = d2 < 1.0
+            bowl = np.where(inside, depth * (d2 - 1.0), 0.0)
+            rim = (depth * rim_height) * np.exp(-((np.sqrt(d2) - 1.0) / RIM_WIDTH) ** 2)
+
+            patch = heights[r0:r1, c0:c1]
+            # Flatten older relief inside the bowl (later impacts overwrite earlier ones)
+            flatten = np.where(inside, erase * (1.0 - d2), 0.0)
+            patch += flatten * (floor_level - patch) + bowl + rim
+
+        np.clip(heights, 0.0, 1.0, out=heights)
+        return heights
@@ -0,0 +1,216 @@
+"""
+Gas giant texture generator
+Builds latitude-banded gas giant textures and pre-baked rotation frames
+"""
+
+import math
+import numpy as np
+from core.data_loader import get_data_loader
+from utils.noise import derive_seed, tileable_noise_grid
+
+# Texture resolution (equirectangular: width spans 360 degrees, height 180)
+TEXTURE_WIDTH = 512
+TEXTURE_HEIGHT = 256
+
+# Rotation frames baked per planet and size
+FRAME_COUNT = 24
+
+
+class GasGiantGenerator:
+    """
+    Generates gas giant visuals from a planet seed.
+
+    generate_texture() builds an equirectangular band texture: seeded bands
+    of varying width, band edges distorted by wrapping noise, and spiral
+    storms. render_frames() projects that texture onto a sphere at a given
+    pixel size for a full revolution, so drawing an animated giant is just
+    picking a frame.
+    """
+
+    def __init__(self, data_loader=None, texture_width=TEXTURE_WIDTH,
+                 texture_height=TEXTURE_HEIGHT):
+        """
+        Initialize the generator
+
+        Args:
+            data_loader: Optional DataLoader (the shared loader if None)
+            texture_width, texture_height: Band texture resolution
+        """
+        self.data_loader = data_loader or get_data_loader()
+        terrain_data = self.data_loader.load_static("planetary_info", "terrain_profiles.json")
+        self.styles = terrain_data["gas_giant_styles"]
+        self.planet_type_styles = terrain_data["planet_type_gas_giant_styles"]
+
+        self.texture_width = texture_width
+        self.texture_height = texture_height
+
+    def style_for_planet(self, planet):
+        """
+        Pick a band style for a planet, consistently per seed.
+
+        Args:
+            planet: Planet with seed and type attributes
+
+        Returns:
+            str: Style name (e.g., "jovian")
+
+        Raises:
+            ValueError: If the planet type isn't a gas/ice giant
+        """
+        options = self.planet_type_styles.get(planet.type)
+        if not options:
+            raise ValueError(f"Planet type '{planet.type}' is not a gas giant")
+        return options[derive_seed(planet.seed, "style") % len(options)]
+
+    def generate_texture(self, seed, style_name):
+        """
+        Generate the band texture for a gas giant.
+
+        Args:
+            seed: Planet seed
+            style_name: Key into gas_giant_styles
+
+        Returns:
+            np.ndarray: uint8 array of shape (texture_height, texture_width, 3),
+                        row 0 at the north pole, column 0 at longitude 0
+        """
+        style = self.styles[style_name]
+        width = self.texture_width
+        height = self.texture_height
+        rng = np.random.default_rng(derive_seed(seed, "gas_giant"))
+
+        # Band boundaries as latitude fractions (0 = north pole, 1 = south pole)
+        band_count = int(rng.integers(style["band_count"][0], style["band_count"][1] + 1))
+        band_widths = rng.uniform(0.5, 1.5, band_count)
+        edges = np.cumsum(band_widths)[:-1] / band_widths.sum()
+
+        palette = np.array(style["band_palette"], dtype=np.float32)
+        band_colors = palette[np.arange(band_count) % len(palette)]
+        # Brightness-only jitter so bands don't drift off the palette's hue
+        band_colors += rng.normal(0.0, style.get("color_jitter", 0), (band_count, 1))
+
+        # Wavy band edges: shift each cell's latitude by wrapping noise
+        frequency = style["distortion_frequency"]
+        latitude = ((np.arange(height, dtype=np.float32) + 0.5) / height)[:, np.newaxis]
+        distortion = tileable_noise_grid(width, height, frequency, frequency / height,
+                                         derive_seed(seed, "distortion"), octaves=3)
+        latitude = latitude + style["distortion"] * distortion
+
+        storms = self._place_storms(rng, style)
+        for storm in storms:
+            self._twist_storm(latitude, storm, style["storm_twist"])
+
+        band_index = np.searchsorted(edges, np.clip(latitude, 0.0, 1.0))
+        texture = band_colors[band_index]
+
+        # Fine turbulence shading within bands
+        turbulence = tileable_noise_grid(width, height, frequency * 4, frequency * 4 / height,
+                                         derive_seed(seed, "turbulence"), octaves=3)
+        texture *= (1.0 + style.get("turbulence", 0.0) * turbulence)[..., np.newaxis]
+
+        storm_color = np.array(style["storm_color"], dtype=np.float32)
+        for storm in storms:
+            self._tint_storm(texture, storm, storm_color)
+
+        return np.clip(texture, 0, 255).astype(np.uint8)
+
+    def _place_storms(self, rng, style):
+        """Seeded storm centers and radii, in texture pixels (col, row, radius)"""
+        count = int(rng.integers(style["storm_count"][0], style["storm_count"][1] + 1))
+        storms = []
+        for _ in range(count):
+            col = rng.uniform(0, self.texture_width)
+            # Keep storms away from the poles, where the projection squashes them
+            row = rng.uniform(0.2, 0.8) * self.texture_height
+            radius = rng.uniform(*style["storm_radius"]) * self.texture_height
+            storms.append((col, row, radius))
+        return storms
+
+    def _storm_window(self, storm):
+        """
+        Pixel window around a storm.
+
+        Returns:
+            tuple: (rows, cols, dx, dy, falloff) where cols wrap around
+                   longitude, dx and dy are pixel offsets from the storm
+                   center and falloff is 1 at the center
+        """
+        col, row, radius = storm
+        r0 = max(int(row - radius), 0)
+        r1 = min(int(row + radius) + 2, self.texture_height)
+        c0 = int(col - radius)
+        c1 = int(col + radius) + 2
+
+        rows = np.arange(r0, r1)
+        cols = np.arange(c0, c1) % self.texture_width
+        dy = (np.arange(r0, r1, dtype=np.float32) + 0.5 - row)[:, np.newaxis]
+        dx = (np.arange(c0, c1, dtype=np.float32) + 0.5 - col)[np.newaxis, :]
+        d = np.sqrt(dx * dx + dy * dy) / radius
+        falloff = np.clip(1.0 - d, 0.0, 1.0)
+        return rows, cols, dx, dy, falloff
+
+    def _twist_storm(self, latitude, storm, twist):
+        """Apply a spiral distortion to the latitude field around a storm"""
+        col, row, radius = storm
+        rows, cols, dx, dy, falloff = self._storm_window(storm)
+
+        # Rotate sample positions by an angle that grows toward the center
+        angle = twist * falloff ** 2
+        cos_a = np.cos(angle)
+        sin_a = np.sin(angle)
+        src_col = (col + dx * cos_a - dy * sin_a).astype(np.int32) % self.texture_width
+        src_row = np.clip((row + dx * sin_a + dy * cos_a).astype(np.int32),
+                          0, self.texture_height - 1)
+
+        source = latitude[src_row, src_col]
+        window = np.ix_(rows, cols)
+        latitude[window] = np.where(falloff > 0, source, latitude[window])
+
+    def _tint_storm(self, texture, storm, storm_color):
+        """Blend the storm's interior color over the texture"""
+        rows, cols, _, _, falloff = self._storm_window(storm)
+        weight = (0.85 * falloff ** 1.5)[..., np.newaxis]
+        window = np.ix_(rows, cols)
+        texture[window] = texture[window] * (1.0 - weight) + storm_color * weight
+
+    def render_frames(self, texture, diameter, frame_count=FRAME_COUNT):
+        """
+        Project a band texture onto a lit sphere for a full revolution.
+
+        Args:
+            texture: Texture from generate_texture()
+            diameter: Sphere size in pixels
+            frame_count: Number of evenly spaced rotation frames
+
+        Returns:
+            np.ndarray: uint8 array of shape (frame_count, diameter, diameter, 4),
+                        RGBA with transparent pixels outside the disk
+        """
+        tex_height, tex_width = texture.shape[:2]
+        coords = (np.arange(diameter, dtype=np.float32) + 0.5) / diameter * 2.0 - 1.0
+        px = coords[np.newaxis, :]
+        py = coords[:, np.newaxis]  # Screen y grows downward (south)
+        r2 = px * px + py * py
+
+        # Orthographic projection: screen position -> latitude/longitude
+        latitude = np.arcsin(np.clip(py, -1.0, 1.0))
+        cos_lat = np.maximum(np.cos(latitude), 1e-6)
+        longitude = np.arcsin(np.clip(px / cos_lat, -1.0, 1.0))
+
+        rows = np.clip(((latitude / math.pi + 0.5) * tex_height).astype(np.int32), 0, tex_height - 1)
+        rows = np.broadcast_to(rows, (diameter, diameter))
+        base_cols = longitude / (2.0 * math.pi) * tex_width
+
+        # Limb darkening, plus an anti-aliased edge in the alpha channel
+        shade = (0.35 + 0.65 * np.sqrt(np.clip(1.0 - r2, 0.0, 1.0)))[..., np.newaxis]
+        edge = np.clip((1.0 - np.sqrt(r2)) * (diameter / 2.0), 0.0, 1.0)
+        alpha = (edge * 255).astype(np.uint8)
+
+        frames = np.empty((frame_count, diameter, diameter, 4), dtype=np.uint8)
+        for frame in range(frame_count):
+            offset = frame * tex_width / frame_count
+            # Floor, not truncation: negative columns would round toward 0
+            cols = np.floor(base_cols + offset).astype(np.int32) % tex_width
+            frames[frame, ..., :3] = texture[rows, cols] * shade
+            frames[frame, ..., 3] = alpha
+        return frames
@@ -0,0 +1,288 @@
+"""
+Level-of-detail scheduling for NPC traffic
+Simulates hyperspace sectors around the player in full, nearby sectors at a
+coarse rate and everything else analytically, within a fixed ship budget
+per frame
+"""
+
+import itertools
+from collections import deque
+import numpy as np
+from systems.npc_traffic import AI_STEP
+
+# Tiers, most detailed first
+TIER_FULL = 0       # Every AI tick, with steering and separation
+TIER_COARSE = 1     # AI ticks a second or so apart
+TIER_ANALYTIC = 2   # Closed-form jumps (NpcTraffic.advance) minutes apart
+
+SECTOR_SIZE = 25.0      # Hyperspace units per side of a sector
+FULL_RADIUS = 1         # Sectors around the player's (each way) simulated in full
+COARSE_RADIUS = 3       # Sectors around the player's simulated coarsely
+
+COARSE_STEP = 1.0           # Seconds between coarse ticks of a sector
+MAX_COARSE_STEP = 2.0       # Longest coarse tick; older time is covered analytically first
+ANALYTIC_INTERVAL = 30.0    # Seconds between analytic jumps of a sector
+MAX_FULL_CATCHUP = 0.25     # Longest full-tier backlog ticked in one update; beyond it ships jump analytically
+
+# Ships simulated per update, at most, in each of the lower tiers. Whole
+# sectors are taken, so a budget can be overrun by one sector's worth.
+COARSE_SHIP_BUDGET = 2000
+ANALYTIC_SHIP_BUDGET = 2000
+
+
+class LodScheduler:
+    """
+    Decides how closely each part of hyperspace is simulated.
+
+    Hyperspace is cut into square sectors. The sectors within FULL_RADIUS
+    of the player's sector run NpcTraffic.tick() every AI tick; the ring
+    out to COARSE_RADIUS is ticked every COARSE_STEP seconds; every other
+    sector is moved with NpcTraffic.advance() every ANALYTIC_INTERVAL
+    seconds or so. The coarse and analytic sectors wait in queues ordered
+    by when they're due, and each update works through them only until its
+    ship budget is spent. A bigger sector just means longer (analytic)
+    jumps, not more work per frame.
+
+    Every ship records the game time it has been simulated up to
+    (sim_time), so whatever tier runs next covers exactly the time it
+    missed. When the player moves into a new sector, sectors that gain
+    detail are first caught up analytically to now.
+
+    Ships must be registered with add_ships() after spawning and dropped
+    with remove_ships() before despawning.
+
+    Example:
+        scheduler = LodScheduler(traffic)
+        scheduler.add_ships(traffic.spawn_fleet("citadel", 5000))
+        scheduler.update(dt, player_x, player_y)
+    """
+
+    def __init__(self, traffic, sector_size=SECTOR_SIZE, full_radius=FULL_RADIUS, coarse_radius=COARSE_RADIUS,
+                 coarse_budget=COARSE_SHIP_BUDGET, analytic_budget=ANALYTIC_SHIP_BUDGET):
+        """
+        Initialize the scheduler
+
+        Args:
+            traffic: NpcTraffic that steers the ships
+            sector_size: Hyperspace units per side of a sector
+            full_radius: Sectors around the player simulated in full
+            coarse_radius: Sectors around the player simulated coarsely
+            coarse_budget: Coarse-tier ships simulated per update
+            analytic_budget: Analytic-tier ships simulated per update
+        """
+        self.traffic = traffic
+        self.store = traffic.store
+        self.sector_size = sector_size
+        self.full_radius = full_radius
+        self.coarse_radius = coarse_radius
+        self.budgets = {TIER_COARSE: coarse_budget, TIER_ANALYTIC: analytic_budget}
+
+        self.store.add_component("sim_time", np.float64, 0.0)
+        self.store.add_component("sector_x", np.int32, 0)
+        self.store.add_component("sector_y", np.int32, 0)
+
+        self.time = 0.0                 # Game time (seconds)
+        self.full_time = 0.0            # Game time the full tier has been ticked to
+        self.members = {}               # (sector_x, sector_y) -> set of ship ids
+        self.tiers = {}                 # Sectors near the player -> tier (others are analytic)
+        self.player_sector = None
+        self.watched = True
+        self.stats = {TIER_FULL: 0, TIER_COARSE: 0, TIER_ANALYTIC: 0}  # Ships simulated last update
+
+        # Per-tier queues of (due time, sector, token). Entries are appended
+        # with due = now + interval, so each queue stays sorted; an entry is
+        # stale (skipped) once its sector has been rescheduled.
+        self.queues = {TIER_COARSE: deque(), TIER_ANALYTIC: deque()}
+        self._tokens = {}
+        self._counter = itertools.count()
+
+    def tier_of(self, sector):
+        """Tier a sector is simulated at"""
+        return self.tiers.get(sector, TIER_ANALYTIC)
+
+    def sector_at(self, x, y):
+        """Sector containing a hyperspace position"""
+        return (int(np.floor(x / self.sector_size)), int(np.floor(y / self.sector_size)))
+
+    def add_ships(self, ids):
+        """
+        Start scheduling ships (call after spawning them)
+
+        Args:
+            ids: Entity ids of the new ships
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        self.store.sim_time[ids] = self.time
+        sector_x, sector_y = self._sectors(ids)
+        self.store.sector_x[ids] = sector_x
+        self.store.sector_y[ids] = sector_y
+        for ship, sector in zip(ids.tolist(), zip(sector_x.tolist(), sector_y.tolist())):
+            self._join(ship, sector)
+
+    def remove_ships(self, ids):
+        """
+        Stop scheduling ships (call before despawning them)
+
+        Args:
+            ids: Entity ids
+        """
+        store = self.store
+        for ship in np.asarray(ids, dtype=np.int64).tolist():
+            self._leave(ship, (int(store.sector_x[ship]), int(store.sector_y[ship])))
+
+    def update(self, dt, player_x, player_y, player_vx=0.0, player_vy=0.0, watched=True):
+        """
+        Advance the simulation by dt
+
+        Args:
+            dt: Seconds since the last update
+            player_x, player_y: Player position in hyperspace
+            player_vx, player_vy: Player velocity in hyperspace
+            watched: False while the player is somewhere other than
+                     hyperspace; nothing gets full detail then
+        """
+        self.time += dt
+        self._update_tiers(self.sector_at(player_x, player_y), watched)
+        self.stats = {TIER_FULL: 0, TIER_COARSE: 0, TIER_ANALYTIC: 0}
+
+        # Full tier: fixed AI ticks, like NpcTraffic.update()
+        self.full_time = max(self.full_time, self.time - MAX_FULL_CATCHUP)
+        if self.full_time + AI_STEP <= self.time:
+            ids = self._ids_in([sector for sector, tier in self.tiers.items() if tier == TIER_FULL])
+            while self.full_time + AI_STEP <= self.time:
+                self._advance_lagging(ids, self.full_time)  # Ships that just arrived from other tiers
+                self.traffic.tick(AI_STEP, player_x, player_y, player_vx, player_vy, ids=ids)
+                self.full_time += AI_STEP
+                self.store.sim_time[ids] = self.full_time
+            self.stats[TIER_FULL] = len(ids)
+            self._reindex(ids)
+
+        def coarse(ids):
+            self._advance_lagging(ids, self.time - MAX_COARSE_STEP)
+            elapsed = self.time - self.store.sim_time[ids]
+            self.traffic.tick(np.minimum(elapsed, MAX_COARSE_STEP).astype(np.float32),
+                              player_x, player_y, player_vx, player_vy, ids=ids)
+
+        def analytic(ids):
+            self.traffic.advance(ids, (self.time - self.store.sim_time[ids]).astype(np.float32))
+
+        self._run_queue(TIER_COARSE, COARSE_STEP, coarse)
+        self._run_queue(TIER_ANALYTIC, ANALYTIC_INTERVAL, analytic)
+
+    def _update_tiers(self, player_sector, watched):
+        """Re-tier the sectors around the player after they change sector"""
+        if player_sector == self.player_sector and watched == self.watched:
+            return
+        self.player_sector = player_sector
+        self.watched = watched
+
+        center_x, center_y = player_sector
+        tiers = {}
+        for offset_x in range(-self.coarse_radius, self.coarse_radius + 1):
+            for offset_y in range(-self.coarse_radius, self.coarse_radius + 1):
+                full = watched and max(abs(offset_x), abs(offset_y)) <= self.full_radius
+                tiers[(center_x + offset_x, center_y + offset_y)] = TIER_FULL if full else TIER_COARSE
+
+        old_tiers, self.tiers = self.tiers, tiers
+        for sector in set(old_tiers) | set(tiers):
+            old_tier = old_tiers.get(sector, TIER_ANALYTIC)
+            new_tier = self.tier_of(sector)
+            if new_tier == old_tier or sector not in self.members:
+                continue
+            if new_tier < old_tier:
+                # Gaining detail: bring the ships up to date first
+                ids = self._ids_in([sector])
+                self._advance_lagging(ids, self.full_time if new_tier == TIER_FULL else self.time)
+                self._reindex(ids)
+            self._schedule(sector)
+
+    def _run_queue(self, tier, interval, run):
+        """Simulate due sectors of one tier, oldest first, in one batch within the budget"""
+        queue = self.queues[tier]
+        budget = self.budgets[tier]
+        sectors = []
+        while queue and budget > 0:
+            due, sector, token = queue[0]
+            if self._tokens.get(sector) != token or sector not in self.members:
+                queue.popleft()
+                continue
+            if due > self.time:
+                break
+            queue.popleft()
+            sectors.append(sector)
+            budget -= len(self.members[sector])
+        if not sectors:
+            return
+
+        ids = self._ids_in(sectors)
+        run(ids)
+        self.store.sim_time[ids] = self.time
+        self.stats[tier] = len(ids)
+        for sector in sectors:
+            self._schedule(sector, interval)
+        self._reindex(ids)
+
+    def _schedule(self, sector, delay=None):
+        """Queue a sector for its tier (full-tier sectors aren't queued)"""
+        tier = self.tier_of(sector)
+        if tier == TIER_FULL:
+            self._tokens.pop(sector, None)
+            return
+        if delay is None:
+            delay = COARSE_STEP if tier == TIER_COARSE else ANALYTIC_INTERVAL
+        token = next(self._counter)
+        self._tokens[sector] = token
+        self.queues[tier].append((self.time + delay, sector, token))
+
+    def _advance_lagging(self, ids, until):
+        """Analytically advance ships simulated only up to before a time"""
+        lag = until - self.store.sim_time[ids]
+        behind = lag > 0
+        if behind.any():
+            self.traffic.advance(ids[behind], lag[behind].astype(np.float32))
+            self.store.sim_time[ids[behind]] = until
+
+    def _sectors(self, ids):
+        """Sector coordinates of ships"""
+        sector_x = np.floor(self.store.x[ids] / self.sector_size).astype(np.int32)
+        sector_y = np.floor(self.store.y[ids] / self.sector_size).astype(np.int32)
+        return sector_x, sector_y
+
+    def _ids_in(self, sectors):
+        """Entity ids of the ships in some sectors"""
+        ids = [ship for sector in sectors for ship in self.members.get(sector, ())]
+        return np.array(ids, dtype=np.int64)
+
+    def _reindex(self, ids):
+        """Move ships that crossed a sector boundary to their new sector"""
+        if len(ids) == 0:
+            return
+        store = self.store
+        sector_x, sector_y = self._sectors(ids)
+        moved = (sector_x != store.sector_x[ids]) | (sector_y != store.sector_y[ids])
+        if not moved.any():
+            return
+        ships = ids[moved]
+        old_sectors = zip(store.sector_x[ships].tolist(), store.sector_y[ships].tolist())
+        new_sectors = zip(sector_x[moved].tolist(), sector_y[moved].tolist())
+        for ship, old_sector, new_sector in zip(ships.tolist(), old_sectors, new_sectors):
+            self._leave(ship, old_sector)
+            self._join(ship, new_sector)
+        store.sector_x[ships] = sector_x[moved]
+        store.sector_y[ships] = sector_y[moved]
+
+    def _join(self, ship, sector):
+        """Add a ship to a sector, scheduling the sector if it was empty"""
+        members = self.members.get(sector)
+        if members is None:
+            members = self.members[sector] = set()
+            self._schedule(sector)
+        members.add(ship)
+
+    def _leave(self, ship, sector):
+        """Remove a ship from a sector, forgetting the sector once it's empty"""
+        members = self.members.get(sector)
+        if members is not None:
+            members.discard(ship)
+            if not members:
+                del self.members[sector]
@@ -0,0 +1,422 @@
+"""
+Mineral market
+Per-starport supply, demand and prices for every mineral in minerals.json,
+updated for all ports at once each economic tick, with goods diffusing
+between connected ports and a compact price history for charts
+"""
+
+import math
+import numpy as np
+from core.game_data import get_game_data
+from core.system_loader import get_system_loader
+from utils.noise import derive_seed, hash_uniforms
+
+# Economic ticks run on the event scheduler under this event type
+ECONOMY_EVENT = "economy_tick"
+ECONOMY_TICK = 60.0   # Game seconds between ticks
+
+# Units a port stocks at equilibrium, by rarity (common, uncommon, rare);
+# each port scales these by its own abundance (ABUNDANCE_RANGE)
+BASE_SUPPLY = (120.0, 50.0, 15.0)
+ABUNDANCE_RANGE = (0.6, 1.4)
+DEMAND_RANGE = (0.8, 1.25)   # Port demand relative to its equilibrium supply
+
+# Price = mineral value * (demand / supply) ** PRICE_ELASTICITY, clamped to
+# PRICE_RATIO_RANGE times the value
+PRICE_ELASTICITY = 0.7
+PRICE_RATIO_RANGE = (0.25, 4.0)
+MIN_SUPPLY = 0.5             # Floor on stock, so prices stay finite
+
+RECOVERY_TIME = 1800.0       # Game seconds for a shock to fade to ~37%
+LINK_RATE = 1.0 / 3600.0     # Share of a surplus difference carried per second between linked ports
+MAX_DIFFUSION = 0.5          # Most of its surplus difference a port can shed in one tick (keeps it stable)
+
+# Ports within this hyperspace distance of each other are linked
+TRADE_RANGE = 40.0
+
+# Price history: one sample per tick, stored as the price / value ratio in
+# uint16 steps of 1 / HISTORY_SCALE (0.01%), HISTORY_LENGTH samples per port
+HISTORY_LENGTH = 512
+HISTORY_SCALE = 10000
+
+
+def station_ports(system_id, system_data):
+    """
+    Market port keys for the stations around a star system's planets and moons
+
+    Args:
+        system_id: SystemLoader id of the system
+        system_data: The system's definition (SystemLoader.load() output)
+
+    Returns:
+        list: Port keys, e.g. "systems/home_system.json#Starbase"
+    """
+    keys = []
+    for planet in [*system_data.get("inner_planets", ()), *system_data.get("outer_planets", ())]:
+        if planet is None:
+            continue
+        for body in [planet, *planet.get("moons", ())]:
+            keys.extend(f"{system_id}#{station['name']}" for station in body.get("stations", []))
+    return keys
+
+
+class MineralMarket:
+    """
+    Mineral prices at every starport and station.
+
+    Each port has a row in (ports, minerals) arrays of supply, demand and
+    price. A tick moves every row at once: stock and demand recover toward
+    the port's equilibrium, surplus stock diffuses along links between
+    ports (so a glut at one port eases prices at its neighbors), and prices
+    follow demand / supply. The links are a sorted edge list summed with
+    np.add.reduceat, so a tick is a few whole-array passes with no Python
+    loop over ports or links.
+
+    Player trades don't move prices straight away: sell() and buy() settle
+    at the current price and queue a shock to the port's stock, applied at
+    the next tick.
+
+    Each tick's prices are kept in a uint16 ring buffer (a ratio to the
+    mineral's value), two bytes per port, mineral and tick, so charts of
+    the last HISTORY_LENGTH ticks stay cheap for hundreds of ports.
+
+    Example:
+        market = MineralMarket.for_systems(["systems/home_system.json"])
+        port = "systems/home_system.json#Starbase"
+        credits = market.sell(port, "iron", 20)
+        market.attach(game_session.events)       # Tick every ECONOMY_TICK game seconds
+        market.history(port, "iron")             # Price per tick, oldest first
+    """
+
+    def __init__(self, game_data=None, history_length=HISTORY_LENGTH):
+        """
+        Initialize a market with no ports
+
+        Args:
+            game_data: Optional GameData (uses the shared one if None)
+            history_length: Price samples kept per port and mineral
+        """
+        game_data = game_data or get_game_data()
+        self.mineral_ids = game_data.mineral_ids
+        self.value = game_data.mineral_value.astype(np.float64)
+        self.mineral_supply = np.array(BASE_SUPPLY)[game_data.mineral_rarity]
+        self.history_length = history_length
+
+        self.keys = []        # Port keys, by port index
+        self.seeds = []       # Port seeds (None if derived from the key)
+        self.port_ids = {}    # Port key -> index
+        minerals = len(self.value)
+        self.positions = np.zeros((0, 2), dtype=np.float64)
+        self.base_supply = np.zeros((0, minerals))
+        self.base_demand = np.zeros((0, minerals))
+        self.supply = np.zeros((0, minerals))
+        self.demand = np.zeros((0, minerals))
+        self.price = np.zeros((0, minerals))
+        self.shocks = np.zeros((0, minerals))   # Player trades waiting for the next tick
+
+        self.links = {}       # (low port, high port) -> rate per second
+        self._edges = None    # Directed edges sorted by source, built on the next tick
+
+        self.ticks = 0
+        self._history = np.zeros((history_length, 0, minerals), dtype=np.uint16)
+
+    def __len__(self):
+        """Number of ports"""
+        return len(self.keys)
+
+    @classmethod
+    def for_systems(cls, system_ids, system_loader=None, game_data=None, trade_range=TRADE_RANGE):
+        """
+        A market with a port at every station in some star systems, linked within trade_range
+
+        Args:
+            system_ids: SystemLoader ids
+            system_loader: Optional SystemLoader (uses the shared one if None)
+            game_data: Optional GameData (uses the shared one if None)
+            trade_range: Hyperspace distance to link ports across
+
+        Returns:
+            MineralMarket
+        """
+        market = cls(game_data)
+        market.add_systems(system_ids, system_loader, trade_range)
+        return market
+
+    def add_systems(self, system_ids, system_loader=None, trade_range=TRADE_RANGE):
+        """
+        Open a port at every station in some star systems that isn't one yet
+
+        New ports are linked to every port within trade_range; existing
+        links are left alone. A loaded market calls this so systems added
+        since the save get their ports.
+
+        Args:
+            system_ids: SystemLoader ids
+            system_loader: Optional SystemLoader (uses the shared one if None)
+            trade_range: Hyperspace distance to link new ports across
+
+        Returns:
+            int: Number of ports opened
+        """
+        system_loader = system_loader or get_system_loader()
+        first_new = len(self.keys)
+        for system_id in system_ids:
+            data = system_loader.load(system_id)
+            coords = data["hyperspace_coords"]
+            for key in station_ports(system_id, data):
+                if key not in self.port_ids:
+                    self.add_port(key, (coords["x"], coords["y"]))
+        if len(self.keys) > first_new:
+            self.link_within(trade_range, first_port=first_new)
+        return len(self.keys) - first_new
+
+    def add_port(self, key, position=(0.0, 0.0), seed=None):
+        """
+        Open a market at a port, stocked at its equilibrium
+
+        How much of each mineral the port holds and wants is drawn from its
+        seed, so the same port always starts the same.
+
+        Args:
+            key: Unique port key (see station_ports)
+            position: Hyperspace coordinates (for link_within)
+            seed: Port seed (derived from the key if None)
+
+        Returns:
+            int: Port index
+
+        Raises:
+            ValueError: If the key is already a port
+        """
+        if key in self.port_ids:
+            raise ValueError(f"Port '{key}' already exists")
+        minerals = len(self.value)
+        draws = hash_uniforms([derive_seed("market", key if seed is None else seed)], 2 * minerals)[0]
+        abundance = ABUNDANCE_RANGE[0] + (ABUNDANCE_RANGE[1] - ABUNDANCE_RANGE[0]) * draws[:minerals]
+        appetite = DEMAND_RANGE[0] + (DEMAND_RANGE[1] - DEMAND_RANGE[0]) * draws[minerals:]
+        base_supply = self.mineral_supply * abundance
+        base_demand = base_supply * appetite
+
+        self.port_ids[key] = len(self.keys)
+        self.keys.append(key)
+        self.seeds.append(seed)
+        self.positions = np.vstack([self.positions, np.asarray(position, dtype=np.float64).reshape(1, 2)])
+        self.base_supply = np.vstack([self.base_supply, base_supply])
+        self.base_demand = np.vstack([self.base_demand, base_demand])
+        self.supply = np.vstack([self.supply, base_supply])
+        self.demand = np.vstack([self.demand, base_demand])
+        self.shocks = np.vstack([self.shocks, np.zeros(minerals)])
+        self.price = np.vstack([self.price, self._prices(base_supply, base_demand)])
+
+        # The new port's history starts at its equilibrium price
+        history = np.empty((self.history_length, 1, minerals), dtype=np.uint16)
+        history[:] = self._history_row(self.price[-1:])
+        self._history = np.concatenate([self._history, history], axis=1)
+        self._edges = None
+        return self.port_ids[key]
+
+    def connect(self, port_a, port_b, rate=LINK_RATE):
+        """
+        Link two ports so stock flows between them
+
+        Args:
+            port_a, port_b: Port keys or indexes
+            rate: Share of their surplus difference carried per second
+        """
+        a, b = self.port(port_a), self.port(port_b)
+        if a != b:
+            self.links[(min(a, b), max(a, b))] = rate
+            self._edges = None
+
+    def link_within(self, distance, rate=LINK_RATE, first_port=0):
+        """
+        Link every pair of ports within a hyperspace distance, nearer ports more strongly
+
+        Args:
+            distance: Largest distance to link across
+            rate: Rate for ports at the same position, falling off linearly to 0 at distance
+            first_port: Only link pairs with a port at this index or later
+                        (the ports just added), keeping older links as they are
+        """
+        offsets = self.positions[:, None, :] - self.positions[None, :, :]
+        distances = np.hypot(offsets[..., 0], offsets[..., 1])
+        near = np.triu(distances <= distance, k=1)
+        near[:first_port, :first_port] = False
+        low, high = np.nonzero(near)
+        for a, b, gap in zip(low.tolist(), high.tolist(), distances[low, high].tolist()):
+            self.links[(a, b)] = rate * max(1.0 - gap / distance, 0.0) if distance > 0 else rate
+        self._edges = None
+
+    def port(self, port):
+        """Port index for a key or index"""
+        return self.port_ids[port] if isinstance(port, str) else int(port)
+
+    def mineral(self, mineral):
+        """Mineral id for a key or id"""
+        return self.mineral_ids[mineral] if isinstance(mineral, str) else int(mineral)
+
+    def price_of(self, port, mineral):
+        """Current price of one unit of a mineral at a port"""
+        return float(self.price[self.port(port), self.mineral(mineral)])
+
+    def sell(self, port, mineral, amount):
+        """
+        Sell minerals to a port at its current price
+
+        Args:
+            port: Port key or index
+            mineral: Mineral key or id
+            amount: Units sold
+
+        Returns:
+            int: Credits paid to the player
+        """
+        port, mineral = self.port(port), self.mineral(mineral)
+        self.shocks[port, mineral] += amount
+        return int(self.price[port, mineral] * amount)
+
+    def buy(self, port, mineral, amount):
+        """
+        Buy minerals from a port at its current price (no more than it stocks)
+
+        Args:
+            port: Port key or index
+            mineral: Mineral key or id
+            amount: Units wanted
+
+        Returns:
+            tuple: (units bought, credits charged)
+        """
+        port, mineral = self.port(port), self.mineral(mineral)
+        available = self.supply[port, mineral] + self.shocks[port, mineral] - MIN_SUPPLY
+        amount = max(0, min(amount, int(available)))
+        self.shocks[port, mineral] -= amount
+        return amount, int(math.ceil(self.price[port, mineral] * amount))
+
+    def tick(self, dt=ECONOMY_TICK):
+        """
+        Advance every port's market by one economic tick
+
+        Args:
+            dt: Game seconds the tick covers
+        """
+        supply, demand = self.supply, self.demand
+
+        # Player trades land, then stock and demand recover toward equilibrium
+        supply += self.shocks
+        self.shocks.fill(0.0)
+        recovery = 1.0 - math.exp(-dt / RECOVERY_TIME)
+        supply += (self.base_supply - supply) * recovery
+        demand += (self.base_demand - demand) * recovery
+
+        # Surpluses and shortages (stock above or below equilibrium) spread to linked ports
+        if self._edges is None:
+            self._build_edges()
+        targets, rates, starts, senders, port_rates = self._edges
+        if len(targets):
+            # Each sender sheds rate * (own surplus - neighbor's surplus) per link, written
+            # as its total rate * own surplus minus the rate-weighted sum of its neighbors'
+            # (one gather instead of two). Scaled down if dt is long enough that a port
+            # would shed more than MAX_DIFFUSION of the difference.
+            surplus = supply - self.base_supply
+            step = dt * min(1.0, MAX_DIFFUSION / (port_rates.max() * dt))
+            inflow = np.add.reduceat(surplus[targets] * rates[:, None], starts, axis=0)
+            supply[senders] -= (surplus[senders] * port_rates[:, None] - inflow) * step
+
+        np.maximum(supply, MIN_SUPPLY, out=supply)
+        self.price = self._prices(supply, demand)
+        self._history[self.ticks % self.history_length] = self._history_row(self.price)
+        self.ticks += 1
+
+    def history(self, port, mineral=None):
+        """
+        Price history at a port, one sample per tick
+
+        Args:
+            port: Port key or index
+            mineral: Mineral key or id (None for every mineral)
+
+        Returns:
+            np.ndarray: Prices, oldest first (shape (samples,) for one
+                        mineral, (samples, minerals) for all)
+        """
+        port = self.port(port)
+        samples = min(self.ticks, self.history_length)
+        order = (np.arange(self.ticks - samples, self.ticks)) % self.history_length
+        columns = slice(None) if mineral is None else self.mineral(mineral)
+        ratios = self._history[order, port, columns].astype(np.float64) / HISTORY_SCALE
+        return ratios * self.value[columns]
+
+    def attach(self, events):
+        """
+        Tick on an EventScheduler every ECONOMY_TICK game seconds
+
+        The recurring event is saved with the scheduler, so it's only
+        scheduled if the scheduler doesn't have one already.
+
+        Args:
+            events: EventScheduler
+        """
+        events.register_handler(ECONOMY_EVENT, self._on_ticks)
+        if not any(event.event_type == ECONOMY_EVENT for event in events.events.values()):
+            events.schedule(ECONOMY_EVENT, ECONOMY_TICK, interval=ECONOMY_TICK)
+
+    def _on_ticks(self, batch):
+        """Run one tick per due economy event"""
+        for event in batch:
+            self.tick(event.interval or ECONOMY_TICK)
+
+    def _prices(self, supply, demand):
+        """Prices for supply and demand rows"""
+        ratio = np.clip((demand / supply) ** PRICE_ELASTICITY, *PRICE_RATIO_RANGE)
+        return ratio * self.value
+
+    def _history_row(self, prices):
+        """Prices as uint16 history samples"""
+        return np.rint(prices / self.value * HISTORY_SCALE).astype(np.uint16)
+
+    def _build_edges(self):
+        """Turn links into directed edge arrays sorted by source port"""
+        pairs = list(self.links.items())
+        low = np.array([a for (a, _), _ in pairs], dtype=np.intp)
+        high = np.array([b for (_, b), _ in pairs], dtype=np.intp)
+        rate = np.array([r for _, r in pairs], dtype=np.float64)
+        sources = np.concatenate([low, high])
+        targets = np.concatenate([high, low])
+        rates = np.concatenate([rate, rate])
+        order = np.argsort(sources, kind="stable")
+        sources, targets, rates = sources[order], targets[order], rates[order]
+        senders, starts = np.unique(sources, return_index=True)
+        port_rates = np.add.reduceat(rates, starts) if len(rates) else rates
+        self._edges = (targets, rates, starts, senders, port_rates)
+
+    def to_dict(self):
+        """
+        Serialize the market for a save (price history isn't saved)
+
+        Returns:
+            dict: Ports, links, stock, demand and pending trades
+        """
+        return {
+            "ports": [{"key": key, "position": position, "seed": seed}
+                      for key, position, seed in zip(self.keys, self.positions.tolist(), self.seeds)],
+            "links": [[a, b, rate] for (a, b), rate in self.links.items()],
+            "supply": self.supply.round(3).tolist(),
+            "demand": self.demand.round(3).tolist(),
+            "shocks": self.shocks.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data, game_data=None, history_length=HISTORY_LENGTH):
+        """Rebuild a market from to_dict() output (see __init__ for the other arguments)"""
+        market = cls(game_data, history_length)
+        for port in data["ports"]:
+            market.add_port(port["key"], port["position"], port["seed"])
+        for a, b, rate in data["links"]:
+            market.links[(a, b)] = rate
+        if market.keys:
+            market.supply[:] = data["supply"]
+            market.demand[:] = data["demand"]
+            market.shocks[:] = data["shocks"]
+            market.price = market._prices(market.supply, market.demand)
+        return market
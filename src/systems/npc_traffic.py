@@ -0,0 +1,365 @@
+"""
+NPC hyperspace traffic
+Steers every NPC ship in a ShipStore with batched NumPy passes: patrols and
+traders travel between stars, and ships near the player pursue or flee
+depending on how their faction and species feel about the player
+"""
+
+import numpy as np
+from core.data_loader import get_data_loader
+from core.game_data import get_game_data
+from systems.ship_store import FUEL_PER_UNIT, integrate_motion
+from utils.spatial_grid import SpatialGrid
+
+# Behaviors (the "behavior" column)
+BEHAVIOR_PATROL = 0   # Armed ships: fly between their faction's stars
+BEHAVIOR_SEEK = 1     # Unarmed traders: fly to any star, then pick another
+BEHAVIOR_FLEE = 2     # Run from the player
+BEHAVIOR_PURSUE = 3   # Intercept the player
+
+AI_TICK_RATE = 20  # Steering updates per second
+AI_STEP = 1.0 / AI_TICK_RATE
+
+DETECTION_RADIUS = 15.0     # Distance at which NPCs react to the player
+HOSTILE_DISPOSITION = -25   # At or below: armed ships pursue the player
+WARY_DISPOSITION = 0        # Below: unarmed ships flee the player
+
+SPEED_PER_ENGINE_CLASS = 1.0   # Top speed (units/second) per engine class
+ACCEL_PER_ENGINE_CLASS = 2.0   # Steering acceleration (units/second^2) per engine class
+ARRIVAL_RADIUS = 0.5           # Close enough to count as reaching a star
+SLOWING_RADIUS = 3.0           # Start braking this far from a destination
+MAX_PURSUIT_LOOKAHEAD = 2.0    # Seconds ahead to predict the player's position
+SEPARATION_RADIUS = 1.0        # Ships closer than this push apart
+SEPARATION_WEIGHT = 1.5
+STAR_SPREAD = 2.0              # Spawn scatter around a star
+
+# Equipment class fitted to NPC ships (capped by each hull's maximum)
+NPC_EQUIPMENT_CLASS = 2
+
+
+class FactionTable:
+    """
+    Factions from factions.json, indexed in file order.
+
+    Disposition toward the player combines the faction's starting player
+    standing with its species' affinity for the player's species (from
+    species.json), so one number drives pursue/flee decisions.
+    """
+
+    def __init__(self, game_data=None, data_loader=None, player_species="human"):
+        """
+        Args:
+            game_data: Optional GameData (uses the shared one if None)
+            data_loader: Optional DataLoader (uses the shared one if None)
+            player_species: Species key of the player's crew
+        """
+        game_data = game_data or get_game_data()
+        data_loader = data_loader or get_data_loader()
+        raw = data_loader.load_static("factions.json")["factions"]
+
+        self.keys = tuple(raw)
+        self.ids = {key: index for index, key in enumerate(self.keys)}
+        self.names = tuple(raw[key]["name"] for key in self.keys)
+        self.species = tuple(
+            tuple(game_data.species_ids[species] for species in raw[key]["species"]) for key in self.keys)
+        self.ship_classes = tuple(
+            tuple(game_data.ship_class_ids[ship] for ship in raw[key]["available_ships"]) for key in self.keys)
+        self.territories = tuple(tuple(raw[key]["territories"]) for key in self.keys)
+        self.player_standing = np.array(
+            [raw[key]["starting_player_standing"] for key in self.keys], dtype=np.int16)
+
+        self.player_species = game_data.species_ids[player_species]
+        self.game_data = game_data
+
+    def disposition(self, faction, species):
+        """
+        How ships feel about the player (vectorized)
+
+        Args:
+            faction, species: Arrays of faction and species ids
+
+        Returns:
+            np.ndarray: Player standing plus species affinity for the player's species
+        """
+        affinity = self.game_data.species_affinity[species, self.player_species]
+        return self.player_standing[faction] + affinity
+
+
+class NpcTraffic:
+    """
+    Batched steering for NPC ships in hyperspace.
+
+    Each AI tick (AI_TICK_RATE per second) picks a behavior for every ship
+    from its role and its disposition toward the player, turns behaviors
+    into steering accelerations, adds separation from nearby ships (found
+    with a SpatialGrid), and moves everyone with integrate_motion(). All of
+    it is whole-array NumPy work; nothing loops over ships in Python.
+
+    Ships refuel when they reach a star.
+
+    Example:
+        traffic = NpcTraffic(store, star_positions)
+        traffic.spawn_fleet("oval_collective", 500)
+        traffic.update(dt, player_x, player_y)
+    """
+
+    def __init__(self, store, stars, faction_stars=None, factions=None, rng=None):
+        """
+        Initialize traffic over a ship store
+
+        Args:
+            store: ShipStore holding the NPC ships
+            stars: (n, 2) array of star positions in hyperspace
+            faction_stars: Optional {faction key: star indices} patrolled by
+                           each faction (every star if not given)
+            factions: Optional FactionTable (loaded from factions.json if None)
+            rng: Optional numpy Generator
+        """
+        self.store = store
+        self.stars = np.asarray(stars, dtype=np.float32).reshape(-1, 2)
+        self.factions = factions or FactionTable()
+        self.rng = rng or np.random.default_rng()
+        self.grid = SpatialGrid(SEPARATION_RADIUS)
+        self.time_since_tick = 0.0
+
+        # Faction -> patrol stars, padded into a table for vectorized picks
+        faction_stars = faction_stars or {}
+        star_lists = [
+            np.asarray(faction_stars.get(key, range(len(self.stars))), dtype=np.int32)
+            for key in self.factions.keys
+        ]
+        self.faction_star_counts = np.array([len(stars) for stars in star_lists], dtype=np.int32)
+        self.faction_star_table = np.zeros((len(star_lists), max(1, self.faction_star_counts.max())),
+                                           dtype=np.int32)
+        for faction, stars_of_faction in enumerate(star_lists):
+            self.faction_star_table[faction, :len(stars_of_faction)] = stars_of_faction
+
+        store.add_component("behavior", np.int8, BEHAVIOR_PATROL)
+        store.add_component("target_star", np.int32, -1)
+        store.add_component("disposition", np.int16, 0)
+
+    def spawn_fleet(self, faction_key, count):
+        """
+        Spawn a faction's ships around its stars, heading for another one
+
+        Hulls and species are picked at random from the faction's
+        available ships and species; equipment is NPC_EQUIPMENT_CLASS
+        capped by each hull's maximum.
+
+        Args:
+            faction_key: Key in factions.json
+            count: Number of ships
+
+        Returns:
+            np.ndarray: The new entity ids
+        """
+        faction = self.factions.ids[faction_key]
+        ship_classes = np.array(self.factions.ship_classes[faction], dtype=np.int16)
+        species = np.array(self.factions.species[faction], dtype=np.int16)
+        hulls = self.rng.choice(ship_classes, count)
+        crews = self.rng.choice(species, count)
+
+        records = self.factions.game_data.ship_classes
+        max_engine = np.array([record.max_engine_class for record in records], dtype=np.int8)[hulls]
+        max_shield = np.array([record.max_shield_class for record in records], dtype=np.int8)[hulls]
+        max_armor = np.array([record.max_armor_class for record in records], dtype=np.int8)[hulls]
+        max_weapon = np.array([record.max_weapon_class for record in records], dtype=np.int8)[hulls]
+        base_hull = np.array([record.base_hull for record in records], dtype=np.float32)[hulls]
+
+        home = self._pick_faction_stars(np.full(count, faction))
+        offsets = self.rng.normal(0.0, STAR_SPREAD, (count, 2)).astype(np.float32)
+        armed = max_weapon > 0
+
+        ids = self.store.spawn_many(
+            count,
+            x=self.stars[home, 0] + offsets[:, 0],
+            y=self.stars[home, 1] + offsets[:, 1],
+            hull=base_hull,
+            engine_class=np.minimum(max_engine, NPC_EQUIPMENT_CLASS),
+            shield_class=np.minimum(max_shield, NPC_EQUIPMENT_CLASS),
+            armor_class=np.minimum(max_armor, NPC_EQUIPMENT_CLASS),
+            weapon_class=np.minimum(max_weapon, NPC_EQUIPMENT_CLASS),
+            ship_class=hulls,
+            species=crews,
+            faction=faction,
+            behavior=np.where(armed, BEHAVIOR_PATROL, BEHAVIOR_SEEK),
+            disposition=self.factions.disposition(np.full(count, faction), crews)
+        )
+        self._retarget(ids)
+        return ids
+
+    def _pick_faction_stars(self, factions):
+        """A random patrol star for each ship's faction"""
+        counts = self.faction_star_counts[factions]
+        picks = (self.rng.random(len(factions)) * counts).astype(np.int32)
+        return self.faction_star_table[factions, picks]
+
+    def _retarget(self, ids):
+        """Send ships to a new star: patrols within their territory, traders anywhere"""
+        if len(ids) == 0:
+            return
+        patrol = self.store.weapon_class[ids] > 0
+        targets = self.rng.integers(0, len(self.stars), len(ids)).astype(np.int32)
+        targets[patrol] = self._pick_faction_stars(self.store.faction[ids[patrol]])
+        self.store.target_star[ids] = targets
+
+    def update(self, dt, player_x, player_y, player_vx=0.0, player_vy=0.0):
+        """
+        Advance traffic by dt, running as many fixed AI ticks as are due
+
+        Args:
+            dt: Seconds since the last update
+            player_x, player_y: Player position in hyperspace
+            player_vx, player_vy: Player velocity (for pursuit prediction)
+
+        Returns:
+            int: Number of ticks run
+        """
+        self.time_since_tick += dt
+        ticks = 0
+        while self.time_since_tick >= AI_STEP:
+            self.time_since_tick -= AI_STEP
+            self.tick(AI_STEP, player_x, player_y, player_vx, player_vy)
+            ticks += 1
+        return ticks
+
+    def tick(self, step, player_x, player_y, player_vx=0.0, player_vy=0.0, ids=None):
+        """
+        One AI tick: choose behaviors, steer, move
+
+        Args:
+            step: Seconds this tick covers (a scalar, or one value per ship in ids)
+            player_x, player_y: Player position in hyperspace
+            player_vx, player_vy: Player velocity
+            ids: Ships to tick (every live ship if None)
+        """
+        store = self.store
+        if ids is None:
+            ids = store.active_ids()
+        if len(ids) == 0:
+            return
+
+        x = store.x[ids]
+        y = store.y[ids]
+        vx = store.vx[ids]
+        vy = store.vy[ids]
+        engine = np.maximum(store.engine_class[ids], 1).astype(np.float32)
+        max_speed = engine * SPEED_PER_ENGINE_CLASS
+        max_accel = engine * ACCEL_PER_ENGINE_CLASS
+        armed = store.weapon_class[ids] > 0
+
+        # Behavior: travel by default, react to the player when close
+        to_player_x = player_x - x
+        to_player_y = player_y - y
+        player_distance = np.hypot(to_player_x, to_player_y)
+        near = player_distance < DETECTION_RADIUS
+        disposition = store.disposition[ids]
+        behavior = np.where(armed, BEHAVIOR_PATROL, BEHAVIOR_SEEK).astype(np.int8)
+        behavior[near & armed & (disposition <= HOSTILE_DISPOSITION)] = BEHAVIOR_PURSUE
+        behavior[near & ~armed & (disposition < WARY_DISPOSITION)] = BEHAVIOR_FLEE
+        store.behavior[ids] = behavior
+
+        # Desired velocity per behavior
+        target = store.target_star[ids]
+        to_target_x = self.stars[target, 0] - x
+        to_target_y = self.stars[target, 1] - y
+        target_distance = np.hypot(to_target_x, to_target_y)
+        travel_speed = max_speed * np.minimum(target_distance / SLOWING_RADIUS, 1.0)
+        desired_x, desired_y = _scaled(to_target_x, to_target_y, target_distance, travel_speed)
+
+        fleeing = behavior == BEHAVIOR_FLEE
+        flee_x, flee_y = _scaled(-to_player_x, -to_player_y, player_distance, max_speed)
+        desired_x = np.where(fleeing, flee_x, desired_x)
+        desired_y = np.where(fleeing, flee_y, desired_y)
+
+        pursuing = behavior == BEHAVIOR_PURSUE
+        if pursuing.any():
+            lookahead = np.minimum(player_distance / max_speed, MAX_PURSUIT_LOOKAHEAD)
+            intercept_x = to_player_x + player_vx * lookahead
+            intercept_y = to_player_y + player_vy * lookahead
+            pursue_x, pursue_y = _scaled(intercept_x, intercept_y, np.hypot(intercept_x, intercept_y), max_speed)
+            desired_x = np.where(pursuing, pursue_x, desired_x)
+            desired_y = np.where(pursuing, pursue_y, desired_y)
+
+        steer_x = desired_x - vx
+        steer_y = desired_y - vy
+
+        # Separation from neighbors (each close pair pushes both ships apart)
+        self.grid.build(x, y)
+        pair_i, pair_j = self.grid.query_pairs(SEPARATION_RADIUS)
+        if len(pair_i):
+            dx = x[pair_i] - x[pair_j]
+            dy = y[pair_i] - y[pair_j]
+            inverse_sq = 1.0 / np.maximum(dx * dx + dy * dy, 1e-4)
+            count = len(ids)
+            push_x = np.bincount(pair_i, dx * inverse_sq, count) - np.bincount(pair_j, dx * inverse_sq, count)
+            push_y = np.bincount(pair_i, dy * inverse_sq, count) - np.bincount(pair_j, dy * inverse_sq, count)
+            steer_x = steer_x + SEPARATION_WEIGHT * push_x
+            steer_y = steer_y + SEPARATION_WEIGHT * push_y
+
+        # Apply steering within each ship's acceleration, then cap speed
+        steer_length = np.hypot(steer_x, steer_y)
+        accel_x, accel_y = _scaled(steer_x, steer_y, steer_length, np.minimum(steer_length, max_accel))
+        vx = vx + accel_x * step
+        vy = vy + accel_y * step
+        speed = np.hypot(vx, vy)
+        vx, vy = _scaled(vx, vy, speed, np.minimum(speed, max_speed))
+        store.vx[ids] = vx
+        store.vy[ids] = vy
+
+        integrate_motion(store, step, ids=ids)
+
+        # Ships that reached their star refuel and pick the next one
+        arrived = ids[(target_distance < ARRIVAL_RADIUS) & ~pursuing & ~fleeing]
+        store.fuel[arrived] = store.max_fuel[arrived]
+        self._retarget(arrived)
+
+    def advance(self, ids, elapsed):
+        """
+        Move ships over a long stretch of time without steering
+
+        The closed-form counterpart of tick() for ships nobody is watching:
+        each ship flies straight at its target star at top speed (as far as
+        its fuel allows), and ships that get there are parked on the star,
+        refuelled and given a new destination. Time left over after an
+        arrival is dropped, so a jump never carries a ship past one star.
+        Pursuit and flight end, since the player isn't nearby.
+
+        Args:
+            ids: Ships to advance
+            elapsed: Seconds to advance (a scalar, or one value per ship)
+        """
+        store = self.store
+        if len(ids) == 0:
+            return
+
+        x = store.x[ids]
+        y = store.y[ids]
+        max_speed = np.maximum(store.engine_class[ids], 1).astype(np.float32) * SPEED_PER_ENGINE_CLASS
+        target = store.target_star[ids]
+        to_target_x = self.stars[target, 0] - x
+        to_target_y = self.stars[target, 1] - y
+        target_distance = np.hypot(to_target_x, to_target_y)
+
+        fuel = store.fuel[ids]
+        reach = np.minimum(max_speed * elapsed, fuel / FUEL_PER_UNIT)
+        travel = np.minimum(reach, target_distance)
+        step_x, step_y = _scaled(to_target_x, to_target_y, target_distance, travel)
+        store.x[ids] = x + step_x
+        store.y[ids] = y + step_y
+        store.fuel[ids] = np.maximum(fuel - travel * FUEL_PER_UNIT, 0.0)
+
+        cruising = (travel > 0) & (travel < target_distance)
+        store.vx[ids], store.vy[ids] = _scaled(to_target_x, to_target_y, target_distance,
+                                               np.where(cruising, max_speed, 0.0))
+        store.behavior[ids] = np.where(store.weapon_class[ids] > 0, BEHAVIOR_PATROL, BEHAVIOR_SEEK)
+
+        arrived = ids[travel >= target_distance]
+        store.fuel[arrived] = store.max_fuel[arrived]
+        self._retarget(arrived)
+
+
+def _scaled(vector_x, vector_y, length, new_length):
+    """Rescale vectors to new lengths (zero-length vectors stay zero)"""
+    factor = np.where(length > 1e-6, new_length / np.maximum(length, 1e-6), 0.0)
+    return (vector_x * factor).astype(np.float32), (vector_y * factor).astype(np.float32)
@@ -0,0 +1,286 @@
+"""
+Background planet pre-generation
+Builds a planet's surface data on worker threads before the player lands
+"""
+
+import heapq
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from systems.terrain_generator import TerrainGenerator
+from systems.resource_scatter import ResourceScatter
+from systems.surface_map import SurfaceMap
+
+# Job priorities (lower runs first)
+PRIORITY_ORBIT = 0      # Ship is in orbit; landing may be seconds away
+PRIORITY_APPROACH = 1   # Ship is within approach range
+PRIORITY_PREFETCH = 2   # Nearby bodies the player might visit next
+
+# Finished planets kept in memory (heights are memory-mapped, so entries are small)
+DEFAULT_MAX_CACHED = 8
+
+
+class PlanetSurfaceData:
+    """Everything the surface view needs for one planet"""
+
+    def __init__(self, planet, terrain_map, scatter, surface_map):
+        """
+        Args:
+            planet: The Planet (or moon) this data belongs to
+            terrain_map: TerrainMap heightmap
+            scatter: Structured array of surface objects (see resource_scatter)
+            surface_map: SurfaceMap ready for SurfaceMapRenderer
+        """
+        self.planet = planet
+        self.terrain_map = terrain_map
+        self.scatter = scatter
+        self.surface_map = surface_map
+
+    def __repr__(self):
+        return f"PlanetSurfaceData({self.planet.name}, objects={len(self.scatter)})"
+
+
+class PregenJob:
+    """A queued or running generation request for one planet"""
+
+    def __init__(self, key, planet, priority, sequence):
+        self.key = key
+        self.planet = planet
+        self.priority = priority
+        self.sequence = sequence  # Tie-breaker: first requested, first served
+        self.cancelled = False
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+    def __lt__(self, other):
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class PlanetPregenService:
+    """
+    Generates planet surfaces (terrain, resource scatter, chunked surface
+    map) on a small thread pool and keeps the results in a shared cache.
+
+    Requests are queued in priority order, so a planet the ship is orbiting
+    jumps ahead of ones it only passed near. Requesting a planet that is
+    already queued just raises its priority; requesting one that is cached
+    is free. Pending jobs can be cancelled, and a running job stops at the
+    next stage boundary. The main loop only ever polls with get(), so it
+    never blocks on generation.
+
+    Example:
+        pregen.request(planet, PRIORITY_APPROACH)
+        ...
+        data = pregen.get(planet)  # None until ready
+    """
+
+    def __init__(self, terrain_generator=None, resource_scatter=None,
+                 max_workers=1, max_cached=DEFAULT_MAX_CACHED):
+        """
+        Initialize the pre-generation service
+
+        Args:
+            terrain_generator: Optional TerrainGenerator (a new one is created if None)
+            resource_scatter: Optional ResourceScatter (a new one is created if None)
+            max_workers: Worker threads (NumPy releases the GIL for most of the work)
+            max_cached: Finished planets kept before the oldest is dropped
+        """
+        self.terrain_generator = terrain_generator or TerrainGenerator()
+        self.resource_scatter = resource_scatter or ResourceScatter(self.terrain_generator.data_loader)
+        self.max_cached = max_cached
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix="planet-pregen")
+        self.lock = threading.Lock()
+        self.pending = []            # Heap of PregenJob
+        self.jobs = {}               # key -> PregenJob (queued or running)
+        self.cache = OrderedDict()   # key -> PlanetSurfaceData, least recently used first
+        self.sequence = itertools.count()
+
+    def can_generate(self, planet):
+        """Whether a planet has a surface to generate (landable, not a gas giant)"""
+        if not getattr(planet, "landable", True):
+            return False
+        try:
+            self.terrain_generator.profile_for_planet_type(planet.type)
+        except ValueError:
+            return False
+        return True
+
+    def planet_key(self, planet):
+        """Cache key for a planet (everything its surface is derived from)"""
+        return (planet.seed, planet.type, planet.body_type)
+
+    def request(self, planet, priority=PRIORITY_APPROACH):
+        """
+        Queue a planet for generation.
+
+        Args:
+            planet: Planet (or moon)
+            priority: PRIORITY_ORBIT, PRIORITY_APPROACH or PRIORITY_PREFETCH
+
+        Returns:
+            PregenJob or None: The queued/running job, or None if the planet
+            is already cached or has no surface
+        """
+        if not self.can_generate(planet):
+            return None
+
+        key = self.planet_key(planet)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return None
+
+            job = self.jobs.get(key)
+            if job is not None:
+                # Already queued or running: revive it and keep the more urgent priority
+                job.cancelled = False
+                if priority < job.priority:
+                    job.priority = priority
+                    heapq.heapify(self.pending)
+                return job
+
+            job = PregenJob(key, planet, priority, next(self.sequence))
+            self.jobs[key] = job
+            heapq.heappush(self.pending, job)
+
+        # Each submission runs whichever job is most urgent when a worker frees up
+        self.executor.submit(self._run_next)
+        return job
+
+    def get(self, planet):
+        """
+        Get a planet's surface data if it's ready, without blocking.
+
+        Returns:
+            PlanetSurfaceData or None
+        """
+        key = self.planet_key(planet)
+        with self.lock:
+            data = self.cache.get(key)
+            if data is not None:
+                self.cache.move_to_end(key)
+            return data
+
+    def is_ready(self, planet):
+        """Whether a planet's surface data is cached"""
+        with self.lock:
+            return self.planet_key(planet) in self.cache
+
+    def wait(self, planet, timeout=None):
+        """
+        Get a planet's surface data, generating it at top priority if needed.
+
+        Only for places that must have the data (e.g., behind a landing
+        transition); everything else should poll with get().
+
+        Args:
+            planet: Planet (or moon)
+            timeout: Seconds to wait, or None to wait until done
+
+        Returns:
+            PlanetSurfaceData or None: None if it timed out, failed or has no surface
+        """
+        data = self.get(planet)
+        if data is not None:
+            return data
+
+        job = self.request(planet, PRIORITY_ORBIT)
+        if job is None:
+            return self.get(planet)
+        job.done.wait(timeout)
+        return job.result
+
+    def cancel(self, planet):
+        """Cancel a planet's job (a running job stops at its next stage)"""
+        with self.lock:
+            job = self.jobs.get(self.planet_key(planet))
+            if job is not None:
+                job.cancelled = True
+
+    def cancel_pending(self, min_priority=PRIORITY_APPROACH):
+        """
+        Cancel queued and running jobs at or below an urgency level.
+
+        Args:
+            min_priority: Cancel jobs with this priority value or higher
+                (the default keeps orbit requests)
+        """
+        with self.lock:
+            for job in self.jobs.values():
+                if job.priority >= min_priority:
+                    job.cancelled = True
+
+    def shutdown(self):
+        """Cancel all work and stop the worker threads"""
+        with self.lock:
+            for job in self.jobs.values():
+                job.cancelled = True
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_next(self):
+        """Worker entry point: run the most urgent job that isn't cancelled"""
+        with self.lock:
+            job = None
+            while self.pending:
+                candidate = heapq.heappop(self.pending)
+                if not candidate.cancelled:
+                    job = candidate
+                    break
+                self._finish(candidate)
+            if job is None:
+                return
+
+        try:
+            job.result = self._generate(job)
+        except Exception as e:
+            job.error = e
+            print(f"WARNING: Pre-generation failed for {job.planet.name}: {e}")
+
+        with self.lock:
+            # Revived by request() after it stopped for a cancel: queue it again
+            requeue = job.result is None and job.error is None and not job.cancelled
+            if requeue:
+                heapq.heappush(self.pending, job)
+            else:
+                if job.result is not None:
+                    self.cache[job.key] = job.result
+                    self.cache.move_to_end(job.key)
+                    while len(self.cache) > self.max_cached:
+                        self.cache.popitem(last=False)
+                self._finish(job)
+        if requeue:
+            self.executor.submit(self._run_next)
+
+    def _finish(self, job):
+        """Retire a job (lock held)"""
+        if self.jobs.get(job.key) is job:
+            del self.jobs[job.key]
+        job.done.set()
+
+    def _generate(self, job):
+        """
+        Build a planet's surface data, checking for cancellation between stages
+
+        Returns:
+            PlanetSurfaceData or None if cancelled
+        """
+        planet = job.planet
+        generator = self.terrain_generator
+        profile_name = generator.profile_for_planet_type(planet.type)
+        craters = generator.crater_settings_for(planet, profile_name)
+
+        # Heightmap (also lands in the disk cache, so it's never wasted)
+        terrain_map = generator.get_terrain(planet.seed, profile_name, craters)
+        if job.cancelled:
+            return None
+
+        scatter = self.resource_scatter.scatter(terrain_map)
+        if job.cancelled:
+            return None
+
+        surface_map = SurfaceMap(generator, planet.seed, profile_name, craters, terrain_map)
+        return PlanetSurfaceData(planet, terrain_map, scatter, surface_map)
@@ -0,0 +1,363 @@
+"""
+Planetary scan engine
+Derives a planet's full sensor analysis (atmosphere, hydrosphere,
+lithosphere, temperature, gravity, life and minerals) from its seed and
+type, memoized per planet and batched across whole systems
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import numpy as np
+from core.data_loader import get_data_loader
+from core.game_data import GameData, RARITIES, get_game_data
+from utils.noise import derive_seed, hash_uniforms
+
+# Scans kept before the least recently used is dropped (a scan is a few hundred bytes)
+DEFAULT_MAX_CACHED = 65536
+
+# A body this size at 1 g has one Earth mass (Homeworld's size)
+REFERENCE_SIZE = 1.6
+
+# Surface pressure (atmospheres) at which each atmospheric density type
+# starts, after "none"; giant planets have no surface, so no upper bound
+DENSITY_THRESHOLDS = (0.001, 0.5, 2.0, 10.0)
+GIANT_PRESSURE = 1000.0
+
+# Scatter density (objects per sampling cell) shown as 100% life or minerals
+FULL_SCATTER_DENSITY = 0.5
+
+# Columns of each body's hash_uniforms() row; one more column per mineral follows
+_DRAW_TEMPERATURE_CLASS = 0
+_DRAW_TEMPERATURE = 1
+_DRAW_GRAVITY = 2
+_DRAW_ATMOSPHERE = 3
+_DRAW_PRESSURE = 4
+_DRAW_HYDROSPHERE = 5
+_DRAW_COVERAGE_BAND = 6
+_DRAW_COVERAGE = 7
+_DRAW_MINERALS = 8
+_DRAW_LIFE = 9
+_DRAW_WEATHER = 10
+_DRAW_LITHOSPHERE = 11
+
+
+@dataclass(frozen=True, slots=True)
+class PlanetScan:
+    """A planet's full sensor analysis (fields follow planet_template.json)"""
+    planet_type: str
+    predominant_surface: str   # Terrain profile, or "gas" for giants
+    mass: float                # Earth masses
+    gravity: float             # g
+    temperature: float         # Kelvin
+    temperature_class: str     # generation_rules band, e.g. "temperate"
+    atmosphere: tuple          # Atmospheric component keys, main one first (empty for vacuum)
+    atmosphere_preset: str
+    atmospheric_density: str   # planet_types.json density type, "none" to "very dense"
+    pressure: float            # Atmospheres at the surface
+    breathable: bool
+    hydrosphere: tuple         # Hydrosphere component keys (empty if dry)
+    hydrosphere_coverage: float  # Percent of the surface
+    lithosphere: tuple         # Mineral keys, most abundant first (empty for giants)
+    mineral_percentage: float
+    bio_percentage: float
+    global_weather: str
+    hazards: tuple
+
+    def to_dict(self):
+        """Serialize the scan (JSON-compatible)"""
+        return {
+            "type": self.planet_type,
+            "predominant_surface": self.predominant_surface,
+            "mass": self.mass,
+            "gravity": self.gravity,
+            "temperature": self.temperature,
+            "temperature_class": self.temperature_class,
+            "atmosphere": list(self.atmosphere),
+            "atmosphere_preset": self.atmosphere_preset,
+            "atmospheric_density": self.atmospheric_density,
+            "pressure": self.pressure,
+            "breathable": self.breathable,
+            "hydrosphere": list(self.hydrosphere),
+            "hydrosphere_coverage": self.hydrosphere_coverage,
+            "lithosphere": list(self.lithosphere),
+            "mineral_percentage": self.mineral_percentage,
+            "bio_percentage": self.bio_percentage,
+            "global_weather": self.global_weather,
+            "hazards": list(self.hazards)
+        }
+
+
+def system_bodies(star_system):
+    """Every planet in a star system, each followed by its moons"""
+    for planet in star_system.inner_planets + star_system.outer_planets:
+        if planet is None:
+            continue
+        yield planet
+        yield from planet.moons
+
+
+class PlanetScanner:
+    """
+    Science Officer sensor scans.
+
+    Everything in a scan is derived from the body's seed, type and size
+    using the planetary chemistry, scan, terrain and scatter data, so the
+    same planet always reads the same. Random draws come from
+    hash_uniforms(), which hashes every body's numbers in one vectorized
+    pass, so a batch gives exactly what scanning bodies one by one would.
+
+    Scans are memoized by planet_key(); a repeat scan is a dict lookup.
+    scan_system() analyzes every planet and moon of a system in one batch
+    for the survey view, and scan_many() takes any list of bodies (a whole
+    sector, for a map overlay).
+
+    Example:
+        scanner = PlanetScanner()
+        scan = scanner.scan(planet)
+        scan.atmosphere, scan.gravity, scan.hazards
+        survey = scanner.scan_system(game_session.current_system)  # {body: PlanetScan}
+    """
+
+    def __init__(self, data_loader=None, max_cached=DEFAULT_MAX_CACHED):
+        """
+        Load and cross-reference the scan data
+
+        Args:
+            data_loader: Optional DataLoader (the shared loader if None)
+            max_cached: Scans kept before the least recently used is dropped
+
+        Raises:
+            KeyError: If a scan profile names a preset, component, band or
+                      mineral that doesn't exist
+        """
+        self.data_loader = data_loader or get_data_loader()
+        self.max_cached = max_cached
+        self.cache = OrderedDict()   # planet_key -> PlanetScan, least recently used first
+
+        load = self.data_loader.load_static
+        chemistry = load("planetary_info", "planetary_chemistry.json")
+        scan_data = load("planetary_info", "scan_profiles.json")
+        scatter_data = load("planetary_info", "scatter_profiles.json")
+        terrain_data = load("planetary_info", "terrain_profiles.json")
+        self.density_types = load("planetary_info", "planet_types.json")["planet"]["atmosphere_density_types"]
+
+        self.components = chemistry["atmospheric_components"]
+        self.families = chemistry["atmospheric_families"]
+        self.presets = chemistry["atmosphere_presets"]
+        self.hydrosphere_components = chemistry["hydrosphere_components"]
+        rules = chemistry["generation_rules"]
+        self.temperature_bands = rules["temperature_kelvin"]
+        self.coverage_bands = rules["hydrosphere_coverage_percent"]
+        gravity_rules = rules["gravity_effects"]
+        self.retention = {
+            "hydrogen": gravity_rules["hydrogen_retention_minimum_gravity"],
+            "helium": gravity_rules["helium_retention_minimum_gravity"]
+        }
+        self.heavy_retention = gravity_rules["heavy_gas_retention_minimum_gravity"]
+
+        self.lithosphere_minerals = scan_data["lithosphere_minerals"]
+        self.high_gravity = scan_data["high_gravity"]
+        self.profiles = scan_data["planet_type_scan_profiles"]
+        self.surfaces = terrain_data["planet_type_profiles"]
+        for planet_type, profile in self.profiles.items():
+            for band in profile["temperature"]:
+                self.temperature_bands[band]
+            for preset in profile["atmospheres"]:
+                for component in self.presets[preset]["components"]:
+                    self.components[component]
+            for component in profile["hydrosphere"]:
+                self.hydrosphere_components[component]
+            for band in profile["coverage"]:
+                self.coverage_bands[band]
+
+        # Life and mineral richness per surface, from how densely the surface is scattered
+        self.scatter_density = {}
+        for surface, kinds in scatter_data["scatter_profiles"].items():
+            life = sum(kinds[kind]["density"] for kind in ("flora", "fauna") if kind in kinds)
+            minerals = kinds["minerals"]["density"] if "minerals" in kinds else 0.0
+            self.scatter_density[surface] = (life, minerals)
+
+        # Lithosphere minerals are weighted by rarity, like the surface scatter
+        game_data = get_game_data() if data_loader is None else GameData(self.data_loader)
+        self.mineral_keys = [mineral.key for mineral in game_data.minerals]
+        rarity_weights = np.array([scatter_data["rarity_weights"][r] for r in RARITIES], dtype=np.float64)
+        self.mineral_weights = rarity_weights[game_data.mineral_rarity]
+
+    def __len__(self):
+        """Number of cached scans"""
+        return len(self.cache)
+
+    def planet_key(self, planet):
+        """Cache key for a body (everything its scan is derived from)"""
+        return (planet.seed, planet.type, planet.body_type, planet.size)
+
+    def scan(self, planet):
+        """
+        Scan one body
+
+        Args:
+            planet: Planet (or moon)
+
+        Returns:
+            PlanetScan
+
+        Raises:
+            ValueError: If the planet type has no scan profile
+        """
+        return self.scan_many([planet])[0]
+
+    def scan_system(self, star_system):
+        """
+        Scan every planet and moon in a star system in one batch
+
+        Returns:
+            dict: Body -> PlanetScan, planets in orbit order, each followed by its moons
+        """
+        bodies = list(system_bodies(star_system))
+        return dict(zip(bodies, self.scan_many(bodies)))
+
+    def scan_many(self, bodies):
+        """
+        Scan any number of bodies, analyzing the uncached ones in one batch
+
+        Args:
+            bodies: Planets (or moons)
+
+        Returns:
+            list: PlanetScan per body, in order
+
+        Raises:
+            ValueError: If a planet type has no scan profile
+        """
+        keys = [self.planet_key(body) for body in bodies]
+        scans = [None] * len(keys)
+        missing = {}   # key -> (body, result indexes)
+        for index, key in enumerate(keys):
+            scan = self.cache.get(key)
+            if scan is not None:
+                self.cache.move_to_end(key)
+                scans[index] = scan
+            elif key in missing:
+                missing[key][1].append(index)
+            else:
+                missing[key] = (bodies[index], [index])
+        if not missing:
+            return scans
+
+        fresh = self._analyze_all([body for body, _ in missing.values()])
+        for (key, (_, indexes)), scan in zip(missing.items(), fresh):
+            for index in indexes:
+                scans[index] = scan
+            self.cache[key] = scan
+        while len(self.cache) > self.max_cached:
+            self.cache.popitem(last=False)
+        return scans
+
+    def _analyze_all(self, bodies):
+        """Analyze bodies, drawing every body's random numbers in one pass"""
+        for body in bodies:
+            if body.type not in self.profiles:
+                raise ValueError(f"Planet type '{body.type}' has no scan profile")
+        seeds = [derive_seed(body.seed, "scan") for body in bodies]
+        draws = hash_uniforms(seeds, _DRAW_LITHOSPHERE + len(self.mineral_keys))
+
+        # Weighted sampling without replacement for every body at once:
+        # the minerals with the largest u ** (1 / weight) are the most abundant
+        keys = np.log(np.maximum(draws[:, _DRAW_LITHOSPHERE:], 1e-300)) / self.mineral_weights
+        lithospheres = np.argsort(-keys, axis=1, kind="stable")[:, :self.lithosphere_minerals]
+
+        return [self._analyze(body, row, minerals)
+                for body, row, minerals in zip(bodies, draws[:, :_DRAW_LITHOSPHERE].tolist(), lithospheres.tolist())]
+
+    def _analyze(self, body, draws, minerals):
+        """Build one body's scan from its draws"""
+        profile = self.profiles[body.type]
+        surface = self.surfaces.get(body.type)
+
+        def pick(options, draw):
+            return options[min(int(draws[draw] * len(options)), len(options) - 1)]
+
+        def within(low, high, draw):
+            return low + (high - low) * draws[draw]
+
+        temperature_class = pick(profile["temperature"], _DRAW_TEMPERATURE_CLASS)
+        band = self.temperature_bands[temperature_class]
+        temperature = round(within(band["min"], band["max"], _DRAW_TEMPERATURE), 1)
+        gravity = round(body.size * within(*profile["gravity_per_size"], _DRAW_GRAVITY), 2)
+        mass = round(gravity * (body.size / REFERENCE_SIZE) ** 2, 2)
+
+        # Atmosphere: the preset's gases this body can hold at its gravity and temperature
+        preset_key = pick(profile["atmospheres"], _DRAW_ATMOSPHERE)
+        preset = self.presets[preset_key]
+        atmosphere = tuple(component for component in preset["components"] if self._retains(component, gravity, temperature))
+        density_range = preset["density_range"]
+        if not atmosphere:
+            pressure = 0.0
+        elif density_range is None:
+            pressure = GIANT_PRESSURE
+        else:
+            pressure = round(within(density_range["min"], density_range["max"], _DRAW_PRESSURE), 4)
+        density_index = int(np.searchsorted(DENSITY_THRESHOLDS, pressure, side="right")) if atmosphere else 0
+        breathable = bool(preset["breathable"]) and "oxygen" in atmosphere
+
+        # Hydrosphere: one of the profile's components that's stable at this temperature
+        stable = [component for component in profile["hydrosphere"]
+                  if self._in_range(self.hydrosphere_components[component], temperature)]
+        hydrosphere = pick(stable, _DRAW_HYDROSPHERE) if stable else "none"
+        if hydrosphere == "none":
+            hydrosphere, coverage = (), 0.0
+        else:
+            coverage_band = self.coverage_bands[pick(profile["coverage"], _DRAW_COVERAGE_BAND)]
+            hydrosphere = (hydrosphere,)
+            coverage = round(within(coverage_band["min"], coverage_band["max"], _DRAW_COVERAGE), 1)
+
+        # Life and minerals follow what the surface scatter will put there
+        life_density, mineral_density = self.scatter_density.get(surface, (0.0, 0.0))
+        bio = round(min(100.0, life_density / FULL_SCATTER_DENSITY * 100.0 * (0.5 + draws[_DRAW_LIFE])), 1)
+        mineral = round(min(100.0, mineral_density / FULL_SCATTER_DENSITY * 100.0 * (0.5 + draws[_DRAW_MINERALS])), 1)
+        lithosphere = tuple(self.mineral_keys[index] for index in minerals) if surface else ()
+
+        hazards = []
+        if not atmosphere:
+            hazards.append("vacuum")
+        elif not breathable:
+            hazards.append(self.families[self.components[atmosphere[0]]["family"]]["hazard_type"])
+        if temperature_class in ("hot", "molten"):
+            hazards.append("extreme heat")
+        elif temperature_class == "frozen":
+            hazards.append("extreme cold")
+        if gravity >= self.high_gravity:
+            hazards.append("high gravity")
+
+        return PlanetScan(
+            planet_type=body.type,
+            predominant_surface=surface or "gas",
+            mass=mass,
+            gravity=gravity,
+            temperature=temperature,
+            temperature_class=temperature_class,
+            atmosphere=atmosphere,
+            atmosphere_preset=preset_key,
+            atmospheric_density=self.density_types[density_index],
+            pressure=pressure,
+            breathable=breathable,
+            hydrosphere=hydrosphere,
+            hydrosphere_coverage=coverage,
+            lithosphere=lithosphere,
+            mineral_percentage=mineral,
+            bio_percentage=bio,
+            global_weather=pick(profile["weather"], _DRAW_WEATHER) if atmosphere else "none",
+            hazards=tuple(hazards)
+        )
+
+    def _retains(self, component, gravity, temperature):
+        """Whether a body holds on to an atmospheric gas"""
+        if gravity < self.retention.get(component, self.heavy_retention):
+            return False
+        return self._in_range(self.components[component], temperature)
+
+    @staticmethod
+    def _in_range(component, temperature):
+        """Whether a temperature is inside a component's temperature_range"""
+        temperature_range = component["temperature_range"]
+        return temperature_range["min"] <= temperature <= temperature_range["max"]
@@ -0,0 +1,234 @@
+"""
+Resource scatter for planetary surfaces
+Places minerals, flora and fauna with seeded, clustered Poisson-disk sampling
+"""
+
+import math
+import numpy as np
+from core.data_loader import get_data_loader
+from core.game_data import GameData, RARITIES, get_game_data
+from utils.noise import derive_seed, noise_grid
+
+# Object kinds stored in the scatter array's "kind" field
+KIND_MINERAL = 0
+KIND_FLORA = 1
+KIND_FAUNA = 2
+KIND_NAMES = {"minerals": KIND_MINERAL, "flora": KIND_FLORA, "fauna": KIND_FAUNA}
+
+# Compact record for one surface object (7 bytes, no padding)
+SCATTER_DTYPE = np.dtype([
+    ("x", np.uint16),
+    ("y", np.uint16),
+    ("kind", np.uint8),
+    ("id", np.uint16)
+])
+
+# Fill passes over empty grid cells; more passes get closer to a maximal packing
+DEFAULT_ROUNDS = 8
+
+# Neighbor cells that can hold a point closer than the spacing (5x5 block
+# minus the center and corners) when cells are spacing / sqrt(2) wide
+_NEIGHBOR_OFFSETS = [
+    (dy, dx)
+    for dy in range(-2, 3)
+    for dx in range(-2, 3)
+    if (dy, dx) != (0, 0) and not (abs(dy) == 2 and abs(dx) == 2)
+]
+
+
+def poisson_disk_sample(rng, width, height, spacing, density=None, rounds=DEFAULT_ROUNDS):
+    """
+    Grid-accelerated Poisson-disk sampling over a rectangle.
+
+    Uses a background grid with cells spacing / sqrt(2) wide, so each cell
+    holds at most one point and conflicts can only come from the 20
+    surrounding cells. Cells are processed in 9 interleaved phases; cells in
+    the same phase are 3 apart and can never conflict with each other, so a
+    whole phase is tested in one vectorized pass.
+
+    Args:
+        rng: numpy Generator
+        width, height: Area size
+        spacing: Minimum distance between points
+        density: Optional callable(cell_x, cell_y) -> probability array in [0, 1]
+                 sampled at grid cell centers; cells failing the draw stay empty
+        rounds: Number of fill passes
+
+    Returns:
+        np.ndarray: float32 array of shape (n, 2) with (x, y) positions
+    """
+    cell = spacing / math.sqrt(2.0)
+    grid_w = int(math.ceil(width / cell))
+    grid_h = int(math.ceil(height / cell))
+
+    # Padded by 2 cells so neighbor lookups never go out of bounds;
+    # empty cells hold a far-away sentinel position
+    far = np.float32(-1e6)
+    points_x = np.full((grid_h + 4, grid_w + 4), far, dtype=np.float32)
+    points_y = np.full((grid_h + 4, grid_w + 4), far, dtype=np.float32)
+    filled = np.zeros((grid_h, grid_w), dtype=bool)
+
+    # Density decides once per cell whether it may ever hold a point
+    eligible = np.ones((grid_h, grid_w), dtype=bool)
+    if density is not None:
+        cell_x = (np.arange(grid_w, dtype=np.float32) + 0.5) * cell
+        cell_y = (np.arange(grid_h, dtype=np.float32) + 0.5) * cell
+        probability = density(cell_x, cell_y)
+        eligible = rng.random((grid_h, grid_w)) < probability
+
+    spacing_sq = spacing * spacing
+    for _ in range(rounds):
+        for phase_y in range(3):
+            for phase_x in range(3):
+                rows, cols = np.nonzero(eligible[phase_y::3, phase_x::3] &
+                                        ~filled[phase_y::3, phase_x::3])
+                if len(rows) == 0:
+                    continue
+                rows = rows * 3 + phase_y
+                cols = cols * 3 + phase_x
+
+                px = ((cols + rng.random(len(cols))) * cell).astype(np.float32)
+                py = ((rows + rng.random(len(rows))) * cell).astype(np.float32)
+                ok = (px < width) & (py < height)
+
+                for dy, dx in _NEIGHBOR_OFFSETS:
+                    nx = points_x[rows + 2 + dy, cols + 2 + dx]
+                    ny = points_y[rows + 2 + dy, cols + 2 + dx]
+                    ok &= (nx - px) ** 2 + (ny - py) ** 2 >= spacing_sq
+
+                rows, cols = rows[ok], cols[ok]
+                points_x[rows + 2, cols + 2] = px[ok]
+                points_y[rows + 2, cols + 2] = py[ok]
+                filled[rows, cols] = True
+
+    rows, cols = np.nonzero(filled)
+    return np.stack([points_x[rows + 2, cols + 2], points_y[rows + 2, cols + 2]], axis=1)
+
+
+class ResourceScatter:
+    """
+    Scatters minerals, flora and fauna across a generated planetary surface.
+
+    Each kind is Poisson-disk sampled with its own spacing, and a secondary
+    noise field modulates where points may appear, giving rich and poor
+    regions instead of a uniform spread. Terrain shapes the field further:
+    nothing is placed in liquid, minerals lean toward high ground, and
+    life keeps to its elevation band. Output depends only on the planet
+    seed and terrain.
+    """
+
+    def __init__(self, data_loader=None):
+        """
+        Initialize the scatter engine
+
+        Args:
+            data_loader: Optional DataLoader (the shared loader if None)
+        """
+        self.data_loader = data_loader or get_data_loader()
+        scatter_data = self.data_loader.load_static("planetary_info", "scatter_profiles.json")
+        self.profiles = scatter_data["scatter_profiles"]
+
+        # Mineral ids are MineralRecord ids; weights come from rarity
+        game_data = get_game_data() if data_loader is None else GameData(self.data_loader)
+        self.mineral_keys = [mineral.key for mineral in game_data.minerals]
+        rarity_weights = np.array([scatter_data["rarity_weights"][r] for r in RARITIES], dtype=np.float64)
+        weights = rarity_weights[game_data.mineral_rarity]
+        self.mineral_weights = weights / weights.sum()
+
+    def scatter(self, terrain_map):
+        """
+        Scatter all surface objects for a terrain map.
+
+        Args:
+            terrain_map: TerrainMap from TerrainGenerator
+
+        Returns:
+            np.ndarray: Structured array with SCATTER_DTYPE (x, y in grid cells)
+        """
+        profile = self.profiles.get(terrain_map.profile_name, {})
+        parts = []
+        for kind_name, settings in profile.items():
+            parts.append(self._scatter_kind(terrain_map, KIND_NAMES[kind_name], settings))
+
+        if not parts:
+            return np.zeros(0, dtype=SCATTER_DTYPE)
+        return np.concatenate(parts)
+
+    def _scatter_kind(self, terrain_map, kind, settings):
+        """Sample one kind of object and assign ids"""
+        seed = terrain_map.seed
+        rng = np.random.default_rng(derive_seed(seed, "scatter", kind))
+
+        def density(cell_x, cell_y):
+            return self._density_field(terrain_map, kind, settings, cell_x, cell_y)
+
+        points = poisson_disk_sample(rng, terrain_map.width, terrain_map.height,
+                                     settings["spacing"], density)
+        xs = np.minimum(points[:, 0].astype(np.intp), terrain_map.width - 1)
+        ys = np.minimum(points[:, 1].astype(np.intp), terrain_map.height - 1)
+
+        # Density is sampled per grid cell, so drop points that landed in liquid near a shore
+        on_land = ~terrain_map.liquid_mask(np.asarray(terrain_map.heights)[ys, xs])
+        xs, ys = xs[on_land], ys[on_land]
+
+        records = np.zeros(len(xs), dtype=SCATTER_DTYPE)
+        records["x"] = xs
+        records["y"] = ys
+        records["kind"] = kind
+        if kind == KIND_MINERAL:
+            records["id"] = rng.choice(len(self.mineral_keys), size=len(records), p=self.mineral_weights)
+        else:
+            records["id"] = rng.integers(0, settings.get("variants", 1), size=len(records))
+        return records
+
+    def _density_field(self, terrain_map, kind, settings, cell_x, cell_y):
+        """
+        Probability that each sampling cell may hold an object.
+
+        Args:
+            terrain_map: TerrainMap being scattered on
+            kind: KIND_* constant
+            settings: Scatter settings for this kind
+            cell_x, cell_y: 1D arrays of cell center coordinates (grid units)
+
+        Returns:
+            np.ndarray: float32 array of shape (len(cell_y), len(cell_x))
+        """
+        # Secondary noise layer makes rich and poor regions
+        cell_size = float(cell_x[1] - cell_x[0]) if len(cell_x) > 1 else 1.0
+        scale = settings.get("cluster_frequency", 8) / terrain_map.width * cell_size
+        clusters = noise_grid(0, 0, len(cell_x), len(cell_y), scale,
+                              derive_seed(terrain_map.seed, "clusters", kind), octaves=2)
+        field = settings["density"] * (1.0 + settings.get("cluster_contrast", 1.5) * clusters)
+
+        # Terrain under each cell center
+        cols = np.minimum(cell_x.astype(np.intp), terrain_map.width - 1)
+        rows = np.minimum(cell_y.astype(np.intp), terrain_map.height - 1)
+        heights = np.asarray(terrain_map.heights)[np.ix_(rows, cols)]
+
+        level = terrain_map.liquid_level
+        land = (heights - level) / max(1.0 - level, 1e-6)  # 0 at the shore, 1 at peaks
+        field = np.where(heights < level, 0.0, field)
+
+        bias = settings.get("elevation_bias")
+        if bias:
+            field = field * ((1.0 - bias) + 2.0 * bias * land)
+
+        band = settings.get("elevation_band")
+        if band:
+            outside = np.maximum(band[0] - land, 0.0) + np.maximum(land - band[1], 0.0)
+            field = field * np.clip(1.0 - outside / 0.1, 0.0, 1.0)
+
+        return np.clip(field, 0.0, 1.0).astype(np.float32)
+
+    def mineral_key(self, mineral_id):
+        """
+        Get the minerals.json key for a mineral id
+
+        Args:
+            mineral_id: Value of the "id" field for a KIND_MINERAL record
+
+        Returns:
+            str: Mineral key (e.g., "iron")
+        """
+        return self.mineral_keys[mineral_id]
@@ -0,0 +1,286 @@
+"""
+Entity-component store for ships
+Keeps every ship's components in NumPy columns so systems can update whole
+fleets in vectorized passes
+"""
+
+import numpy as np
+
+# Component columns: name -> (dtype, value for a newly spawned ship)
+# Defaults match a new Ship (entities/ship.py)
+SHIP_COLUMNS = {
+    # Position and velocity in the ship's current context (units, units/second)
+    "x": (np.float32, 0.0),
+    "y": (np.float32, 0.0),
+    "vx": (np.float32, 0.0),
+    "vy": (np.float32, 0.0),
+
+    # Resources and status
+    "fuel": (np.float32, 100.0),
+    "max_fuel": (np.float32, 500.0),
+    "hull": (np.float32, 100.0),  # 0-100 percent
+
+    # Equipment classes (0 = not fitted)
+    "engine_class": (np.int8, 1),
+    "shield_class": (np.int8, 1),
+    "armor_class": (np.int8, 1),
+    "weapon_class": (np.int8, 0),
+
+    # GameData / factions.json ids (-1 = none)
+    "ship_class": (np.int16, -1),
+    "species": (np.int16, -1),
+    "faction": (np.int16, -1)
+}
+
+# Ship fields copied into the store by spawn_ship()
+_SHIP_FIELDS = {
+    "fuel": "fuel",
+    "max_fuel": "max_fuel",
+    "hull_integrity": "hull",
+    "engine_class": "engine_class",
+    "shield_class": "shield_class",
+    "armor_class": "armor_class"
+}
+
+# Fuel burned per unit travelled (placeholder until engines have real stats)
+FUEL_PER_UNIT = 0.05
+
+DEFAULT_CAPACITY = 256
+
+
+class ShipStore:
+    """
+    Ship components in NumPy columns, indexed by entity id.
+
+    Every column (see SHIP_COLUMNS) is an attribute holding one array, so
+    store.x[entity_id] is a ship's x position and store.x[store.active_ids()]
+    is every live ship's. Despawned ids go on a free list and are reused
+    by the next spawn, so spawn and despawn are O(1) and the arrays stay
+    dense. When they fill up, every column doubles in size; this replaces
+    the arrays, so don't hold onto a column across a spawn.
+
+    Each id also has a generation that goes up when it's despawned, so a
+    saved (id, generation) pair can tell whether the ship it named is gone.
+
+    Systems that need per-ship state of their own (AI behavior, targets)
+    add it as extra columns with add_component(), so it grows and is
+    recycled along with everything else.
+
+    Example:
+        ship_id = store.spawn(x=120.0, y=80.0, faction=1)
+        live = store.active_ids()
+        store.x[live] += store.vx[live] * dt
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """
+        Initialize an empty store
+
+        Args:
+            capacity: Ships to allocate room for up front
+        """
+        self.capacity = 0
+        self.size = 0          # High-water mark: ids below this have been used
+        self.free_ids = []     # Despawned ids, reused last-in first-out
+        self.columns = dict(SHIP_COLUMNS)  # name -> (dtype, default), including add_component() ones
+        self.alive = np.zeros(0, dtype=bool)
+        self.generation = np.zeros(0, dtype=np.uint32)
+        for name, (dtype, _) in self.columns.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self._grow(max(1, capacity))
+
+    def add_component(self, name, dtype, default):
+        """
+        Add a column for every ship (existing ships get the default)
+
+        Args:
+            name: Column name (becomes an attribute of the store)
+            dtype: NumPy dtype
+            default: Value for existing and newly spawned ships
+
+        Raises:
+            ValueError: If the name is already used
+        """
+        if name in self.columns or hasattr(self, name):
+            raise ValueError(f"Ship column '{name}' already exists")
+        self.columns[name] = (dtype, default)
+        setattr(self, name, np.full(self.capacity, default, dtype=dtype))
+
+    def __len__(self):
+        """Number of live ships"""
+        return self.size - len(self.free_ids)
+
+    def _grow(self, capacity):
+        """Reallocate every column to hold capacity ships"""
+        def resized(array):
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self.capacity] = array
+            return grown
+
+        self.alive = resized(self.alive)
+        self.generation = resized(self.generation)
+        for name in self.columns:
+            setattr(self, name, resized(getattr(self, name)))
+        self.capacity = capacity
+
+    def _reserve(self, count):
+        """Take count ids (free list first, then fresh ones), growing if needed"""
+        reused = [self.free_ids.pop() for _ in range(min(count, len(self.free_ids)))]
+        fresh = count - len(reused)
+        if self.size + fresh > self.capacity:
+            capacity = self.capacity
+            while self.size + fresh > capacity:
+                capacity *= 2
+            self._grow(capacity)
+        ids = np.concatenate([np.array(reused, dtype=np.int64),
+                              np.arange(self.size, self.size + fresh, dtype=np.int64)])
+        self.size += fresh
+        return ids
+
+    def spawn(self, **values):
+        """
+        Add one ship.
+
+        Args:
+            **values: Column values; columns not given get their defaults
+
+        Returns:
+            int: The new ship's entity id
+
+        Raises:
+            KeyError: If a value names an unknown column
+        """
+        return int(self.spawn_many(1, **values)[0])
+
+    def spawn_many(self, count, **values):
+        """
+        Add many ships in one pass.
+
+        Args:
+            count: Number of ships
+            **values: Column values, each a scalar or an array of length count
+
+        Returns:
+            np.ndarray: The new ships' entity ids
+
+        Raises:
+            KeyError: If a value names an unknown column
+        """
+        unknown = set(values) - set(self.columns)
+        if unknown:
+            raise KeyError(f"Unknown ship columns: {', '.join(sorted(unknown))}")
+
+        ids = self._reserve(count)
+        for name, (_, default) in self.columns.items():
+            getattr(self, name)[ids] = values.get(name, default)
+        self.alive[ids] = True
+        return ids
+
+    def spawn_ship(self, ship, **values):
+        """
+        Add a Ship's resources, status and equipment to the store
+
+        Args:
+            ship: Ship entity to copy from
+            **values: Other column values (position, faction, ...)
+
+        Returns:
+            int: The new entity id
+        """
+        for field, column in _SHIP_FIELDS.items():
+            values.setdefault(column, getattr(ship, field))
+        return self.spawn(**values)
+
+    def despawn(self, entity_id):
+        """
+        Remove a ship; its id will be reused
+
+        Raises:
+            KeyError: If the id isn't a live ship
+        """
+        if not self.is_alive(entity_id):
+            raise KeyError(f"Ship {entity_id} is not alive")
+        self.alive[entity_id] = False
+        self.generation[entity_id] += 1
+        self.free_ids.append(int(entity_id))
+
+    def despawn_many(self, ids):
+        """
+        Remove many ships in one pass (ids that aren't alive are skipped)
+
+        Args:
+            ids: Array of entity ids
+        """
+        ids = np.unique(np.asarray(ids, dtype=np.int64))
+        ids = ids[self.alive[ids]]
+        self.alive[ids] = False
+        self.generation[ids] += 1
+        self.free_ids.extend(ids.tolist())
+
+    def is_alive(self, entity_id, generation=None):
+        """
+        Whether an id names a live ship
+
+        Args:
+            entity_id: Entity id
+            generation: If given, also require the id not to have been reused since
+        """
+        if not 0 <= entity_id < self.size or not self.alive[entity_id]:
+            return False
+        return generation is None or self.generation[entity_id] == generation
+
+    def active_ids(self):
+        """Entity ids of every live ship, in ascending order"""
+        return np.flatnonzero(self.alive[:self.size])
+
+    def get(self, entity_id):
+        """
+        Read one ship's components (for debugging and UI, not hot loops)
+
+        Returns:
+            dict: Column name -> Python value
+        """
+        if not self.is_alive(entity_id):
+            raise KeyError(f"Ship {entity_id} is not alive")
+        return {name: getattr(self, name)[entity_id].item() for name in self.columns}
+
+
+def integrate_motion(store, dt, fuel_per_unit=FUEL_PER_UNIT, ids=None):
+    """
+    Move live ships by their velocity, burning fuel for the distance.
+
+    Ships can't travel further than their fuel allows; a ship that runs dry
+    stops where its fuel ran out.
+
+    Args:
+        store: ShipStore
+        dt: Seconds to advance (a scalar, or one value per ship in ids)
+        fuel_per_unit: Fuel burned per unit travelled
+        ids: Ships to move (every live ship if None)
+    """
+    if ids is None:
+        ids = store.active_ids()
+    if len(ids) == 0:
+        return
+
+    vx = store.vx[ids]
+    vy = store.vy[ids]
+    fuel = store.fuel[ids]
+    distance = np.hypot(vx, vy) * dt
+
+    # Scale each step down to what the remaining fuel can cover
+    if fuel_per_unit > 0:
+        reachable = fuel / fuel_per_unit
+        scale = np.where(distance > reachable, reachable / np.maximum(distance, 1e-12), 1.0)
+    else:
+        scale = np.ones_like(distance)
+    scale = scale.astype(np.float32)
+
+    store.x[ids] += vx * dt * scale
+    store.y[ids] += vy * dt * scale
+    store.fuel[ids] = np.maximum(fuel - distance * scale * fuel_per_unit, 0.0)
+
+    # Out of fuel: drift to a stop
+    empty = ids[store.fuel[ids] <= 0.0]
+    store.vx[empty] = 0.0
+    store.vy[empty] = 0.0
@@ -0,0 +1,142 @@
+"""
+Chunked planetary surface map
+Splits a planet's terrain into fixed-size chunks that can be built on demand
+"""
+
+import math
+import numpy as np
+from core.constants import SURFACE_CHUNK_SIZE, PLANETARY_TILE_SIZE
+from systems.terrain_generator import build_palette_lut, palette_map
+
+
+class SurfaceMap:
+    """
+    A planet's terrain, addressed in fixed-size chunks.
+
+    If the full heightmap is already in the disk cache, chunks are sliced
+    out of its memory map. Otherwise each chunk is generated on its own with
+    TerrainGenerator.generate_region(), which tiles seamlessly, so nothing
+    has to generate the whole 500x500 map before the first frame.
+
+    Chunk (cx, cy) covers cells [cx * chunk_size, (cx + 1) * chunk_size)
+    horizontally, with row 0 at the southern edge like the heightmap.
+    """
+
+    def __init__(self, generator, seed, profile_name, craters=None,
+                 terrain_map=None, chunk_size=SURFACE_CHUNK_SIZE):
+        """
+        Initialize the surface map
+
+        Args:
+            generator: TerrainGenerator used for lazily generated chunks
+            seed: Planet seed
+            profile_name: Terrain profile name
+            craters: Optional crater settings
+            terrain_map: Optional full TerrainMap to slice chunks from
+            chunk_size: Cells per chunk side
+        """
+        self.generator = generator
+        self.seed = seed
+        self.profile_name = profile_name
+        self.craters = craters
+        self.terrain_map = terrain_map
+        self.chunk_size = chunk_size
+
+        self.grid_width = generator.grid_width
+        self.grid_height = generator.grid_height
+        self.chunks_x = math.ceil(self.grid_width / chunk_size)
+        self.chunks_y = math.ceil(self.grid_height / chunk_size)
+
+        # Palette is built once; every chunk is mapped through the same LUT
+        self.palette = build_palette_lut(generator.profiles[profile_name])
+
+    @classmethod
+    def for_planet(cls, generator, planet, chunk_size=SURFACE_CHUNK_SIZE):
+        """
+        Create a surface map for a planet, reusing a cached heightmap if there is one.
+
+        Args:
+            generator: TerrainGenerator
+            planet: Landable Planet (or moon)
+            chunk_size: Cells per chunk side
+
+        Returns:
+            SurfaceMap: Chunked map for the planet
+        """
+        profile_name = generator.profile_for_planet_type(planet.type)
+        craters = generator.crater_settings_for(planet, profile_name)
+        terrain_map = generator.get_cached_terrain(planet.seed, profile_name, craters)
+        return cls(generator, planet.seed, profile_name, craters, terrain_map, chunk_size)
+
+    def in_bounds(self, cx, cy):
+        """Whether a chunk index lies on the planetary grid"""
+        return 0 <= cx < self.chunks_x and 0 <= cy < self.chunks_y
+
+    def chunk_bounds(self, cx, cy):
+        """
+        Get the cell window covered by a chunk (edge chunks may be smaller).
+
+        Returns:
+            tuple: (x0, y0, width, height) in cells
+        """
+        x0 = cx * self.chunk_size
+        y0 = cy * self.chunk_size
+        width = min(self.chunk_size, self.grid_width - x0)
+        height = min(self.chunk_size, self.grid_height - y0)
+        return x0, y0, width, height
+
+    def chunk_heights(self, cx, cy):
+        """
+        Get the elevations for one chunk.
+
+        Returns:
+            np.ndarray: float32 array of shape (height, width)
+        """
+        x0, y0, width, height = self.chunk_bounds(cx, cy)
+        if self.terrain_map is not None:
+            return np.asarray(self.terrain_map.heights[y0:y0 + height, x0:x0 + width])
+        return self.generator.generate_region(self.seed, self.profile_name,
+                                              x0, y0, width, height, self.craters)
+
+    def chunk_colors(self, cx, cy):
+        """
+        Get palette-mapped colors for one chunk.
+
+        Returns:
+            np.ndarray: uint8 array of shape (height, width, 3), row 0 at the south edge
+        """
+        return palette_map(self.chunk_heights(cx, cy), self.palette)
+
+    def chunk_at(self, x, y):
+        """
+        Get the chunk index containing a surface position.
+
+        Args:
+            x, y: Position in surface units (cells * PLANETARY_TILE_SIZE)
+
+        Returns:
+            tuple: (cx, cy)
+        """
+        cells_per_chunk = self.chunk_size * PLANETARY_TILE_SIZE
+        return int(x // cells_per_chunk), int(y // cells_per_chunk)
+
+    def chunks_around(self, x, y, radius):
+        """
+        List in-bounds chunks within a square radius of a position, nearest first.
+
+        Args:
+            x, y: Position in surface units
+            radius: Radius in chunks
+
+        Returns:
+            list: (cx, cy) tuples sorted by distance from the position's chunk
+        """
+        center_x, center_y = self.chunk_at(x, y)
+        chunks = [
+            (cx, cy)
+            for cy in range(center_y - radius, center_y + radius + 1)
+            for cx in range(center_x - radius, center_x + radius + 1)
+            if self.in_bounds(cx, cy)
+        ]
+        chunks.sort(key=lambda c: (c[0] - center_x) ** 2 + (c[1] - center_y) ** 2)
+        return chunks
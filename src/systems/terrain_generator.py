@@ -0,0 +1,399 @@
+"""
+Planetary terrain generator
+Builds seeded heightmaps for planetary surfaces and caches them on disk
+"""
+
+import json
+import os
+import zlib
+from pathlib import Path
+import numpy as np
+from core.data_loader import get_data_loader
+from core.constants import PLANETARY_GRID_SIZE, BODY_TYPE_MOON, BODY_TYPE_ASTEROID
+from utils.noise import noise_grid, derive_seed
+from systems.crater_overlay import CraterOverlay
+
+# Bump whenever generation output changes, so stale cache files are ignored
+GENERATOR_VERSION = 1
+
+# Airless bodies get a crater overlay even when their profile has none
+AIRLESS_BODY_TYPES = (BODY_TYPE_MOON, BODY_TYPE_ASTEROID)
+
+
+def build_palette_lut(profile, size=256):
+    """
+    Build a color lookup table mapping quantized elevation to RGB.
+
+    The liquid palette is stretched over [0, liquid_level) and the land
+    palette over [liquid_level, 1], so moving the threshold never requires
+    repainting the palette stops.
+
+    Args:
+        profile: Terrain profile dict (see terrain_profiles.json)
+        size: Number of LUT entries
+
+    Returns:
+        np.ndarray: uint8 array of shape (size, 3)
+    """
+    level = profile.get("liquid_level", 0.0)
+    positions = []
+    colors = []
+
+    if level > 0 and profile.get("liquid_palette"):
+        for stop, color in profile["liquid_palette"]:
+            # Keep liquid stops strictly below the threshold
+            positions.append(stop * level * (1.0 - 1e-6))
+            colors.append(color)
+
+    for stop, color in profile["land_palette"]:
+        positions.append(level + stop * (1.0 - level))
+        colors.append(color)
+
+    positions = np.array(positions, dtype=np.float64)
+    colors = np.array(colors, dtype=np.float64)
+    elevations = np.linspace(0.0, 1.0, size)
+
+    lut = np.empty((size, 3), dtype=np.uint8)
+    for channel in range(3):
+        lut[:, channel] = np.round(np.interp(elevations, positions, colors[:, channel]))
+    return lut
+
+
+def palette_map(heights, lut):
+    """
+    Map elevations in [0, 1] to colors through a palette LUT.
+
+    Args:
+        heights: Array of elevations
+        lut: Palette from build_palette_lut()
+
+    Returns:
+        np.ndarray: uint8 array of shape heights.shape + (3,)
+    """
+    lut_size = len(lut)
+    indices = (np.asarray(heights) * (lut_size - 1) + 0.5).astype(np.intp)
+    np.clip(indices, 0, lut_size - 1, out=indices)
+    return lut[indices]
+
+
+class TerrainMap:
+    """
+    A generated planetary heightmap plus the profile that produced it.
+
+    Heights are float32 in [0, 1], indexed [y, x] with row 0 at the
+    southern edge (y = 0), matching the game's Cartesian convention.
+    When loaded from the disk cache, heights is a read-only memmap.
+    """
+
+    def __init__(self, heights, seed, profile_name, profile, craters=None):
+        """
+        Args:
+            heights: 2D float32 array (or memmap) of elevations
+            seed: Planet seed the map was generated from
+            profile_name: Name of the terrain profile
+            profile: Terrain profile dict
+            craters: Crater settings applied on top of the profile, if any
+        """
+        self.heights = heights
+        self.seed = seed
+        self.profile_name = profile_name
+        self.profile = profile
+        self.craters = craters
+        self.palette = build_palette_lut(profile)
+
+    @property
+    def width(self):
+        return self.heights.shape[1]
+
+    @property
+    def height(self):
+        return self.heights.shape[0]
+
+    @property
+    def liquid_level(self):
+        return self.profile.get("liquid_level", 0.0)
+
+    def liquid_mask(self, heights=None):
+        """
+        Get a boolean mask of cells below the liquid threshold.
+
+        Args:
+            heights: Optional sub-array to classify (defaults to the whole map)
+
+        Returns:
+            np.ndarray: bool array, True where the cell is liquid
+        """
+        if heights is None:
+            heights = self.heights
+        return heights < self.liquid_level
+
+    def colors(self, heights=None):
+        """
+        Palette-map elevations to RGB colors.
+
+        Args:
+            heights: Optional sub-array to color (defaults to the whole map)
+
+        Returns:
+            np.ndarray: uint8 array of shape (rows, cols, 3)
+        """
+        if heights is None:
+            heights = self.heights
+        return palette_map(heights, self.palette)
+
+    def __repr__(self):
+        """String representation for debugging"""
+        return f"TerrainMap(seed={self.seed}, profile={self.profile_name}, {self.width}x{self.height})"
+
+
+class TerrainGenerator:
+    """
+    Generates planetary heightmaps from a seed and a terrain profile.
+
+    Generation is vectorized multi-octave gradient noise. Finished maps are
+    written to the disk cache as .npy files keyed by seed, profile and
+    GENERATOR_VERSION; return visits reopen them with a memory map instead
+    of regenerating.
+    """
+
+    def __init__(self, data_loader=None, cache_dir=None,
+                 grid_width=PLANETARY_GRID_SIZE, grid_height=PLANETARY_GRID_SIZE):
+        """
+        Initialize the terrain generator
+
+        Args:
+            data_loader: Optional DataLoader (the shared loader if None)
+            cache_dir: Directory for cached heightmaps (defaults to data/cache/terrain)
+            grid_width, grid_height: Planetary grid size in cells
+        """
+        self.data_loader = data_loader or get_data_loader()
+        terrain_data = self.data_loader.load_static("planetary_info", "terrain_profiles.json")
+        self.profiles = terrain_data["terrain_profiles"]
+        self.planet_type_profiles = terrain_data["planet_type_profiles"]
+        self.airless_body_craters = terrain_data.get("airless_body_craters")
+
+        self.cache_dir = Path(cache_dir or self.data_loader.get_data_path("cache", "terrain"))
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+
+        # Crater populations are cheap but reused by every region of a surface
+        self._crater_overlays = {}
+
+    def profile_for_planet_type(self, planet_type):
+        """
+        Get the terrain profile name used for a planet type.
+
+        Args:
+            planet_type: Planet type string (e.g., "terran", "molten")
+
+        Returns:
+            str: Terrain profile name
+
+        Raises:
+            ValueError: If the planet type has no surface terrain (e.g., gas giants)
+        """
+        profile_name = self.planet_type_profiles.get(planet_type)
+        if profile_name is None:
+            raise ValueError(f"Planet type '{planet_type}' has no surface terrain")
+        return profile_name
+
+    def crater_settings_for(self, planet, profile_name):
+        """
+        Get the crater settings for a body, if it should be cratered.
+
+        Profiles with their own "craters" block always use it; other moons
+        and asteroids fall back to the shared airless-body settings.
+
+        Args:
+            planet: Planet (or moon) with a body_type attribute
+            profile_name: Terrain profile name
+
+        Returns:
+            dict or None: Crater settings, or None for no craters
+        """
+        profile_craters = self.profiles[profile_name].get("craters")
+        if profile_craters:
+            return profile_craters
+        if getattr(planet, "body_type", None) in AIRLESS_BODY_TYPES:
+            return self.airless_body_craters
+        return None
+
+    def get_crater_overlay(self, seed, craters):
+        """
+        Get the (memoized) crater population for a seed and settings.
+
+        Args:
+            seed: Planet seed
+            craters: Crater settings dict
+
+        Returns:
+            CraterOverlay: Craters covering the whole planetary grid
+        """
+        key = (seed, json.dumps(craters, sort_keys=True, default=dict))
+        overlay = self._crater_overlays.get(key)
+        if overlay is None:
+            overlay = CraterOverlay(seed, self.grid_width, self.grid_height, craters)
+            self._crater_overlays[key] = overlay
+        return overlay
+
+    def generate_region(self, seed, profile_name, x0, y0, width, height, craters=None):
+        """
+        Generate elevations for a rectangular window of the planetary grid.
+
+        Output depends only on absolute cell coordinates, so windows can be
+        generated independently and still tile seamlessly.
+
+        Args:
+            seed: Planet seed
+            profile_name: Terrain profile name
+            x0, y0: Lower-left cell of the window
+            width, height: Window size in cells
+            craters: Optional crater settings for the crater overlay stage
+
+        Returns:
+            np.ndarray: float32 array of shape (height, width) in [0, 1]
+        """
+        profile = self.profiles[profile_name]
+        scale = profile["frequency"] / self.grid_width
+
+        noise = noise_grid(
+            x0, y0, width, height, scale, seed,
+            octaves=profile["octaves"],
+            persistence=profile.get("persistence", 0.5),
+            lacunarity=profile.get("lacunarity", 2.0)
+        )
+        heights = 0.5 + 0.5 * profile.get("amplitude", 1.0) * noise
+
+        # Optional high-frequency layer (e.g., dunes in desert lowlands)
+        detail = profile.get("detail")
+        if detail:
+            detail_noise = noise_grid(
+                x0, y0, width, height, detail["frequency"] / self.grid_width,
+                derive_seed(seed, "detail"), octaves=detail.get("octaves", 2)
+            )
+            weight = np.clip((detail["below"] - heights) / detail["below"], 0.0, 1.0)
+            heights += detail["amplitude"] * detail_noise * weight
+
+        np.clip(heights, 0.0, 1.0, out=heights)
+        heights = heights.astype(np.float32, copy=False)
+
+        if craters:
+            self.get_crater_overlay(seed, craters).apply(heights, x0, y0)
+
+        return heights
+
+    def generate(self, seed, profile_name, craters=None):
+        """
+        Generate a full planetary heightmap without touching the cache.
+
+        Args:
+            seed: Planet seed
+            profile_name: Terrain profile name
+            craters: Optional crater settings
+
+        Returns:
+            TerrainMap: The generated map
+        """
+        heights = self.generate_region(seed, profile_name, 0, 0,
+                                       self.grid_width, self.grid_height, craters)
+        return TerrainMap(heights, seed, profile_name, self.profiles[profile_name], craters)
+
+    def get_terrain(self, seed, profile_name, craters=None):
+        """
+        Get a planetary heightmap, from the disk cache when possible.
+
+        Args:
+            seed: Planet seed
+            profile_name: Terrain profile name
+            craters: Optional crater settings
+
+        Returns:
+            TerrainMap: Map whose heights are a read-only memmap of the cache file
+        """
+        cache_path = self.cache_path(seed, profile_name, craters)
+        profile = self.profiles[profile_name]
+
+        heights = self._open_cached(cache_path)
+        if heights is None:
+            terrain = self.generate(seed, profile_name, craters)
+            self._write_cache(cache_path, terrain.heights)
+            heights = self._open_cached(cache_path)
+            if heights is None:
+                # Cache directory not writable; fall back to the in-memory map
+                return terrain
+
+        return TerrainMap(heights, seed, profile_name, profile, craters)
+
+    def get_cached_terrain(self, seed, profile_name, craters=None):
+        """
+        Open a heightmap only if it's already in the disk cache.
+
+        Args:
+            seed: Planet seed
+            profile_name: Terrain profile name
+            craters: Optional crater settings
+
+        Returns:
+            TerrainMap or None: Memory-mapped map, or None if not cached
+        """
+        heights = self._open_cached(self.cache_path(seed, profile_name, craters))
+        if heights is None:
+            return None
+        return TerrainMap(heights, seed, profile_name, self.profiles[profile_name], craters)
+
+    def get_planet_terrain(self, planet):
+        """
+        Get the heightmap for a Planet object
+
+        Args:
+            planet: Planet (or moon) with seed and type attributes
+
+        Returns:
+            TerrainMap: The planet's terrain
+        """
+        profile_name = self.profile_for_planet_type(planet.type)
+        craters = self.crater_settings_for(planet, profile_name)
+        return self.get_terrain(planet.seed, profile_name, craters)
+
+    def cache_path(self, seed, profile_name, craters=None):
+        """
+        Get the cache file path for a seed/profile pair.
+
+        The key includes GENERATOR_VERSION and a hash of the profile and
+        crater parameters, so editing terrain_profiles.json invalidates old files.
+
+        Args:
+            seed: Planet seed
+            profile_name: Terrain profile name
+            craters: Optional crater settings
+
+        Returns:
+            Path: Path to the .npy cache file
+        """
+        profile_json = json.dumps([self.profiles[profile_name], craters], sort_keys=True, default=dict)
+        profile_hash = zlib.crc32(profile_json.encode("utf-8")) & 0xFFFFFFFF
+        filename = (f"{seed:08x}_{profile_name}_{profile_hash:08x}"
+                    f"_{self.grid_width}x{self.grid_height}_v{GENERATOR_VERSION}.npy")
+        return self.cache_dir / filename
+
+    def _open_cached(self, cache_path):
+        """Memory-map a cached heightmap, or return None if missing/unreadable"""
+        try:
+            heights = np.load(cache_path, mmap_mode="r")
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+
+        if heights.shape != (self.grid_height, self.grid_width) or heights.dtype != np.float32:
+            return None
+        return heights
+
+    def _write_cache(self, cache_path, heights):
+        """Write a heightmap to the cache atomically (temp file + rename)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+            with open(temp_path, "wb") as f:
+                np.save(f, heights)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"WARNING: Could not write terrain cache {cache_path}: {e}")
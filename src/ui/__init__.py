@@ -1,7 +1,13 @@
 # UI rendering components
-from .hud_renderer import HudRenderer
-from .space_view_renderer import SpaceViewRenderer
-from .minimap_renderer import MinimapRenderer
-from .starfield_renderer import StarfieldRenderer
-from .message_log_renderer import MessageLogRenderer
-from .menu_renderer import MenuRenderer
+from utils.lazy_exports import lazy_exports
+
+__getattr__, __all__ = lazy_exports(globals(), {
+    "HudRenderer": ".hud_renderer",
+    "SpaceViewRenderer": ".space_view_renderer",
+    "MinimapRenderer": ".minimap_renderer",
+    "StarfieldRenderer": ".starfield_renderer",
+    "MessageLogRenderer": ".message_log_renderer",
+    "MenuRenderer": ".menu_renderer",
+    "GasGiantRenderer": ".gas_giant_renderer",
+    "SurfaceMapRenderer": ".surface_map_renderer"
+})
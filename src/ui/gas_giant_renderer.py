@@ -0,0 +1,124 @@
+"""
+Renderer for animated gas giants
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pygame
+from systems.gas_giant_generator import GasGiantGenerator, FRAME_COUNT
+
+# Seconds for one full revolution of a gas giant
+ROTATION_PERIOD = 48.0
+
+
+class GasGiantRenderer:
+    """
+    Draws gas giants from pre-baked rotation frames.
+
+    Frames are generated once per (seed, diameter) on a background worker
+    and kept in a small LRU cache, so drawing an animated giant costs a
+    single blit per frame. Until a giant's frames are ready, render()
+    returns False and the caller draws its flat circle instead. Each frame
+    becomes a Surface the first time it's shown, so no single draw
+    converts the whole revolution.
+    """
+
+    def __init__(self, generator=None, max_cached=8):
+        """
+        Initialize the gas giant renderer
+
+        Args:
+            generator: Optional GasGiantGenerator (a new one is created if None)
+            max_cached: Number of (seed, diameter) frame sets to keep
+        """
+        self.generator = generator or GasGiantGenerator()
+        self.max_cached = max_cached
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gas-giant-bake")
+        self.lock = threading.Lock()
+        self.frame_cache = OrderedDict()  # (seed, diameter) -> frames (arrays until first shown, then Surfaces)
+        self.baking = set()               # Keys queued or running on the worker
+        self.failed = set()               # Keys whose bake raised (drawn flat from then on)
+
+    def get_frames(self, planet, diameter):
+        """
+        Get the rotation frames for a planet at a pixel size, without blocking.
+
+        Queues a bake on the worker the first time a (seed, diameter) is asked for.
+
+        Args:
+            planet: Gas giant Planet
+            diameter: Rendered diameter in pixels
+
+        Returns:
+            list or None: One frame per rotation step (RGBA arrays until
+            shown, then pygame Surfaces), or None while baking
+        """
+        key = (planet.seed, diameter)
+        with self.lock:
+            frames = self.frame_cache.get(key)
+            if frames is not None:
+                self.frame_cache.move_to_end(key)
+                return frames
+            if key in self.baking or key in self.failed:
+                return None
+            self.baking.add(key)
+        self.executor.submit(self._bake, key, planet, diameter)
+        return None
+
+    def render(self, surface, planet, screen_x, screen_y, radius, time_seconds):
+        """
+        Draw a gas giant centered on a screen position.
+
+        Args:
+            surface: Surface to render to
+            planet: Gas giant Planet
+            screen_x, screen_y: Center position in pixels
+            radius: Rendered radius in pixels
+            time_seconds: Animation clock
+
+        Returns:
+            bool: False if the frames aren't baked yet (nothing was drawn)
+        """
+        diameter = max(radius * 2, 1)
+        frames = self.get_frames(planet, diameter)
+        if frames is None:
+            return False
+        phase = (time_seconds % ROTATION_PERIOD) / ROTATION_PERIOD
+        index = int(phase * len(frames)) % len(frames)
+        frame = frames[index]
+        if isinstance(frame, np.ndarray):
+            frame = frames[index] = self._to_surface(frame)
+        surface.blit(frame, (int(screen_x) - diameter // 2, int(screen_y) - diameter // 2))
+        return True
+
+    def shutdown(self):
+        """Drop queued bakes and stop the worker"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _bake(self, key, planet, diameter):
+        """Worker entry point: generate a frame set and cache it"""
+        try:
+            style = self.generator.style_for_planet(planet)
+            texture = self.generator.generate_texture(planet.seed, style)
+            frames = list(self.generator.render_frames(texture, diameter, FRAME_COUNT))
+        except Exception as e:
+            print(f"WARNING: Gas giant frames failed for {planet.name}: {e}")
+            with self.lock:
+                self.baking.discard(key)
+                self.failed.add(key)
+            return
+
+        with self.lock:
+            self.baking.discard(key)
+            self.frame_cache[key] = frames
+            if len(self.frame_cache) > self.max_cached:
+                self.frame_cache.popitem(last=False)  # Drop least recently used
+
+    def _to_surface(self, frame):
+        """Convert an RGBA frame array to a pygame Surface"""
+        size = (frame.shape[1], frame.shape[0])
+        image = pygame.image.frombuffer(frame.tobytes(), size, "RGBA")
+        if pygame.display.get_surface() is not None:
+            return image.convert_alpha()
+        return image
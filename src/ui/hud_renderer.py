@@ -16,6 +16,7 @@ class HudRenderer:
         """
         self.space_view_renderer = None # Created when needed
         self.minimap_renderer = None # Created when needed
+        self.message_log_renderer = None # Created when needed (keeps its rendered lines between frames)
 
     def _calculate_layout(self, surface):
         """Calculate HUD panel rectangle based on surface size"""
@@ -36,6 +37,16 @@ class HudRenderer:
 
         return main_view, auxiliary_view, command_view, message_log
     
+    def shutdown(self):
+        """Stop background work in the view renderers"""
+        if self.space_view_renderer is not None:
+            self.space_view_renderer.shutdown()
+
+    def scroll_message_log(self, game_session, lines):
+        """Scroll the message log back (positive lines) or toward the newest (negative)"""
+        if self.message_log_renderer is not None:
+            self.message_log_renderer.scroll(game_session.messages, lines)
+
     def render(self, surface, game_session):
         """Render the HUD with content from game session
         
@@ -51,11 +62,11 @@ class HudRenderer:
         if self.space_view_renderer is None:
             self.space_view_renderer = SpaceViewRenderer(main_view.width, main_view.height)
             self.minimap_renderer = MinimapRenderer()
+            self.message_log_renderer = MessageLogRenderer()
 
         # Message Log Renderer
-        message_log_renderer = MessageLogRenderer()
         message_log_surface = surface.subsurface(message_log)
-        message_log_renderer.render(message_log_surface, game_session)
+        self.message_log_renderer.render(message_log_surface, game_session)
 
         main_surface = surface.subsurface(main_view)
         self.space_view_renderer.render(main_surface, game_session)
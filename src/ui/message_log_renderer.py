@@ -2,16 +2,55 @@
 Renderer for the message log display
 """
 import pygame
-from core.colors import TEXT_NORMAL
+from core.colors import MESSAGE_IMPORTANT, MESSAGE_SYSTEM, TEXT_NORMAL, TEXT_SUCCESS
+from core.message_log import CHANNEL_COMMS, CHANNEL_NAVIGATION, CHANNEL_SCIENCE, CHANNEL_SYSTEM
+
+# Text color per message channel
+CHANNEL_COLORS = {
+    CHANNEL_SYSTEM: MESSAGE_SYSTEM,
+    CHANNEL_NAVIGATION: TEXT_NORMAL,
+    CHANNEL_COMMS: MESSAGE_IMPORTANT,
+    CHANNEL_SCIENCE: TEXT_SUCCESS
+}
+
+# Lines moved per scroll key press
+SCROLL_LINES = 4
 
 class MessageLogRenderer:
-    """Renders the scrolling message log"""
+    """
+    Renders the scrolling message log
+
+    The rendered lines are kept on a cached surface and only redrawn when
+    the log's version, the scroll position or the panel size changes, so an
+    idle log costs one blit per frame.
+    """
     
     def __init__(self):
         """Initialize the message log renderer"""
         self.font = pygame.font.Font(None, 22)  # Small font for messages
         self.line_height = 15  # Pixels between lines
         self.padding = 10  # Padding from edges
+
+        # Seq just below the bottom line when scrolled back; None follows the newest message
+        self.before = None
+        self.visible_lines = 1  # Lines that fit, as of the last render
+        self._log = None
+        self._cache = None
+        self._cache_key = None
+
+    def scroll(self, log, lines):
+        """
+        Scroll back through the log (positive lines) or toward the newest (negative)
+
+        Args:
+            log: The session's MessageLog
+            lines: Messages to move by
+        """
+        self._follow(log)
+        bottom = (log.next_seq if self.before is None else self.before) - lines
+        # Stop with the oldest message at the top; back at the newest, follow new messages again
+        bottom = max(bottom, min(log.first_seq + self.visible_lines, log.next_seq))
+        self.before = None if bottom >= log.next_seq else bottom
     
     def render(self, surface, game_session):
         """
@@ -21,25 +60,44 @@ class MessageLogRenderer:
             surface: Pygame surface to render to (the message log panel)
             game_session: Game session containing messages
         """
-        # Get dimensions
-        width = surface.get_width()
-        height = surface.get_height()
-        
+        log = game_session.messages
+        self._follow(log)
+        size = surface.get_size()
+        key = (self.before, log.version if self.before is None else None, size)
+        if key != self._cache_key:
+            self._cache = self._draw(log, size)
+            self._cache_key = key
+        surface.blit(self._cache, (0, 0))
+
+    def _follow(self, log):
+        """Start over at the newest message when the session's log is replaced (e.g. on load)"""
+        if log is not self._log:
+            self._log = log
+            self.before = None
+            self._cache_key = None
+
+    def _draw(self, log, size):
+        """Draw the visible messages onto a new transparent surface"""
+        width, height = size
+        cache = pygame.Surface(size, pygame.SRCALPHA)
+
         # Calculate how many lines fit in the panel
-        max_visible_lines = (height - self.padding * 2) // self.line_height
-        
-        # Get the most recent messages that fit
-        messages = game_session.messages[-max_visible_lines:]
+        max_visible_lines = max((height - self.padding * 2) // self.line_height, 0)
+        self.visible_lines = max(max_visible_lines, 1)
+
+        # Get the messages that fit, ending at the scroll position
+        messages = log.history(max_visible_lines, before=self.before)
 
         # Start from the bottom and work upward
         y = height - self.padding - self.line_height
         
         # Render messages in reverse order (newest at bottom)
         for message in reversed(messages):
-            text_surface = self.font.render(message, True, TEXT_NORMAL)
-            surface.blit(text_surface, (self.padding, y))
+            text_surface = self.font.render(message.text, True, CHANNEL_COLORS.get(message.channel, TEXT_NORMAL))
+            cache.blit(text_surface, (self.padding, y))
             y -= self.line_height
             
             # Stop if we've gone above the visible area
             if y < self.padding:
-                break
\ No newline at end of file
+                break
+        return cache
@@ -3,7 +3,15 @@ Renders space navigation view (starfield, ship, planets, other ships)
 """
 import pygame
 from ui.starfield_renderer import StarfieldRenderer
-from core.constants import CONTEXT_OUTER_SYSTEM, CONTEXT_INNER_SYSTEM, INNER_ZONE_MULTIPLIER, RENDER_SCALE
+from ui.gas_giant_renderer import GasGiantRenderer
+from core.constants import (
+    CONTEXT_OUTER_SYSTEM,
+    CONTEXT_INNER_SYSTEM,
+    INNER_ZONE_MULTIPLIER,
+    RENDER_SCALE,
+    PLANET_TYPE_GAS_GIANT,
+    PLANET_TYPE_ICE_GIANT
+)
 
 
 class SpaceViewRenderer:
@@ -24,6 +32,11 @@ class SpaceViewRenderer:
         self.width = width
         self.height = height
         self.starfield = StarfieldRenderer(width, height)
+        self.gas_giant_renderer = GasGiantRenderer()
+    
+    def shutdown(self):
+        """Drop queued gas giant bakes and stop their worker"""
+        self.gas_giant_renderer.shutdown()
     
     def render(self, surface: pygame.Surface, game_session):
         """
@@ -112,6 +125,15 @@ class SpaceViewRenderer:
             if (-margin <= screen_x <= self.width + margin and
                 -margin <= screen_y <= self.height + margin):
 
+                # Gas giants are drawn from pre-baked animated frames, or as a
+                # flat circle while their frames bake in the background
+                if planet.type in (PLANET_TYPE_GAS_GIANT, PLANET_TYPE_ICE_GIANT):
+                    if self.gas_giant_renderer.render(
+                        surface, planet, screen_x, screen_y, render_size,
+                        pygame.time.get_ticks() / 1000.0
+                    ):
+                        continue
+
                 # Get color based on type
                 color = planet_colors.get(planet.type, (255, 255, 255))
 
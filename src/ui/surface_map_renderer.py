@@ -0,0 +1,162 @@
+"""
+Renders the planetary surface view from streamed terrain chunks
+"""
+import time
+from collections import OrderedDict
+import pygame
+from core.constants import PLANETARY_TILE_SIZE, SURFACE_RENDER_SCALE
+
+# Color shown for chunks that haven't been built yet
+PLACEHOLDER_COLOR = (30, 30, 30)
+
+
+class SurfaceMapRenderer:
+    """
+    Renders a SurfaceMap around the rover, one cached surface per chunk.
+
+    Chunks are built lazily (heights -> palette colors -> scaled surface)
+    and kept in an LRU cache. Building is limited to a small time budget
+    per frame: visible chunks go first, nearest first, then any spare time
+    prefetches the ring just outside the viewport. Visible chunks that
+    haven't been built yet draw as a flat placeholder for a frame or two
+    rather than stalling the frame.
+
+    Uses the same camera conventions as SpaceViewRenderer: the view is
+    centered on the rover, world units convert to pixels by a render scale,
+    and Y is flipped so north is up.
+    """
+
+    def __init__(self, width, height, surface_map, scale=SURFACE_RENDER_SCALE,
+                 max_cached_chunks=96, build_budget_ms=4.0, prefetch_margin=1):
+        """
+        Initialize the surface map renderer.
+
+        Args:
+            width: Width of viewport
+            height: Height of viewport
+            surface_map: SurfaceMap to draw
+            scale: Pixels per surface unit
+            max_cached_chunks: LRU capacity for built chunk surfaces
+            build_budget_ms: Time allowed for chunk building per frame
+            prefetch_margin: Chunks beyond the viewport to build ahead
+        """
+        self.width = width
+        self.height = height
+        self.surface_map = surface_map
+        self.scale = scale
+        self.max_cached_chunks = max_cached_chunks
+        self.build_budget_ms = build_budget_ms
+        self.prefetch_margin = prefetch_margin
+
+        self.chunk_pixels = int(surface_map.chunk_size * PLANETARY_TILE_SIZE * scale)
+        self.chunk_cache = OrderedDict()  # (cx, cy) -> pygame.Surface
+
+    def warm(self, rover_x, rover_y):
+        """
+        Build every visible chunk right away (e.g., during the landing transition).
+
+        Args:
+            rover_x, rover_y: Rover position in surface units
+        """
+        for chunk in self._visible_chunks(*self._camera(rover_x, rover_y)):
+            self._get_chunk(chunk, build=True)
+
+    def render(self, surface, rover_x, rover_y):
+        """
+        Render the terrain around the rover.
+
+        Args:
+            surface: Surface to render to
+            rover_x, rover_y: Rover position in surface units
+        """
+        camera_x, camera_y = self._camera(rover_x, rover_y)
+        deadline = time.perf_counter() + self.build_budget_ms / 1000.0
+
+        for cx, cy in self._visible_chunks(camera_x, camera_y):
+            chunk_surface = self._get_chunk((cx, cy), build=time.perf_counter() < deadline)
+            rect = self._chunk_screen_rect(cx, cy, camera_x, camera_y)
+            if chunk_surface is not None:
+                surface.blit(chunk_surface, rect.topleft)
+            else:
+                surface.fill(PLACEHOLDER_COLOR, rect)
+
+        # Spend whatever budget is left building just outside the view
+        radius = self._view_radius_chunks() + self.prefetch_margin
+        for chunk in self.surface_map.chunks_around(rover_x, rover_y, radius):
+            if time.perf_counter() >= deadline:
+                break
+            if chunk not in self.chunk_cache:
+                self._get_chunk(chunk, build=True)
+
+    def _camera(self, rover_x, rover_y):
+        """Camera offset (lower-left of viewport) in surface units"""
+        camera_x = rover_x - (self.width / self.scale) / 2
+        camera_y = rover_y - (self.height / self.scale) / 2
+        return camera_x, camera_y
+
+    def _view_radius_chunks(self):
+        """Chunks needed from the center to cover the viewport's half-diagonal"""
+        half_span = max(self.width, self.height) / 2
+        return int(half_span // self.chunk_pixels) + 1
+
+    def _visible_chunks(self, camera_x, camera_y):
+        """In-bounds chunks overlapping the viewport, nearest to the center first"""
+        chunk_units = self.surface_map.chunk_size * PLANETARY_TILE_SIZE
+        x_start = int(camera_x // chunk_units)
+        y_start = int(camera_y // chunk_units)
+        x_end = int((camera_x + self.width / self.scale) // chunk_units)
+        y_end = int((camera_y + self.height / self.scale) // chunk_units)
+
+        center_x = (x_start + x_end) / 2
+        center_y = (y_start + y_end) / 2
+        chunks = [
+            (cx, cy)
+            for cy in range(y_start, y_end + 1)
+            for cx in range(x_start, x_end + 1)
+            if self.surface_map.in_bounds(cx, cy)
+        ]
+        chunks.sort(key=lambda c: (c[0] - center_x) ** 2 + (c[1] - center_y) ** 2)
+        return chunks
+
+    def _chunk_screen_rect(self, cx, cy, camera_x, camera_y):
+        """Screen rectangle covered by a chunk (Y flipped, north up)"""
+        x0, y0, cols, rows = self.surface_map.chunk_bounds(cx, cy)
+        world_left = x0 * PLANETARY_TILE_SIZE
+        world_top = (y0 + rows) * PLANETARY_TILE_SIZE
+        screen_x = (world_left - camera_x) * self.scale
+        screen_y = self.height - (world_top - camera_y) * self.scale
+        pixels_per_cell = PLANETARY_TILE_SIZE * self.scale
+        return pygame.Rect(int(screen_x), int(screen_y),
+                           int(cols * pixels_per_cell), int(rows * pixels_per_cell))
+
+    def _get_chunk(self, chunk, build):
+        """Get a chunk's surface from the cache, building it if allowed"""
+        chunk_surface = self.chunk_cache.get(chunk)
+        if chunk_surface is not None:
+            self.chunk_cache.move_to_end(chunk)
+            return chunk_surface
+        if not build:
+            return None
+
+        chunk_surface = self._build_chunk(*chunk)
+        self.chunk_cache[chunk] = chunk_surface
+        if len(self.chunk_cache) > self.max_cached_chunks:
+            self.chunk_cache.popitem(last=False)  # Drop least recently used
+        return chunk_surface
+
+    def _build_chunk(self, cx, cy):
+        """Rasterize one chunk: palette-map its heights once and scale to pixels"""
+        colors = self.surface_map.chunk_colors(cx, cy)
+        # Row 0 is the southern edge; flip so north is at the top of the image
+        colors = colors[::-1].copy()
+        rows, cols = colors.shape[:2]
+        image = pygame.image.frombuffer(colors.tobytes(), (cols, rows), "RGB")
+
+        # Edge chunks can be smaller than a full chunk
+        pixels_per_cell = PLANETARY_TILE_SIZE * self.scale
+        size = (int(cols * pixels_per_cell), int(rows * pixels_per_cell))
+        chunk_surface = pygame.transform.scale(image, size)
+
+        if pygame.display.get_surface() is not None:
+            return chunk_surface.convert()
+        return chunk_surface
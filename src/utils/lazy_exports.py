@@ -0,0 +1,35 @@
+"""
+Lazy package exports
+Lets a package re-export names from its submodules without importing them
+until first use, so importing one module from a package doesn't import
+all of its siblings (keeps startup fast)
+"""
+
+import importlib
+
+
+def lazy_exports(namespace, exports):
+    """
+    Build a module __getattr__ (PEP 562) that imports exports on first access
+
+    Args:
+        namespace: The package's globals()
+        exports: Exported name -> relative submodule name (e.g. ".game_data")
+
+    Returns:
+        tuple: (__getattr__, __all__) for the package to assign
+
+    Example:
+        __getattr__, __all__ = lazy_exports(globals(), {"GameData": ".game_data"})
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value  # Cached, so later lookups skip __getattr__
+        return value
+
+    return __getattr__, list(exports)
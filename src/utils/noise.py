@@ -0,0 +1,219 @@
+"""
+Vectorized gradient noise utility
+
+Seeded Perlin-style gradient noise evaluated over whole NumPy arrays,
+used by the procedural generators for heightmaps, band distortion and
+density fields.
+"""
+
+import zlib
+import numpy as np
+
+# Eight unit-ish gradient directions for 2D Perlin noise
+_GRADIENTS = np.array([
+    [1, 1], [-1, 1], [1, -1], [-1, -1],
+    [1, 0], [-1, 0], [0, 1], [0, -1]
+], dtype=np.float32)
+
+# Raw 2D Perlin output with the gradients above stays within about +/-0.7;
+# scaling by this brings fractal noise close to the [-1, 1] range.
+NOISE_NORMALIZER = 1.0 / 0.7
+
+
+def derive_seed(*parts):
+    """
+    Derive a stable 32-bit seed from any number of identifying parts.
+
+    Python's built-in hash() is randomized per process, so seeds are
+    derived with CRC32 to stay identical between runs.
+
+    Args:
+        *parts: Values identifying the thing being seeded (names, indices, seeds)
+
+    Returns:
+        int: Seed in the range [0, 2**32)
+
+    Example:
+        derive_seed("Arth", "Homeworld")  # Same value on every run
+    """
+    key = "/".join(str(part) for part in parts)
+    return zlib.crc32(key.encode("utf-8")) & 0xFFFFFFFF
+
+
+def hash_uniforms(seeds, count):
+    """
+    Deterministic uniform numbers for many seeds at once.
+
+    Each value is a SplitMix64 hash of (seed, index), so a seed's numbers
+    are the same whether it's hashed alone or in a batch of thousands,
+    with no per-seed generator to build.
+
+    Args:
+        seeds: Array of 32-bit seeds (see derive_seed)
+        count: Numbers per seed
+
+    Returns:
+        np.ndarray: float64 array of shape (len(seeds), count) in [0, 1)
+    """
+    seeds = np.asarray(seeds, dtype=np.uint64).reshape(-1, 1)
+    z = (seeds << np.uint64(32)) | np.arange(count, dtype=np.uint64)
+    z = z + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def permutation_table(seed):
+    """
+    Build a seeded 512-entry permutation table (256 entries repeated twice).
+
+    Args:
+        seed: Integer seed
+
+    Returns:
+        np.ndarray: int32 array of length 512
+    """
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(256).astype(np.int32)
+    return np.concatenate([perm, perm])
+
+
+def _fade(t):
+    """Perlin's quintic smoothstep: 6t^5 - 15t^4 + 10t^3"""
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+
+def gradient_noise(x, y, perm):
+    """
+    Evaluate single-octave 2D gradient noise at every (x, y) pair.
+
+    Args:
+        x, y: Arrays (or scalars) of sample coordinates, broadcastable together
+        perm: Permutation table from permutation_table()
+
+    Returns:
+        np.ndarray: Noise values, roughly in [-0.7, 0.7]
+    """
+    # x and y are only broadcast together at the hash step, so a row/column
+    # pair (as used by noise_grid) keeps the per-axis math one-dimensional
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+
+    x_floor = np.floor(x)
+    y_floor = np.floor(y)
+    xf = x - x_floor
+    yf = y - y_floor
+    xi = x_floor.astype(np.int32) & 255
+    yi = y_floor.astype(np.int32) & 255
+
+    u = _fade(xf)
+    v = _fade(yf)
+
+    # Hash each lattice corner into a gradient index
+    row0 = perm[xi]
+    row1 = perm[xi + 1]
+    h00 = perm[row0 + yi] & 7
+    h10 = perm[row1 + yi] & 7
+    h01 = perm[row0 + yi + 1] & 7
+    h11 = perm[row1 + yi + 1] & 7
+
+    gx = _GRADIENTS[:, 0]
+    gy = _GRADIENTS[:, 1]
+    n00 = gx[h00] * xf + gy[h00] * yf
+    n10 = gx[h10] * (xf - 1.0) + gy[h10] * yf
+    n01 = gx[h01] * xf + gy[h01] * (yf - 1.0)
+    n11 = gx[h11] * (xf - 1.0) + gy[h11] * (yf - 1.0)
+
+    nx0 = n00 + u * (n10 - n00)
+    nx1 = n01 + u * (n11 - n01)
+    return nx0 + v * (nx1 - nx0)
+
+
+def fractal_noise(x, y, seed, octaves=4, persistence=0.5, lacunarity=2.0):
+    """
+    Sum several octaves of gradient noise (fractal Brownian motion).
+
+    Each octave uses its own permutation table derived from the seed, so
+    octaves don't line up on the same lattice.
+
+    Args:
+        x, y: Arrays of sample coordinates (already scaled by base frequency)
+        seed: Integer seed
+        octaves: Number of detail layers
+        persistence: Amplitude multiplier between octaves
+        lacunarity: Frequency multiplier between octaves
+
+    Returns:
+        np.ndarray: Noise values, roughly in [-1, 1]
+    """
+    x = np.asarray(x, dtype=np.float32)
+    y = np.asarray(y, dtype=np.float32)
+
+    total = np.zeros(np.broadcast_shapes(x.shape, y.shape), dtype=np.float32)
+    amplitude = 1.0
+    frequency = 1.0
+    amplitude_sum = 0.0
+
+    for octave in range(octaves):
+        perm = permutation_table(derive_seed(seed, "octave", octave))
+        total += amplitude * gradient_noise(x * frequency, y * frequency, perm)
+        amplitude_sum += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total * (NOISE_NORMALIZER / amplitude_sum)
+
+
+def noise_grid(x0, y0, width, height, scale, seed, octaves=4,
+               persistence=0.5, lacunarity=2.0):
+    """
+    Sample fractal noise over a rectangular window of integer grid cells.
+
+    Sampling is a pure function of absolute cell coordinates, so adjacent
+    windows line up seamlessly (used for chunked generation).
+
+    Args:
+        x0, y0: Grid coordinates of the window's lower-left cell
+        width, height: Window size in cells
+        scale: Noise units per grid cell (base frequency / grid size)
+        seed: Integer seed
+        octaves, persistence, lacunarity: See fractal_noise()
+
+    Returns:
+        np.ndarray: float32 array of shape (height, width), indexed [row=y, col=x]
+    """
+    xs = (np.arange(x0, x0 + width, dtype=np.float32) + 0.5) * scale
+    ys = (np.arange(y0, y0 + height, dtype=np.float32) + 0.5) * scale
+    return fractal_noise(xs[np.newaxis, :], ys[:, np.newaxis], seed,
+                         octaves, persistence, lacunarity)
+
+
+def tileable_noise_grid(width, height, period, scale_y, seed, octaves=4,
+                        persistence=0.5, lacunarity=2.0):
+    """
+    Sample fractal noise that wraps seamlessly in the x direction.
+
+    The window spans one full period horizontally; two samples one period
+    apart are cross-faded so the left and right edges match exactly
+    (used for textures that rotate, like gas giant bands).
+
+    Args:
+        width, height: Output size in cells
+        period: Noise units spanned horizontally (one wrap)
+        scale_y: Noise units per cell vertically
+        seed: Integer seed
+        octaves, persistence, lacunarity: See fractal_noise()
+
+    Returns:
+        np.ndarray: float32 array of shape (height, width)
+    """
+    xs = (np.arange(width, dtype=np.float32) + 0.5) * (period / width)
+    ys = (np.arange(height, dtype=np.float32) + 0.5) * scale_y
+    xs = xs[np.newaxis, :]
+    ys = ys[:, np.newaxis]
+
+    near = fractal_noise(xs, ys, seed, octaves, persistence, lacunarity)
+    far = fractal_noise(xs - period, ys, seed, octaves, persistence, lacunarity)
+    blend = xs / period
+    return near * (1.0 - blend) + far * blend
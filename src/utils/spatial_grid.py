@@ -0,0 +1,203 @@
+"""
+Uniform spatial grid for batched neighbor queries
+"""
+
+import numpy as np
+
+# Cell offsets covering each neighboring pair of cells exactly once:
+# the cell itself plus half of its 8 neighbors
+_HALF_NEIGHBORHOOD = [(0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+_FULL_NEIGHBORHOOD = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+
+# Cell keys pack (cx, cy) into one int64 as cx * _KEY_STRIDE + cy
+_KEY_STRIDE = 1 << 31
+
+
+def _expand_ranges(starts, counts):
+    """Concatenate range(start, start + count) for every pair, vectorized"""
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    owners = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owners, np.repeat(starts, counts) + offsets
+
+
+class SpatialGrid:
+    """
+    Buckets points into square cells so neighbor queries only compare
+    points in adjacent cells.
+
+    build() sorts the points by cell key once; queries then find each
+    cell's run of points with a binary search. There is no per-cell
+    storage, so the covered area can be as large as needed. Queries work
+    on all points at once and return index arrays, which keeps them
+    vectorized for thousands of points.
+
+    Query radii must not exceed cell_size, since only adjacent cells are
+    searched.
+
+    Example:
+        grid = SpatialGrid(cell_size=2.0)
+        grid.build(x, y)
+        i, j = grid.query_pairs(radius=1.5)  # Every pair closer than 1.5
+    """
+
+    def __init__(self, cell_size):
+        """
+        Initialize an empty grid
+
+        Args:
+            cell_size: Width of a cell in world units
+        """
+        self.cell_size = float(cell_size)
+        self.x = np.zeros(0, dtype=np.float32)
+        self.y = np.zeros(0, dtype=np.float32)
+        self.cell_x = np.zeros(0, dtype=np.int64)
+        self.cell_y = np.zeros(0, dtype=np.int64)
+        self.order = np.zeros(0, dtype=np.int64)        # Point indices sorted by cell key
+        self.sorted_keys = np.zeros(0, dtype=np.int64)  # Cell key of each point in that order
+        self.cell_keys = np.zeros(0, dtype=np.int64)    # Occupied cells, ascending
+        self.origin = (0, 0)
+
+    def __len__(self):
+        return len(self.x)
+
+    def build(self, x, y):
+        """
+        Bucket a set of points, replacing the previous contents
+
+        Args:
+            x, y: Arrays of point coordinates
+        """
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        if len(self.x) == 0:
+            self.order = self.sorted_keys = self.cell_keys = np.zeros(0, dtype=np.int64)
+            return
+
+        cell_x = np.floor(self.x / self.cell_size).astype(np.int64)
+        cell_y = np.floor(self.y / self.cell_size).astype(np.int64)
+        # Shift so cell coordinates are positive (one spare cell for the -1 neighbor)
+        self.origin = (int(cell_x.min()) - 1, int(cell_y.min()) - 1)
+        self.cell_x = cell_x - self.origin[0]
+        self.cell_y = cell_y - self.origin[1]
+
+        keys = self.cell_x * _KEY_STRIDE + self.cell_y
+        self.order = np.argsort(keys, kind="stable")
+        self.sorted_keys = keys[self.order]
+        self.sorted_x = self.x[self.order]
+        self.sorted_y = self.y[self.order]
+
+        # Occupied cells: key, first sorted position and point count, plus
+        # which occupied cell each sorted point is in
+        self.cell_keys, self.cell_starts, self.cell_counts = np.unique(
+            self.sorted_keys, return_index=True, return_counts=True)
+        self.point_cells = np.repeat(np.arange(len(self.cell_keys)), self.cell_counts)
+
+    def _cell_runs(self, keys):
+        """Start and length of each key's run in the sorted points (0 if the cell is empty)"""
+        index = np.searchsorted(self.cell_keys, keys)
+        index = np.minimum(index, len(self.cell_keys) - 1)
+        occupied = self.cell_keys[index] == keys
+        return self.cell_starts[index], np.where(occupied, self.cell_counts[index], 0)
+
+    def query_pairs(self, radius):
+        """
+        Find every pair of points closer than radius
+
+        Args:
+            radius: Distance threshold (at most cell_size)
+
+        Returns:
+            tuple: (i, j) index arrays with i != j, each pair listed once
+        """
+        if radius > self.cell_size:
+            raise ValueError(f"Query radius {radius} exceeds cell size {self.cell_size}")
+        if len(self.x) < 2:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        # Work in sorted positions (cache-friendly), and look neighbors up
+        # once per occupied cell rather than once per point
+        radius_sq = radius * radius
+        pairs_i = []
+        pairs_j = []
+        for offset_x, offset_y in _HALF_NEIGHBORHOOD:
+            cell_starts, cell_counts = self._cell_runs(self.cell_keys + offset_x * _KEY_STRIDE + offset_y)
+            i, j = _expand_ranges(cell_starts[self.point_cells], cell_counts[self.point_cells])
+            if (offset_x, offset_y) == (0, 0):
+                keep = i < j  # Same cell: each pair once, no self-pairs
+                i, j = i[keep], j[keep]
+
+            dx = self.sorted_x[i] - self.sorted_x[j]
+            dy = self.sorted_y[i] - self.sorted_y[j]
+            close = dx * dx + dy * dy < radius_sq
+            pairs_i.append(i[close])
+            pairs_j.append(j[close])
+
+        return self.order[np.concatenate(pairs_i)], self.order[np.concatenate(pairs_j)]
+
+    def query_points(self, px, py, radius):
+        """
+        Find the grid points within radius of each of many query positions
+
+        Args:
+            px, py: Arrays of query positions
+            radius: Distance threshold (at most cell_size)
+
+        Returns:
+            tuple: (query index, point index) arrays, one entry per close pair
+        """
+        if radius > self.cell_size:
+            raise ValueError(f"Query radius {radius} exceeds cell size {self.cell_size}")
+        px = np.asarray(px)
+        py = np.asarray(py)
+        if len(self.x) == 0 or len(px) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        cell_x = np.floor(px / self.cell_size).astype(np.int64) - self.origin[0]
+        cell_y = np.floor(py / self.cell_size).astype(np.int64) - self.origin[1]
+        queries = []
+        positions = []
+        for offset_x, offset_y in _FULL_NEIGHBORHOOD:
+            starts, counts = self._cell_runs((cell_x + offset_x) * _KEY_STRIDE + cell_y + offset_y)
+            query, position = _expand_ranges(starts, counts)
+            queries.append(query)
+            positions.append(position)
+        query = np.concatenate(queries)
+        position = np.concatenate(positions)
+
+        dx = self.sorted_x[position] - px[query]
+        dy = self.sorted_y[position] - py[query]
+        close = dx * dx + dy * dy < radius * radius
+        return query[close], self.order[position[close]]
+
+    def query_point(self, px, py, radius):
+        """
+        Find the points within radius of one position
+
+        Args:
+            px, py: Query position
+            radius: Distance threshold (at most cell_size)
+
+        Returns:
+            np.ndarray: Indices of points closer than radius
+        """
+        if radius > self.cell_size:
+            raise ValueError(f"Query radius {radius} exceeds cell size {self.cell_size}")
+        if len(self.x) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        cell_x = int(np.floor(px / self.cell_size)) - self.origin[0]
+        cell_y = int(np.floor(py / self.cell_size)) - self.origin[1]
+        keys = np.array([(cell_x + dx) * _KEY_STRIDE + (cell_y + dy) for dx, dy in _FULL_NEIGHBORHOOD],
+                        dtype=np.int64)
+        starts, counts = self._cell_runs(np.sort(keys))
+        _, positions = _expand_ranges(starts, counts)
+        candidates = self.order[positions]
+
+        dx = self.x[candidates] - px
+        dy = self.y[candidates] - py
+        return candidates[dx * dx + dy * dy < radius * radius]
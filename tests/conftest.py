@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration
+
+Game modules import each other relative to src/ (e.g. `from core.constants import ...`),
+the same way they resolve when running src/main.py, so put src/ on the import path.
+"""
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from systems.ship_store import ShipStore
+from systems.combat_engine import CombatEngine, ProjectilePool, COMBAT_STEP
+
+
+def duel(distance=10.0, seed=3, **attacker):
+    """A stationary armed attacker (faction 0) and an unarmed target (faction 1)"""
+    store = ShipStore()
+    values = {"weapon_class": 1, "shield_class": 0, "armor_class": 0, **attacker}
+    shooter = store.spawn(x=0.0, y=0.0, faction=0, **values)
+    target = store.spawn(x=distance, y=0.0, faction=1, weapon_class=0, shield_class=1, armor_class=2)
+    engine = CombatEngine(store, seed=seed)
+    engine.enlist([shooter, target])
+    return engine, store, shooter, target
+
+
+def fleet_battle(seed):
+    """Two mixed fleets closing on each other; returns the final hulls and stats"""
+    rng = np.random.default_rng(0)
+    store = ShipStore()
+    lasers = store.spawn_many(60, x=rng.uniform(0, 20, 60), y=rng.uniform(0, 30, 60), vx=1.0,
+                              faction=0, weapon_class=2, shield_class=2, armor_class=1)
+    missiles = store.spawn_many(60, x=rng.uniform(40, 60, 60), y=rng.uniform(0, 30, 60), vx=-1.0,
+                                faction=1, weapon_class=1, shield_class=1, armor_class=3)
+    engine = CombatEngine(store, seed=seed)
+    engine.enlist(lasers)
+    engine.enlist(missiles, weapon_group="missile_launcher")
+    for _ in range(30):
+        engine.update(0.1)
+    return store.hull[:store.size].copy(), dict(engine.stats)
+
+
+def test_pool_reuses_slots_and_grows():
+    """Released slots are handed out again; a full pool doubles"""
+    pool = ProjectilePool(capacity=4)
+    first = pool.spawn(3)
+    pool.release(first[:2])
+    assert sorted(pool.spawn(2).tolist()) == sorted(first[:2].tolist())
+    more = pool.spawn(4)
+    assert pool.capacity == 8 and len(pool) == 7
+    assert len(set(more.tolist()) | set(first.tolist())) == 7
+
+def test_shields_then_armor_absorb_damage():
+    """A class 1 laser (10) is soaked by class 1 shields (10); the next shot hits armor-reduced hull"""
+    engine, store, shooter, target = duel()
+    report = engine.resolve_turn()
+    assert report["shots"] == 1 and report["hits"] == 1 and report["damage"] == 10.0
+    assert store.shield_points[target] == 0.0 and store.hull[target] == 100.0
+
+    engine.resolve_turn()
+    assert store.hull[target] == pytest.approx(100.0 - 10.0 * (1.0 - 0.2))  # Class 2 armor stops 20%
+    assert len(engine.projectiles) == 0
+
+def test_out_of_range_ships_hold_fire():
+    """Lasers don't fire beyond their range; missiles reach further"""
+    engine, store, _, _ = duel(distance=30.0)
+    assert engine.resolve_turn()["shots"] == 0
+    engine, store, _, target = duel(distance=30.0)
+    engine.enlist([0], weapon_group="missile_launcher")
+    assert engine.resolve_turn()["hits"] == 1
+
+def test_destroyed_ships_drop_out():
+    """Ships at zero hull are reported once and stop fighting"""
+    engine, store, shooter, target = duel(weapon_class=5)
+    store.hull[target] = 5.0
+    destroyed = engine.update(1.0)
+    assert destroyed.tolist() == [target]
+    assert engine.ids.tolist() == [shooter]
+    assert engine.update(1.0).tolist() == []
+
+def test_battles_are_deterministic_per_seed():
+    """The same seed replays the same battle; real-time update runs fixed steps"""
+    hulls, stats = fleet_battle(seed=11)
+    again, stats_again = fleet_battle(seed=11)
+    assert np.array_equal(hulls, again) and stats == stats_again
+    assert stats["hits"] > 0
+
+    engine, _, _, _ = duel()
+    engine.update(COMBAT_STEP * 2.5)
+    assert engine.simulated == pytest.approx(COMBAT_STEP * 2)
@@ -0,0 +1,73 @@
+import time
+import pytest
+from systems.combat_estimator import CombatEstimator, Loadout
+
+
+def survey_ship(weapon="laser.class_2", **skills):
+    """A human survey vessel with basic defenses"""
+    return Loadout.from_equipment("human_survey_vessel", weapon, "shield.class_1", "armor.class_1",
+                                  "engine.class_1", skills=skills)
+
+
+def test_loadout_resolves_equipment_and_crew():
+    """Stats come from ship_equipment data; unset skills use the designer species' starting levels"""
+    loadout = survey_ship(navigation=120)
+    assert loadout.hull == 100.0 and loadout.weapon_group == "laser" and loadout.weapon_damage == 20.0
+    assert loadout.shield_points == 10.0 and loadout.armor_durability == pytest.approx(0.1)
+    assert loadout.engine_class == 1 and loadout.navigation == 120 and loadout.engineering == 30
+    assert loadout.key() == survey_ship(navigation=120).key() != survey_ship().key()
+
+    with pytest.raises(ValueError):
+        Loadout.from_equipment("human_survey_vessel", "scanners.flux_scanner")
+    with pytest.raises(KeyError):
+        survey_ship(piloting=10)
+
+
+def test_mirror_match_is_even_and_deterministic():
+    """Identical ships split the wins; the same seed gives the same odds, from either side"""
+    estimator = CombatEstimator(runs=2000, seed=5, max_workers=0)
+    ship = survey_ship()
+    odds = estimator.estimate(ship, ship)
+    assert odds.win_a + odds.win_b + odds.draw == pytest.approx(1.0)
+    assert odds.win_a == pytest.approx(odds.win_b, abs=0.06)
+    assert odds.time_to_kill_a > 0 and 0 < odds.hull_loss_a <= 100.0
+
+    other = CombatEstimator(runs=2000, seed=5, max_workers=0)
+    assert other.estimate(ship, ship) == odds
+
+
+def test_better_loadout_and_crew_win_more():
+    """A stronger laser, or a better navigator, tilts the odds"""
+    estimator = CombatEstimator(runs=2000, max_workers=0)
+    base = survey_ship()
+    assert estimator.estimate(survey_ship("laser.class_4"), base).win_a > 0.9
+    assert estimator.should_engage(survey_ship("laser.class_4"), base)
+    assert not estimator.should_engage(base, survey_ship("laser.class_4"))
+
+    skilled = estimator.estimate(survey_ship(navigation=200), base)
+    assert skilled.win_a > skilled.win_b
+
+
+def test_swapped_request_is_a_cache_hit():
+    """b against a is answered from a against b's cache entry"""
+    estimator = CombatEstimator(runs=1000, max_workers=0)
+    a, b = survey_ship("laser.class_3"), survey_ship()
+    odds = estimator.estimate(a, b)
+    assert not estimator.request(b, a)
+    assert estimator.get(b, a) == odds.swapped()
+
+
+def test_process_pool_matches_inline_results():
+    """Chunks seeded from the estimator's seed give the same odds on any number of workers"""
+    a, b = survey_ship("missile_launcher.class_3"), survey_ship()
+    inline = CombatEstimator(runs=3000, seed=2, max_workers=0).estimate(a, b)
+
+    pooled = CombatEstimator(runs=3000, seed=2, max_workers=2)
+    try:
+        assert pooled.request(a, b)
+        deadline = time.monotonic() + 30.0
+        while pooled.get(a, b) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pooled.get(a, b) == inline
+    finally:
+        pooled.shutdown()
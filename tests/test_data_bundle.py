@@ -0,0 +1,87 @@
+import json
+import os
+import pytest
+from core.data_bundle import BundleError, DataBundle, build_bundle, ensure_bundle
+from core.data_loader import DataLoader
+
+
+@pytest.fixture
+def static_root(tmp_path):
+    """A small static data tree"""
+    root = tmp_path / "static"
+    (root / "menu").mkdir(parents=True)
+    (root / "skills.json").write_text(json.dumps({"skills": {"science": {"max": 250}}}))
+    (root / "menu" / "main_menu.json").write_text(json.dumps({"title": "Main", "options": [1, 2]}))
+    return root
+
+def test_bundle_round_trip(static_root, tmp_path):
+    """Every section decodes to the same data as its JSON file"""
+    content_hash = build_bundle(static_root, tmp_path / "data.sfdb")
+    bundle = DataBundle(tmp_path / "data.sfdb")
+    assert bundle.content_hash == content_hash
+    assert bundle.load("skills.json") == {"skills": {"science": {"max": 250}}}
+    assert bundle.load("menu/main_menu.json")["options"] == [1, 2]
+    bundle.close()
+
+def test_content_hash_tracks_content(static_root, tmp_path):
+    """Rebuilding unchanged data gives the same hash, edits change it"""
+    first = build_bundle(static_root, tmp_path / "a.sfdb")
+    assert build_bundle(static_root, tmp_path / "b.sfdb") == first
+    (static_root / "skills.json").write_text(json.dumps({"skills": {}}))
+    assert build_bundle(static_root, tmp_path / "c.sfdb") != first
+
+def test_invalid_files_fail_the_build(static_root, tmp_path):
+    """Malformed JSON and duplicate keys are rejected and nothing is written"""
+    (static_root / "bad.json").write_text('{"a": 1,, "b": 2}')
+    (static_root / "dupe.json").write_text('{"a": 1, "a": 2}')
+    with pytest.raises(BundleError) as error:
+        build_bundle(static_root, tmp_path / "data.sfdb")
+    assert "bad.json" in str(error.value) and "dupe.json" in str(error.value)
+    assert not (tmp_path / "data.sfdb").exists()
+
+def edit_skills(static_root, max_value):
+    """Rewrite skills.json with a later mtime"""
+    path = static_root / "skills.json"
+    path.write_text(json.dumps({"skills": {"science": {"max": max_value}}}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def test_loader_builds_missing_or_stale_bundle(static_root, tmp_path):
+    """The first load builds the bundle, and rebuilds it after an edit"""
+    loader = DataLoader()
+    loader.static_root = static_root
+    loader.bundle_path = tmp_path / "data.sfdb"
+    assert loader.load_static("menu", "main_menu.json")["title"] == "Main"
+    assert loader.cache_info()["from_bundle"] == 1
+    loader.bundle.close()
+
+    edit_skills(static_root, 300)
+    bundle = ensure_bundle(static_root, tmp_path / "data.sfdb")
+    assert bundle.load("skills.json")["skills"]["science"]["max"] == 300
+    bundle.close()
+
+def test_loader_reads_json_for_files_edited_after_opening(static_root, tmp_path):
+    """A section that went stale while the bundle was open isn't used"""
+    loader = DataLoader()
+    loader.static_root = static_root
+    loader.bundle_path = tmp_path / "data.sfdb"
+    assert loader.bundle is not None
+    edit_skills(static_root, 300)
+    assert loader.load_static("skills.json")["skills"]["science"]["max"] == 300
+    assert loader.cache_info()["from_bundle"] == 0
+
+def test_corrupt_or_truncated_bundles_are_not_trusted(static_root, tmp_path):
+    """A flipped byte fails its section's CRC; a short file fails to open"""
+    path = tmp_path / "data.sfdb"
+    build_bundle(static_root, path)
+    raw = bytearray(path.read_bytes())
+    raw[-3] ^= 0xFF
+    path.write_bytes(raw)
+    bundle = DataBundle(path)
+    with pytest.raises(BundleError):
+        bundle.load(sorted(bundle.sections, key=lambda key: bundle.sections[key]["offset"])[-1])
+    bundle.close()
+
+    path.write_bytes(raw[:-10])
+    with pytest.raises(BundleError):
+        DataBundle(path)
@@ -0,0 +1,54 @@
+import json
+import os
+import pytest
+from core.data_loader import DataLoader, get_data_loader, thaw
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Loader whose static directory is a temp directory with one file"""
+    data_loader = DataLoader()
+    data_loader.static_root = tmp_path
+    data_loader.bundle_path = tmp_path.parent / f"{tmp_path.name}.sfdb"
+    (tmp_path / "menu.json").write_text(json.dumps({"title": "Menu", "options": [{"id": "a"}]}))
+    return data_loader
+
+def test_shared_loader_is_a_singleton():
+    """Every caller gets the same process-wide loader"""
+    assert get_data_loader() is get_data_loader()
+
+def test_static_data_is_memoized(loader):
+    """Second load is a cache hit returning the same object"""
+    first = loader.load_static("menu.json")
+    second = loader.load_static("menu.json")
+    assert first is second
+    assert loader.cache_info()["misses"] == 1
+    assert loader.cache_info()["hits"] == 1
+
+def test_static_data_is_read_only(loader):
+    """Shared data can't be modified, but thaw() gives a mutable copy"""
+    data = loader.load_static("menu.json")
+    with pytest.raises(TypeError):
+        data["title"] = "Changed"
+    assert isinstance(data["options"], tuple)
+
+    copy = thaw(data)
+    copy["options"].append({"id": "b"})
+    assert len(loader.load_static("menu.json")["options"]) == 1
+
+def test_revalidate_picks_up_changes(loader, tmp_path):
+    """Changed files are only re-read when revalidation is requested"""
+    loader.load_static("menu.json")
+    path = tmp_path / "menu.json"
+    path.write_text(json.dumps({"title": "New menu", "options": []}))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert loader.load_static("menu.json")["title"] == "Menu"
+    assert loader.load_static("menu.json", revalidate=True)["title"] == "New menu"
+    assert loader.cache_info()["reloads"] == 1
+
+def test_missing_file_raises(loader):
+    """Missing static files still raise FileNotFoundError"""
+    with pytest.raises(FileNotFoundError):
+        loader.load_static("nope.json")
@@ -0,0 +1,83 @@
+import json
+import pytest
+from core.event_scheduler import EventScheduler
+
+
+@pytest.fixture
+def scheduler():
+    """Scheduler recording every batch it dispatches as (type, [ids], time)"""
+    scheduler = EventScheduler()
+    scheduler.log = []
+    for event_type in ("distress_call", "patrol_arrival", "fuel_tick"):
+        scheduler.register_handler(event_type, lambda batch, event_type=event_type: scheduler.log.append(
+            (event_type, [event.payload.get("n") for event in batch], scheduler.time)))
+    return scheduler
+
+
+def test_events_run_in_time_order_batched_by_type(scheduler):
+    """Due events are dispatched once per type, in the order each type first came due"""
+    scheduler.schedule("patrol_arrival", 2.0, {"n": 1})
+    scheduler.schedule("distress_call", 1.0, {"n": 2})
+    scheduler.schedule("patrol_arrival", 1.5, {"n": 3})
+    scheduler.schedule("distress_call", 5.0, {"n": 4})
+
+    assert scheduler.advance(0.5) == 0
+    assert scheduler.advance(2.0) == 3
+    assert scheduler.log == [("distress_call", [2], 2.5), ("patrol_arrival", [3, 1], 2.5)]
+    assert len(scheduler) == 1
+    assert scheduler.next_event_time() == 5.0
+
+def test_recurring_events_and_cancel(scheduler):
+    """Repeats run once per interval that passed; cancelling stops them"""
+    handle = scheduler.schedule("fuel_tick", 1.0, {"n": 0}, interval=1.0)
+    scheduler.advance(3.5)
+    assert scheduler.log == [("fuel_tick", [0, 0, 0], 3.5)]
+    assert scheduler.next_event_time() == 4.0
+
+    assert scheduler.cancel(handle)
+    assert not scheduler.cancel(handle.event_id)
+    scheduler.advance(10.0)
+    assert len(scheduler.log) == 1 and len(scheduler) == 0
+    with pytest.raises(ValueError):
+        scheduler.schedule("fuel_tick", 1.0, interval=0)
+
+def test_cancel_within_a_batch(scheduler):
+    """A handler can cancel events that came due in the same advance"""
+    victim = scheduler.schedule("patrol_arrival", 1.0, {"n": 9})
+    scheduler.register_handler("distress_call", lambda batch: scheduler.cancel(victim))
+    scheduler.schedule("distress_call", 0.5)
+    scheduler.advance(1.0)
+    assert scheduler.log == []
+
+def test_unhandled_events_wait_for_a_handler(scheduler):
+    """Due events without a handler are kept (and saved) until one registers"""
+    scheduler.schedule("story_trigger", 1.0, {"n": 7})
+    scheduler.advance(2.0)
+    assert [event.event_type for event in scheduler.pending] == ["story_trigger"]
+
+    restored = EventScheduler.from_dict(json.loads(json.dumps(scheduler.to_dict())))
+    seen = []
+    restored.register_handler("story_trigger", lambda batch: seen.extend(event.payload["n"] for event in batch))
+    restored.advance(0.0)
+    assert seen == [7] and len(restored) == 0
+
+def test_round_trip_through_save_data(scheduler):
+    """Serialized schedulers resume with the same clock, ids and repeats"""
+    scheduler.schedule("distress_call", 4.0, {"n": 1})
+    scheduler.schedule("fuel_tick", 1.0, {"n": 2}, interval=2.0)
+    cancelled = scheduler.schedule("patrol_arrival", 3.0)
+    scheduler.cancel(cancelled)
+    scheduler.advance(1.5)
+
+    data = json.loads(json.dumps(scheduler.to_dict()))
+    assert [event["type"] for event in data["events"]] == ["fuel_tick", "distress_call"]
+    restored = EventScheduler.from_dict(data)
+    seen = []
+    for event_type in ("distress_call", "fuel_tick"):
+        restored.register_handler(event_type, lambda batch, event_type=event_type: seen.append(
+            (event_type, [event.payload.get("n") for event in batch])))
+
+    assert restored.time == 1.5
+    assert restored.schedule("distress_call", 1.0).event_id == scheduler.next_id
+    restored.advance(3.0)  # New call at 2.5, repeat at 3.5, saved call at 4.0
+    assert seen == [("distress_call", [None, 1]), ("fuel_tick", [2])]
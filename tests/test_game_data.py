@@ -0,0 +1,49 @@
+import dataclasses
+import pytest
+from core.game_data import GameData, SchemaError, validate_fields, MINERAL_SCHEMA
+
+
+@pytest.fixture(scope="module")
+def game_data():
+    """Records built from the real static data"""
+    return GameData()
+
+def test_records_are_frozen(game_data):
+    """Records can't be modified or given new attributes"""
+    laser = game_data.equipment_by_key["laser.class_2"]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        laser.damage = 99
+    assert not hasattr(laser, "__dict__")
+
+def test_ids_index_records_and_columns(game_data):
+    """An id indexes both the record tuple and the NumPy columns"""
+    shield_id = game_data.equipment_by_class[("shield", 3)]
+    shield = game_data.equipment[shield_id]
+    assert shield.equipment_class == 3  # Derived from the "class_3" key
+    assert game_data.equipment_protection[shield_id] == shield.protection_value
+    assert game_data.equipment_cost[shield_id] == shield.cost
+
+def test_index_tables(game_data):
+    """Rarity and cost indexes are consistent with the records"""
+    for rarity, ids in game_data.minerals_by_rarity.items():
+        assert all(game_data.minerals[i].rarity == rarity for i in ids)
+    costs = [game_data.equipment[i].cost for i in game_data.equipment_by_cost]
+    assert costs == sorted(costs)
+
+def test_species_references_resolve(game_data):
+    """Skill vectors follow skill ids and ship designers map to species ids"""
+    human = game_data.species[game_data.species_ids["human"]]
+    assert human.maximum_skills[game_data.skill_ids["science"]] == 250
+    designer = game_data.ship_classes[game_data.ship_class_ids["oval_survey_vessel"]].designer_species_id
+    assert game_data.species[designer].name == "Ov’al"
+
+def test_schema_rejects_bad_records():
+    """Unknown fields, missing fields and wrong types are all errors"""
+    good = {"name": "Iron", "value": 60, "rarity": "common"}
+    validate_fields("iron", good, MINERAL_SCHEMA)
+    with pytest.raises(SchemaError):
+        validate_fields("iron", {**good, "valeu": 1}, MINERAL_SCHEMA)
+    with pytest.raises(SchemaError):
+        validate_fields("iron", {"name": "Iron", "rarity": "common"}, MINERAL_SCHEMA)
+    with pytest.raises(SchemaError):
+        validate_fields("iron", {**good, "value": "60"}, MINERAL_SCHEMA)
@@ -0,0 +1,60 @@
+import numpy as np
+import pygame
+import pytest
+from utils.noise import tileable_noise_grid
+from systems.gas_giant_generator import GasGiantGenerator, FRAME_COUNT
+from ui.gas_giant_renderer import GasGiantRenderer
+
+
+@pytest.fixture
+def generator():
+    """Generator with a small texture to keep tests fast"""
+    return GasGiantGenerator(texture_width=128, texture_height=64)
+
+def test_tileable_noise_wraps():
+    """Left and right edges of tileable noise continue into each other"""
+    noise = tileable_noise_grid(256, 16, 4.0, 0.25, seed=3)
+    edge_step = np.abs(noise[:, 0] - noise[:, -1]).mean()
+    interior_step = np.abs(np.diff(noise, axis=1)).mean()
+    assert edge_step < interior_step * 3
+
+def test_texture_is_deterministic(generator):
+    """Same seed gives the same bands, different seeds differ"""
+    a = generator.generate_texture(10, "jovian")
+    b = generator.generate_texture(10, "jovian")
+    c = generator.generate_texture(11, "jovian")
+    assert a.shape == (64, 128, 3)
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+def test_frames_are_transparent_outside_disk(generator):
+    """Corners of every frame are fully transparent, the center opaque"""
+    texture = generator.generate_texture(10, "ice_giant")
+    frames = generator.render_frames(texture, 40, frame_count=4)
+    assert frames.shape == (4, 40, 40, 4)
+    assert (frames[:, 0, 0, 3] == 0).all()
+    assert (frames[:, 20, 20, 3] == 255).all()
+    assert not np.array_equal(frames[0], frames[1])
+
+def test_style_choice_is_stable(generator):
+    """A planet's style depends only on its seed and type"""
+    class Giant:
+        type = "gas_giant"
+        seed = 1234
+    assert generator.style_for_planet(Giant()) == generator.style_for_planet(Giant())
+    assert generator.style_for_planet(Giant()) in ("jovian", "saturnine")
+
+def test_renderer_bakes_in_the_background(generator):
+    """The first draw queues a bake and draws nothing; later draws blit frames"""
+    class Giant:
+        name = "Giant"
+        type = "gas_giant"
+        seed = 1234
+    renderer = GasGiantRenderer(generator)
+    target = pygame.Surface((64, 64), pygame.SRCALPHA)
+    assert renderer.render(target, Giant(), 32, 32, 16, 0.0) is False
+    renderer.executor.submit(lambda: None).result()  # The single worker has finished the bake
+    assert len(renderer.get_frames(Giant(), 32)) == FRAME_COUNT
+    assert renderer.render(target, Giant(), 32, 32, 16, 0.0) is True
+    assert target.get_at((32, 32)).a == 255
+    renderer.shutdown()
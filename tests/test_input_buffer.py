@@ -0,0 +1,71 @@
+import pygame
+import pytest
+from core.input_buffer import InputBuffer
+from core.input_manager import InputManager
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() holding a set of keys down"""
+
+    def __init__(self, *keys):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+def key_event(event_type, key):
+    return pygame.event.Event(event_type, key=key, mod=0, unicode="")
+
+def test_held_time_is_clipped_to_window():
+    """Only the part of a press inside the window counts"""
+    buffer = InputBuffer(min_tap=0.0)
+    buffer.key_down("a", 1.0)
+    buffer.key_up("a", 1.5)
+    assert buffer.held_time({"a"}, 0.0, 1.2) == pytest.approx(0.2)
+    assert buffer.held_time({"a"}, 1.4, 2.0) == pytest.approx(0.1)
+    assert buffer.held_time({"b"}, 0.0, 2.0) == 0.0
+
+def test_overlapping_keys_count_once():
+    """Two keys for the same action held together don't double the time"""
+    buffer = InputBuffer(min_tap=0.0)
+    buffer.key_down("a", 0.0)
+    buffer.key_down("b", 0.5)
+    buffer.key_up("a", 1.0)
+    assert buffer.held_time({"a", "b"}, 0.0, 2.0) == pytest.approx(2.0)  # b still held
+
+def test_repeats_ignored_and_taps_kept():
+    """Key repeat doesn't restart a press; a same-frame tap lasts min_tap"""
+    buffer = InputBuffer(min_tap=0.1)
+    buffer.key_down("a", 0.0)
+    buffer.key_down("a", 0.5)  # Repeat
+    buffer.key_up("a", 1.0)
+    assert buffer.held_time({"a"}, 0.0, 2.0) == pytest.approx(1.0)
+
+    buffer.key_down("b", 3.0)
+    buffer.key_up("b", 3.0)
+    assert buffer.held_time({"b"}, 3.0, 4.0) == pytest.approx(0.1)
+
+def test_sync_recovers_lost_events():
+    """A missing key-up is closed, and an unseen key-down opened, at snapshot time"""
+    buffer = InputBuffer(min_tap=0.0)
+    buffer.key_down("a", 0.0)
+    buffer.sync(KeyState("b"), ["a", "b"], timestamp=1.0)
+    assert buffer.held_time({"a"}, 0.0, 5.0) == pytest.approx(1.0)
+    assert buffer.held_time({"b"}, 0.0, 5.0) == pytest.approx(4.0)
+
+    buffer.trim(before=2.0)
+    assert buffer.released == []
+
+def test_movement_durations_per_step():
+    """Fixed steps see exactly the held time, with opposite directions cancelling"""
+    input_manager = InputManager()
+    input_manager.begin_frame(KeyState(), timestamp=0.0)
+    input_manager.begin_frame(KeyState(pygame.K_d), timestamp=0.05)
+    input_manager.process_event(key_event(pygame.KEYDOWN, pygame.K_d))
+    input_manager.begin_frame(KeyState(pygame.K_d, pygame.K_KP7), timestamp=0.1)
+    input_manager.process_event(key_event(pygame.KEYDOWN, pygame.K_KP7))
+
+    x, y = input_manager.get_movement_durations(0.0, 0.2)
+    assert x == pytest.approx(0.15 - 0.1)  # Right from 0.05, up-left from 0.1
+    assert y == pytest.approx(-0.1)
@@ -0,0 +1,85 @@
+import json
+import pygame
+import pytest
+from core.input_manager import InputManager
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() holding a set of keys down"""
+
+    def __init__(self, *keys):
+        self.keys = set(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+
+def key_down(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="")
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the shared DataLoader's data directory at a temp directory"""
+    from core.data_loader import get_data_loader
+    pygame.init()  # Key name lookups need pygame initialized
+    monkeypatch.setattr(get_data_loader(), "data_root", tmp_path)
+    return tmp_path
+
+def test_events_resolve_through_key_table():
+    """Each key maps straight to its actions; unbound keys and other events give None"""
+    input_manager = InputManager()
+    assert input_manager.get_action(key_down(pygame.K_KP8)) == "up"
+    assert input_manager.get_action(key_down(pygame.K_F12)) is None
+    assert input_manager.get_action(pygame.event.Event(pygame.KEYUP, key=pygame.K_w)) is None
+
+def test_rebinding_updates_key_table():
+    """Adding and removing bindings takes effect immediately"""
+    input_manager = InputManager()
+    input_manager.add_binding("up", pygame.K_j)
+    input_manager.remove_binding("up", pygame.K_w)
+    assert input_manager.get_action(key_down(pygame.K_j)) == "up"
+    assert input_manager.get_action(key_down(pygame.K_w)) is None
+
+def test_held_actions_come_from_one_snapshot():
+    """Movement reads the frame's snapshot, combining cardinals into diagonals"""
+    input_manager = InputManager()
+    input_manager.begin_frame(KeyState(pygame.K_w, pygame.K_RIGHT))
+    assert input_manager.held_actions == {"up", "right"}
+    assert input_manager.get_movement_vector() == (1, -1)
+
+    input_manager.begin_frame(KeyState(pygame.K_KP1, pygame.K_w))
+    assert input_manager.get_movement_vector() == (-1, 1)  # Keypad diagonal wins
+
+def test_frame_actions_and_queue():
+    """KEYDOWN events fill the frame's action set and queue; the next frame clears them"""
+    input_manager = InputManager()
+    input_manager.begin_frame(KeyState())
+    for key in (pygame.K_s, pygame.K_RETURN):
+        input_manager.process_event(key_down(key))
+
+    assert input_manager.was_triggered("down")
+    assert [action for action, _ in input_manager.poll_actions()] == ["down", "return"]
+    assert input_manager.poll_actions() == []
+
+    input_manager.begin_frame(KeyState())
+    assert not input_manager.triggered_actions
+
+def test_bindings_round_trip_through_config(data_dir):
+    """Saved rebindings replace the defaults for the actions they list"""
+    input_manager = InputManager()
+    input_manager.key_bindings["scan"] = [pygame.K_e]
+    input_manager.save_bindings()
+
+    config = json.loads((data_dir / "config" / "key_bindings.json").read_text())
+    assert config["bindings"]["scan"] == ["e"]
+
+    restored = InputManager()
+    assert restored.load_bindings()
+    assert restored.get_action(key_down(pygame.K_e)) == "scan"
+
+def test_missing_config_keeps_defaults(data_dir):
+    """No config file is not an error"""
+    input_manager = InputManager()
+    assert not input_manager.load_bindings()
+    assert input_manager.get_action(key_down(pygame.K_w)) == "up"
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from systems.ship_store import ShipStore
+from systems.npc_traffic import NpcTraffic
+from systems.lod_scheduler import (
+    LodScheduler, ANALYTIC_INTERVAL, TIER_ANALYTIC, TIER_COARSE, TIER_FULL
+)
+
+SECTOR = 10.0
+
+
+def make_scheduler(stars, **kwargs):
+    traffic = NpcTraffic(ShipStore(), stars, rng=np.random.default_rng(2))
+    return LodScheduler(traffic, sector_size=SECTOR, full_radius=0, coarse_radius=1, **kwargs)
+
+
+def test_tiers_follow_the_player():
+    """The player's sector is full, its neighbors coarse, the rest analytic; unwatched means no full tier"""
+    scheduler = make_scheduler([[0.0, 0.0]])
+    scheduler.update(0.05, 5.0, 5.0)
+    assert scheduler.tier_of((0, 0)) == TIER_FULL
+    assert scheduler.tier_of((1, -1)) == TIER_COARSE
+    assert scheduler.tier_of((2, 0)) == TIER_ANALYTIC
+
+    scheduler.update(0.05, 25.0, 5.0)
+    assert scheduler.tier_of((0, 0)) == TIER_ANALYTIC
+    assert scheduler.tier_of((2, 0)) == TIER_FULL
+
+    scheduler.update(0.05, 25.0, 5.0, watched=False)
+    assert scheduler.tier_of((2, 0)) == TIER_COARSE
+
+def test_work_per_update_is_bounded():
+    """However many distant ships there are, each update simulates at most the budget (plus a sector)"""
+    rng = np.random.default_rng(5)
+    stars = rng.uniform(0, 2000, (200, 2))
+    scheduler = make_scheduler(stars, coarse_budget=100, analytic_budget=300)
+    traffic = scheduler.traffic
+    ids = traffic.spawn_fleet("oval_collective", 5000)
+    traffic.store.x[ids] = rng.uniform(0, 2000, len(ids))
+    traffic.store.y[ids] = rng.uniform(0, 2000, len(ids))
+    scheduler.add_ships(ids)
+
+    largest_sector = max(len(members) for members in scheduler.members.values())
+    for _ in range(20):
+        scheduler.update(ANALYTIC_INTERVAL, 1000.0, 1000.0)
+        assert scheduler.stats[TIER_ANALYTIC] <= 300 + largest_sector
+        assert scheduler.stats[TIER_COARSE] <= 100 + largest_sector
+
+def test_promotion_catches_ships_up():
+    """Ships in a sector the player enters are brought up to the full tier's time first"""
+    scheduler = make_scheduler([[0.0, 0.0], [500.0, 0.0]])
+    store = scheduler.store
+    ship = scheduler.traffic.spawn_fleet("citadel", 1)[0]
+    store.x[ship], store.y[ship] = 255.0, 5.0
+    store.target_star[ship] = 1
+    scheduler.add_ships([ship])
+
+    scheduler.update(1.0, 5.0, 5.0)
+    assert store.sim_time[ship] == 0.0  # Distant and not due yet
+    scheduler.update(0.05, 255.0, 5.0)
+    assert store.sim_time[ship] == pytest.approx(scheduler.full_time)
+    assert store.x[ship] > 255.0
+
+def test_ships_change_sector_as_they_move():
+    """Sector membership follows ships across boundaries and forgets removed ships"""
+    scheduler = make_scheduler([[100.0, 5.0]])
+    store = scheduler.store
+    ship = scheduler.traffic.spawn_fleet("citadel", 1)[0]
+    store.x[ship], store.y[ship] = 9.9, 5.0
+    store.vx[ship] = 2.0
+    scheduler.add_ships([ship])
+    assert scheduler.members == {(0, 0): {ship}}
+
+    scheduler.update(0.1, 5.0, 5.0)
+    assert scheduler.members == {(1, 0): {ship}}
+    scheduler.remove_ships([ship])
+    assert scheduler.members == {}
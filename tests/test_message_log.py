@@ -0,0 +1,80 @@
+import pytest
+from core.message_log import (CHANNEL_COMMS, CHANNEL_NAVIGATION, CHANNEL_SYSTEM, JOURNAL_BLOCK,
+                              MessageJournal, MessageLog)
+
+
+def filled_log(count, capacity=8, **kwargs):
+    """A log with count messages, alternating navigation and comms"""
+    log = MessageLog(capacity=capacity, **kwargs)
+    for seq in range(1, count + 1):
+        log.add(f"message {seq}", CHANNEL_NAVIGATION if seq % 2 else CHANNEL_COMMS, time=float(seq))
+    return log
+
+
+def test_ring_buffer_keeps_the_newest_messages():
+    """Memory holds capacity messages; older ones move to the journal"""
+    log = filled_log(20)
+    assert len(log) == 8 and len(log.journal) == 12
+    assert [message.seq for message in log] == list(range(13, 21))
+    assert [message.text for message in log.recent(3)] == ["message 18", "message 19", "message 20"]
+    assert log.recent(2, channel=CHANNEL_COMMS)[-1].seq == 20
+    assert log.first_seq == 1
+
+
+def test_history_pages_back_through_the_journal():
+    """Paging reads past memory into the journal, across journal blocks"""
+    count = JOURNAL_BLOCK * 3 + 10
+    log = filled_log(count)
+    page = log.history(5, before=log.first_seq + 7)
+    assert [message.seq for message in page] == [3, 4, 5, 6, 7]
+    assert page[0].time == 3.0 and page[0].channel == CHANNEL_NAVIGATION
+
+    everything = log.history(count + 5)
+    assert [message.seq for message in everything] == list(range(1, count + 1))
+    comms = log.history(count, channel=CHANNEL_COMMS)
+    assert len(comms) == count // 2 and all(message.seq % 2 == 0 for message in comms)
+
+
+def test_search_covers_the_whole_session():
+    """Search finds journaled and in-memory messages, newest first"""
+    log = filled_log(300)
+    assert [message.seq for message in log.search("MESSAGE 29")] == [299, 298, 297, 296, 295, 294,
+                                                                      293, 292, 291, 290, 29]
+    assert [message.seq for message in log.search("message 1", limit=2)] == [199, 198]
+    assert log.search("message 2", channel=CHANNEL_NAVIGATION, limit=1)[0].seq == 299
+
+
+def test_version_counts_changes():
+    """Renderers can skip redrawing while the version holds"""
+    log = MessageLog(capacity=2)
+    assert log.version == 0
+    log.add("one")
+    log.add("two")
+    log.add("three")
+    assert log.version == 3
+    log.clear()
+    assert log.version == 4 and len(log) == 0 and log.next_seq == 4
+    assert [message.text for message in log.history(5)] == ["one"]
+
+
+def test_without_journal_old_messages_are_dropped():
+    """journal=False keeps only the ring buffer"""
+    log = filled_log(20, journal=False)
+    assert log.journal is None
+    assert len(log.history(50)) == 8 and log.first_seq == 13
+
+
+def test_unknown_channel_rejected():
+    """Channels are a fixed set"""
+    with pytest.raises(ValueError):
+        MessageLog().add("hello", "gossip")
+
+
+def test_round_trip_keeps_memory_and_numbering(tmp_path):
+    """Saves hold the in-memory messages; numbering carries on after loading"""
+    log = filled_log(12, journal=MessageJournal(tmp_path / "journal.jsonl"))
+    assert (tmp_path / "journal.jsonl").exists()
+    restored = MessageLog.from_dict(log.to_dict(), capacity=8, journal=False)
+    assert [message.text for message in restored] == [message.text for message in log]
+    assert restored.add("next", CHANNEL_SYSTEM).seq == 13
+    log.close()
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from core.event_scheduler import EventScheduler
+from systems.mineral_market import ECONOMY_TICK, MineralMarket, station_ports
+
+
+@pytest.fixture
+def market():
+    """Three ports in a row: a and b linked, c on its own"""
+    market = MineralMarket(history_length=8)
+    for key in ("a", "b", "c"):
+        market.add_port(key)
+    market.connect("a", "b", rate=1.0 / 600.0)
+    return market
+
+def test_ports_open_at_equilibrium(market):
+    """With no trades, ticks leave prices where they started"""
+    start = market.price.copy()
+    for _ in range(5):
+        market.tick()
+    assert np.allclose(market.price, start)
+    assert market.port("c") == 2
+
+def test_sales_lower_the_price_at_the_next_tick(market):
+    """A sale settles at the current price, then the glut lowers it"""
+    before = market.price_of("a", "iron")
+    assert market.sell("a", "iron", 100) == int(before * 100)
+    assert market.price_of("a", "iron") == before  # Not until the tick
+    market.tick()
+    assert market.price_of("a", "iron") < before
+
+def test_gluts_spread_to_linked_ports_only(market):
+    """Stock flows along links, so a linked port's price eases too"""
+    b_before, c_before = market.price_of("b", "iron"), market.price_of("c", "iron")
+    market.sell("a", "iron", 500)
+    for _ in range(3):
+        market.tick()
+    assert market.price_of("b", "iron") < b_before
+    assert market.price_of("c", "iron") == pytest.approx(c_before)
+
+def test_buying_is_capped_by_stock(market):
+    """A port can't sell more than it holds"""
+    stock = market.supply[0, market.mineral("iron")]
+    bought, cost = market.buy("a", "iron", 10**6)
+    assert bought == int(stock - 0.5)
+    assert cost >= bought * market.price_of("a", "iron")
+
+def test_history_is_a_compact_ring(market):
+    """History keeps the last history_length ticks, oldest first"""
+    assert market.history("a", "iron").shape == (0,)
+    market.sell("a", "iron", 300)
+    prices = []
+    for _ in range(10):
+        market.tick()
+        prices.append(market.price_of("a", "iron"))
+    history = market.history("a", "iron")
+    assert market._history.dtype == np.uint16
+    assert history.shape == (8,)
+    assert np.allclose(history, prices[-8:], rtol=1e-3)
+    assert market.history("a").shape == (8, len(market.value))
+
+def test_attach_ticks_on_the_scheduler(market):
+    """The recurring economy event is scheduled once and ticks the market"""
+    events = EventScheduler()
+    market.attach(events)
+    market.attach(events)
+    assert len(events) == 1
+    events.advance(ECONOMY_TICK * 3)
+    assert market.ticks == 3
+
+def test_save_round_trip(market):
+    """Stock, demand, links and pending trades survive a save"""
+    market.sell("b", "gold", 40)
+    market.tick()
+    market.sell("a", "iron", 10)
+    restored = MineralMarket.from_dict(market.to_dict())
+    assert restored.keys == market.keys
+    assert restored.links == market.links
+    assert np.allclose(restored.price, market.price, rtol=1e-4)
+    assert np.array_equal(restored.shocks, market.shocks)
+
+def test_home_system_stations_become_ports():
+    """for_systems() opens a port per station"""
+    assert station_ports("s", {"inner_planets": [None, {"stations": [{"name": "Dock"}]}]}) == ["s#Dock"]
+    market = MineralMarket.for_systems(["systems/home_system.json"])
+    assert "systems/home_system.json#Starbase" in market.port_ids
+
+def test_loaded_market_opens_ports_for_new_systems():
+    """add_systems() opens only the missing ports and links them without touching older links"""
+    systems = {
+        "old": {"hyperspace_coords": {"x": 0, "y": 0},
+                "inner_planets": [{"stations": [{"name": "A"}, {"name": "B"}]}]},
+        "new": {"hyperspace_coords": {"x": 10, "y": 0},
+                "inner_planets": [{"stations": [{"name": "C"}]}]}
+    }
+    loader = SimpleNamespace(load=systems.__getitem__)
+    market = MineralMarket.for_systems(["old"], system_loader=loader)
+    market.connect("old#A", "old#B", rate=0.5)
+    restored = MineralMarket.from_dict(market.to_dict())
+
+    assert restored.add_systems(["old", "new"], system_loader=loader) == 1
+    assert restored.keys == ["old#A", "old#B", "new#C"]
+    assert restored.links[(0, 1)] == 0.5
+    assert (0, 2) in restored.links and (1, 2) in restored.links
+    assert restored.add_systems(["old", "new"], system_loader=loader) == 0
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from systems.ship_store import ShipStore
+from systems.npc_traffic import (
+    NpcTraffic, AI_STEP, ARRIVAL_RADIUS, BEHAVIOR_FLEE, BEHAVIOR_PATROL, BEHAVIOR_PURSUE,
+    BEHAVIOR_SEEK, HOSTILE_DISPOSITION
+)
+
+STARS = np.array([[0.0, 0.0], [40.0, 0.0], [0.0, 40.0]], dtype=np.float32)
+
+
+@pytest.fixture
+def traffic():
+    return NpcTraffic(ShipStore(), STARS, faction_stars={"citadel": [0, 1]}, rng=np.random.default_rng(1))
+
+
+def test_add_component_extends_store():
+    """Added columns cover existing ships, are spawnable and can't be added twice"""
+    store = ShipStore(capacity=2)
+    first = store.spawn()
+    store.add_component("target_star", np.int32, -1)
+    ids = store.spawn_many(3, target_star=2)  # Forces growth
+    assert store.target_star[first] == -1
+    assert store.target_star[ids].tolist() == [2, 2, 2]
+    assert store.get(first)["target_star"] == -1
+    with pytest.raises(ValueError):
+        store.add_component("x", np.float32, 0.0)
+
+def test_spawned_fleet_uses_faction_data(traffic):
+    """Fleets take hulls, species, equipment and patrol stars from the faction"""
+    factions = traffic.factions
+    citadel = factions.ids["citadel"]
+    ids = traffic.spawn_fleet("citadel", 50)
+    store = traffic.store
+
+    assert (store.faction[ids] == citadel).all()
+    assert set(store.ship_class[ids].tolist()) <= set(factions.ship_classes[citadel])
+    assert set(store.species[ids].tolist()) <= set(factions.species[citadel])
+    patrols = store.weapon_class[ids] > 0
+    assert set(store.target_star[ids[patrols]].tolist()) <= {0, 1}
+    assert (store.behavior[ids] == np.where(patrols, BEHAVIOR_PATROL, BEHAVIOR_SEEK)).all()
+
+def test_ships_travel_and_retarget(traffic):
+    """A ship steers to its star, refuels on arrival and picks a new destination"""
+    store = traffic.store
+    ship = traffic.spawn_fleet("oval_collective", 1)[0]
+    store.x[ship], store.y[ship] = 10.0, 10.0
+    start = store.target_star[ship]
+    target = STARS[start]
+    distance = np.hypot(*(target - (10.0, 10.0)))
+
+    traffic.tick(AI_STEP, 1000.0, 1000.0)
+    assert np.hypot(store.x[ship] - target[0], store.y[ship] - target[1]) < distance
+
+    store.x[ship], store.y[ship] = target + ARRIVAL_RADIUS / 2
+    store.fuel[ship] = 1.0
+    traffic.tick(AI_STEP, 1000.0, 1000.0)
+    assert store.fuel[ship] == store.max_fuel[ship]
+
+def test_player_reactions(traffic):
+    """Wary unarmed ships flee the player; hostile armed ships pursue"""
+    store = traffic.store
+    trader, raider = traffic.spawn_fleet("oval_collective", 2)
+    store.weapon_class[trader] = 0
+    store.weapon_class[raider] = 1
+    store.disposition[trader] = -10
+    store.disposition[raider] = HOSTILE_DISPOSITION
+    store.x[[trader, raider]] = [5.0, -5.0]
+    store.y[[trader, raider]] = 0.0
+    store.vx[[trader, raider]] = 0.0
+    store.vy[[trader, raider]] = 0.0
+
+    traffic.tick(AI_STEP, 0.0, 0.0)
+    assert store.behavior[trader] == BEHAVIOR_FLEE and store.vx[trader] > 0
+    assert store.behavior[raider] == BEHAVIOR_PURSUE and store.vx[raider] > 0
+
+def test_separation_pushes_ships_apart(traffic):
+    """Overlapping ships with nowhere to go drift apart"""
+    store = traffic.store
+    left, right = traffic.spawn_fleet("citadel", 2)
+    store.target_star[[left, right]] = 0
+    store.x[[left, right]] = [-0.1, 0.1]
+    store.y[[left, right]] = 0.0
+    store.vx[[left, right]] = 0.0
+    store.vy[[left, right]] = 0.0
+
+    traffic.tick(AI_STEP, 1000.0, 1000.0)
+    assert store.vx[left] < 0 < store.vx[right]
+
+def test_update_runs_fixed_ticks(traffic):
+    """update() banks frame time and runs whole AI ticks"""
+    traffic.spawn_fleet("citadel", 3)
+    assert traffic.update(AI_STEP * 0.5, 0.0, 0.0) == 0
+    assert traffic.update(AI_STEP * 2.0, 0.0, 0.0) == 2
+
+def test_advance_jumps_along_route(traffic):
+    """Analytic advance covers speed * time toward the star, or parks and refuels on arrival"""
+    store = traffic.store
+    cruiser, arriver = traffic.spawn_fleet("citadel", 2)
+    store.target_star[[cruiser, arriver]] = 1  # Star at (40, 0)
+    store.x[[cruiser, arriver]] = [0.0, 39.0]
+    store.y[[cruiser, arriver]] = 0.0
+    store.engine_class[[cruiser, arriver]] = 1
+    store.fuel[arriver] = 1.0
+
+    traffic.advance(np.array([cruiser, arriver]), 10.0)
+    assert store.x[cruiser] == pytest.approx(10.0)
+    assert store.vx[cruiser] == pytest.approx(1.0)
+    assert store.x[arriver] == pytest.approx(40.0)
+    assert store.fuel[arriver] == store.max_fuel[arriver]
@@ -0,0 +1,80 @@
+import threading
+from types import SimpleNamespace
+import pytest
+from systems.terrain_generator import TerrainGenerator
+from systems.planet_pregen import PlanetPregenService, PRIORITY_ORBIT, PRIORITY_PREFETCH
+
+
+def Planet(name, planet_type):
+    """Minimal stand-in for a Planet"""
+    return SimpleNamespace(name=name, type=planet_type, seed=len(name), body_type="planet")
+
+@pytest.fixture
+def pregen(tmp_path):
+    """Single-worker service over a small grid, caching into a temp directory"""
+    generator = TerrainGenerator(cache_dir=tmp_path, grid_width=48, grid_height=48)
+    service = PlanetPregenService(terrain_generator=generator)
+    yield service
+    service.shutdown()
+
+def hold_worker(pregen):
+    """Occupy the only worker until the returned event is set"""
+    release = threading.Event()
+    pregen.executor.submit(release.wait)
+    return release
+
+def test_wait_builds_surface(pregen):
+    """wait() returns finished surface data and caches it"""
+    planet = Planet("Dustball", "desert")
+    data = pregen.wait(planet, timeout=10)
+    assert data is not None
+    assert data.terrain_map.width == 48
+    assert pregen.get(planet) is data
+    assert pregen.request(planet) is None  # Already cached
+
+def test_gas_giants_are_skipped(pregen):
+    """Bodies without a surface are never queued"""
+    assert pregen.request(Planet("Giant", "gas_giant")) is None
+
+def test_orbit_priority_runs_first(pregen):
+    """A more urgent request jumps ahead of earlier queued work"""
+    release = hold_worker(pregen)
+    far = pregen.request(Planet("Far", "rocky"), PRIORITY_PREFETCH)
+    near = pregen.request(Planet("Near", "ice"), PRIORITY_ORBIT)
+    release.set()
+
+    assert near.done.wait(10) and far.done.wait(10)
+    # Cache insertion order is completion order
+    assert list(pregen.cache) == [near.key, far.key]
+
+def test_cancelled_job_never_runs(pregen):
+    """Cancelling a queued planet drops it without generating"""
+    release = hold_worker(pregen)
+    planet = Planet("Skipped", "rocky")
+    job = pregen.request(planet)
+    pregen.cancel(planet)
+    release.set()
+
+    assert job.done.wait(10)
+    assert job.result is None
+    assert pregen.get(planet) is None
+
+def test_job_revived_after_cancel_is_run_again(pregen):
+    """A request that lands after a running job stopped for a cancel still gets the surface"""
+    planet = Planet("Revived", "rocky")
+    generate = pregen._generate
+    calls = []
+
+    def cancel_then_revive(job):
+        calls.append(job)
+        if len(calls) > 1:
+            return generate(job)
+        job.cancelled = True
+        result = generate(job)           # Stops at the first stage boundary
+        pregen.request(planet, PRIORITY_ORBIT)
+        return result
+
+    pregen._generate = cancel_then_revive
+    data = pregen.wait(planet, timeout=10)
+    assert len(calls) == 2
+    assert data is not None and pregen.get(planet) is data
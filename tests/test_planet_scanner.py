@@ -0,0 +1,67 @@
+import pytest
+from entities.celestial_objects.planet import Planet
+from entities.celestial_objects.star_system import StarSystem
+from systems.planet_scanner import PlanetScanner, system_bodies
+from utils.noise import hash_uniforms
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    """One scanner for the module (loading the data is the slow part)"""
+    return PlanetScanner()
+
+def test_scan_is_deterministic():
+    """The same seed and type read the same from separate scanners"""
+    first = PlanetScanner().scan(Planet("A", "rocky", 0, 1.2, seed=1234))
+    second = PlanetScanner().scan(Planet("B", "rocky", 90, 1.2, seed=1234))
+    assert first == second
+    assert first.planet_type == "rocky"
+
+def test_batch_matches_single_scans(scanner):
+    """scan_many() gives exactly what scanning each body alone would"""
+    types = list(scanner.profiles)
+    bodies = [Planet(f"P{i}", types[i % len(types)], 0, 0.5 + (i % 7) * 0.3, seed=i * 7919)
+              for i in range(60)]
+    batch = scanner.scan_many(bodies)
+    for body, scan in zip(bodies, batch):
+        assert PlanetScanner().scan(body) == scan
+
+def test_repeat_scans_are_cached():
+    """A repeat scan returns the cached object; the cache is bounded"""
+    scanner = PlanetScanner(max_cached=2)
+    planet = Planet("Cached", "desert", 0, 1.0, seed=5)
+    scan = scanner.scan(planet)
+    assert scanner.scan(planet) is scan
+    assert len(scanner) == 1
+
+    scanner.scan_many([Planet(f"X{i}", "ice", 0, 1.0, seed=100 + i) for i in range(3)])
+    assert len(scanner) == 2
+
+def test_scan_system_covers_planets_and_moons(scanner):
+    """The survey batch has a scan for every planet and moon"""
+    star_system = StarSystem("systems/home_system.json")
+    survey = scanner.scan_system(star_system)
+    assert list(survey) == list(system_bodies(star_system))
+    assert any(body.body_type != "planet" for body in survey)
+    for body, scan in survey.items():
+        assert scan.planet_type == body.type
+        assert scanner.scan(body) is scan
+
+def test_gas_giants_have_no_surface(scanner):
+    """Giants report a gas surface, no lithosphere and crushing pressure"""
+    scan = scanner.scan(Planet("Giant", "gas_giant", 0, 3.0, seed=77))
+    assert scan.predominant_surface == "gas"
+    assert scan.lithosphere == ()
+    assert "hydrogen" in scan.atmosphere
+
+def test_unknown_type_raises(scanner):
+    """A type without a scan profile is an error"""
+    with pytest.raises(ValueError):
+        scanner.scan(Planet("Odd", "not_a_type", 0, 1.0, seed=1))
+
+def test_hash_uniforms_batch_independent():
+    """A seed's numbers don't depend on what else is in the batch"""
+    alone = hash_uniforms([42], 5)
+    batch = hash_uniforms([7, 42, 99], 5)
+    assert (alone[0] == batch[1]).all()
+    assert ((batch >= 0.0) & (batch < 1.0)).all()
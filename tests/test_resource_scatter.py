@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from systems.terrain_generator import TerrainGenerator
+from systems.resource_scatter import (
+    ResourceScatter,
+    poisson_disk_sample,
+    KIND_MINERAL,
+    SCATTER_DTYPE
+)
+
+
+@pytest.fixture(scope="module")
+def terrain():
+    """A small continental map (has both liquid and land)"""
+    generator = TerrainGenerator(grid_width=160, grid_height=160)
+    return generator.generate(2024, "continental")
+
+def test_poisson_points_keep_spacing():
+    """No two points are closer than the requested spacing"""
+    rng = np.random.default_rng(7)
+    points = poisson_disk_sample(rng, 120, 80, 5.0)
+    diff = points[:, np.newaxis, :] - points[np.newaxis, :, :]
+    dist_sq = (diff ** 2).sum(axis=-1)
+    np.fill_diagonal(dist_sq, np.inf)
+    assert len(points) > 100
+    assert dist_sq.min() >= 25.0 - 1e-3
+
+def test_density_zero_leaves_area_empty():
+    """Cells with zero density never receive points"""
+    rng = np.random.default_rng(7)
+    points = poisson_disk_sample(
+        rng, 100, 100, 4.0,
+        density=lambda xs, ys: np.broadcast_to((xs < 50)[np.newaxis, :], (len(ys), len(xs)))
+    )
+    assert len(points) > 0
+    assert points[:, 0].max() < 50 + 4.0
+
+def test_scatter_is_deterministic(terrain):
+    """Same terrain and seed give the same objects"""
+    scatter = ResourceScatter()
+    a = scatter.scatter(terrain)
+    b = scatter.scatter(terrain)
+    assert a.dtype == SCATTER_DTYPE
+    assert a.dtype.itemsize == 7
+    assert np.array_equal(a, b)
+
+def test_nothing_placed_in_liquid(terrain):
+    """Every object sits on land"""
+    objects = ResourceScatter().scatter(terrain)
+    heights = terrain.heights[objects["y"], objects["x"]]
+    assert len(objects) > 0
+    assert (heights >= terrain.liquid_level).all()
+
+def test_common_minerals_outnumber_rare(terrain):
+    """Mineral choice is weighted by rarity"""
+    scatter = ResourceScatter()
+    objects = scatter.scatter(terrain)
+    minerals = objects[objects["kind"] == KIND_MINERAL]
+    rarities = [scatter.data_loader.load_static("minerals.json")["minerals"][scatter.mineral_key(i)]["rarity"]
+                for i in minerals["id"]]
+    assert rarities.count("common") > rarities.count("rare")
@@ -0,0 +1,93 @@
+import pytest
+from core.save_manager import (
+    SaveManager, SaveError, apply_diff, diff_state, DELTA_FILENAME, SNAPSHOT_FILENAME
+)
+
+
+class FakeSession:
+    """Stands in for GameSession: just returns its data"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def to_save_data(self):
+        return {key: value for key, value in self.data.items()}
+
+
+@pytest.fixture
+def save_manager(tmp_path):
+    manager = SaveManager(save_dir=tmp_path, full_snapshot_every=3)
+    yield manager
+    manager.shutdown()
+
+def big_state():
+    """State with a large part that autosaves don't touch"""
+    return {"ship": {"fuel": 100, "hull": 100}, "stars": list(range(2000)), "messages": ["hi"]}
+
+def test_diff_round_trip():
+    """apply_diff(base, diff_state(base, new)) == new, and base is untouched"""
+    base = {"a": 1, "b": {"c": [1, 2], "d": 4}, "gone": True}
+    new = {"a": 1, "b": {"c": [1, 2, 3], "d": 4}, "added": "x"}
+    changes = diff_state(base, new)
+    assert apply_diff(base, changes) == new
+    assert base["b"]["c"] == [1, 2]
+    assert diff_state(new, new) is None
+
+def test_autosave_writes_delta(save_manager):
+    """After the first snapshot, autosaves only write the changes"""
+    session = FakeSession(big_state())
+    save_manager.autosave(session)
+    save_manager.flush()
+
+    session.data["ship"] = {"fuel": 90, "hull": 100}
+    save_manager.autosave(session)
+    save_manager.flush()
+
+    slot = save_manager.slot_dir("autosave")
+    assert (slot / DELTA_FILENAME).stat().st_size < (slot / SNAPSHOT_FILENAME).stat().st_size
+    assert save_manager.load_save_data("autosave")["data"]["ship"]["fuel"] == 90
+
+def test_periodic_full_snapshot(save_manager):
+    """Every few autosaves, the delta is folded into a new snapshot"""
+    session = FakeSession(big_state())
+    for fuel in range(5):
+        session.data["ship"] = {"fuel": fuel, "hull": 100}
+        save_manager.autosave(session)
+        save_manager.flush()
+    assert save_manager.deltas_written["autosave"] < 3
+    assert save_manager.load_save_data("autosave")["data"]["ship"]["fuel"] == 4
+
+def test_corrupt_delta_falls_back_to_snapshot(save_manager):
+    """A torn autosave loses only that autosave"""
+    session = FakeSession(big_state())
+    save_manager.save(session, "slot_1")
+    save_manager.flush()
+    session.data["messages"] = ["hi", "there"]
+    save_manager.autosave(session, "slot_1")
+    save_manager.flush()
+
+    delta_path = save_manager.slot_dir("slot_1") / DELTA_FILENAME
+    delta_path.write_bytes(delta_path.read_bytes()[:-4])  # Simulate a torn write
+    assert save_manager.load_save_data("slot_1")["data"]["messages"] == ["hi"]
+
+def test_missing_slot_raises(save_manager):
+    """Loading an empty slot is a SaveError"""
+    with pytest.raises(SaveError):
+        save_manager.load_save_data("nothing_here")
+
+def test_slots_listed_newest_first(save_manager):
+    """Queued and written slots are listed, most recent first"""
+    session = FakeSession(big_state())
+    save_manager.save(session, "older")
+    save_manager.flush()
+    save_manager.save(session, "newer")
+    assert save_manager.list_slots() == ["newer", "older"]
+
+def test_unencodable_data_sets_last_error(save_manager):
+    """Encoding failures on the worker are reported, not lost in its future"""
+    session = FakeSession({"ship": object()})
+    save_manager.save(session, "slot_1")
+    save_manager.flush()
+    assert isinstance(save_manager.last_error, TypeError)
+    with pytest.raises(SaveError):
+        save_manager.load_save_data("slot_1")
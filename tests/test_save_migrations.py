@@ -0,0 +1,79 @@
+import pytest
+from core.save_manager import SAVE_VERSION, SaveError
+from core.save_migrations import MigrationRegistry, migrate_save
+
+
+@pytest.fixture
+def registry():
+    """Registry with two chained upgrades (1 -> 2 -> 3)"""
+    migrations = MigrationRegistry()
+
+    @migrations.register(1)
+    def add_fuel(data):
+        return {**data, "ship": {**data["ship"], "fuel": 100}}
+
+    @migrations.register(2)
+    def rename_log(data):
+        data = dict(data)
+        data["messages"] = data.pop("log")
+        return data
+
+    return migrations
+
+def test_migrations_chain_to_target(registry):
+    """A version 1 save passes through every upgrade in order"""
+    save = {"save_version": 1, "data": {"ship": {}, "log": ["hi"]}}
+    migrated = registry.migrate(save, target_version=3)
+    assert migrated["save_version"] == 3
+    assert migrated["data"] == {"ship": {"fuel": 100}, "messages": ["hi"]}
+
+def test_current_save_is_untouched(registry):
+    """Saves already at the target version pass through as-is"""
+    save = {"save_version": 3, "data": {"messages": []}}
+    assert registry.migrate(save, target_version=3)["data"] is save["data"]
+
+def test_newer_or_unmigratable_saves_fail(registry):
+    """Saves from a newer build, or with a gap in the chain, are errors"""
+    with pytest.raises(SaveError):
+        registry.migrate({"save_version": 4, "data": {}}, target_version=3)
+    with pytest.raises(SaveError):
+        registry.migrate({"save_version": 0, "data": {}}, target_version=3)
+
+def test_duplicate_registration_rejected(registry):
+    """Each version has at most one upgrade"""
+    with pytest.raises(ValueError):
+        registry.register(1)(lambda data: data)
+
+def test_version_1_system_paths_become_ids():
+    """Version 1 saves stored CWD-relative system paths"""
+    save = {"save_version": 1, "data": {
+        "home_system": {"path": "data/systems/home_system.json"},
+        "current_system": {"path": "data/systems/home_system.json"}
+    }}
+    migrated = migrate_save(save)
+    assert migrated["data"]["home_system"] == {"id": "systems/home_system.json"}
+    assert migrated["save_version"] == SAVE_VERSION
+
+def test_version_2_saves_get_an_empty_event_scheduler():
+    """Version 3 added scheduled events; older saves start with none"""
+    save = {"save_version": 2, "data": {"messages": []}}
+    migrated = migrate_save(save)
+    assert migrated["data"]["events"]["events"] == []
+    assert migrated["data"]["events"]["time"] == 0.0
+
+def test_version_3_message_strings_become_log_entries():
+    """Version 4 saves messages with seq numbers, times and channels"""
+    save = {"save_version": 3, "data": {"messages": ["hello", "there"]}}
+    migrated = migrate_save(save)["data"]["messages"]
+    assert migrated["next_seq"] == 3
+    assert migrated["messages"][1] == {"seq": 2, "time": 0.0, "channel": "system", "text": "there"}
+
+def test_version_4_saves_open_a_fresh_market():
+    """Version 5 added the mineral market; older saves start without one"""
+    save = {"save_version": 4, "data": {"messages": {"next_seq": 1, "messages": []}}}
+    assert migrate_save(save)["data"]["market"] is None
+
+def test_version_5_saves_get_empty_trigger_progress():
+    """Version 6 added trigger progress; older saves have no retired triggers or visit"""
+    save = {"save_version": 5, "data": {"market": None}}
+    assert migrate_save(save)["data"]["triggers"] == {"retired": [], "context": None, "inside": {}}
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from systems.ship_store import ShipStore, integrate_motion
+
+
+def test_despawned_ids_are_reused():
+    """Free-list reuse keeps ids dense; generations mark the reuse"""
+    store = ShipStore(capacity=4)
+    first, second = store.spawn(), store.spawn()
+    generation = store.generation[first]
+    store.despawn(first)
+
+    assert not store.is_alive(first)
+    assert store.spawn(x=5.0) == first
+    assert not store.is_alive(first, generation)
+    assert store.x[first] == 5.0
+    assert len(store) == 2 and store.size == 2
+    assert store.active_ids().tolist() == [first, second]
+
+def test_growth_keeps_existing_ships():
+    """Filling the store doubles every column without losing data"""
+    store = ShipStore(capacity=2)
+    ids = store.spawn_many(5, x=np.arange(5, dtype=np.float32), faction=1)
+    assert store.capacity == 8
+    assert store.x[ids].tolist() == [0, 1, 2, 3, 4]
+    assert (store.faction[ids] == 1).all()
+    assert store.fuel[ids[0]] == 100.0  # Unset columns get defaults
+
+def test_bulk_despawn_and_errors():
+    """Bulk despawn skips dead ids; single despawn and unknown columns raise"""
+    store = ShipStore()
+    ids = store.spawn_many(3)
+    store.despawn_many([ids[0], ids[0], ids[2]])
+    assert store.active_ids().tolist() == [ids[1]]
+    with pytest.raises(KeyError):
+        store.despawn(ids[0])
+    with pytest.raises(KeyError):
+        store.spawn(warp_factor=9)
+
+def test_spawn_ship_copies_components():
+    """A Ship's status and equipment land in the matching columns"""
+    ship = SimpleNamespace(fuel=40, max_fuel=500, hull_integrity=75,
+                           engine_class=3, shield_class=2, armor_class=1)
+    store = ShipStore()
+    record = store.get(store.spawn_ship(ship, x=10.0))
+    assert (record["fuel"], record["hull"], record["engine_class"], record["x"]) == (40, 75, 3, 10)
+
+def test_motion_burns_fuel_and_stops_when_empty():
+    """Ships move by velocity, and one without enough fuel stops where it runs out"""
+    store = ShipStore()
+    full = store.spawn(vx=2.0, fuel=100.0)
+    low = store.spawn(vx=2.0, fuel=0.05)
+    integrate_motion(store, dt=1.0, fuel_per_unit=0.1)
+
+    assert store.x[full] == pytest.approx(2.0)
+    assert store.fuel[full] == pytest.approx(99.8)
+    assert store.x[low] == pytest.approx(0.5)
+    assert store.fuel[low] == 0.0 and store.vx[low] == 0.0
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from utils.spatial_grid import SpatialGrid
+
+
+def brute_force_pairs(x, y, radius):
+    """Every (i, j) pair with i < j closer than radius"""
+    dx = x[:, None] - x[None, :]
+    dy = y[:, None] - y[None, :]
+    i, j = np.nonzero(np.triu(dx * dx + dy * dy < radius * radius, k=1))
+    return set(zip(i.tolist(), j.tolist()))
+
+
+def test_pairs_match_brute_force():
+    """Grid pairs equal the all-pairs answer, each pair once, negative coordinates included"""
+    rng = np.random.default_rng(7)
+    x = rng.uniform(-20, 20, 600).astype(np.float32)
+    y = rng.uniform(-20, 20, 600).astype(np.float32)
+    grid = SpatialGrid(cell_size=1.5)
+    grid.build(x, y)
+
+    i, j = grid.query_pairs(1.2)
+    found = {(min(a, b), max(a, b)) for a, b in zip(i.tolist(), j.tolist())}
+    assert len(found) == len(i)
+    assert found == brute_force_pairs(x, y, 1.2)
+
+def test_point_query_and_radius_limit():
+    """Point queries search the 3x3 cells around the position; radii beyond a cell raise"""
+    x = np.array([0.0, 0.9, 2.5, -0.5], dtype=np.float32)
+    y = np.array([0.0, 0.0, 0.0, -0.5], dtype=np.float32)
+    grid = SpatialGrid(cell_size=1.0)
+    grid.build(x, y)
+
+    assert sorted(grid.query_point(0.1, 0.0, 1.0).tolist()) == [0, 1, 3]
+    assert grid.query_point(10.0, 10.0, 1.0).tolist() == []
+    with pytest.raises(ValueError):
+        grid.query_pairs(2.0)
+
+def test_empty_grid():
+    """An empty build answers every query with nothing"""
+    grid = SpatialGrid(cell_size=1.0)
+    grid.build([], [])
+    i, j = grid.query_pairs(1.0)
+    assert len(i) == len(j) == 0
+    assert len(grid.query_point(0.0, 0.0, 1.0)) == 0
+
+def test_many_point_queries_match_brute_force():
+    """Batched point queries return every (query, point) pair within the radius"""
+    rng = np.random.default_rng(11)
+    x, y = rng.uniform(-10, 10, (2, 400))
+    qx, qy = rng.uniform(-12, 12, (2, 300))
+    grid = SpatialGrid(cell_size=1.0)
+    grid.build(x, y)
+
+    query, point = grid.query_points(qx, qy, 0.8)
+    close = (qx[:, None] - x[None, :]) ** 2 + (qy[:, None] - y[None, :]) ** 2 < 0.64
+    assert set(zip(query.tolist(), point.tolist())) == set(zip(*np.nonzero(close)))
@@ -0,0 +1,90 @@
+import sys
+import pytest
+from core.state_manager import LazyState, StateManager
+
+
+class RecordingState:
+    """Minimal stand-in for a GameState that records transitions"""
+
+    built = 0
+
+    def __init__(self, state_manager):
+        RecordingState.built += 1
+        self.state_manager = state_manager
+        self.events = []
+
+    def on_enter(self):
+        self.events.append("enter")
+
+    def on_exit(self):
+        self.events.append("exit")
+
+    def shutdown(self):
+        self.events.append("shutdown")
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """A state module on the import path that hasn't been imported yet"""
+    (tmp_path / "lazy_test_state.py").write_text(
+        "class LazyTestState:\n"
+        "    def __init__(self, state_manager):\n"
+        "        self.state_manager = state_manager\n"
+        "    def on_enter(self):\n"
+        "        pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_test_state"
+    sys.modules.pop("lazy_test_state", None)
+
+def test_factory_builds_state_on_first_change():
+    """Factories run once, on the first transition into their state"""
+    RecordingState.built = 0
+    manager = StateManager()
+    manager.register_factory("menu", RecordingState)
+    manager.register_factory("space", RecordingState)
+    assert RecordingState.built == 0
+
+    manager.change_state("menu")
+    menu = manager.get_current_state()
+    manager.change_state("space")
+    manager.change_state("menu")
+    assert RecordingState.built == 2
+    assert manager.get_current_state() is menu
+    assert menu.events == ["enter", "exit", "enter"]
+
+def test_shutdown_reaches_every_built_state():
+    """Built states are shut down at quit; unbuilt factories are left alone"""
+    RecordingState.built = 0
+    manager = StateManager()
+    manager.register_factory("menu", RecordingState)
+    manager.register_factory("space", RecordingState)
+    manager.change_state("menu")
+    manager.shutdown()
+    assert manager.get_current_state().events == ["enter", "shutdown"]
+    assert RecordingState.built == 1
+
+def test_unknown_state_raises():
+    """Changing to an unregistered state is an error"""
+    with pytest.raises(ValueError):
+        StateManager().change_state("nowhere")
+
+def test_lazy_state_imports_on_first_use(lazy_module):
+    """LazyState keeps its module unimported until the state is needed"""
+    manager = StateManager()
+    manager.register_factory("lazy", LazyState(lazy_module, "LazyTestState"))
+    assert lazy_module not in sys.modules
+
+    manager.change_state("lazy")
+    assert type(manager.get_current_state()).__name__ == "LazyTestState"
+
+def test_warm_up_imports_in_background(lazy_module):
+    """warm_up() imports the module without building the state"""
+    manager = StateManager()
+    manager.register_factory("lazy", LazyState(lazy_module, "LazyTestState"))
+    manager.warm_up("lazy")
+    manager._warmups["lazy"].result(timeout=5)
+    manager.shutdown()
+
+    assert lazy_module in sys.modules
+    assert "lazy" not in manager.states
@@ -0,0 +1,70 @@
+import json
+import pytest
+from core.data_loader import DataLoader
+from core.system_loader import HOME_SYSTEM_ID, SystemLoader, split_system_id
+from entities.celestial_objects.star_system import StarSystem
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """System loader whose data directory is a temp directory with one system"""
+    data_loader = DataLoader()
+    data_loader.data_root = tmp_path
+    (tmp_path / "systems").mkdir()
+    (tmp_path / "systems" / "tiny.json").write_text(json.dumps({
+        "name": "Tiny",
+        "star": {"name": "Tiny", "spectral_class": "M5V", "size": 3},
+        "inner_planets": [None, {"name": "Rock", "type": "rocky", "orbit_angle": 90, "size": 1.0}]
+    }))
+    return SystemLoader(data_loader)
+
+def test_system_ids():
+    """Bare ids use the data source; prefixed ids name their source"""
+    assert split_system_id("systems/tiny.json") == ("data", "systems/tiny.json")
+    assert split_system_id("procedural:4211") == ("procedural", "4211")
+
+def test_definitions_are_cached(loader):
+    """Second load is a cache hit returning the same read-only definition"""
+    first = loader.load("systems/tiny.json")
+    assert loader.load("systems/tiny.json") is first
+    with pytest.raises(TypeError):
+        first["name"] = "Changed"
+
+    info = loader.cache_info()
+    assert (info["hits"], info["misses"], info["cached_systems"]) == (1, 1, 1)
+    assert info["sources"]["data"]["loads"] == 1
+
+def test_registered_source(loader):
+    """Other providers plug in by prefix and are cached the same way"""
+    calls = []
+
+    def generate(name):
+        calls.append(name)
+        return {"name": f"Gen {name}", "star": {"name": "Gen", "spectral_class": "K1V"}}
+
+    loader.register_source("procedural", generate)
+    system = StarSystem("procedural:7", loader.load("procedural:7"))
+    loader.load("procedural:7")
+    assert system.name == "Gen 7"
+    assert calls == ["7"]
+
+    with pytest.raises(KeyError):
+        loader.load("nowhere:7")
+
+def test_listing_sources_make_up_system_ids(loader):
+    """system_ids() lists data/systems/ and any source registered with a lister"""
+    assert loader.system_ids() == ["systems/tiny.json"]
+    loader.register_source("procedural", lambda name: {}, list_names=lambda: ["2", "1"])
+    loader.register_source("save", lambda name: {})
+    assert loader.system_ids() == ["procedural:1", "procedural:2", "systems/tiny.json"]
+
+def test_star_system_from_definition(loader):
+    """StarSystem builds planets from a loaded definition, keeping empty orbits"""
+    system = StarSystem("systems/tiny.json", loader.load("systems/tiny.json"))
+    assert system.system_id == "systems/tiny.json"
+    assert system.inner_planets[0] is None
+    assert system.inner_planets[1].orbital_index == 1
+
+def test_home_system_uses_shared_loader():
+    """The home system resolves relative to the data directory, not the CWD"""
+    assert StarSystem(HOME_SYSTEM_ID).name == "Arth"
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from utils.noise import derive_seed, noise_grid
+from systems.terrain_generator import TerrainGenerator, build_palette_lut
+from systems.surface_map import SurfaceMap
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Small-grid generator that caches into a temp directory"""
+    return TerrainGenerator(cache_dir=tmp_path, grid_width=64, grid_height=48)
+
+def test_derive_seed_is_stable():
+    """Same parts always give the same seed, different parts differ"""
+    assert derive_seed("Arth", "Homeworld") == derive_seed("Arth", "Homeworld")
+    assert derive_seed("Arth", "Homeworld") != derive_seed("Arth", "Dustball")
+
+def test_noise_is_deterministic():
+    """Same seed reproduces the same noise, a different seed doesn't"""
+    a = noise_grid(0, 0, 32, 32, 0.1, seed=42)
+    b = noise_grid(0, 0, 32, 32, 0.1, seed=42)
+    c = noise_grid(0, 0, 32, 32, 0.1, seed=43)
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, c)
+
+def test_regions_tile_seamlessly(generator):
+    """A window of the map matches the same cells of the full map"""
+    full = generator.generate(1234, "continental").heights
+    window = generator.generate_region(1234, "continental", 16, 8, 20, 10)
+    assert np.allclose(window, full[8:18, 16:36])
+
+def test_heights_in_range(generator):
+    """Every terrain profile produces heights within [0, 1]"""
+    for profile_name in generator.profiles:
+        heights = generator.generate(99, profile_name).heights
+        assert heights.dtype == np.float32
+        assert heights.min() >= 0.0 and heights.max() <= 1.0
+
+def test_cache_round_trip(generator):
+    """Second request is served from the memory-mapped cache file"""
+    first = generator.get_terrain(77, "ice")
+    assert generator.cache_path(77, "ice").exists()
+
+    second = generator.get_terrain(77, "ice")
+    assert isinstance(second.heights, np.memmap)
+    assert np.array_equal(first.heights, second.heights)
+
+def test_palette_splits_at_liquid_level():
+    """Cells below the liquid level use the liquid palette, above use land"""
+    profile = {
+        "liquid_level": 0.5,
+        "liquid_palette": [[0.0, [0, 0, 255]], [1.0, [0, 0, 255]]],
+        "land_palette": [[0.0, [0, 255, 0]], [1.0, [0, 255, 0]]]
+    }
+    lut = build_palette_lut(profile)
+    assert tuple(lut[0]) == (0, 0, 255)
+    assert tuple(lut[-1]) == (0, 255, 0)
+
+def test_gas_giant_has_no_terrain(generator):
+    """Gas giants are visual only"""
+    with pytest.raises(ValueError):
+        generator.profile_for_planet_type("gas_giant")
+
+def test_crater_radii_follow_range(generator):
+    """Crater radii stay in range and small craters outnumber large ones"""
+    settings = generator.profiles["cratered"]["craters"]
+    overlay = generator.get_crater_overlay(5, settings)
+    assert overlay.radius.min() >= settings["min_radius"]
+    assert overlay.radius.max() <= settings["max_radius"]
+    median = np.median(overlay.radius)
+    assert median < (settings["min_radius"] + settings["max_radius"]) / 4
+
+def test_craters_tile_seamlessly(generator):
+    """Craters split across windows come out the same as in the full map"""
+    craters = generator.profiles["cratered"]["craters"]
+    full = generator.generate(8, "cratered", craters).heights
+    window = generator.generate_region(8, "cratered", 10, 5, 30, 25, craters)
+    assert np.allclose(window, full[5:30, 10:40], atol=1e-6)
+
+def test_moons_get_craters(generator):
+    """Moons without a cratered profile still get the airless overlay"""
+    class Moon:
+        body_type = "moon"
+    class World:
+        body_type = "planet"
+    assert generator.crater_settings_for(Moon(), "ice") is generator.airless_body_craters
+    assert generator.crater_settings_for(World(), "ice") is None
+    assert generator.crater_settings_for(World(), "cratered") is not None
+
+def test_surface_chunks_match_full_map(generator):
+    """Lazily generated chunks line up with the full map, edge chunks are clipped"""
+    full = generator.generate(555, "desert").heights
+    surface_map = SurfaceMap(generator, 555, "desert", chunk_size=20)
+    assert (surface_map.chunks_x, surface_map.chunks_y) == (4, 3)
+    assert surface_map.chunk_bounds(3, 2) == (60, 40, 4, 8)
+    assert np.allclose(surface_map.chunk_heights(3, 2), full[40:48, 60:64])
+    assert not surface_map.in_bounds(4, 0)
@@ -0,0 +1,111 @@
+import random
+import pytest
+from types import SimpleNamespace
+from core.trigger_index import (
+    Trigger, TriggerIndex, context_key, TRIGGER_DWELL, TRIGGER_ENTER, TRIGGER_EXIT
+)
+
+SPACE = "hyperspace"
+
+
+@pytest.fixture
+def index():
+    return TriggerIndex(cell_size=10.0)
+
+
+def kinds(fired):
+    """(kind, trigger id) pairs from update() output"""
+    return [(kind, trigger.trigger_id) for kind, trigger in fired]
+
+
+def test_enter_dwell_exit_fire_once_per_visit(index):
+    """Enter and dwell don't repeat while the ship stays; leaving fires exit and re-arms them"""
+    seen = []
+    index.register_handler("clue", on_enter=lambda trigger: seen.append(trigger.data))
+    index.add(Trigger.circle("clue_1", SPACE, 50.0, 50.0, 5.0, "clue", dwell=1.0, data="ruins ahead"))
+
+    assert index.update(SPACE, 40.0, 50.0, 0.5) == []
+    assert kinds(index.update(SPACE, 48.0, 50.0, 0.5)) == [(TRIGGER_ENTER, "clue_1")]
+    assert index.update(SPACE, 49.0, 50.0, 0.6) == []
+    assert kinds(index.update(SPACE, 50.0, 50.0, 0.6)) == [(TRIGGER_DWELL, "clue_1")]
+    assert index.update(SPACE, 50.0, 50.0, 5.0) == []
+    assert kinds(index.update(SPACE, 60.0, 50.0, 0.5)) == [(TRIGGER_EXIT, "clue_1")]
+    assert kinds(index.update(SPACE, 50.0, 50.0, 0.5)) == [(TRIGGER_ENTER, "clue_1")]
+    assert seen == ["ruins ahead", "ruins ahead"]
+
+def test_triggers_are_per_context(index):
+    """A trigger only fires in its own context; changing context exits it"""
+    inner = "systems/home_system.json#inner_system"
+    index.add(Trigger.rectangle("zone", inner, 20.0, 20.0, 10.0, 4.0, "encounter"))
+
+    assert index.update(SPACE, 20.0, 20.0, 0.1) == []
+    assert kinds(index.update(inner, 24.0, 21.0, 0.1)) == [(TRIGGER_ENTER, "zone")]
+    assert kinds(index.update(SPACE, 24.0, 21.0, 0.1)) == [(TRIGGER_EXIT, "zone")]
+
+def test_once_triggers_retire_after_their_visit(index):
+    """One-shot triggers are removed when the ship leaves them"""
+    index.add(Trigger.circle("message", SPACE, 5.0, 5.0, 2.0, "clue", once=True))
+    index.update(SPACE, 5.0, 5.0, 0.1)
+    assert kinds(index.update(SPACE, 9.0, 5.0, 0.1)) == [(TRIGGER_EXIT, "message")]
+    assert len(index) == 0
+    assert index.update(SPACE, 5.0, 5.0, 0.1) == []
+
+def test_large_and_removed_triggers(index):
+    """Triggers spanning many cells still hit; removed ones never fire and ids stay unique"""
+    index.add(Trigger.circle("nebula", SPACE, 0.0, 0.0, 500.0, "hazard"))
+    index.add(Trigger.circle("beacon", SPACE, 1.0, 1.0, 1.0, "clue"))
+    assert "nebula" in [trigger.trigger_id for trigger in index.large[SPACE]]
+    assert {trigger.trigger_id for trigger in index.query(SPACE, 1.0, 1.0)} == {"nebula", "beacon"}
+
+    assert index.remove("beacon") and index.remove("nebula")
+    assert not index.remove("beacon")
+    assert index.query(SPACE, 1.0, 1.0) == []
+    index.add(Trigger.circle("beacon", SPACE, 1.0, 1.0, 1.0, "clue"))
+    with pytest.raises(ValueError):
+        index.add(Trigger.circle("beacon", SPACE, 9.0, 9.0, 1.0, "clue"))
+
+def test_query_matches_brute_force():
+    """The grid finds exactly the triggers a full scan would"""
+    rng = random.Random(4)
+    index = TriggerIndex(cell_size=5.0)
+    triggers = [Trigger.circle(n, SPACE, rng.uniform(0, 200), rng.uniform(0, 200), rng.uniform(0.5, 8.0), "clue")
+                for n in range(3000)]
+    for trigger in triggers:
+        index.add(trigger)
+    for _ in range(200):
+        x, y = rng.uniform(0, 200), rng.uniform(0, 200)
+        expected = {trigger.trigger_id for trigger in triggers if trigger.contains(x, y, index.ship_radius)}
+        assert {trigger.trigger_id for trigger in index.query(SPACE, x, y)} == expected
+
+def test_ship_radius_pads_shapes_like_collisions():
+    """The ship touches a trigger when its radius reaches the shape, as in CollisionManager"""
+    index = TriggerIndex(cell_size=10.0, ship_radius=0.5)
+    index.add(Trigger.circle("buoy", SPACE, 9.8, 5.0, 1.0, "clue"))
+    index.add(Trigger.rectangle("gate", SPACE, 30.0, 30.0, 2.0, 2.0, "clue"))
+    assert [trigger.trigger_id for trigger in index.query(SPACE, 11.2, 5.0)] == ["buoy"]
+    assert index.query(SPACE, 11.4, 5.0) == []
+    assert [trigger.trigger_id for trigger in index.query(SPACE, 28.6, 31.4)] == ["gate"]
+    assert index.query(SPACE, 28.4, 30.0) == []
+
+def test_progress_survives_save_and_reload(index):
+    """Retired one-shots stay retired and a visit in progress doesn't enter again"""
+    clue = Trigger.circle("clue", SPACE, 5.0, 5.0, 2.0, "clue", once=True)
+    zone = Trigger.circle("zone", SPACE, 50.0, 50.0, 5.0, "encounter", dwell=1.0)
+    index.add(clue)
+    index.add(zone)
+    index.update(SPACE, 5.0, 5.0, 0.1)
+    index.update(SPACE, 50.0, 50.0, 0.1)
+    index.update(SPACE, 50.0, 50.0, 0.5)
+
+    restored = TriggerIndex.from_dict(index.to_dict())
+    assert not restored.add(Trigger.circle("clue", SPACE, 5.0, 5.0, 2.0, "clue", once=True))
+    assert restored.add(Trigger.circle("zone", SPACE, 50.0, 50.0, 5.0, "encounter", dwell=1.0))
+    assert kinds(restored.update(SPACE, 50.0, 50.0, 0.6)) == [(TRIGGER_DWELL, "zone")]
+    assert restored.update(SPACE, 5.0, 5.0, 0.1) == [(TRIGGER_EXIT, restored.triggers["zone"])]
+
+def test_context_keys():
+    """Hyperspace is shared; system contexts include the system and planet"""
+    hyperspace = SimpleNamespace(type="hyperspace", data={})
+    planetary = SimpleNamespace(type="planetary_system", data={"planet_index": 4})
+    assert context_key("systems/home_system.json", hyperspace) == "hyperspace"
+    assert context_key("systems/home_system.json", planetary) == "systems/home_system.json#planetary_system:4"